@@ -12,6 +12,8 @@ namespace Audio
         [Range(20f, 2000f)] public float frequency = 440f;
         [Range(0f, 1f)] public float amplitude = 0.5f;
         public bool isPlaying = false;
+        [Tooltip("Noise generator seed; 0 = from the clock. Fixed seeds make the output reproducible offline (audio_synth.py).")]
+        public int noiseSeed = 0;
 
         private double phase;
         private double increment;
@@ -21,7 +23,7 @@ namespace Audio
         private void Awake()
         {
             sampleRate = AudioSettings.outputSampleRate;
-            rng = new System.Random();
+            rng = noiseSeed != 0 ? new System.Random(noiseSeed) : new System.Random();
         }
 
         private void Update()
@@ -25,23 +25,60 @@ namespace Core.Network {
       byte[] descriptorData = global::System.Convert.FromBase64String(
           string.Concat(
             "ChBnYW1lX3N0YXRlLnByb3RvEgxDb3JlLk5ldHdvcmsiLQoKVmVjdG9yM01z",
-            "ZxIJCgF4GAEgASgCEgkKAXkYAiABKAISCQoBehgDIAEoAiKdAQoMVHJhbnNm",
-            "b3JtTXNnEgwKBG5hbWUYASABKAkSKgoIcG9zaXRpb24YAiABKAsyGC5Db3Jl",
-            "Lk5ldHdvcmsuVmVjdG9yM01zZxIqCghyb3RhdGlvbhgDIAEoCzIYLkNvcmUu",
-            "TmV0d29yay5WZWN0b3IzTXNnEicKBXNjYWxlGAQgASgLMhguQ29yZS5OZXR3",
-            "b3JrLlZlY3RvcjNNc2cidAoKQ29tbWFuZE1zZxIOCgZhY3Rpb24YASABKAkS",
-            "DgoGdGFyZ2V0GAIgASgJEhQKDHBheWxvYWRfanNvbhgDIAEoCRIwCg52ZWN0",
-            "b3JfcGF5bG9hZBgEIAEoCzIYLkNvcmUuTmV0d29yay5WZWN0b3IzTXNnIl8K",
-            "DEdhbWVTdGF0ZU1zZxIRCgl0aW1lc3RhbXAYASABKAISLAoIZW50aXRpZXMY",
-            "AiADKAsyGi5Db3JlLk5ldHdvcmsuVHJhbnNmb3JtTXNnEg4KBnN0YXR1cxgD",
-            "IAEoCWIGcHJvdG8z"));
+            "ZxIJCgF4GAEgASgCEgkKAXkYAiABKAISCQoBehgDIAEoAiJpChBTZWN0b3JW",
+            "ZWN0b3IzTXNnEhAKCHNlY3Rvcl94GAEgASgREhAKCHNlY3Rvcl95GAIgASgR",
+            "EhAKCHNlY3Rvcl96GAMgASgREgkKAXgYBCABKAISCQoBeRgFIAEoAhIJCgF6",
+            "GAYgASgCItUBCgxUcmFuc2Zvcm1Nc2cSDAoEbmFtZRgBIAEoCRIqCghwb3Np",
+            "dGlvbhgCIAEoCzIYLkNvcmUuTmV0d29yay5WZWN0b3IzTXNnEioKCHJvdGF0",
+            "aW9uGAMgASgLMhguQ29yZS5OZXR3b3JrLlZlY3RvcjNNc2cSJwoFc2NhbGUY",
+            "BCABKAsyGC5Db3JlLk5ldHdvcmsuVmVjdG9yM01zZxI2Cg53b3JsZF9wb3Np",
+            "dGlvbhgFIAEoCzIeLkNvcmUuTmV0d29yay5TZWN0b3JWZWN0b3IzTXNnImoK",
+            "EVRyYW5zZm9ybUJhdGNoTXNnEg0KBW5hbWVzGAEgAygJEg8KB2hhbmRsZXMY",
+            "AiADKAUSEQoJcG9zaXRpb25zGAMgASgMEhEKCXJvdGF0aW9ucxgEIAEoDBIP",
+            "CgdzZWN0b3JzGAUgASgMItQCCgpDb21tYW5kTXNnEg4KBmFjdGlvbhgBIAEo",
+            "CRIOCgZ0YXJnZXQYAiABKAkSFAoMcGF5bG9hZF9qc29uGAMgASgJEjAKDnZl",
+            "Y3Rvcl9wYXlsb2FkGAQgASgLMhguQ29yZS5OZXR3b3JrLlZlY3RvcjNNc2cS",
+            "OAoPdHJhbnNmb3JtX2JhdGNoGAUgASgLMh8uQ29yZS5OZXR3b3JrLlRyYW5z",
+            "Zm9ybUJhdGNoTXNnEiwKBWJhdGNoGAYgASgLMh0uQ29yZS5OZXR3b3JrLkNv",
+            "bW1hbmRCYXRjaE1zZxI1Cg13b3JsZF9wYXlsb2FkGAcgASgLMh4uQ29yZS5O",
+            "ZXR3b3JrLlNlY3RvclZlY3RvcjNNc2cSFAoMaW5zdGFuY2VfaWRzGAggAygF",
+            "EikKBG1lc2gYCSABKAsyGy5Db3JlLk5ldHdvcmsuTWVzaFVwbG9hZE1zZyK2",
+            "AQoNTWVzaFVwbG9hZE1zZxIMCgRoYXNoGAEgASgJEhEKCW1lc2hfbmFtZRgC",
+            "IAEoCRIUCgx2ZXJ0ZXhfY291bnQYAyABKAUSEwoLaW5kZXhfY291bnQYBCAB",
+            "KAUSDwoHaW5kZXgzMhgFIAEoCBITCgtoYXNfbm9ybWFscxgGIAEoCBIOCgZo",
+            "YXNfdXYYByABKAgSEwoLdG90YWxfYnl0ZXMYCCABKAUSDgoGb2Zmc2V0GAkg",
+            "ASgFIlQKD0NvbW1hbmRCYXRjaE1zZxIqCghjb21tYW5kcxgBIAMoCzIYLkNv",
+            "cmUuTmV0d29yay5Db21tYW5kTXNnEhUKDXN0b3Bfb25fZXJyb3IYAiABKAgi",
+            "5AEKDEhpZXJhcmNoeU1zZxINCgVjb3VudBgBIAEoBRINCgVuYW1lcxgCIAMo",
+            "CRISCgpjb21wb25lbnRzGAMgAygJEjUKDmNvbXBvbmVudF9zZXRzGAQgAygL",
+            "Mh0uQ29yZS5OZXR3b3JrLkNvbXBvbmVudFNldE1zZxIPCgdwYXJlbnRzGAUg",
+            "ASgMEhAKCG5hbWVfaWRzGAYgASgMEg8KB3NldF9pZHMYByABKAwSEQoJcG9z",
+            "aXRpb25zGAggASgMEg4KBmFjdGl2ZRgJIAEoDBIUCgxpbnN0YW5jZV9pZHMY",
+            "CiABKAwiZwoNRnJhbWVTdGF0c01zZxIPCgdtZWFuX21zGAEgASgCEg4KBnA5",
+            "NV9tcxgCIAEoAhIOCgZtYXhfbXMYAyABKAISDwoHc2FtcGxlcxgEIAEoBRIU",
+            "CgxvYmplY3RfY291bnQYBSABKAUiJQoPQ29tcG9uZW50U2V0TXNnEhIKCmNv",
+            "bXBvbmVudHMYASADKAUitwIKDEdhbWVTdGF0ZU1zZxIRCgl0aW1lc3RhbXAY",
+            "ASABKAISLAoIZW50aXRpZXMYAiADKAsyGi5Db3JlLk5ldHdvcmsuVHJhbnNm",
+            "b3JtTXNnEg4KBnN0YXR1cxgDIAEoCRIPCgdoYW5kbGVzGAQgAygFEisKB3Jl",
+            "c3VsdHMYBSADKAsyGi5Db3JlLk5ldHdvcmsuR2FtZVN0YXRlTXNnEhAKCHF1",
+            "ZXVlX21zGAYgASgCEg8KB2V4ZWNfbXMYByABKAISLQoJaGllcmFyY2h5GAgg",
+            "ASgLMhouQ29yZS5OZXR3b3JrLkhpZXJhcmNoeU1zZxIwCgtmcmFtZV9zdGF0",
+            "cxgJIAEoCzIbLkNvcmUuTmV0d29yay5GcmFtZVN0YXRzTXNnEhQKDGluc3Rh",
+            "bmNlX2lkcxgKIAMoBWIGcHJvdG8z"));
       descriptor = pbr::FileDescriptor.FromGeneratedCode(descriptorData,
           new pbr::FileDescriptor[] { },
           new pbr::GeneratedClrTypeInfo(null, null, new pbr::GeneratedClrTypeInfo[] {
             new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.Vector3Msg), global::Core.Network.Vector3Msg.Parser, new[]{ "X", "Y", "Z" }, null, null, null, null),
-            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.TransformMsg), global::Core.Network.TransformMsg.Parser, new[]{ "Name", "Position", "Rotation", "Scale" }, null, null, null, null),
-            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.CommandMsg), global::Core.Network.CommandMsg.Parser, new[]{ "Action", "Target", "PayloadJson", "VectorPayload" }, null, null, null, null),
-            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.GameStateMsg), global::Core.Network.GameStateMsg.Parser, new[]{ "Timestamp", "Entities", "Status" }, null, null, null, null)
+            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.SectorVector3Msg), global::Core.Network.SectorVector3Msg.Parser, new[]{ "SectorX", "SectorY", "SectorZ", "X", "Y", "Z" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.TransformMsg), global::Core.Network.TransformMsg.Parser, new[]{ "Name", "Position", "Rotation", "Scale", "WorldPosition" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.TransformBatchMsg), global::Core.Network.TransformBatchMsg.Parser, new[]{ "Names", "Handles", "Positions", "Rotations", "Sectors" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.CommandMsg), global::Core.Network.CommandMsg.Parser, new[]{ "Action", "Target", "PayloadJson", "VectorPayload", "TransformBatch", "Batch", "WorldPayload", "InstanceIds", "Mesh" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.MeshUploadMsg), global::Core.Network.MeshUploadMsg.Parser, new[]{ "Hash", "MeshName", "VertexCount", "IndexCount", "Index32", "HasNormals", "HasUv", "TotalBytes", "Offset" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.CommandBatchMsg), global::Core.Network.CommandBatchMsg.Parser, new[]{ "Commands", "StopOnError" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.HierarchyMsg), global::Core.Network.HierarchyMsg.Parser, new[]{ "Count", "Names", "Components", "ComponentSets", "Parents", "NameIds", "SetIds", "Positions", "Active", "InstanceIds" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.FrameStatsMsg), global::Core.Network.FrameStatsMsg.Parser, new[]{ "MeanMs", "P95Ms", "MaxMs", "Samples", "ObjectCount" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.ComponentSetMsg), global::Core.Network.ComponentSetMsg.Parser, new[]{ "Components" }, null, null, null, null),
+            new pbr::GeneratedClrTypeInfo(typeof(global::Core.Network.GameStateMsg), global::Core.Network.GameStateMsg.Parser, new[]{ "Timestamp", "Entities", "Status", "Handles", "Results", "QueueMs", "ExecMs", "Hierarchy", "FrameStats", "InstanceIds" }, null, null, null, null)
           }));
     }
     #endregion
@@ -312,17 +349,22 @@ namespace Core.Network {
 
   }
 
+  /// <summary>
+  /// Double-precision position: integer sector + float offset inside it.
+  /// world = sector * 1024 + offset (Core.Vector3d.SectorSize, world_coords.py).
+  /// Offsets stay within +-512, so precision is ~1.5e-5 units at any distance.
+  /// </summary>
   [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
-  public sealed partial class TransformMsg : pb::IMessage<TransformMsg>
+  public sealed partial class SectorVector3Msg : pb::IMessage<SectorVector3Msg>
   #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
       , pb::IBufferMessage
   #endif
   {
-    private static readonly pb::MessageParser<TransformMsg> _parser = new pb::MessageParser<TransformMsg>(() => new TransformMsg());
+    private static readonly pb::MessageParser<SectorVector3Msg> _parser = new pb::MessageParser<SectorVector3Msg>(() => new SectorVector3Msg());
     private pb::UnknownFieldSet _unknownFields;
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public static pb::MessageParser<TransformMsg> Parser { get { return _parser; } }
+    public static pb::MessageParser<SectorVector3Msg> Parser { get { return _parser; } }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
@@ -338,7 +380,7 @@ namespace Core.Network {
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public TransformMsg() {
+    public SectorVector3Msg() {
       OnConstruction();
     }
 
@@ -346,90 +388,115 @@ namespace Core.Network {
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public TransformMsg(TransformMsg other) : this() {
-      name_ = other.name_;
-      position_ = other.position_ != null ? other.position_.Clone() : null;
-      rotation_ = other.rotation_ != null ? other.rotation_.Clone() : null;
-      scale_ = other.scale_ != null ? other.scale_.Clone() : null;
+    public SectorVector3Msg(SectorVector3Msg other) : this() {
+      sectorX_ = other.sectorX_;
+      sectorY_ = other.sectorY_;
+      sectorZ_ = other.sectorZ_;
+      x_ = other.x_;
+      y_ = other.y_;
+      z_ = other.z_;
       _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
     }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public TransformMsg Clone() {
-      return new TransformMsg(this);
+    public SectorVector3Msg Clone() {
+      return new SectorVector3Msg(this);
     }
 
-    /// <summary>Field number for the "name" field.</summary>
-    public const int NameFieldNumber = 1;
-    private string name_ = "";
+    /// <summary>Field number for the "sector_x" field.</summary>
+    public const int SectorXFieldNumber = 1;
+    private int sectorX_;
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public string Name {
-      get { return name_; }
+    public int SectorX {
+      get { return sectorX_; }
       set {
-        name_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+        sectorX_ = value;
       }
     }
 
-    /// <summary>Field number for the "position" field.</summary>
-    public const int PositionFieldNumber = 2;
-    private global::Core.Network.Vector3Msg position_;
+    /// <summary>Field number for the "sector_y" field.</summary>
+    public const int SectorYFieldNumber = 2;
+    private int sectorY_;
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public global::Core.Network.Vector3Msg Position {
-      get { return position_; }
+    public int SectorY {
+      get { return sectorY_; }
       set {
-        position_ = value;
+        sectorY_ = value;
       }
     }
 
-    /// <summary>Field number for the "rotation" field.</summary>
-    public const int RotationFieldNumber = 3;
-    private global::Core.Network.Vector3Msg rotation_;
-    /// <summary>
-    /// Euler angles
-    /// </summary>
+    /// <summary>Field number for the "sector_z" field.</summary>
+    public const int SectorZFieldNumber = 3;
+    private int sectorZ_;
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public global::Core.Network.Vector3Msg Rotation {
-      get { return rotation_; }
+    public int SectorZ {
+      get { return sectorZ_; }
       set {
-        rotation_ = value;
+        sectorZ_ = value;
       }
     }
 
-    /// <summary>Field number for the "scale" field.</summary>
-    public const int ScaleFieldNumber = 4;
-    private global::Core.Network.Vector3Msg scale_;
+    /// <summary>Field number for the "x" field.</summary>
+    public const int XFieldNumber = 4;
+    private float x_;
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public global::Core.Network.Vector3Msg Scale {
-      get { return scale_; }
+    public float X {
+      get { return x_; }
       set {
-        scale_ = value;
+        x_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "y" field.</summary>
+    public const int YFieldNumber = 5;
+    private float y_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public float Y {
+      get { return y_; }
+      set {
+        y_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "z" field.</summary>
+    public const int ZFieldNumber = 6;
+    private float z_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public float Z {
+      get { return z_; }
+      set {
+        z_ = value;
       }
     }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public override bool Equals(object other) {
-      return Equals(other as TransformMsg);
+      return Equals(other as SectorVector3Msg);
     }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public bool Equals(TransformMsg other) {
+    public bool Equals(SectorVector3Msg other) {
       if (ReferenceEquals(other, null)) {
         return false;
       }
       if (ReferenceEquals(other, this)) {
         return true;
       }
-      if (Name != other.Name) return false;
-      if (!object.Equals(Position, other.Position)) return false;
-      if (!object.Equals(Rotation, other.Rotation)) return false;
-      if (!object.Equals(Scale, other.Scale)) return false;
+      if (SectorX != other.SectorX) return false;
+      if (SectorY != other.SectorY) return false;
+      if (SectorZ != other.SectorZ) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(X, other.X)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(Y, other.Y)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(Z, other.Z)) return false;
       return Equals(_unknownFields, other._unknownFields);
     }
 
@@ -437,10 +504,12 @@ namespace Core.Network {
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public override int GetHashCode() {
       int hash = 1;
-      if (Name.Length != 0) hash ^= Name.GetHashCode();
-      if (position_ != null) hash ^= Position.GetHashCode();
-      if (rotation_ != null) hash ^= Rotation.GetHashCode();
-      if (scale_ != null) hash ^= Scale.GetHashCode();
+      if (SectorX != 0) hash ^= SectorX.GetHashCode();
+      if (SectorY != 0) hash ^= SectorY.GetHashCode();
+      if (SectorZ != 0) hash ^= SectorZ.GetHashCode();
+      if (X != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(X);
+      if (Y != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(Y);
+      if (Z != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(Z);
       if (_unknownFields != null) {
         hash ^= _unknownFields.GetHashCode();
       }
@@ -459,21 +528,29 @@ namespace Core.Network {
     #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
       output.WriteRawMessage(this);
     #else
-      if (Name.Length != 0) {
-        output.WriteRawTag(10);
-        output.WriteString(Name);
+      if (SectorX != 0) {
+        output.WriteRawTag(8);
+        output.WriteSInt32(SectorX);
       }
-      if (position_ != null) {
-        output.WriteRawTag(18);
-        output.WriteMessage(Position);
+      if (SectorY != 0) {
+        output.WriteRawTag(16);
+        output.WriteSInt32(SectorY);
       }
-      if (rotation_ != null) {
-        output.WriteRawTag(26);
-        output.WriteMessage(Rotation);
+      if (SectorZ != 0) {
+        output.WriteRawTag(24);
+        output.WriteSInt32(SectorZ);
       }
-      if (scale_ != null) {
-        output.WriteRawTag(34);
-        output.WriteMessage(Scale);
+      if (X != 0F) {
+        output.WriteRawTag(37);
+        output.WriteFloat(X);
+      }
+      if (Y != 0F) {
+        output.WriteRawTag(45);
+        output.WriteFloat(Y);
+      }
+      if (Z != 0F) {
+        output.WriteRawTag(53);
+        output.WriteFloat(Z);
       }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(output);
@@ -485,21 +562,29 @@ namespace Core.Network {
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
-      if (Name.Length != 0) {
-        output.WriteRawTag(10);
-        output.WriteString(Name);
+      if (SectorX != 0) {
+        output.WriteRawTag(8);
+        output.WriteSInt32(SectorX);
       }
-      if (position_ != null) {
-        output.WriteRawTag(18);
-        output.WriteMessage(Position);
+      if (SectorY != 0) {
+        output.WriteRawTag(16);
+        output.WriteSInt32(SectorY);
       }
-      if (rotation_ != null) {
-        output.WriteRawTag(26);
-        output.WriteMessage(Rotation);
+      if (SectorZ != 0) {
+        output.WriteRawTag(24);
+        output.WriteSInt32(SectorZ);
       }
-      if (scale_ != null) {
-        output.WriteRawTag(34);
-        output.WriteMessage(Scale);
+      if (X != 0F) {
+        output.WriteRawTag(37);
+        output.WriteFloat(X);
+      }
+      if (Y != 0F) {
+        output.WriteRawTag(45);
+        output.WriteFloat(Y);
+      }
+      if (Z != 0F) {
+        output.WriteRawTag(53);
+        output.WriteFloat(Z);
       }
       if (_unknownFields != null) {
         _unknownFields.WriteTo(ref output);
@@ -511,17 +596,23 @@ namespace Core.Network {
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public int CalculateSize() {
       int size = 0;
-      if (Name.Length != 0) {
-        size += 1 + pb::CodedOutputStream.ComputeStringSize(Name);
+      if (SectorX != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeSInt32Size(SectorX);
       }
-      if (position_ != null) {
-        size += 1 + pb::CodedOutputStream.ComputeMessageSize(Position);
+      if (SectorY != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeSInt32Size(SectorY);
       }
-      if (rotation_ != null) {
-        size += 1 + pb::CodedOutputStream.ComputeMessageSize(Rotation);
+      if (SectorZ != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeSInt32Size(SectorZ);
       }
-      if (scale_ != null) {
-        size += 1 + pb::CodedOutputStream.ComputeMessageSize(Scale);
+      if (X != 0F) {
+        size += 1 + 4;
+      }
+      if (Y != 0F) {
+        size += 1 + 4;
+      }
+      if (Z != 0F) {
+        size += 1 + 4;
       }
       if (_unknownFields != null) {
         size += _unknownFields.CalculateSize();
@@ -531,30 +622,27 @@ namespace Core.Network {
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public void MergeFrom(TransformMsg other) {
+    public void MergeFrom(SectorVector3Msg other) {
       if (other == null) {
         return;
       }
-      if (other.Name.Length != 0) {
-        Name = other.Name;
+      if (other.SectorX != 0) {
+        SectorX = other.SectorX;
       }
-      if (other.position_ != null) {
-        if (position_ == null) {
-          Position = new global::Core.Network.Vector3Msg();
-        }
-        Position.MergeFrom(other.Position);
+      if (other.SectorY != 0) {
+        SectorY = other.SectorY;
       }
-      if (other.rotation_ != null) {
-        if (rotation_ == null) {
-          Rotation = new global::Core.Network.Vector3Msg();
-        }
-        Rotation.MergeFrom(other.Rotation);
+      if (other.SectorZ != 0) {
+        SectorZ = other.SectorZ;
       }
-      if (other.scale_ != null) {
-        if (scale_ == null) {
-          Scale = new global::Core.Network.Vector3Msg();
-        }
-        Scale.MergeFrom(other.Scale);
+      if (other.X != 0F) {
+        X = other.X;
+      }
+      if (other.Y != 0F) {
+        Y = other.Y;
+      }
+      if (other.Z != 0F) {
+        Z = other.Z;
       }
       _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
     }
@@ -571,29 +659,28 @@ namespace Core.Network {
           default:
             _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
             break;
-          case 10: {
-            Name = input.ReadString();
+          case 8: {
+            SectorX = input.ReadSInt32();
             break;
           }
-          case 18: {
-            if (position_ == null) {
-              Position = new global::Core.Network.Vector3Msg();
-            }
-            input.ReadMessage(Position);
+          case 16: {
+            SectorY = input.ReadSInt32();
             break;
           }
-          case 26: {
-            if (rotation_ == null) {
-              Rotation = new global::Core.Network.Vector3Msg();
-            }
-            input.ReadMessage(Rotation);
+          case 24: {
+            SectorZ = input.ReadSInt32();
             break;
           }
-          case 34: {
-            if (scale_ == null) {
-              Scale = new global::Core.Network.Vector3Msg();
-            }
-            input.ReadMessage(Scale);
+          case 37: {
+            X = input.ReadFloat();
+            break;
+          }
+          case 45: {
+            Y = input.ReadFloat();
+            break;
+          }
+          case 53: {
+            Z = input.ReadFloat();
             break;
           }
         }
@@ -611,29 +698,28 @@ namespace Core.Network {
           default:
             _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
             break;
-          case 10: {
-            Name = input.ReadString();
+          case 8: {
+            SectorX = input.ReadSInt32();
             break;
           }
-          case 18: {
-            if (position_ == null) {
-              Position = new global::Core.Network.Vector3Msg();
-            }
-            input.ReadMessage(Position);
+          case 16: {
+            SectorY = input.ReadSInt32();
             break;
           }
-          case 26: {
-            if (rotation_ == null) {
-              Rotation = new global::Core.Network.Vector3Msg();
-            }
-            input.ReadMessage(Rotation);
+          case 24: {
+            SectorZ = input.ReadSInt32();
             break;
           }
-          case 34: {
-            if (scale_ == null) {
-              Scale = new global::Core.Network.Vector3Msg();
-            }
-            input.ReadMessage(Scale);
+          case 37: {
+            X = input.ReadFloat();
+            break;
+          }
+          case 45: {
+            Y = input.ReadFloat();
+            break;
+          }
+          case 53: {
+            Z = input.ReadFloat();
             break;
           }
         }
@@ -643,20 +729,17 @@ namespace Core.Network {
 
   }
 
-  /// <summary>
-  /// Command Request (Python -> Unity)
-  /// </summary>
   [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
-  public sealed partial class CommandMsg : pb::IMessage<CommandMsg>
+  public sealed partial class TransformMsg : pb::IMessage<TransformMsg>
   #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
       , pb::IBufferMessage
   #endif
   {
-    private static readonly pb::MessageParser<CommandMsg> _parser = new pb::MessageParser<CommandMsg>(() => new CommandMsg());
+    private static readonly pb::MessageParser<TransformMsg> _parser = new pb::MessageParser<TransformMsg>(() => new TransformMsg());
     private pb::UnknownFieldSet _unknownFields;
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public static pb::MessageParser<CommandMsg> Parser { get { return _parser; } }
+    public static pb::MessageParser<TransformMsg> Parser { get { return _parser; } }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
@@ -672,7 +755,7 @@ namespace Core.Network {
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public CommandMsg() {
+    public TransformMsg() {
       OnConstruction();
     }
 
@@ -680,90 +763,2891 @@ namespace Core.Network {
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public CommandMsg(CommandMsg other) : this() {
-      action_ = other.action_;
-      target_ = other.target_;
-      payloadJson_ = other.payloadJson_;
-      vectorPayload_ = other.vectorPayload_ != null ? other.vectorPayload_.Clone() : null;
+    public TransformMsg(TransformMsg other) : this() {
+      name_ = other.name_;
+      position_ = other.position_ != null ? other.position_.Clone() : null;
+      rotation_ = other.rotation_ != null ? other.rotation_.Clone() : null;
+      scale_ = other.scale_ != null ? other.scale_.Clone() : null;
+      worldPosition_ = other.worldPosition_ != null ? other.worldPosition_.Clone() : null;
       _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
     }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public CommandMsg Clone() {
-      return new CommandMsg(this);
+    public TransformMsg Clone() {
+      return new TransformMsg(this);
+    }
+
+    /// <summary>Field number for the "name" field.</summary>
+    public const int NameFieldNumber = 1;
+    private string name_ = "";
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string Name {
+      get { return name_; }
+      set {
+        name_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "position" field.</summary>
+    public const int PositionFieldNumber = 2;
+    private global::Core.Network.Vector3Msg position_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.Vector3Msg Position {
+      get { return position_; }
+      set {
+        position_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "rotation" field.</summary>
+    public const int RotationFieldNumber = 3;
+    private global::Core.Network.Vector3Msg rotation_;
+    /// <summary>
+    /// Euler angles
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.Vector3Msg Rotation {
+      get { return rotation_; }
+      set {
+        rotation_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "scale" field.</summary>
+    public const int ScaleFieldNumber = 4;
+    private global::Core.Network.Vector3Msg scale_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.Vector3Msg Scale {
+      get { return scale_; }
+      set {
+        scale_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "world_position" field.</summary>
+    public const int WorldPositionFieldNumber = 5;
+    private global::Core.Network.SectorVector3Msg worldPosition_;
+    /// <summary>
+    /// VirtualTransform / WorldMover objects only
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.SectorVector3Msg WorldPosition {
+      get { return worldPosition_; }
+      set {
+        worldPosition_ = value;
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as TransformMsg);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(TransformMsg other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (Name != other.Name) return false;
+      if (!object.Equals(Position, other.Position)) return false;
+      if (!object.Equals(Rotation, other.Rotation)) return false;
+      if (!object.Equals(Scale, other.Scale)) return false;
+      if (!object.Equals(WorldPosition, other.WorldPosition)) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (Name.Length != 0) hash ^= Name.GetHashCode();
+      if (position_ != null) hash ^= Position.GetHashCode();
+      if (rotation_ != null) hash ^= Rotation.GetHashCode();
+      if (scale_ != null) hash ^= Scale.GetHashCode();
+      if (worldPosition_ != null) hash ^= WorldPosition.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (Name.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteString(Name);
+      }
+      if (position_ != null) {
+        output.WriteRawTag(18);
+        output.WriteMessage(Position);
+      }
+      if (rotation_ != null) {
+        output.WriteRawTag(26);
+        output.WriteMessage(Rotation);
+      }
+      if (scale_ != null) {
+        output.WriteRawTag(34);
+        output.WriteMessage(Scale);
+      }
+      if (worldPosition_ != null) {
+        output.WriteRawTag(42);
+        output.WriteMessage(WorldPosition);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (Name.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteString(Name);
+      }
+      if (position_ != null) {
+        output.WriteRawTag(18);
+        output.WriteMessage(Position);
+      }
+      if (rotation_ != null) {
+        output.WriteRawTag(26);
+        output.WriteMessage(Rotation);
+      }
+      if (scale_ != null) {
+        output.WriteRawTag(34);
+        output.WriteMessage(Scale);
+      }
+      if (worldPosition_ != null) {
+        output.WriteRawTag(42);
+        output.WriteMessage(WorldPosition);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (Name.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(Name);
+      }
+      if (position_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(Position);
+      }
+      if (rotation_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(Rotation);
+      }
+      if (scale_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(Scale);
+      }
+      if (worldPosition_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(WorldPosition);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(TransformMsg other) {
+      if (other == null) {
+        return;
+      }
+      if (other.Name.Length != 0) {
+        Name = other.Name;
+      }
+      if (other.position_ != null) {
+        if (position_ == null) {
+          Position = new global::Core.Network.Vector3Msg();
+        }
+        Position.MergeFrom(other.Position);
+      }
+      if (other.rotation_ != null) {
+        if (rotation_ == null) {
+          Rotation = new global::Core.Network.Vector3Msg();
+        }
+        Rotation.MergeFrom(other.Rotation);
+      }
+      if (other.scale_ != null) {
+        if (scale_ == null) {
+          Scale = new global::Core.Network.Vector3Msg();
+        }
+        Scale.MergeFrom(other.Scale);
+      }
+      if (other.worldPosition_ != null) {
+        if (worldPosition_ == null) {
+          WorldPosition = new global::Core.Network.SectorVector3Msg();
+        }
+        WorldPosition.MergeFrom(other.WorldPosition);
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 10: {
+            Name = input.ReadString();
+            break;
+          }
+          case 18: {
+            if (position_ == null) {
+              Position = new global::Core.Network.Vector3Msg();
+            }
+            input.ReadMessage(Position);
+            break;
+          }
+          case 26: {
+            if (rotation_ == null) {
+              Rotation = new global::Core.Network.Vector3Msg();
+            }
+            input.ReadMessage(Rotation);
+            break;
+          }
+          case 34: {
+            if (scale_ == null) {
+              Scale = new global::Core.Network.Vector3Msg();
+            }
+            input.ReadMessage(Scale);
+            break;
+          }
+          case 42: {
+            if (worldPosition_ == null) {
+              WorldPosition = new global::Core.Network.SectorVector3Msg();
+            }
+            input.ReadMessage(WorldPosition);
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 10: {
+            Name = input.ReadString();
+            break;
+          }
+          case 18: {
+            if (position_ == null) {
+              Position = new global::Core.Network.Vector3Msg();
+            }
+            input.ReadMessage(Position);
+            break;
+          }
+          case 26: {
+            if (rotation_ == null) {
+              Rotation = new global::Core.Network.Vector3Msg();
+            }
+            input.ReadMessage(Rotation);
+            break;
+          }
+          case 34: {
+            if (scale_ == null) {
+              Scale = new global::Core.Network.Vector3Msg();
+            }
+            input.ReadMessage(Scale);
+            break;
+          }
+          case 42: {
+            if (worldPosition_ == null) {
+              WorldPosition = new global::Core.Network.SectorVector3Msg();
+            }
+            input.ReadMessage(WorldPosition);
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  /// <summary>
+  /// Bulk transform update (action "set_transforms")
+  /// Objects are addressed by name or by the integer handles Unity returned for those names.
+  /// Buffers are packed little-endian float32 x,y,z triples, one per object.
+  /// </summary>
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class TransformBatchMsg : pb::IMessage<TransformBatchMsg>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<TransformBatchMsg> _parser = new pb::MessageParser<TransformBatchMsg>(() => new TransformBatchMsg());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<TransformBatchMsg> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Core.Network.GameStateReflection.Descriptor.MessageTypes[3]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public TransformBatchMsg() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public TransformBatchMsg(TransformBatchMsg other) : this() {
+      names_ = other.names_.Clone();
+      handles_ = other.handles_.Clone();
+      positions_ = other.positions_;
+      rotations_ = other.rotations_;
+      sectors_ = other.sectors_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public TransformBatchMsg Clone() {
+      return new TransformBatchMsg(this);
+    }
+
+    /// <summary>Field number for the "names" field.</summary>
+    public const int NamesFieldNumber = 1;
+    private static readonly pb::FieldCodec<string> _repeated_names_codec
+        = pb::FieldCodec.ForString(10);
+    private readonly pbc::RepeatedField<string> names_ = new pbc::RepeatedField<string>();
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<string> Names {
+      get { return names_; }
+    }
+
+    /// <summary>Field number for the "handles" field.</summary>
+    public const int HandlesFieldNumber = 2;
+    private static readonly pb::FieldCodec<int> _repeated_handles_codec
+        = pb::FieldCodec.ForInt32(18);
+    private readonly pbc::RepeatedField<int> handles_ = new pbc::RepeatedField<int>();
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<int> Handles {
+      get { return handles_; }
+    }
+
+    /// <summary>Field number for the "positions" field.</summary>
+    public const int PositionsFieldNumber = 3;
+    private pb::ByteString positions_ = pb::ByteString.Empty;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString Positions {
+      get { return positions_; }
+      set {
+        positions_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "rotations" field.</summary>
+    public const int RotationsFieldNumber = 4;
+    private pb::ByteString rotations_ = pb::ByteString.Empty;
+    /// <summary>
+    /// Euler angles, optional
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString Rotations {
+      get { return rotations_; }
+      set {
+        rotations_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "sectors" field.</summary>
+    public const int SectorsFieldNumber = 5;
+    private pb::ByteString sectors_ = pb::ByteString.Empty;
+    /// <summary>
+    /// Optional packed little-endian int32 sector triples; positions are then offsets
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString Sectors {
+      get { return sectors_; }
+      set {
+        sectors_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as TransformBatchMsg);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(TransformBatchMsg other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if(!names_.Equals(other.names_)) return false;
+      if(!handles_.Equals(other.handles_)) return false;
+      if (Positions != other.Positions) return false;
+      if (Rotations != other.Rotations) return false;
+      if (Sectors != other.Sectors) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      hash ^= names_.GetHashCode();
+      hash ^= handles_.GetHashCode();
+      if (Positions.Length != 0) hash ^= Positions.GetHashCode();
+      if (Rotations.Length != 0) hash ^= Rotations.GetHashCode();
+      if (Sectors.Length != 0) hash ^= Sectors.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      names_.WriteTo(output, _repeated_names_codec);
+      handles_.WriteTo(output, _repeated_handles_codec);
+      if (Positions.Length != 0) {
+        output.WriteRawTag(26);
+        output.WriteBytes(Positions);
+      }
+      if (Rotations.Length != 0) {
+        output.WriteRawTag(34);
+        output.WriteBytes(Rotations);
+      }
+      if (Sectors.Length != 0) {
+        output.WriteRawTag(42);
+        output.WriteBytes(Sectors);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      names_.WriteTo(ref output, _repeated_names_codec);
+      handles_.WriteTo(ref output, _repeated_handles_codec);
+      if (Positions.Length != 0) {
+        output.WriteRawTag(26);
+        output.WriteBytes(Positions);
+      }
+      if (Rotations.Length != 0) {
+        output.WriteRawTag(34);
+        output.WriteBytes(Rotations);
+      }
+      if (Sectors.Length != 0) {
+        output.WriteRawTag(42);
+        output.WriteBytes(Sectors);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      size += names_.CalculateSize(_repeated_names_codec);
+      size += handles_.CalculateSize(_repeated_handles_codec);
+      if (Positions.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(Positions);
+      }
+      if (Rotations.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(Rotations);
+      }
+      if (Sectors.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(Sectors);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(TransformBatchMsg other) {
+      if (other == null) {
+        return;
+      }
+      names_.Add(other.names_);
+      handles_.Add(other.handles_);
+      if (other.Positions.Length != 0) {
+        Positions = other.Positions;
+      }
+      if (other.Rotations.Length != 0) {
+        Rotations = other.Rotations;
+      }
+      if (other.Sectors.Length != 0) {
+        Sectors = other.Sectors;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 10: {
+            names_.AddEntriesFrom(input, _repeated_names_codec);
+            break;
+          }
+          case 18:
+          case 16: {
+            handles_.AddEntriesFrom(input, _repeated_handles_codec);
+            break;
+          }
+          case 26: {
+            Positions = input.ReadBytes();
+            break;
+          }
+          case 34: {
+            Rotations = input.ReadBytes();
+            break;
+          }
+          case 42: {
+            Sectors = input.ReadBytes();
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 10: {
+            names_.AddEntriesFrom(ref input, _repeated_names_codec);
+            break;
+          }
+          case 18:
+          case 16: {
+            handles_.AddEntriesFrom(ref input, _repeated_handles_codec);
+            break;
+          }
+          case 26: {
+            Positions = input.ReadBytes();
+            break;
+          }
+          case 34: {
+            Rotations = input.ReadBytes();
+            break;
+          }
+          case 42: {
+            Sectors = input.ReadBytes();
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  /// <summary>
+  /// Command Request (Python -> Unity)
+  /// </summary>
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class CommandMsg : pb::IMessage<CommandMsg>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<CommandMsg> _parser = new pb::MessageParser<CommandMsg>(() => new CommandMsg());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<CommandMsg> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Core.Network.GameStateReflection.Descriptor.MessageTypes[4]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public CommandMsg() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public CommandMsg(CommandMsg other) : this() {
+      action_ = other.action_;
+      target_ = other.target_;
+      payloadJson_ = other.payloadJson_;
+      vectorPayload_ = other.vectorPayload_ != null ? other.vectorPayload_.Clone() : null;
+      transformBatch_ = other.transformBatch_ != null ? other.transformBatch_.Clone() : null;
+      batch_ = other.batch_ != null ? other.batch_.Clone() : null;
+      worldPayload_ = other.worldPayload_ != null ? other.worldPayload_.Clone() : null;
+      instanceIds_ = other.instanceIds_.Clone();
+      mesh_ = other.mesh_ != null ? other.mesh_.Clone() : null;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public CommandMsg Clone() {
+      return new CommandMsg(this);
+    }
+
+    /// <summary>Field number for the "action" field.</summary>
+    public const int ActionFieldNumber = 1;
+    private string action_ = "";
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string Action {
+      get { return action_; }
+      set {
+        action_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "target" field.</summary>
+    public const int TargetFieldNumber = 2;
+    private string target_ = "";
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string Target {
+      get { return target_; }
+      set {
+        target_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "payload_json" field.</summary>
+    public const int PayloadJsonFieldNumber = 3;
+    private string payloadJson_ = "";
+    /// <summary>
+    /// Fallback for complex data
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string PayloadJson {
+      get { return payloadJson_; }
+      set {
+        payloadJson_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "vector_payload" field.</summary>
+    public const int VectorPayloadFieldNumber = 4;
+    private global::Core.Network.Vector3Msg vectorPayload_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.Vector3Msg VectorPayload {
+      get { return vectorPayload_; }
+      set {
+        vectorPayload_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "transform_batch" field.</summary>
+    public const int TransformBatchFieldNumber = 5;
+    private global::Core.Network.TransformBatchMsg transformBatch_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.TransformBatchMsg TransformBatch {
+      get { return transformBatch_; }
+      set {
+        transformBatch_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "batch" field.</summary>
+    public const int BatchFieldNumber = 6;
+    private global::Core.Network.CommandBatchMsg batch_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.CommandBatchMsg Batch {
+      get { return batch_; }
+      set {
+        batch_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "world_payload" field.</summary>
+    public const int WorldPayloadFieldNumber = 7;
+    private global::Core.Network.SectorVector3Msg worldPayload_;
+    /// <summary>
+    /// set_transform: used instead of vector_payload when set
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.SectorVector3Msg WorldPayload {
+      get { return worldPayload_; }
+      set {
+        worldPayload_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "instance_ids" field.</summary>
+    public const int InstanceIdsFieldNumber = 8;
+    private static readonly pb::FieldCodec<int> _repeated_instanceIds_codec
+        = pb::FieldCodec.ForInt32(66);
+    private readonly pbc::RepeatedField<int> instanceIds_ = new pbc::RepeatedField<int>();
+    /// <summary>
+    /// destroy_instances: exact objects (HierarchyMsg.instance_ids)
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<int> InstanceIds {
+      get { return instanceIds_; }
+    }
+
+    /// <summary>Field number for the "mesh" field.</summary>
+    public const int MeshFieldNumber = 9;
+    private global::Core.Network.MeshUploadMsg mesh_;
+    /// <summary>
+    /// upload_mesh / mesh_chunk
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.MeshUploadMsg Mesh {
+      get { return mesh_; }
+      set {
+        mesh_ = value;
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as CommandMsg);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(CommandMsg other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (Action != other.Action) return false;
+      if (Target != other.Target) return false;
+      if (PayloadJson != other.PayloadJson) return false;
+      if (!object.Equals(VectorPayload, other.VectorPayload)) return false;
+      if (!object.Equals(TransformBatch, other.TransformBatch)) return false;
+      if (!object.Equals(Batch, other.Batch)) return false;
+      if (!object.Equals(WorldPayload, other.WorldPayload)) return false;
+      if(!instanceIds_.Equals(other.instanceIds_)) return false;
+      if (!object.Equals(Mesh, other.Mesh)) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (Action.Length != 0) hash ^= Action.GetHashCode();
+      if (Target.Length != 0) hash ^= Target.GetHashCode();
+      if (PayloadJson.Length != 0) hash ^= PayloadJson.GetHashCode();
+      if (vectorPayload_ != null) hash ^= VectorPayload.GetHashCode();
+      if (transformBatch_ != null) hash ^= TransformBatch.GetHashCode();
+      if (batch_ != null) hash ^= Batch.GetHashCode();
+      if (worldPayload_ != null) hash ^= WorldPayload.GetHashCode();
+      hash ^= instanceIds_.GetHashCode();
+      if (mesh_ != null) hash ^= Mesh.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (Action.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteString(Action);
+      }
+      if (Target.Length != 0) {
+        output.WriteRawTag(18);
+        output.WriteString(Target);
+      }
+      if (PayloadJson.Length != 0) {
+        output.WriteRawTag(26);
+        output.WriteString(PayloadJson);
+      }
+      if (vectorPayload_ != null) {
+        output.WriteRawTag(34);
+        output.WriteMessage(VectorPayload);
+      }
+      if (transformBatch_ != null) {
+        output.WriteRawTag(42);
+        output.WriteMessage(TransformBatch);
+      }
+      if (batch_ != null) {
+        output.WriteRawTag(50);
+        output.WriteMessage(Batch);
+      }
+      if (worldPayload_ != null) {
+        output.WriteRawTag(58);
+        output.WriteMessage(WorldPayload);
+      }
+      instanceIds_.WriteTo(output, _repeated_instanceIds_codec);
+      if (mesh_ != null) {
+        output.WriteRawTag(74);
+        output.WriteMessage(Mesh);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (Action.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteString(Action);
+      }
+      if (Target.Length != 0) {
+        output.WriteRawTag(18);
+        output.WriteString(Target);
+      }
+      if (PayloadJson.Length != 0) {
+        output.WriteRawTag(26);
+        output.WriteString(PayloadJson);
+      }
+      if (vectorPayload_ != null) {
+        output.WriteRawTag(34);
+        output.WriteMessage(VectorPayload);
+      }
+      if (transformBatch_ != null) {
+        output.WriteRawTag(42);
+        output.WriteMessage(TransformBatch);
+      }
+      if (batch_ != null) {
+        output.WriteRawTag(50);
+        output.WriteMessage(Batch);
+      }
+      if (worldPayload_ != null) {
+        output.WriteRawTag(58);
+        output.WriteMessage(WorldPayload);
+      }
+      instanceIds_.WriteTo(ref output, _repeated_instanceIds_codec);
+      if (mesh_ != null) {
+        output.WriteRawTag(74);
+        output.WriteMessage(Mesh);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (Action.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(Action);
+      }
+      if (Target.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(Target);
+      }
+      if (PayloadJson.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(PayloadJson);
+      }
+      if (vectorPayload_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(VectorPayload);
+      }
+      if (transformBatch_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(TransformBatch);
+      }
+      if (batch_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(Batch);
+      }
+      if (worldPayload_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(WorldPayload);
+      }
+      size += instanceIds_.CalculateSize(_repeated_instanceIds_codec);
+      if (mesh_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(Mesh);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(CommandMsg other) {
+      if (other == null) {
+        return;
+      }
+      if (other.Action.Length != 0) {
+        Action = other.Action;
+      }
+      if (other.Target.Length != 0) {
+        Target = other.Target;
+      }
+      if (other.PayloadJson.Length != 0) {
+        PayloadJson = other.PayloadJson;
+      }
+      if (other.vectorPayload_ != null) {
+        if (vectorPayload_ == null) {
+          VectorPayload = new global::Core.Network.Vector3Msg();
+        }
+        VectorPayload.MergeFrom(other.VectorPayload);
+      }
+      if (other.transformBatch_ != null) {
+        if (transformBatch_ == null) {
+          TransformBatch = new global::Core.Network.TransformBatchMsg();
+        }
+        TransformBatch.MergeFrom(other.TransformBatch);
+      }
+      if (other.batch_ != null) {
+        if (batch_ == null) {
+          Batch = new global::Core.Network.CommandBatchMsg();
+        }
+        Batch.MergeFrom(other.Batch);
+      }
+      if (other.worldPayload_ != null) {
+        if (worldPayload_ == null) {
+          WorldPayload = new global::Core.Network.SectorVector3Msg();
+        }
+        WorldPayload.MergeFrom(other.WorldPayload);
+      }
+      instanceIds_.Add(other.instanceIds_);
+      if (other.mesh_ != null) {
+        if (mesh_ == null) {
+          Mesh = new global::Core.Network.MeshUploadMsg();
+        }
+        Mesh.MergeFrom(other.Mesh);
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 10: {
+            Action = input.ReadString();
+            break;
+          }
+          case 18: {
+            Target = input.ReadString();
+            break;
+          }
+          case 26: {
+            PayloadJson = input.ReadString();
+            break;
+          }
+          case 34: {
+            if (vectorPayload_ == null) {
+              VectorPayload = new global::Core.Network.Vector3Msg();
+            }
+            input.ReadMessage(VectorPayload);
+            break;
+          }
+          case 42: {
+            if (transformBatch_ == null) {
+              TransformBatch = new global::Core.Network.TransformBatchMsg();
+            }
+            input.ReadMessage(TransformBatch);
+            break;
+          }
+          case 50: {
+            if (batch_ == null) {
+              Batch = new global::Core.Network.CommandBatchMsg();
+            }
+            input.ReadMessage(Batch);
+            break;
+          }
+          case 58: {
+            if (worldPayload_ == null) {
+              WorldPayload = new global::Core.Network.SectorVector3Msg();
+            }
+            input.ReadMessage(WorldPayload);
+            break;
+          }
+          case 66:
+          case 64: {
+            instanceIds_.AddEntriesFrom(input, _repeated_instanceIds_codec);
+            break;
+          }
+          case 74: {
+            if (mesh_ == null) {
+              Mesh = new global::Core.Network.MeshUploadMsg();
+            }
+            input.ReadMessage(Mesh);
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 10: {
+            Action = input.ReadString();
+            break;
+          }
+          case 18: {
+            Target = input.ReadString();
+            break;
+          }
+          case 26: {
+            PayloadJson = input.ReadString();
+            break;
+          }
+          case 34: {
+            if (vectorPayload_ == null) {
+              VectorPayload = new global::Core.Network.Vector3Msg();
+            }
+            input.ReadMessage(VectorPayload);
+            break;
+          }
+          case 42: {
+            if (transformBatch_ == null) {
+              TransformBatch = new global::Core.Network.TransformBatchMsg();
+            }
+            input.ReadMessage(TransformBatch);
+            break;
+          }
+          case 50: {
+            if (batch_ == null) {
+              Batch = new global::Core.Network.CommandBatchMsg();
+            }
+            input.ReadMessage(Batch);
+            break;
+          }
+          case 58: {
+            if (worldPayload_ == null) {
+              WorldPayload = new global::Core.Network.SectorVector3Msg();
+            }
+            input.ReadMessage(WorldPayload);
+            break;
+          }
+          case 66:
+          case 64: {
+            instanceIds_.AddEntriesFrom(ref input, _repeated_instanceIds_codec);
+            break;
+          }
+          case 74: {
+            if (mesh_ == null) {
+              Mesh = new global::Core.Network.MeshUploadMsg();
+            }
+            input.ReadMessage(Mesh);
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  /// <summary>
+  /// Mesh upload (actions "upload_mesh" and "mesh_chunk", target = object to receive it).
+  /// The mesh is one packed little-endian buffer, planar:
+  ///   float32 x,y,z * vertex_count | [float32 normals * vertex_count] | [float32 u,v * vertex_count] | indices
+  /// "upload_mesh" carries only this header: Unity answers "ok: cached" when it already has a mesh
+  /// with the same hash and layout (and assigns it), otherwise "ok: need &lt;offset>".
+  /// "mesh_chunk" repeats the header plus offset; the bytes themselves travel as extra ZeroMQ
+  /// frames after the CommandMsg (no protobuf copy). The last chunk builds and assigns the mesh.
+  /// </summary>
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class MeshUploadMsg : pb::IMessage<MeshUploadMsg>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<MeshUploadMsg> _parser = new pb::MessageParser<MeshUploadMsg>(() => new MeshUploadMsg());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<MeshUploadMsg> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Core.Network.GameStateReflection.Descriptor.MessageTypes[5]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public MeshUploadMsg() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public MeshUploadMsg(MeshUploadMsg other) : this() {
+      hash_ = other.hash_;
+      meshName_ = other.meshName_;
+      vertexCount_ = other.vertexCount_;
+      indexCount_ = other.indexCount_;
+      index32_ = other.index32_;
+      hasNormals_ = other.hasNormals_;
+      hasUv_ = other.hasUv_;
+      totalBytes_ = other.totalBytes_;
+      offset_ = other.offset_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public MeshUploadMsg Clone() {
+      return new MeshUploadMsg(this);
+    }
+
+    /// <summary>Field number for the "hash" field.</summary>
+    public const int HashFieldNumber = 1;
+    private string hash_ = "";
+    /// <summary>
+    /// SHA-256 hex of the packed buffer
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string Hash {
+      get { return hash_; }
+      set {
+        hash_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "mesh_name" field.</summary>
+    public const int MeshNameFieldNumber = 2;
+    private string meshName_ = "";
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public string MeshName {
+      get { return meshName_; }
+      set {
+        meshName_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "vertex_count" field.</summary>
+    public const int VertexCountFieldNumber = 3;
+    private int vertexCount_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int VertexCount {
+      get { return vertexCount_; }
+      set {
+        vertexCount_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "index_count" field.</summary>
+    public const int IndexCountFieldNumber = 4;
+    private int indexCount_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int IndexCount {
+      get { return indexCount_; }
+      set {
+        indexCount_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "index32" field.</summary>
+    public const int Index32FieldNumber = 5;
+    private bool index32_;
+    /// <summary>
+    /// uint32 indices (else uint16)
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Index32 {
+      get { return index32_; }
+      set {
+        index32_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "has_normals" field.</summary>
+    public const int HasNormalsFieldNumber = 6;
+    private bool hasNormals_;
+    /// <summary>
+    /// Otherwise Unity recalculates them
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool HasNormals {
+      get { return hasNormals_; }
+      set {
+        hasNormals_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "has_uv" field.</summary>
+    public const int HasUvFieldNumber = 7;
+    private bool hasUv_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool HasUv {
+      get { return hasUv_; }
+      set {
+        hasUv_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "total_bytes" field.</summary>
+    public const int TotalBytesFieldNumber = 8;
+    private int totalBytes_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int TotalBytes {
+      get { return totalBytes_; }
+      set {
+        totalBytes_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "offset" field.</summary>
+    public const int OffsetFieldNumber = 9;
+    private int offset_;
+    /// <summary>
+    /// mesh_chunk: where the attached bytes go
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int Offset {
+      get { return offset_; }
+      set {
+        offset_ = value;
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as MeshUploadMsg);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(MeshUploadMsg other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (Hash != other.Hash) return false;
+      if (MeshName != other.MeshName) return false;
+      if (VertexCount != other.VertexCount) return false;
+      if (IndexCount != other.IndexCount) return false;
+      if (Index32 != other.Index32) return false;
+      if (HasNormals != other.HasNormals) return false;
+      if (HasUv != other.HasUv) return false;
+      if (TotalBytes != other.TotalBytes) return false;
+      if (Offset != other.Offset) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (Hash.Length != 0) hash ^= Hash.GetHashCode();
+      if (MeshName.Length != 0) hash ^= MeshName.GetHashCode();
+      if (VertexCount != 0) hash ^= VertexCount.GetHashCode();
+      if (IndexCount != 0) hash ^= IndexCount.GetHashCode();
+      if (Index32 != false) hash ^= Index32.GetHashCode();
+      if (HasNormals != false) hash ^= HasNormals.GetHashCode();
+      if (HasUv != false) hash ^= HasUv.GetHashCode();
+      if (TotalBytes != 0) hash ^= TotalBytes.GetHashCode();
+      if (Offset != 0) hash ^= Offset.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (Hash.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteString(Hash);
+      }
+      if (MeshName.Length != 0) {
+        output.WriteRawTag(18);
+        output.WriteString(MeshName);
+      }
+      if (VertexCount != 0) {
+        output.WriteRawTag(24);
+        output.WriteInt32(VertexCount);
+      }
+      if (IndexCount != 0) {
+        output.WriteRawTag(32);
+        output.WriteInt32(IndexCount);
+      }
+      if (Index32 != false) {
+        output.WriteRawTag(40);
+        output.WriteBool(Index32);
+      }
+      if (HasNormals != false) {
+        output.WriteRawTag(48);
+        output.WriteBool(HasNormals);
+      }
+      if (HasUv != false) {
+        output.WriteRawTag(56);
+        output.WriteBool(HasUv);
+      }
+      if (TotalBytes != 0) {
+        output.WriteRawTag(64);
+        output.WriteInt32(TotalBytes);
+      }
+      if (Offset != 0) {
+        output.WriteRawTag(72);
+        output.WriteInt32(Offset);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (Hash.Length != 0) {
+        output.WriteRawTag(10);
+        output.WriteString(Hash);
+      }
+      if (MeshName.Length != 0) {
+        output.WriteRawTag(18);
+        output.WriteString(MeshName);
+      }
+      if (VertexCount != 0) {
+        output.WriteRawTag(24);
+        output.WriteInt32(VertexCount);
+      }
+      if (IndexCount != 0) {
+        output.WriteRawTag(32);
+        output.WriteInt32(IndexCount);
+      }
+      if (Index32 != false) {
+        output.WriteRawTag(40);
+        output.WriteBool(Index32);
+      }
+      if (HasNormals != false) {
+        output.WriteRawTag(48);
+        output.WriteBool(HasNormals);
+      }
+      if (HasUv != false) {
+        output.WriteRawTag(56);
+        output.WriteBool(HasUv);
+      }
+      if (TotalBytes != 0) {
+        output.WriteRawTag(64);
+        output.WriteInt32(TotalBytes);
+      }
+      if (Offset != 0) {
+        output.WriteRawTag(72);
+        output.WriteInt32(Offset);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (Hash.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(Hash);
+      }
+      if (MeshName.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeStringSize(MeshName);
+      }
+      if (VertexCount != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(VertexCount);
+      }
+      if (IndexCount != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(IndexCount);
+      }
+      if (Index32 != false) {
+        size += 1 + 1;
+      }
+      if (HasNormals != false) {
+        size += 1 + 1;
+      }
+      if (HasUv != false) {
+        size += 1 + 1;
+      }
+      if (TotalBytes != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(TotalBytes);
+      }
+      if (Offset != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(Offset);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(MeshUploadMsg other) {
+      if (other == null) {
+        return;
+      }
+      if (other.Hash.Length != 0) {
+        Hash = other.Hash;
+      }
+      if (other.MeshName.Length != 0) {
+        MeshName = other.MeshName;
+      }
+      if (other.VertexCount != 0) {
+        VertexCount = other.VertexCount;
+      }
+      if (other.IndexCount != 0) {
+        IndexCount = other.IndexCount;
+      }
+      if (other.Index32 != false) {
+        Index32 = other.Index32;
+      }
+      if (other.HasNormals != false) {
+        HasNormals = other.HasNormals;
+      }
+      if (other.HasUv != false) {
+        HasUv = other.HasUv;
+      }
+      if (other.TotalBytes != 0) {
+        TotalBytes = other.TotalBytes;
+      }
+      if (other.Offset != 0) {
+        Offset = other.Offset;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 10: {
+            Hash = input.ReadString();
+            break;
+          }
+          case 18: {
+            MeshName = input.ReadString();
+            break;
+          }
+          case 24: {
+            VertexCount = input.ReadInt32();
+            break;
+          }
+          case 32: {
+            IndexCount = input.ReadInt32();
+            break;
+          }
+          case 40: {
+            Index32 = input.ReadBool();
+            break;
+          }
+          case 48: {
+            HasNormals = input.ReadBool();
+            break;
+          }
+          case 56: {
+            HasUv = input.ReadBool();
+            break;
+          }
+          case 64: {
+            TotalBytes = input.ReadInt32();
+            break;
+          }
+          case 72: {
+            Offset = input.ReadInt32();
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 10: {
+            Hash = input.ReadString();
+            break;
+          }
+          case 18: {
+            MeshName = input.ReadString();
+            break;
+          }
+          case 24: {
+            VertexCount = input.ReadInt32();
+            break;
+          }
+          case 32: {
+            IndexCount = input.ReadInt32();
+            break;
+          }
+          case 40: {
+            Index32 = input.ReadBool();
+            break;
+          }
+          case 48: {
+            HasNormals = input.ReadBool();
+            break;
+          }
+          case 56: {
+            HasUv = input.ReadBool();
+            break;
+          }
+          case 64: {
+            TotalBytes = input.ReadInt32();
+            break;
+          }
+          case 72: {
+            Offset = input.ReadInt32();
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  /// <summary>
+  /// Several commands run back-to-back in one editor frame (action "batch")
+  /// </summary>
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class CommandBatchMsg : pb::IMessage<CommandBatchMsg>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<CommandBatchMsg> _parser = new pb::MessageParser<CommandBatchMsg>(() => new CommandBatchMsg());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<CommandBatchMsg> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Core.Network.GameStateReflection.Descriptor.MessageTypes[6]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public CommandBatchMsg() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public CommandBatchMsg(CommandBatchMsg other) : this() {
+      commands_ = other.commands_.Clone();
+      stopOnError_ = other.stopOnError_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public CommandBatchMsg Clone() {
+      return new CommandBatchMsg(this);
+    }
+
+    /// <summary>Field number for the "commands" field.</summary>
+    public const int CommandsFieldNumber = 1;
+    private static readonly pb::FieldCodec<global::Core.Network.CommandMsg> _repeated_commands_codec
+        = pb::FieldCodec.ForMessage(10, global::Core.Network.CommandMsg.Parser);
+    private readonly pbc::RepeatedField<global::Core.Network.CommandMsg> commands_ = new pbc::RepeatedField<global::Core.Network.CommandMsg>();
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<global::Core.Network.CommandMsg> Commands {
+      get { return commands_; }
+    }
+
+    /// <summary>Field number for the "stop_on_error" field.</summary>
+    public const int StopOnErrorFieldNumber = 2;
+    private bool stopOnError_;
+    /// <summary>
+    /// Remaining commands are reported as "skipped"
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool StopOnError {
+      get { return stopOnError_; }
+      set {
+        stopOnError_ = value;
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as CommandBatchMsg);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(CommandBatchMsg other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if(!commands_.Equals(other.commands_)) return false;
+      if (StopOnError != other.StopOnError) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      hash ^= commands_.GetHashCode();
+      if (StopOnError != false) hash ^= StopOnError.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      commands_.WriteTo(output, _repeated_commands_codec);
+      if (StopOnError != false) {
+        output.WriteRawTag(16);
+        output.WriteBool(StopOnError);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      commands_.WriteTo(ref output, _repeated_commands_codec);
+      if (StopOnError != false) {
+        output.WriteRawTag(16);
+        output.WriteBool(StopOnError);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      size += commands_.CalculateSize(_repeated_commands_codec);
+      if (StopOnError != false) {
+        size += 1 + 1;
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(CommandBatchMsg other) {
+      if (other == null) {
+        return;
+      }
+      commands_.Add(other.commands_);
+      if (other.StopOnError != false) {
+        StopOnError = other.StopOnError;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 10: {
+            commands_.AddEntriesFrom(input, _repeated_commands_codec);
+            break;
+          }
+          case 16: {
+            StopOnError = input.ReadBool();
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 10: {
+            commands_.AddEntriesFrom(ref input, _repeated_commands_codec);
+            break;
+          }
+          case 16: {
+            StopOnError = input.ReadBool();
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  /// <summary>
+  /// Whole scene tree as flat columns (action "get_hierarchy_columnar").
+  /// Nodes are in pre-order (a parent always precedes its children); node i is
+  /// described by element i of every per-node buffer. Buffers are packed little-endian.
+  /// </summary>
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class HierarchyMsg : pb::IMessage<HierarchyMsg>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<HierarchyMsg> _parser = new pb::MessageParser<HierarchyMsg>(() => new HierarchyMsg());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<HierarchyMsg> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Core.Network.GameStateReflection.Descriptor.MessageTypes[7]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public HierarchyMsg() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public HierarchyMsg(HierarchyMsg other) : this() {
+      count_ = other.count_;
+      names_ = other.names_.Clone();
+      components_ = other.components_.Clone();
+      componentSets_ = other.componentSets_.Clone();
+      parents_ = other.parents_;
+      nameIds_ = other.nameIds_;
+      setIds_ = other.setIds_;
+      positions_ = other.positions_;
+      active_ = other.active_;
+      instanceIds_ = other.instanceIds_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public HierarchyMsg Clone() {
+      return new HierarchyMsg(this);
+    }
+
+    /// <summary>Field number for the "count" field.</summary>
+    public const int CountFieldNumber = 1;
+    private int count_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int Count {
+      get { return count_; }
+      set {
+        count_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "names" field.</summary>
+    public const int NamesFieldNumber = 2;
+    private static readonly pb::FieldCodec<string> _repeated_names_codec
+        = pb::FieldCodec.ForString(18);
+    private readonly pbc::RepeatedField<string> names_ = new pbc::RepeatedField<string>();
+    /// <summary>
+    /// Interned name table
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<string> Names {
+      get { return names_; }
+    }
+
+    /// <summary>Field number for the "components" field.</summary>
+    public const int ComponentsFieldNumber = 3;
+    private static readonly pb::FieldCodec<string> _repeated_components_codec
+        = pb::FieldCodec.ForString(26);
+    private readonly pbc::RepeatedField<string> components_ = new pbc::RepeatedField<string>();
+    /// <summary>
+    /// Interned component type names
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<string> Components {
+      get { return components_; }
+    }
+
+    /// <summary>Field number for the "component_sets" field.</summary>
+    public const int ComponentSetsFieldNumber = 4;
+    private static readonly pb::FieldCodec<global::Core.Network.ComponentSetMsg> _repeated_componentSets_codec
+        = pb::FieldCodec.ForMessage(34, global::Core.Network.ComponentSetMsg.Parser);
+    private readonly pbc::RepeatedField<global::Core.Network.ComponentSetMsg> componentSets_ = new pbc::RepeatedField<global::Core.Network.ComponentSetMsg>();
+    /// <summary>
+    /// Distinct component combinations
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<global::Core.Network.ComponentSetMsg> ComponentSets {
+      get { return componentSets_; }
+    }
+
+    /// <summary>Field number for the "parents" field.</summary>
+    public const int ParentsFieldNumber = 5;
+    private pb::ByteString parents_ = pb::ByteString.Empty;
+    /// <summary>
+    /// int32 per node: parent node index, -1 for scene roots
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString Parents {
+      get { return parents_; }
+      set {
+        parents_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "name_ids" field.</summary>
+    public const int NameIdsFieldNumber = 6;
+    private pb::ByteString nameIds_ = pb::ByteString.Empty;
+    /// <summary>
+    /// int32 per node: index into names
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString NameIds {
+      get { return nameIds_; }
+      set {
+        nameIds_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "set_ids" field.</summary>
+    public const int SetIdsFieldNumber = 7;
+    private pb::ByteString setIds_ = pb::ByteString.Empty;
+    /// <summary>
+    /// int32 per node: index into component_sets
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString SetIds {
+      get { return setIds_; }
+      set {
+        setIds_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "positions" field.</summary>
+    public const int PositionsFieldNumber = 8;
+    private pb::ByteString positions_ = pb::ByteString.Empty;
+    /// <summary>
+    /// float32 x,y,z per node (world space)
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString Positions {
+      get { return positions_; }
+      set {
+        positions_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "active" field.</summary>
+    public const int ActiveFieldNumber = 9;
+    private pb::ByteString active_ = pb::ByteString.Empty;
+    /// <summary>
+    /// uint8 per node: activeSelf
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString Active {
+      get { return active_; }
+      set {
+        active_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    /// <summary>Field number for the "instance_ids" field.</summary>
+    public const int InstanceIdsFieldNumber = 10;
+    private pb::ByteString instanceIds_ = pb::ByteString.Empty;
+    /// <summary>
+    /// int32 per node: GameObject.GetInstanceID() (valid until the scene reloads)
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pb::ByteString InstanceIds {
+      get { return instanceIds_; }
+      set {
+        instanceIds_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as HierarchyMsg);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(HierarchyMsg other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (Count != other.Count) return false;
+      if(!names_.Equals(other.names_)) return false;
+      if(!components_.Equals(other.components_)) return false;
+      if(!componentSets_.Equals(other.componentSets_)) return false;
+      if (Parents != other.Parents) return false;
+      if (NameIds != other.NameIds) return false;
+      if (SetIds != other.SetIds) return false;
+      if (Positions != other.Positions) return false;
+      if (Active != other.Active) return false;
+      if (InstanceIds != other.InstanceIds) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (Count != 0) hash ^= Count.GetHashCode();
+      hash ^= names_.GetHashCode();
+      hash ^= components_.GetHashCode();
+      hash ^= componentSets_.GetHashCode();
+      if (Parents.Length != 0) hash ^= Parents.GetHashCode();
+      if (NameIds.Length != 0) hash ^= NameIds.GetHashCode();
+      if (SetIds.Length != 0) hash ^= SetIds.GetHashCode();
+      if (Positions.Length != 0) hash ^= Positions.GetHashCode();
+      if (Active.Length != 0) hash ^= Active.GetHashCode();
+      if (InstanceIds.Length != 0) hash ^= InstanceIds.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (Count != 0) {
+        output.WriteRawTag(8);
+        output.WriteInt32(Count);
+      }
+      names_.WriteTo(output, _repeated_names_codec);
+      components_.WriteTo(output, _repeated_components_codec);
+      componentSets_.WriteTo(output, _repeated_componentSets_codec);
+      if (Parents.Length != 0) {
+        output.WriteRawTag(42);
+        output.WriteBytes(Parents);
+      }
+      if (NameIds.Length != 0) {
+        output.WriteRawTag(50);
+        output.WriteBytes(NameIds);
+      }
+      if (SetIds.Length != 0) {
+        output.WriteRawTag(58);
+        output.WriteBytes(SetIds);
+      }
+      if (Positions.Length != 0) {
+        output.WriteRawTag(66);
+        output.WriteBytes(Positions);
+      }
+      if (Active.Length != 0) {
+        output.WriteRawTag(74);
+        output.WriteBytes(Active);
+      }
+      if (InstanceIds.Length != 0) {
+        output.WriteRawTag(82);
+        output.WriteBytes(InstanceIds);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (Count != 0) {
+        output.WriteRawTag(8);
+        output.WriteInt32(Count);
+      }
+      names_.WriteTo(ref output, _repeated_names_codec);
+      components_.WriteTo(ref output, _repeated_components_codec);
+      componentSets_.WriteTo(ref output, _repeated_componentSets_codec);
+      if (Parents.Length != 0) {
+        output.WriteRawTag(42);
+        output.WriteBytes(Parents);
+      }
+      if (NameIds.Length != 0) {
+        output.WriteRawTag(50);
+        output.WriteBytes(NameIds);
+      }
+      if (SetIds.Length != 0) {
+        output.WriteRawTag(58);
+        output.WriteBytes(SetIds);
+      }
+      if (Positions.Length != 0) {
+        output.WriteRawTag(66);
+        output.WriteBytes(Positions);
+      }
+      if (Active.Length != 0) {
+        output.WriteRawTag(74);
+        output.WriteBytes(Active);
+      }
+      if (InstanceIds.Length != 0) {
+        output.WriteRawTag(82);
+        output.WriteBytes(InstanceIds);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (Count != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(Count);
+      }
+      size += names_.CalculateSize(_repeated_names_codec);
+      size += components_.CalculateSize(_repeated_components_codec);
+      size += componentSets_.CalculateSize(_repeated_componentSets_codec);
+      if (Parents.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(Parents);
+      }
+      if (NameIds.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(NameIds);
+      }
+      if (SetIds.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(SetIds);
+      }
+      if (Positions.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(Positions);
+      }
+      if (Active.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(Active);
+      }
+      if (InstanceIds.Length != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeBytesSize(InstanceIds);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(HierarchyMsg other) {
+      if (other == null) {
+        return;
+      }
+      if (other.Count != 0) {
+        Count = other.Count;
+      }
+      names_.Add(other.names_);
+      components_.Add(other.components_);
+      componentSets_.Add(other.componentSets_);
+      if (other.Parents.Length != 0) {
+        Parents = other.Parents;
+      }
+      if (other.NameIds.Length != 0) {
+        NameIds = other.NameIds;
+      }
+      if (other.SetIds.Length != 0) {
+        SetIds = other.SetIds;
+      }
+      if (other.Positions.Length != 0) {
+        Positions = other.Positions;
+      }
+      if (other.Active.Length != 0) {
+        Active = other.Active;
+      }
+      if (other.InstanceIds.Length != 0) {
+        InstanceIds = other.InstanceIds;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 8: {
+            Count = input.ReadInt32();
+            break;
+          }
+          case 18: {
+            names_.AddEntriesFrom(input, _repeated_names_codec);
+            break;
+          }
+          case 26: {
+            components_.AddEntriesFrom(input, _repeated_components_codec);
+            break;
+          }
+          case 34: {
+            componentSets_.AddEntriesFrom(input, _repeated_componentSets_codec);
+            break;
+          }
+          case 42: {
+            Parents = input.ReadBytes();
+            break;
+          }
+          case 50: {
+            NameIds = input.ReadBytes();
+            break;
+          }
+          case 58: {
+            SetIds = input.ReadBytes();
+            break;
+          }
+          case 66: {
+            Positions = input.ReadBytes();
+            break;
+          }
+          case 74: {
+            Active = input.ReadBytes();
+            break;
+          }
+          case 82: {
+            InstanceIds = input.ReadBytes();
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 8: {
+            Count = input.ReadInt32();
+            break;
+          }
+          case 18: {
+            names_.AddEntriesFrom(ref input, _repeated_names_codec);
+            break;
+          }
+          case 26: {
+            components_.AddEntriesFrom(ref input, _repeated_components_codec);
+            break;
+          }
+          case 34: {
+            componentSets_.AddEntriesFrom(ref input, _repeated_componentSets_codec);
+            break;
+          }
+          case 42: {
+            Parents = input.ReadBytes();
+            break;
+          }
+          case 50: {
+            NameIds = input.ReadBytes();
+            break;
+          }
+          case 58: {
+            SetIds = input.ReadBytes();
+            break;
+          }
+          case 66: {
+            Positions = input.ReadBytes();
+            break;
+          }
+          case 74: {
+            Active = input.ReadBytes();
+            break;
+          }
+          case 82: {
+            InstanceIds = input.ReadBytes();
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  /// <summary>
+  /// Editor frame timing since the previous "frame_stats" request (ZeroMQBridge Update intervals)
+  /// </summary>
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class FrameStatsMsg : pb::IMessage<FrameStatsMsg>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<FrameStatsMsg> _parser = new pb::MessageParser<FrameStatsMsg>(() => new FrameStatsMsg());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<FrameStatsMsg> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Core.Network.GameStateReflection.Descriptor.MessageTypes[8]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public FrameStatsMsg() {
+      OnConstruction();
+    }
+
+    partial void OnConstruction();
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public FrameStatsMsg(FrameStatsMsg other) : this() {
+      meanMs_ = other.meanMs_;
+      p95Ms_ = other.p95Ms_;
+      maxMs_ = other.maxMs_;
+      samples_ = other.samples_;
+      objectCount_ = other.objectCount_;
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public FrameStatsMsg Clone() {
+      return new FrameStatsMsg(this);
+    }
+
+    /// <summary>Field number for the "mean_ms" field.</summary>
+    public const int MeanMsFieldNumber = 1;
+    private float meanMs_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public float MeanMs {
+      get { return meanMs_; }
+      set {
+        meanMs_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "p95_ms" field.</summary>
+    public const int P95MsFieldNumber = 2;
+    private float p95Ms_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public float P95Ms {
+      get { return p95Ms_; }
+      set {
+        p95Ms_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "max_ms" field.</summary>
+    public const int MaxMsFieldNumber = 3;
+    private float maxMs_;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public float MaxMs {
+      get { return maxMs_; }
+      set {
+        maxMs_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "samples" field.</summary>
+    public const int SamplesFieldNumber = 4;
+    private int samples_;
+    /// <summary>
+    /// Frames measured
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int Samples {
+      get { return samples_; }
+      set {
+        samples_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "object_count" field.</summary>
+    public const int ObjectCountFieldNumber = 5;
+    private int objectCount_;
+    /// <summary>
+    /// GameObjects in the active scene
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int ObjectCount {
+      get { return objectCount_; }
+      set {
+        objectCount_ = value;
+      }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override bool Equals(object other) {
+      return Equals(other as FrameStatsMsg);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public bool Equals(FrameStatsMsg other) {
+      if (ReferenceEquals(other, null)) {
+        return false;
+      }
+      if (ReferenceEquals(other, this)) {
+        return true;
+      }
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(MeanMs, other.MeanMs)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(P95Ms, other.P95Ms)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(MaxMs, other.MaxMs)) return false;
+      if (Samples != other.Samples) return false;
+      if (ObjectCount != other.ObjectCount) return false;
+      return Equals(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override int GetHashCode() {
+      int hash = 1;
+      if (MeanMs != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(MeanMs);
+      if (P95Ms != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(P95Ms);
+      if (MaxMs != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(MaxMs);
+      if (Samples != 0) hash ^= Samples.GetHashCode();
+      if (ObjectCount != 0) hash ^= ObjectCount.GetHashCode();
+      if (_unknownFields != null) {
+        hash ^= _unknownFields.GetHashCode();
+      }
+      return hash;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public override string ToString() {
+      return pb::JsonFormatter.ToDiagnosticString(this);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void WriteTo(pb::CodedOutputStream output) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      output.WriteRawMessage(this);
+    #else
+      if (MeanMs != 0F) {
+        output.WriteRawTag(13);
+        output.WriteFloat(MeanMs);
+      }
+      if (P95Ms != 0F) {
+        output.WriteRawTag(21);
+        output.WriteFloat(P95Ms);
+      }
+      if (MaxMs != 0F) {
+        output.WriteRawTag(29);
+        output.WriteFloat(MaxMs);
+      }
+      if (Samples != 0) {
+        output.WriteRawTag(32);
+        output.WriteInt32(Samples);
+      }
+      if (ObjectCount != 0) {
+        output.WriteRawTag(40);
+        output.WriteInt32(ObjectCount);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(output);
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
+      if (MeanMs != 0F) {
+        output.WriteRawTag(13);
+        output.WriteFloat(MeanMs);
+      }
+      if (P95Ms != 0F) {
+        output.WriteRawTag(21);
+        output.WriteFloat(P95Ms);
+      }
+      if (MaxMs != 0F) {
+        output.WriteRawTag(29);
+        output.WriteFloat(MaxMs);
+      }
+      if (Samples != 0) {
+        output.WriteRawTag(32);
+        output.WriteInt32(Samples);
+      }
+      if (ObjectCount != 0) {
+        output.WriteRawTag(40);
+        output.WriteInt32(ObjectCount);
+      }
+      if (_unknownFields != null) {
+        _unknownFields.WriteTo(ref output);
+      }
+    }
+    #endif
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public int CalculateSize() {
+      int size = 0;
+      if (MeanMs != 0F) {
+        size += 1 + 4;
+      }
+      if (P95Ms != 0F) {
+        size += 1 + 4;
+      }
+      if (MaxMs != 0F) {
+        size += 1 + 4;
+      }
+      if (Samples != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(Samples);
+      }
+      if (ObjectCount != 0) {
+        size += 1 + pb::CodedOutputStream.ComputeInt32Size(ObjectCount);
+      }
+      if (_unknownFields != null) {
+        size += _unknownFields.CalculateSize();
+      }
+      return size;
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(FrameStatsMsg other) {
+      if (other == null) {
+        return;
+      }
+      if (other.MeanMs != 0F) {
+        MeanMs = other.MeanMs;
+      }
+      if (other.P95Ms != 0F) {
+        P95Ms = other.P95Ms;
+      }
+      if (other.MaxMs != 0F) {
+        MaxMs = other.MaxMs;
+      }
+      if (other.Samples != 0) {
+        Samples = other.Samples;
+      }
+      if (other.ObjectCount != 0) {
+        ObjectCount = other.ObjectCount;
+      }
+      _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public void MergeFrom(pb::CodedInputStream input) {
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      input.ReadRawMessage(this);
+    #else
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
+            break;
+          case 13: {
+            MeanMs = input.ReadFloat();
+            break;
+          }
+          case 21: {
+            P95Ms = input.ReadFloat();
+            break;
+          }
+          case 29: {
+            MaxMs = input.ReadFloat();
+            break;
+          }
+          case 32: {
+            Samples = input.ReadInt32();
+            break;
+          }
+          case 40: {
+            ObjectCount = input.ReadInt32();
+            break;
+          }
+        }
+      }
+    #endif
+    }
+
+    #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    void pb::IBufferMessage.InternalMergeFrom(ref pb::ParseContext input) {
+      uint tag;
+      while ((tag = input.ReadTag()) != 0) {
+        switch(tag) {
+          default:
+            _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
+            break;
+          case 13: {
+            MeanMs = input.ReadFloat();
+            break;
+          }
+          case 21: {
+            P95Ms = input.ReadFloat();
+            break;
+          }
+          case 29: {
+            MaxMs = input.ReadFloat();
+            break;
+          }
+          case 32: {
+            Samples = input.ReadInt32();
+            break;
+          }
+          case 40: {
+            ObjectCount = input.ReadInt32();
+            break;
+          }
+        }
+      }
+    }
+    #endif
+
+  }
+
+  [global::System.Diagnostics.DebuggerDisplayAttribute("{ToString(),nq}")]
+  public sealed partial class ComponentSetMsg : pb::IMessage<ComponentSetMsg>
+  #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
+      , pb::IBufferMessage
+  #endif
+  {
+    private static readonly pb::MessageParser<ComponentSetMsg> _parser = new pb::MessageParser<ComponentSetMsg>(() => new ComponentSetMsg());
+    private pb::UnknownFieldSet _unknownFields;
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pb::MessageParser<ComponentSetMsg> Parser { get { return _parser; } }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public static pbr::MessageDescriptor Descriptor {
+      get { return global::Core.Network.GameStateReflection.Descriptor.MessageTypes[9]; }
+    }
+
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    pbr::MessageDescriptor pb::IMessage.Descriptor {
+      get { return Descriptor; }
     }
 
-    /// <summary>Field number for the "action" field.</summary>
-    public const int ActionFieldNumber = 1;
-    private string action_ = "";
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public string Action {
-      get { return action_; }
-      set {
-        action_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
-      }
+    public ComponentSetMsg() {
+      OnConstruction();
     }
 
-    /// <summary>Field number for the "target" field.</summary>
-    public const int TargetFieldNumber = 2;
-    private string target_ = "";
+    partial void OnConstruction();
+
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public string Target {
-      get { return target_; }
-      set {
-        target_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
-      }
+    public ComponentSetMsg(ComponentSetMsg other) : this() {
+      components_ = other.components_.Clone();
+      _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
     }
 
-    /// <summary>Field number for the "payload_json" field.</summary>
-    public const int PayloadJsonFieldNumber = 3;
-    private string payloadJson_ = "";
-    /// <summary>
-    /// Fallback for complex data
-    /// </summary>
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public string PayloadJson {
-      get { return payloadJson_; }
-      set {
-        payloadJson_ = pb::ProtoPreconditions.CheckNotNull(value, "value");
-      }
+    public ComponentSetMsg Clone() {
+      return new ComponentSetMsg(this);
     }
 
-    /// <summary>Field number for the "vector_payload" field.</summary>
-    public const int VectorPayloadFieldNumber = 4;
-    private global::Core.Network.Vector3Msg vectorPayload_;
+    /// <summary>Field number for the "components" field.</summary>
+    public const int ComponentsFieldNumber = 1;
+    private static readonly pb::FieldCodec<int> _repeated_components_codec
+        = pb::FieldCodec.ForInt32(10);
+    private readonly pbc::RepeatedField<int> components_ = new pbc::RepeatedField<int>();
+    /// <summary>
+    /// Indices into HierarchyMsg.components
+    /// </summary>
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public global::Core.Network.Vector3Msg VectorPayload {
-      get { return vectorPayload_; }
-      set {
-        vectorPayload_ = value;
-      }
+    public pbc::RepeatedField<int> Components {
+      get { return components_; }
     }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public override bool Equals(object other) {
-      return Equals(other as CommandMsg);
+      return Equals(other as ComponentSetMsg);
     }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public bool Equals(CommandMsg other) {
+    public bool Equals(ComponentSetMsg other) {
       if (ReferenceEquals(other, null)) {
         return false;
       }
       if (ReferenceEquals(other, this)) {
         return true;
       }
-      if (Action != other.Action) return false;
-      if (Target != other.Target) return false;
-      if (PayloadJson != other.PayloadJson) return false;
-      if (!object.Equals(VectorPayload, other.VectorPayload)) return false;
+      if(!components_.Equals(other.components_)) return false;
       return Equals(_unknownFields, other._unknownFields);
     }
 
@@ -771,10 +3655,7 @@ namespace Core.Network {
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public override int GetHashCode() {
       int hash = 1;
-      if (Action.Length != 0) hash ^= Action.GetHashCode();
-      if (Target.Length != 0) hash ^= Target.GetHashCode();
-      if (PayloadJson.Length != 0) hash ^= PayloadJson.GetHashCode();
-      if (vectorPayload_ != null) hash ^= VectorPayload.GetHashCode();
+      hash ^= components_.GetHashCode();
       if (_unknownFields != null) {
         hash ^= _unknownFields.GetHashCode();
       }
@@ -793,22 +3674,7 @@ namespace Core.Network {
     #if !GOOGLE_PROTOBUF_REFSTRUCT_COMPATIBILITY_MODE
       output.WriteRawMessage(this);
     #else
-      if (Action.Length != 0) {
-        output.WriteRawTag(10);
-        output.WriteString(Action);
-      }
-      if (Target.Length != 0) {
-        output.WriteRawTag(18);
-        output.WriteString(Target);
-      }
-      if (PayloadJson.Length != 0) {
-        output.WriteRawTag(26);
-        output.WriteString(PayloadJson);
-      }
-      if (vectorPayload_ != null) {
-        output.WriteRawTag(34);
-        output.WriteMessage(VectorPayload);
-      }
+      components_.WriteTo(output, _repeated_components_codec);
       if (_unknownFields != null) {
         _unknownFields.WriteTo(output);
       }
@@ -819,22 +3685,7 @@ namespace Core.Network {
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     void pb::IBufferMessage.InternalWriteTo(ref pb::WriteContext output) {
-      if (Action.Length != 0) {
-        output.WriteRawTag(10);
-        output.WriteString(Action);
-      }
-      if (Target.Length != 0) {
-        output.WriteRawTag(18);
-        output.WriteString(Target);
-      }
-      if (PayloadJson.Length != 0) {
-        output.WriteRawTag(26);
-        output.WriteString(PayloadJson);
-      }
-      if (vectorPayload_ != null) {
-        output.WriteRawTag(34);
-        output.WriteMessage(VectorPayload);
-      }
+      components_.WriteTo(ref output, _repeated_components_codec);
       if (_unknownFields != null) {
         _unknownFields.WriteTo(ref output);
       }
@@ -845,18 +3696,7 @@ namespace Core.Network {
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public int CalculateSize() {
       int size = 0;
-      if (Action.Length != 0) {
-        size += 1 + pb::CodedOutputStream.ComputeStringSize(Action);
-      }
-      if (Target.Length != 0) {
-        size += 1 + pb::CodedOutputStream.ComputeStringSize(Target);
-      }
-      if (PayloadJson.Length != 0) {
-        size += 1 + pb::CodedOutputStream.ComputeStringSize(PayloadJson);
-      }
-      if (vectorPayload_ != null) {
-        size += 1 + pb::CodedOutputStream.ComputeMessageSize(VectorPayload);
-      }
+      size += components_.CalculateSize(_repeated_components_codec);
       if (_unknownFields != null) {
         size += _unknownFields.CalculateSize();
       }
@@ -865,25 +3705,11 @@ namespace Core.Network {
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
-    public void MergeFrom(CommandMsg other) {
+    public void MergeFrom(ComponentSetMsg other) {
       if (other == null) {
         return;
       }
-      if (other.Action.Length != 0) {
-        Action = other.Action;
-      }
-      if (other.Target.Length != 0) {
-        Target = other.Target;
-      }
-      if (other.PayloadJson.Length != 0) {
-        PayloadJson = other.PayloadJson;
-      }
-      if (other.vectorPayload_ != null) {
-        if (vectorPayload_ == null) {
-          VectorPayload = new global::Core.Network.Vector3Msg();
-        }
-        VectorPayload.MergeFrom(other.VectorPayload);
-      }
+      components_.Add(other.components_);
       _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
     }
 
@@ -899,23 +3725,9 @@ namespace Core.Network {
           default:
             _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, input);
             break;
-          case 10: {
-            Action = input.ReadString();
-            break;
-          }
-          case 18: {
-            Target = input.ReadString();
-            break;
-          }
-          case 26: {
-            PayloadJson = input.ReadString();
-            break;
-          }
-          case 34: {
-            if (vectorPayload_ == null) {
-              VectorPayload = new global::Core.Network.Vector3Msg();
-            }
-            input.ReadMessage(VectorPayload);
+          case 10:
+          case 8: {
+            components_.AddEntriesFrom(input, _repeated_components_codec);
             break;
           }
         }
@@ -933,23 +3745,9 @@ namespace Core.Network {
           default:
             _unknownFields = pb::UnknownFieldSet.MergeFieldFrom(_unknownFields, ref input);
             break;
-          case 10: {
-            Action = input.ReadString();
-            break;
-          }
-          case 18: {
-            Target = input.ReadString();
-            break;
-          }
-          case 26: {
-            PayloadJson = input.ReadString();
-            break;
-          }
-          case 34: {
-            if (vectorPayload_ == null) {
-              VectorPayload = new global::Core.Network.Vector3Msg();
-            }
-            input.ReadMessage(VectorPayload);
+          case 10:
+          case 8: {
+            components_.AddEntriesFrom(ref input, _repeated_components_codec);
             break;
           }
         }
@@ -977,7 +3775,7 @@ namespace Core.Network {
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public static pbr::MessageDescriptor Descriptor {
-      get { return global::Core.Network.GameStateReflection.Descriptor.MessageTypes[3]; }
+      get { return global::Core.Network.GameStateReflection.Descriptor.MessageTypes[10]; }
     }
 
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
@@ -1000,6 +3798,13 @@ namespace Core.Network {
       timestamp_ = other.timestamp_;
       entities_ = other.entities_.Clone();
       status_ = other.status_;
+      handles_ = other.handles_.Clone();
+      results_ = other.results_.Clone();
+      queueMs_ = other.queueMs_;
+      execMs_ = other.execMs_;
+      hierarchy_ = other.hierarchy_ != null ? other.hierarchy_.Clone() : null;
+      frameStats_ = other.frameStats_ != null ? other.frameStats_.Clone() : null;
+      instanceIds_ = other.instanceIds_.Clone();
       _unknownFields = pb::UnknownFieldSet.Clone(other._unknownFields);
     }
 
@@ -1044,6 +3849,108 @@ namespace Core.Network {
       }
     }
 
+    /// <summary>Field number for the "handles" field.</summary>
+    public const int HandlesFieldNumber = 4;
+    private static readonly pb::FieldCodec<int> _repeated_handles_codec
+        = pb::FieldCodec.ForInt32(34);
+    private readonly pbc::RepeatedField<int> handles_ = new pbc::RepeatedField<int>();
+    /// <summary>
+    /// set_transforms: handle per requested name (-1 = not found)
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<int> Handles {
+      get { return handles_; }
+    }
+
+    /// <summary>Field number for the "results" field.</summary>
+    public const int ResultsFieldNumber = 5;
+    private static readonly pb::FieldCodec<global::Core.Network.GameStateMsg> _repeated_results_codec
+        = pb::FieldCodec.ForMessage(42, global::Core.Network.GameStateMsg.Parser);
+    private readonly pbc::RepeatedField<global::Core.Network.GameStateMsg> results_ = new pbc::RepeatedField<global::Core.Network.GameStateMsg>();
+    /// <summary>
+    /// batch: one reply per command, in order
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<global::Core.Network.GameStateMsg> Results {
+      get { return results_; }
+    }
+
+    /// <summary>Field number for the "queue_ms" field.</summary>
+    public const int QueueMsFieldNumber = 6;
+    private float queueMs_;
+    /// <summary>
+    /// Time the request waited in ZeroMQBridge.commandQueue
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public float QueueMs {
+      get { return queueMs_; }
+      set {
+        queueMs_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "exec_ms" field.</summary>
+    public const int ExecMsFieldNumber = 7;
+    private float execMs_;
+    /// <summary>
+    /// Main-thread execution time
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public float ExecMs {
+      get { return execMs_; }
+      set {
+        execMs_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "hierarchy" field.</summary>
+    public const int HierarchyFieldNumber = 8;
+    private global::Core.Network.HierarchyMsg hierarchy_;
+    /// <summary>
+    /// get_hierarchy_columnar
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.HierarchyMsg Hierarchy {
+      get { return hierarchy_; }
+      set {
+        hierarchy_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "frame_stats" field.</summary>
+    public const int FrameStatsFieldNumber = 9;
+    private global::Core.Network.FrameStatsMsg frameStats_;
+    /// <summary>
+    /// frame_stats
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public global::Core.Network.FrameStatsMsg FrameStats {
+      get { return frameStats_; }
+      set {
+        frameStats_ = value;
+      }
+    }
+
+    /// <summary>Field number for the "instance_ids" field.</summary>
+    public const int InstanceIdsFieldNumber = 10;
+    private static readonly pb::FieldCodec<int> _repeated_instanceIds_codec
+        = pb::FieldCodec.ForInt32(82);
+    private readonly pbc::RepeatedField<int> instanceIds_ = new pbc::RepeatedField<int>();
+    /// <summary>
+    /// create: GetInstanceID() of the new object (destroy_instances)
+    /// </summary>
+    [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
+    [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
+    public pbc::RepeatedField<int> InstanceIds {
+      get { return instanceIds_; }
+    }
+
     [global::System.Diagnostics.DebuggerNonUserCodeAttribute]
     [global::System.CodeDom.Compiler.GeneratedCode("protoc", null)]
     public override bool Equals(object other) {
@@ -1062,6 +3969,13 @@ namespace Core.Network {
       if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(Timestamp, other.Timestamp)) return false;
       if(!entities_.Equals(other.entities_)) return false;
       if (Status != other.Status) return false;
+      if(!handles_.Equals(other.handles_)) return false;
+      if(!results_.Equals(other.results_)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(QueueMs, other.QueueMs)) return false;
+      if (!pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.Equals(ExecMs, other.ExecMs)) return false;
+      if (!object.Equals(Hierarchy, other.Hierarchy)) return false;
+      if (!object.Equals(FrameStats, other.FrameStats)) return false;
+      if(!instanceIds_.Equals(other.instanceIds_)) return false;
       return Equals(_unknownFields, other._unknownFields);
     }
 
@@ -1072,6 +3986,13 @@ namespace Core.Network {
       if (Timestamp != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(Timestamp);
       hash ^= entities_.GetHashCode();
       if (Status.Length != 0) hash ^= Status.GetHashCode();
+      hash ^= handles_.GetHashCode();
+      hash ^= results_.GetHashCode();
+      if (QueueMs != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(QueueMs);
+      if (ExecMs != 0F) hash ^= pbc::ProtobufEqualityComparers.BitwiseSingleEqualityComparer.GetHashCode(ExecMs);
+      if (hierarchy_ != null) hash ^= Hierarchy.GetHashCode();
+      if (frameStats_ != null) hash ^= FrameStats.GetHashCode();
+      hash ^= instanceIds_.GetHashCode();
       if (_unknownFields != null) {
         hash ^= _unknownFields.GetHashCode();
       }
@@ -1099,6 +4020,25 @@ namespace Core.Network {
         output.WriteRawTag(26);
         output.WriteString(Status);
       }
+      handles_.WriteTo(output, _repeated_handles_codec);
+      results_.WriteTo(output, _repeated_results_codec);
+      if (QueueMs != 0F) {
+        output.WriteRawTag(53);
+        output.WriteFloat(QueueMs);
+      }
+      if (ExecMs != 0F) {
+        output.WriteRawTag(61);
+        output.WriteFloat(ExecMs);
+      }
+      if (hierarchy_ != null) {
+        output.WriteRawTag(66);
+        output.WriteMessage(Hierarchy);
+      }
+      if (frameStats_ != null) {
+        output.WriteRawTag(74);
+        output.WriteMessage(FrameStats);
+      }
+      instanceIds_.WriteTo(output, _repeated_instanceIds_codec);
       if (_unknownFields != null) {
         _unknownFields.WriteTo(output);
       }
@@ -1118,6 +4058,25 @@ namespace Core.Network {
         output.WriteRawTag(26);
         output.WriteString(Status);
       }
+      handles_.WriteTo(ref output, _repeated_handles_codec);
+      results_.WriteTo(ref output, _repeated_results_codec);
+      if (QueueMs != 0F) {
+        output.WriteRawTag(53);
+        output.WriteFloat(QueueMs);
+      }
+      if (ExecMs != 0F) {
+        output.WriteRawTag(61);
+        output.WriteFloat(ExecMs);
+      }
+      if (hierarchy_ != null) {
+        output.WriteRawTag(66);
+        output.WriteMessage(Hierarchy);
+      }
+      if (frameStats_ != null) {
+        output.WriteRawTag(74);
+        output.WriteMessage(FrameStats);
+      }
+      instanceIds_.WriteTo(ref output, _repeated_instanceIds_codec);
       if (_unknownFields != null) {
         _unknownFields.WriteTo(ref output);
       }
@@ -1135,6 +4094,21 @@ namespace Core.Network {
       if (Status.Length != 0) {
         size += 1 + pb::CodedOutputStream.ComputeStringSize(Status);
       }
+      size += handles_.CalculateSize(_repeated_handles_codec);
+      size += results_.CalculateSize(_repeated_results_codec);
+      if (QueueMs != 0F) {
+        size += 1 + 4;
+      }
+      if (ExecMs != 0F) {
+        size += 1 + 4;
+      }
+      if (hierarchy_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(Hierarchy);
+      }
+      if (frameStats_ != null) {
+        size += 1 + pb::CodedOutputStream.ComputeMessageSize(FrameStats);
+      }
+      size += instanceIds_.CalculateSize(_repeated_instanceIds_codec);
       if (_unknownFields != null) {
         size += _unknownFields.CalculateSize();
       }
@@ -1154,6 +4128,27 @@ namespace Core.Network {
       if (other.Status.Length != 0) {
         Status = other.Status;
       }
+      handles_.Add(other.handles_);
+      results_.Add(other.results_);
+      if (other.QueueMs != 0F) {
+        QueueMs = other.QueueMs;
+      }
+      if (other.ExecMs != 0F) {
+        ExecMs = other.ExecMs;
+      }
+      if (other.hierarchy_ != null) {
+        if (hierarchy_ == null) {
+          Hierarchy = new global::Core.Network.HierarchyMsg();
+        }
+        Hierarchy.MergeFrom(other.Hierarchy);
+      }
+      if (other.frameStats_ != null) {
+        if (frameStats_ == null) {
+          FrameStats = new global::Core.Network.FrameStatsMsg();
+        }
+        FrameStats.MergeFrom(other.FrameStats);
+      }
+      instanceIds_.Add(other.instanceIds_);
       _unknownFields = pb::UnknownFieldSet.MergeFrom(_unknownFields, other._unknownFields);
     }
 
@@ -1181,6 +4176,42 @@ namespace Core.Network {
             Status = input.ReadString();
             break;
           }
+          case 34:
+          case 32: {
+            handles_.AddEntriesFrom(input, _repeated_handles_codec);
+            break;
+          }
+          case 42: {
+            results_.AddEntriesFrom(input, _repeated_results_codec);
+            break;
+          }
+          case 53: {
+            QueueMs = input.ReadFloat();
+            break;
+          }
+          case 61: {
+            ExecMs = input.ReadFloat();
+            break;
+          }
+          case 66: {
+            if (hierarchy_ == null) {
+              Hierarchy = new global::Core.Network.HierarchyMsg();
+            }
+            input.ReadMessage(Hierarchy);
+            break;
+          }
+          case 74: {
+            if (frameStats_ == null) {
+              FrameStats = new global::Core.Network.FrameStatsMsg();
+            }
+            input.ReadMessage(FrameStats);
+            break;
+          }
+          case 82:
+          case 80: {
+            instanceIds_.AddEntriesFrom(input, _repeated_instanceIds_codec);
+            break;
+          }
         }
       }
     #endif
@@ -1208,6 +4239,42 @@ namespace Core.Network {
             Status = input.ReadString();
             break;
           }
+          case 34:
+          case 32: {
+            handles_.AddEntriesFrom(ref input, _repeated_handles_codec);
+            break;
+          }
+          case 42: {
+            results_.AddEntriesFrom(ref input, _repeated_results_codec);
+            break;
+          }
+          case 53: {
+            QueueMs = input.ReadFloat();
+            break;
+          }
+          case 61: {
+            ExecMs = input.ReadFloat();
+            break;
+          }
+          case 66: {
+            if (hierarchy_ == null) {
+              Hierarchy = new global::Core.Network.HierarchyMsg();
+            }
+            input.ReadMessage(Hierarchy);
+            break;
+          }
+          case 74: {
+            if (frameStats_ == null) {
+              FrameStats = new global::Core.Network.FrameStatsMsg();
+            }
+            input.ReadMessage(FrameStats);
+            break;
+          }
+          case 82:
+          case 80: {
+            instanceIds_.AddEntriesFrom(ref input, _repeated_instanceIds_codec);
+            break;
+          }
         }
       }
     }
@@ -19,6 +19,29 @@ namespace Core
 
         public static Vector3d Zero => new Vector3d(0, 0, 0);
 
+        // Wire format for double positions (SectorVector3Msg): integer sector + float offset.
+        // Power of two so sector * SectorSize is exact.
+        public const double SectorSize = 1024.0;
+
+        public static Vector3d FromSector(long sx, long sy, long sz, float x, float y, float z)
+        {
+            return new Vector3d(sx * SectorSize + x, sy * SectorSize + y, sz * SectorSize + z);
+        }
+
+        public void ToSector(out int sx, out int sy, out int sz, out Vector3 offset)
+        {
+            double cx = Math.Round(x / SectorSize);
+            double cy = Math.Round(y / SectorSize);
+            double cz = Math.Round(z / SectorSize);
+            // int sectors reach +-2.2e12 units; past that the casts wrap (same limit as world_coords.encode)
+            if (!(Math.Abs(cx) <= int.MaxValue && Math.Abs(cy) <= int.MaxValue && Math.Abs(cz) <= int.MaxValue))
+                throw new System.OverflowException($"position {x},{y},{z} beyond +-{int.MaxValue * SectorSize:G3} units");
+            sx = (int)cx;
+            sy = (int)cy;
+            sz = (int)cz;
+            offset = new Vector3((float)(x - cx * SectorSize), (float)(y - cy * SectorSize), (float)(z - cz * SectorSize));
+        }
+
         public double Magnitude => Math.Sqrt(x * x + y * y + z * z);
         public double SqrMagnitude => x * x + y * y + z * z;
 
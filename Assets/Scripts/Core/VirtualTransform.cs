@@ -13,8 +13,12 @@ namespace Core
         private void Start()
         {
             // Initialize virtual position from initial Unity placement (relative to 0,0,0 start)
+            // unless it was already set (bridge create / set_transform with a double-precision position)
             initialUnityOffset = transform.position;
-            WorldPosition = new Vector3d(initialUnityOffset.x, initialUnityOffset.y, initialUnityOffset.z);
+            if (WorldPosition.SqrMagnitude == 0)
+            {
+                WorldPosition = new Vector3d(initialUnityOffset.x, initialUnityOffset.y, initialUnityOffset.z);
+            }
             
             if (WorldMover.Instance != null)
             {
@@ -2,6 +2,7 @@ using UnityEngine;
 using NetMQ;
 using NetMQ.Sockets;
 using System.Collections.Concurrent;
+using System.Collections.Generic;
 using System.Threading;
 using Google.Protobuf;
 using Core.Network; 
@@ -18,8 +19,55 @@ namespace Core
         private bool running = false;
         
         // Command Queue for Main Thread
-        private ConcurrentQueue<byte[]> commandQueue = new ConcurrentQueue<byte[]>();
+        private struct QueuedCommand
+        {
+            public byte[] Data;
+            public List<byte[]> Frames; // Extra ZeroMQ frames after the CommandMsg (mesh_chunk data), or null
+            public long ReceivedTicks; // Stopwatch timestamp, for GameStateMsg.QueueMs
+        }
+        private ConcurrentQueue<QueuedCommand> commandQueue = new ConcurrentQueue<QueuedCommand>();
         private ConcurrentQueue<byte[]> replyQueue = new ConcurrentQueue<byte[]>();
+
+        // set_transforms: handle <-> object cache (avoids one GameObject.Find per object per call)
+        private Dictionary<int, GameObject> handleObjects = new Dictionary<int, GameObject>();
+        private Dictionary<string, int> nameHandles = new Dictionary<string, int>();
+        private int nextHandle = 1;
+
+        // frame_stats: Update-to-Update intervals since the last request (ring buffer, newest wins)
+        private float[] frameTimes = new float[4096];
+        private int frameCount = 0;
+        private long lastFrameTicks = 0;
+
+        // create / set_property: component type name -> Type (assembly scan is slow)
+        private Dictionary<string, System.Type> typeCache = new Dictionary<string, System.Type>();
+
+        // upload_mesh / mesh_chunk: finished meshes by hash + layout (re-uploads are just assigned),
+        // and uploads still receiving chunks
+        private class PendingMesh
+        {
+            public byte[] Data;
+            public int Received; // Contiguous bytes from the start
+        }
+        private Dictionary<string, Mesh> meshCache = new Dictionary<string, Mesh>();
+        private Dictionary<string, PendingMesh> pendingMeshes = new Dictionary<string, PendingMesh>();
+        private const int MaxPendingMeshes = 4;
+        private List<byte[]> currentFrames; // Frames of the command being executed
+
+        [System.Serializable]
+        private class CreateSpec
+        {
+            public string primitive; // cube, sphere, capsule, cylinder, plane, quad; empty = bare GameObject
+            public string[] components;
+            public string parent;    // Optional: name of the object to parent under (world position kept)
+        }
+
+        [System.Serializable]
+        private class PropertySpec
+        {
+            public string type;
+            public string propertyName;
+            public string value;
+        }
         
         private void OnEnable()
         {
@@ -66,15 +114,27 @@ namespace Core
             AsyncIO.ForceDotNet.Force();
             using (server = new ResponseSocket("@tcp://127.0.0.1:5555"))
             {
+                // Replies still owed by the main thread for requests already answered with "error: timeout".
+                // They must be dropped, otherwise every later request gets the previous request's reply.
+                int staleReplies = 0;
                 while (running)
                 {
                     // Receive (Blocking)
                     // Use TryReceive to allow loop exit?
                     byte[] messageBytes;
-                    if (server.TryReceiveFrameBytes(System.TimeSpan.FromSeconds(0.1), out messageBytes))
+                    bool more;
+                    if (server.TryReceiveFrameBytes(System.TimeSpan.FromSeconds(0.1), out messageBytes, out more))
                     {
+                        // Raw data frames may follow the CommandMsg (mesh_chunk)
+                        List<byte[]> frames = null;
+                        while (more)
+                        {
+                            if (frames == null) frames = new List<byte[]>();
+                            frames.Add(server.ReceiveFrameBytes(out more));
+                        }
+
                         // Enqueue to Main Thread
-                        commandQueue.Enqueue(messageBytes);
+                        commandQueue.Enqueue(new QueuedCommand { Data = messageBytes, Frames = frames, ReceivedTicks = System.Diagnostics.Stopwatch.GetTimestamp() });
                         
                         // Wait for Reply from Main Thread
                         byte[] reply = null;
@@ -83,6 +143,12 @@ namespace Core
                         {
                             if (replyQueue.TryDequeue(out reply))
                             {
+                                if (staleReplies > 0)
+                                {
+                                    staleReplies--;
+                                    reply = null;
+                                    continue;
+                                }
                                 server.SendFrame(reply);
                                 break;
                             }
@@ -92,6 +158,7 @@ namespace Core
                         if (reply == null && running)
                         {
                             // Timeout / Error
+                            staleReplies++;
                             var err = new GameStateMsg { Status = "error: timeout" };
                             server.SendFrame(err.ToByteArray());
                         }
@@ -102,6 +169,7 @@ namespace Core
 
         private void Update()
         {
+            RecordFrameTime();
             ProcessCommandQueue();
             
             // Force Gravity Alignment in Editor
@@ -131,23 +199,99 @@ namespace Core
             }
         }
 
+        private void RecordFrameTime()
+        {
+            long now = System.Diagnostics.Stopwatch.GetTimestamp();
+            if (lastFrameTicks != 0)
+            {
+                frameTimes[frameCount % frameTimes.Length] = TicksToMs(now - lastFrameTicks);
+                frameCount++;
+            }
+            lastFrameTicks = now;
+        }
+
+        private FrameStatsMsg TakeFrameStats()
+        {
+            // Stats since the previous call, then start over
+            int n = Mathf.Min(frameCount, frameTimes.Length);
+            var stats = new FrameStatsMsg { Samples = n };
+            if (n > 0)
+            {
+                var sorted = new float[n];
+                System.Array.Copy(frameTimes, sorted, n);
+                System.Array.Sort(sorted);
+                float sum = 0f;
+                foreach (var t in sorted) sum += t;
+                stats.MeanMs = sum / n;
+                stats.P95Ms = sorted[Mathf.Min(n - 1, (int)(n * 0.95f))];
+                stats.MaxMs = sorted[n - 1];
+            }
+            frameCount = 0;
+
+            int objects = 0;
+            var stack = new Stack<Transform>();
+            foreach (var root in UnityEngine.SceneManagement.SceneManager.GetActiveScene().GetRootGameObjects())
+            {
+                stack.Push(root.transform);
+            }
+            while (stack.Count > 0)
+            {
+                var t = stack.Pop();
+                objects++;
+                for (int c = 0; c < t.childCount; c++) stack.Push(t.GetChild(c));
+            }
+            stats.ObjectCount = objects;
+            return stats;
+        }
+
         private void ProcessCommandQueue()
         {
-            if (commandQueue.TryDequeue(out byte[] data))
+            // One command per Update: the REP socket only takes the next request once the last one was
+            // answered, so a budgeted drain loop has nothing more to drain (more work per frame goes
+            // through "batch"; a backlog only builds behind requests already answered "error: timeout").
+            if (commandQueue.TryDequeue(out QueuedCommand item))
             {
-                byte[] response = ProcessCommand(data);
+                byte[] response = ProcessCommand(item);
                 replyQueue.Enqueue(response);
             }
         }
 
-        private byte[] ProcessCommand(byte[] data)
+        private byte[] ProcessCommand(QueuedCommand item)
+        {
+            long started = System.Diagnostics.Stopwatch.GetTimestamp();
+            GameStateMsg reply;
+            try
+            {
+                var cmd = CommandMsg.Parser.ParseFrom(item.Data);
+                currentFrames = item.Frames;
+                reply = ExecuteCommand(cmd);
+            }
+            catch (System.Exception e)
+            {
+                reply = new GameStateMsg { Timestamp = Time.time, Status = "error: " + e.Message };
+            }
+            finally
+            {
+                currentFrames = null;
+            }
+
+            // Server-side timing for client tracing (bridge_trace.py)
+            reply.QueueMs = TicksToMs(started - item.ReceivedTicks);
+            reply.ExecMs = TicksToMs(System.Diagnostics.Stopwatch.GetTimestamp() - started);
+            return reply.ToByteArray();
+        }
+
+        private static float TicksToMs(long ticks)
+        {
+            return (float)(ticks * 1000.0 / System.Diagnostics.Stopwatch.Frequency);
+        }
+
+        private GameStateMsg ExecuteCommand(CommandMsg cmd)
         {
             var reply = new GameStateMsg { Timestamp = Time.time, Status = "ok" };
             
             try
             {
-                var cmd = CommandMsg.Parser.ParseFrom(data);
-                
                 if (cmd.Action == "destroy")
                 {
                     GameObject obj = GameObject.Find(cmd.Target);
@@ -170,40 +314,34 @@ namespace Core
                 else if (cmd.Action == "set_transform")
                 {
                      GameObject obj = GameObject.Find(cmd.Target);
-                     if (obj && cmd.VectorPayload != null)
+                     if (obj && cmd.WorldPayload != null)
+                     {
+                         // Double precision (sector + offset)
+                         var w = cmd.WorldPayload;
+                         var newPos = Vector3d.FromSector(w.SectorX, w.SectorY, w.SectorZ, w.X, w.Y, w.Z);
+                         Debug.Log($"[ZeroMQ] SetTransform {cmd.Target} to {newPos}");
+                         ApplyPosition(obj, newPos);
+                     }
+                     else if (obj && cmd.VectorPayload != null)
                      {
                          var newPos = new Vector3d(cmd.VectorPayload.X, cmd.VectorPayload.Y, cmd.VectorPayload.Z);
                          Debug.Log($"[ZeroMQ] SetTransform {cmd.Target} to {newPos}");
-                         
-                         // 1. Check WorldMover (Player/Camera Origin)
-                         var wm = obj.GetComponent<WorldMover>();
-                         if (wm != null)
-                         {
-                             wm.VirtualPosition = newPos;
-                             // Force update
-                             wm.SendMessage("LateUpdate", SendMessageOptions.DontRequireReceiver);
-                         }
-                         // 2. Check VirtualTransform (Networked/Large Scale Objects)
-                         else 
-                         {
-                             var vt = obj.GetComponent<VirtualTransform>();
-                             if (vt != null)
-                             {
-                                 vt.WorldPosition = newPos;
-                             }
-                             
-                             // 3. Fallback to Unity Transform (Visual/Physics Local)
-                             // Note: If VT exists, WorldMover will likely overwrite this next frame, 
-                             // but setting VT above fixes that.
-                             // For non-VT objects, this moves them.
-                             obj.transform.position = newPos.ToVector3();
-                         }
+                         ApplyPosition(obj, newPos);
                      }
                      else
                      {
                          reply.Status = "error: not found or invalid payload";
                      }
                 }
+                else if (cmd.Action == "set_transforms")
+                {
+                    SetTransforms(cmd.TransformBatch, reply);
+                }
+                else if (cmd.Action == "batch")
+                {
+                    // All sub-commands run in this frame, one reply each
+                    ExecuteBatch(cmd.Batch, reply);
+                }
                 else if (cmd.Action == "init_universe")
                 {
                     var gen = FindFirstObjectByType<Procedural.UniverseGenerator>();
@@ -250,7 +388,54 @@ namespace Core
                          reply.Status = "error: verifier not found";
                      }
                 }
-                 else if (cmd.Action == "get_hierarchy")
+                else if (cmd.Action == "create")
+                {
+                    reply.Status = CreateObject(cmd, reply);
+                }
+                else if (cmd.Action == "set_property")
+                {
+                    GameObject obj = GameObject.Find(cmd.Target);
+                    reply.Status = obj ? SetProperty(obj, JsonUtility.FromJson<PropertySpec>(cmd.PayloadJson)) : "error: not found";
+                }
+                else if (cmd.Action == "get_property")
+                {
+                    reply.Status = GetProperty(cmd.Target, JsonUtility.FromJson<PropertySpec>(cmd.PayloadJson));
+                }
+                else if (cmd.Action == "get_world_mover")
+                {
+                    // Player virtual position (TransformMsg.WorldPosition), for streaming around it
+                    var wm = WorldMover.Instance != null ? WorldMover.Instance : FindFirstObjectByType<WorldMover>();
+                    if (wm) AddEntityToState(reply, wm.gameObject);
+                    else reply.Status = "error: no WorldMover";
+                }
+                else if (cmd.Action == "upload_mesh" || cmd.Action == "mesh_chunk")
+                {
+                    GameObject obj = GameObject.Find(cmd.Target);
+                    if (!obj) reply.Status = "error: not found";
+                    else if (cmd.Mesh == null) reply.Status = "error: missing mesh";
+                    else reply.Status = UploadMesh(obj, cmd.Mesh, cmd.Action == "mesh_chunk" ? currentFrames : null);
+                }
+                else if (cmd.Action == "frame_stats")
+                {
+                    reply.FrameStats = TakeFrameStats();
+                    reply.Status = $"ok: {reply.FrameStats.Samples} frames";
+                }
+                 else if (cmd.Action == "destroy_instances")
+                {
+                    // Exact objects (duplicates share names, so destroy-by-name is ambiguous)
+                    // A repeated id is still one object
+                    var ids = new HashSet<int>(cmd.InstanceIds);
+                    int destroyed = DestroyInstances(ids);
+                    int missing = ids.Count - destroyed;
+                    reply.Status = missing > 0 ? $"error: {missing} of {ids.Count} not found" : $"ok: {destroyed} destroyed";
+                }
+                else if (cmd.Action == "get_hierarchy_columnar")
+                {
+                    // Full scene tree as flat arrays (see HierarchyMsg)
+                    reply.Hierarchy = BuildColumnarHierarchy();
+                    reply.Status = $"ok: {reply.Hierarchy.Count} objects";
+                }
+                else if (cmd.Action == "get_hierarchy")
                 {
                     AddEntityToState(reply, GameObject.Find("GameRoot"));
                     
@@ -290,9 +475,588 @@ namespace Core
                 reply.Status = "error: " + e.Message;
             }
             
-            return reply.ToByteArray();
+            return reply;
+        }
+
+        private static int MeshBytes(MeshUploadMsg m)
+        {
+            int perVertex = 12 + (m.HasNormals ? 12 : 0) + (m.HasUv ? 8 : 0);
+            return m.VertexCount * perVertex + m.IndexCount * (m.Index32 ? 4 : 2);
+        }
+
+        private string UploadMesh(GameObject obj, MeshUploadMsg m, List<byte[]> frames)
+        {
+            // 1. Same content + layout already built: just assign it
+            string key = $"{m.Hash}/{m.VertexCount}/{m.IndexCount}/{m.Index32}/{m.HasNormals}/{m.HasUv}";
+            if (meshCache.TryGetValue(key, out Mesh cached) && cached != null)
+            {
+                AssignMesh(obj, cached);
+                return "ok: cached";
+            }
+            if (m.VertexCount <= 0 || m.IndexCount % 3 != 0 || MeshBytes(m) != m.TotalBytes)
+            {
+                return $"error: bad mesh layout ({m.TotalBytes} bytes for {m.VertexCount} vertices, {m.IndexCount} indices)";
+            }
+
+            // 2. Receive buffer (a repeated upload_mesh resumes where it stopped)
+            if (!pendingMeshes.TryGetValue(key, out PendingMesh pending))
+            {
+                if (pendingMeshes.Count >= MaxPendingMeshes) pendingMeshes.Clear(); // Abandoned uploads
+                pending = new PendingMesh { Data = new byte[m.TotalBytes] };
+                pendingMeshes[key] = pending;
+            }
+
+            // 3. Chunk data; anything past the received prefix is dropped and asked for again
+            if (frames != null && m.Offset <= pending.Received)
+            {
+                int pos = m.Offset;
+                foreach (var frame in frames)
+                {
+                    if (pos + frame.Length > pending.Data.Length) return "error: chunk past end of mesh";
+                    System.Buffer.BlockCopy(frame, 0, pending.Data, pos, frame.Length);
+                    pos += frame.Length;
+                }
+                pending.Received = Mathf.Max(pending.Received, pos);
+            }
+            if (pending.Received < pending.Data.Length) return $"ok: need {pending.Received}";
+
+            // 4. Complete: verify, build, assign
+            pendingMeshes.Remove(key);
+            string hash;
+            using (var sha = System.Security.Cryptography.SHA256.Create())
+            {
+                hash = System.BitConverter.ToString(sha.ComputeHash(pending.Data)).Replace("-", "").ToLowerInvariant();
+            }
+            if (hash != m.Hash) return "error: hash mismatch";
+
+            Mesh mesh = BuildMesh(m, pending.Data);
+            meshCache[key] = mesh;
+            AssignMesh(obj, mesh);
+            return $"ok: uploaded {m.VertexCount} vertices";
+        }
+
+        private static Mesh BuildMesh(MeshUploadMsg m, byte[] data)
+        {
+            int n = m.VertexCount;
+            int offset = 0;
+            var mesh = new Mesh { name = string.IsNullOrEmpty(m.MeshName) ? "UploadedMesh" : m.MeshName };
+            mesh.indexFormat = m.Index32 ? UnityEngine.Rendering.IndexFormat.UInt32 : UnityEngine.Rendering.IndexFormat.UInt16;
+
+            var floats = new float[n * 3];
+            System.Buffer.BlockCopy(data, offset, floats, 0, n * 12);
+            offset += n * 12;
+            var vertices = new Vector3[n];
+            for (int i = 0; i < n; i++) vertices[i] = new Vector3(floats[3 * i], floats[3 * i + 1], floats[3 * i + 2]);
+            mesh.SetVertices(vertices);
+
+            if (m.HasNormals)
+            {
+                System.Buffer.BlockCopy(data, offset, floats, 0, n * 12);
+                offset += n * 12;
+                var normals = new Vector3[n];
+                for (int i = 0; i < n; i++) normals[i] = new Vector3(floats[3 * i], floats[3 * i + 1], floats[3 * i + 2]);
+                mesh.SetNormals(normals);
+            }
+            if (m.HasUv)
+            {
+                System.Buffer.BlockCopy(data, offset, floats, 0, n * 8);
+                offset += n * 8;
+                var uv = new Vector2[n];
+                for (int i = 0; i < n; i++) uv[i] = new Vector2(floats[2 * i], floats[2 * i + 1]);
+                mesh.SetUVs(0, uv);
+            }
+
+            // Indices (checked here: Unity would log an error and leave the mesh empty)
+            if (m.Index32)
+            {
+                var indices = new int[m.IndexCount];
+                System.Buffer.BlockCopy(data, offset, indices, 0, m.IndexCount * 4);
+                foreach (int i in indices)
+                {
+                    if ((uint)i >= (uint)n) throw new System.ArgumentException($"index {i} out of range ({n} vertices)");
+                }
+                mesh.SetIndices(indices, MeshTopology.Triangles, 0);
+            }
+            else
+            {
+                var indices = new ushort[m.IndexCount];
+                System.Buffer.BlockCopy(data, offset, indices, 0, m.IndexCount * 2);
+                foreach (ushort i in indices)
+                {
+                    if (i >= n) throw new System.ArgumentException($"index {i} out of range ({n} vertices)");
+                }
+                mesh.SetIndices(indices, MeshTopology.Triangles, 0);
+            }
+
+            if (!m.HasNormals) mesh.RecalculateNormals();
+            return mesh;
+        }
+
+        private static void AssignMesh(GameObject obj, Mesh mesh)
+        {
+            var filter = obj.GetComponent<MeshFilter>();
+            if (filter == null) filter = obj.AddComponent<MeshFilter>();
+            filter.sharedMesh = mesh;
+            if (obj.GetComponent<MeshRenderer>() == null)
+            {
+                var renderer = obj.AddComponent<MeshRenderer>();
+                renderer.sharedMaterial = new Material(Shader.Find("Standard"));
+            }
+            var collider = obj.GetComponent<MeshCollider>();
+            if (collider != null) collider.sharedMesh = mesh;
+        }
+
+        private void ExecuteBatch(CommandBatchMsg batch, GameStateMsg reply)
+        {
+            if (batch == null)
+            {
+                reply.Status = "error: missing batch";
+                return;
+            }
+
+            int failed = 0;
+            bool skipping = false;
+            foreach (var sub in batch.Commands)
+            {
+                GameStateMsg result;
+                if (skipping)
+                    result = new GameStateMsg { Timestamp = Time.time, Status = "skipped" };
+                else if (sub.Action == "batch")
+                    result = new GameStateMsg { Timestamp = Time.time, Status = "error: nested batch" };
+                else
+                    result = ExecuteCommand(sub);
+
+                if (result.Status.StartsWith("error"))
+                {
+                    failed++;
+                    if (batch.StopOnError) skipping = true;
+                }
+                reply.Results.Add(result);
+            }
+
+            if (failed > 0) reply.Status = $"error: {failed} of {batch.Commands.Count} failed";
         }
         
+        private System.Type ResolveType(string name)
+        {
+            System.Type type;
+            if (typeCache.TryGetValue(name, out type)) return type;
+            foreach (var asm in System.AppDomain.CurrentDomain.GetAssemblies())
+            {
+                type = asm.GetType(name) ?? asm.GetType("UnityEngine." + name);
+                if (type != null) break;
+            }
+            typeCache[name] = type; // Misses are cached too
+            return type;
+        }
+
+        private string CreateObject(CommandMsg cmd, GameStateMsg reply)
+        {
+            var spec = string.IsNullOrEmpty(cmd.PayloadJson) ? new CreateSpec() : JsonUtility.FromJson<CreateSpec>(cmd.PayloadJson);
+
+            // 1. Resolve every component first so a typo doesn't leave a half-built object behind
+            var types = new List<System.Type>();
+            if (spec.components != null)
+            {
+                foreach (var name in spec.components)
+                {
+                    var type = ResolveType(name);
+                    if (type == null || !typeof(Component).IsAssignableFrom(type)) return "error: unknown component " + name;
+                    types.Add(type);
+                }
+            }
+
+            // ...and the parent, for the same reason
+            Transform parent = null;
+            if (!string.IsNullOrEmpty(spec.parent))
+            {
+                var parentObj = GameObject.Find(spec.parent);
+                if (parentObj == null) return "error: parent not found " + spec.parent;
+                parent = parentObj.transform;
+            }
+
+            // 2. Primitive (with mesh + collider) or an empty object
+            GameObject obj;
+            switch ((spec.primitive ?? "").ToLowerInvariant())
+            {
+                case "": obj = new GameObject(); break;
+                case "cube": obj = GameObject.CreatePrimitive(PrimitiveType.Cube); break;
+                case "sphere": obj = GameObject.CreatePrimitive(PrimitiveType.Sphere); break;
+                case "capsule": obj = GameObject.CreatePrimitive(PrimitiveType.Capsule); break;
+                case "cylinder": obj = GameObject.CreatePrimitive(PrimitiveType.Cylinder); break;
+                case "plane": obj = GameObject.CreatePrimitive(PrimitiveType.Plane); break;
+                case "quad": obj = GameObject.CreatePrimitive(PrimitiveType.Quad); break;
+                default: return "error: unknown primitive " + spec.primitive;
+            }
+            obj.name = cmd.Target;
+            if (cmd.VectorPayload != null)
+            {
+                obj.transform.position = new Vector3(cmd.VectorPayload.X, cmd.VectorPayload.Y, cmd.VectorPayload.Z);
+            }
+            if (parent != null) obj.transform.SetParent(parent, true);
+
+            // 3. Components (RequireComponent may already have added some)
+            foreach (var type in types)
+            {
+                if (obj.GetComponent(type) == null) obj.AddComponent(type);
+            }
+
+            // 4. Double-precision placement goes through the VirtualTransform once it exists
+            if (cmd.WorldPayload != null)
+            {
+                var w = cmd.WorldPayload;
+                ApplyPosition(obj, Vector3d.FromSector(w.SectorX, w.SectorY, w.SectorZ, w.X, w.Y, w.Z));
+            }
+            reply.InstanceIds.Add(obj.GetInstanceID());
+            return "ok: created";
+        }
+
+        private string SetProperty(GameObject obj, PropertySpec spec)
+        {
+            var type = ResolveType(spec.type);
+            var comp = type != null ? obj.GetComponent(type) : null;
+            if (comp == null) return "error: component not found " + spec.type;
+
+            var field = type.GetField(spec.propertyName, MemberFlags);
+            if (field != null)
+            {
+                field.SetValue(comp, ParseValue(spec.value, field.FieldType));
+                return "ok";
+            }
+            var prop = type.GetProperty(spec.propertyName, MemberFlags);
+            if (prop != null && prop.CanWrite)
+            {
+                prop.SetValue(comp, ParseValue(spec.value, prop.PropertyType));
+                return "ok";
+            }
+            return "error: no property " + spec.propertyName;
+        }
+
+        private string GetProperty(string target, PropertySpec spec)
+        {
+            // No target: first component of that type in the scene (e.g. the PhysicsEngine)
+            var type = ResolveType(spec.type);
+            if (type == null) return "error: unknown type " + spec.type;
+            Component comp = null;
+            if (string.IsNullOrEmpty(target)) comp = FindFirstObjectByType(type) as Component;
+            else
+            {
+                GameObject obj = GameObject.Find(target);
+                if (obj == null) return "error: not found";
+                comp = obj.GetComponent(type);
+            }
+            if (comp == null) return "error: component not found " + spec.type;
+
+            var field = type.GetField(spec.propertyName, MemberFlags);
+            if (field != null) return "ok: " + FormatValue(field.GetValue(comp));
+            var prop = type.GetProperty(spec.propertyName, MemberFlags);
+            if (prop != null && prop.CanRead) return "ok: " + FormatValue(prop.GetValue(comp));
+            return "error: no property " + spec.propertyName;
+        }
+
+        private const System.Reflection.BindingFlags MemberFlags = System.Reflection.BindingFlags.Instance |
+            System.Reflection.BindingFlags.Public | System.Reflection.BindingFlags.NonPublic;
+
+        private static object ParseValue(string value, System.Type type)
+        {
+            // Invariant culture: "0.5", vectors as "x,y,z"
+            var culture = System.Globalization.CultureInfo.InvariantCulture;
+            if (type == typeof(Vector3) || type == typeof(Vector3d))
+            {
+                var parts = value.Split(',');
+                if (parts.Length != 3) throw new System.FormatException("expected x,y,z but got " + value);
+                double x = double.Parse(parts[0], culture);
+                double y = double.Parse(parts[1], culture);
+                double z = double.Parse(parts[2], culture);
+                if (type == typeof(Vector3)) return new Vector3((float)x, (float)y, (float)z);
+                return new Vector3d(x, y, z);
+            }
+            if (type.IsEnum) return System.Enum.Parse(type, value, true);
+            return System.Convert.ChangeType(value, type, culture);
+        }
+
+        private static string FormatValue(object value)
+        {
+            // Round-trip formatting, same shapes ParseValue accepts
+            var culture = System.Globalization.CultureInfo.InvariantCulture;
+            if (value is Vector3 v) return v.x.ToString("R", culture) + "," + v.y.ToString("R", culture) + "," + v.z.ToString("R", culture);
+            if (value is Vector3d d) return d.x.ToString("R", culture) + "," + d.y.ToString("R", culture) + "," + d.z.ToString("R", culture);
+            if (value is double dv) return dv.ToString("R", culture);
+            if (value is float fv) return fv.ToString("R", culture);
+            if (value is System.IFormattable f) return f.ToString(null, culture);
+            return value != null ? value.ToString() : "null";
+        }
+
+        private void ApplyPosition(GameObject obj, Vector3d newPos)
+        {
+            // 1. Check WorldMover (Player/Camera Origin)
+            var wm = obj.GetComponent<WorldMover>();
+            if (wm != null)
+            {
+                wm.VirtualPosition = newPos;
+                // Force update
+                wm.SendMessage("LateUpdate", SendMessageOptions.DontRequireReceiver);
+                return;
+            }
+
+            // 2. Check VirtualTransform (Networked/Large Scale Objects)
+            var vt = obj.GetComponent<VirtualTransform>();
+            if (vt != null)
+            {
+                vt.WorldPosition = newPos;
+            }
+
+            // 3. Fallback to Unity Transform (Visual/Physics Local)
+            // Note: If VT exists, WorldMover will likely overwrite this next frame,
+            // but setting VT above fixes that.
+            // For non-VT objects, this moves them.
+            obj.transform.position = newPos.ToVector3();
+        }
+
+        private GameObject ResolveHandle(int handle)
+        {
+            GameObject obj;
+            if (handleObjects.TryGetValue(handle, out obj) && obj != null) return obj;
+            return null;
+        }
+
+        private int GetHandle(string name)
+        {
+            int handle;
+            if (nameHandles.TryGetValue(name, out handle) && ResolveHandle(handle) != null) return handle;
+
+            GameObject obj = GameObject.Find(name);
+            if (obj == null) return -1;
+
+            handle = nextHandle++;
+            nameHandles[name] = handle;
+            handleObjects[handle] = obj;
+            return handle;
+        }
+
+        private void SetTransforms(TransformBatchMsg batch, GameStateMsg reply)
+        {
+            if (batch == null)
+            {
+                reply.Status = "error: missing transform_batch";
+                return;
+            }
+
+            bool byName = batch.Names.Count > 0;
+            int count = byName ? batch.Names.Count : batch.Handles.Count;
+
+            float[] positions = ReadFloats(batch.Positions, count);
+            float[] rotations = batch.Rotations.IsEmpty ? null : ReadFloats(batch.Rotations, count);
+            int[] sectors = batch.Sectors.IsEmpty ? null : ReadInts(batch.Sectors, count);
+            if (positions == null || (!batch.Rotations.IsEmpty && rotations == null) ||
+                (!batch.Sectors.IsEmpty && sectors == null))
+            {
+                reply.Status = "error: buffer size mismatch";
+                return;
+            }
+
+            int missing = 0;
+            for (int i = 0; i < count; i++)
+            {
+                GameObject obj;
+                if (byName)
+                {
+                    int handle = GetHandle(batch.Names[i]);
+                    reply.Handles.Add(handle);
+                    obj = handle >= 0 ? handleObjects[handle] : null;
+                }
+                else
+                {
+                    obj = ResolveHandle(batch.Handles[i]);
+                }
+
+                if (obj == null)
+                {
+                    missing++;
+                    continue;
+                }
+
+                int p = i * 3;
+                if (sectors != null)
+                {
+                    // Positions are offsets inside the sector
+                    ApplyPosition(obj, Vector3d.FromSector(sectors[p], sectors[p + 1], sectors[p + 2],
+                        positions[p], positions[p + 1], positions[p + 2]));
+                }
+                else
+                {
+                    ApplyPosition(obj, new Vector3d(positions[p], positions[p + 1], positions[p + 2]));
+                }
+                if (rotations != null)
+                {
+                    obj.transform.eulerAngles = new Vector3(rotations[p], rotations[p + 1], rotations[p + 2]);
+                }
+            }
+
+            if (missing > 0) reply.Status = $"error: {missing} of {count} not found";
+        }
+
+        private static float[] ReadFloats(ByteString data, int count)
+        {
+            // Packed little-endian float32 x,y,z triples
+            if (data.Length != count * 3 * sizeof(float)) return null;
+            var values = new float[count * 3];
+            System.Buffer.BlockCopy(data.ToByteArray(), 0, values, 0, data.Length);
+            return values;
+        }
+
+        private static int[] ReadInts(ByteString data, int count)
+        {
+            // Packed little-endian int32 x,y,z triples
+            if (data.Length != count * 3 * sizeof(int)) return null;
+            var values = new int[count * 3];
+            System.Buffer.BlockCopy(data.ToByteArray(), 0, values, 0, data.Length);
+            return values;
+        }
+
+        private static SectorVector3Msg ToSectorMsg(Vector3d world)
+        {
+            int sx, sy, sz;
+            Vector3 offset;
+            world.ToSector(out sx, out sy, out sz, out offset);
+            return new SectorVector3Msg { SectorX = sx, SectorY = sy, SectorZ = sz, X = offset.x, Y = offset.y, Z = offset.z };
+        }
+
+        private HierarchyMsg BuildColumnarHierarchy()
+        {
+            var msg = new HierarchyMsg();
+            var nameIds = new Dictionary<string, int>();
+            var componentIds = new Dictionary<string, int>();
+            var setIds = new Dictionary<string, int>();
+
+            var parents = new List<int>();
+            var nodeNames = new List<int>();
+            var nodeSets = new List<int>();
+            var positions = new List<float>();
+            var active = new List<byte>();
+            var instanceIds = new List<int>();
+            var setKey = new System.Text.StringBuilder();
+            var setComponents = new List<int>();
+
+            // 1. Pre-order walk (explicit stack: scenes can be deep)
+            var stack = new Stack<KeyValuePair<Transform, int>>();
+            var roots = UnityEngine.SceneManagement.SceneManager.GetActiveScene().GetRootGameObjects();
+            for (int r = roots.Length - 1; r >= 0; r--)
+            {
+                stack.Push(new KeyValuePair<Transform, int>(roots[r].transform, -1));
+            }
+
+            while (stack.Count > 0)
+            {
+                var entry = stack.Pop();
+                Transform t = entry.Key;
+                int index = parents.Count;
+                parents.Add(entry.Value);
+
+                // 2. Intern the name
+                int nameId;
+                if (!nameIds.TryGetValue(t.name, out nameId))
+                {
+                    nameId = msg.Names.Count;
+                    nameIds[t.name] = nameId;
+                    msg.Names.Add(t.name);
+                }
+                nodeNames.Add(nameId);
+
+                // 3. Intern the component set
+                setKey.Length = 0;
+                setComponents.Clear();
+                foreach (var c in t.GetComponents<Component>())
+                {
+                    if (c == null) continue; // Missing script
+                    string type = c.GetType().FullName;
+                    int componentId;
+                    if (!componentIds.TryGetValue(type, out componentId))
+                    {
+                        componentId = msg.Components.Count;
+                        componentIds[type] = componentId;
+                        msg.Components.Add(type);
+                    }
+                    setComponents.Add(componentId);
+                    setKey.Append(componentId).Append(',');
+                }
+                int setId;
+                string key = setKey.ToString();
+                if (!setIds.TryGetValue(key, out setId))
+                {
+                    setId = msg.ComponentSets.Count;
+                    setIds[key] = setId;
+                    var set = new ComponentSetMsg();
+                    set.Components.AddRange(setComponents);
+                    msg.ComponentSets.Add(set);
+                }
+                nodeSets.Add(setId);
+
+                var pos = t.position;
+                positions.Add(pos.x);
+                positions.Add(pos.y);
+                positions.Add(pos.z);
+                active.Add(t.gameObject.activeSelf ? (byte)1 : (byte)0);
+                instanceIds.Add(t.gameObject.GetInstanceID());
+
+                for (int c = t.childCount - 1; c >= 0; c--)
+                {
+                    stack.Push(new KeyValuePair<Transform, int>(t.GetChild(c), index));
+                }
+            }
+
+            // 4. Pack the columns
+            msg.Count = parents.Count;
+            msg.Parents = PackInts(parents);
+            msg.NameIds = PackInts(nodeNames);
+            msg.SetIds = PackInts(nodeSets);
+            var posBytes = new byte[positions.Count * sizeof(float)];
+            System.Buffer.BlockCopy(positions.ToArray(), 0, posBytes, 0, posBytes.Length);
+            msg.Positions = ByteString.CopyFrom(posBytes);
+            msg.Active = ByteString.CopyFrom(active.ToArray());
+            msg.InstanceIds = PackInts(instanceIds);
+            return msg;
+        }
+
+        private int DestroyInstances(HashSet<int> wanted)
+        {
+            // One scene walk collects every requested object, then they are destroyed together
+            var found = new List<GameObject>();
+            int matched = 0;
+            // (transform, inside an object that is already being destroyed)
+            var stack = new Stack<KeyValuePair<Transform, bool>>();
+            foreach (var root in UnityEngine.SceneManagement.SceneManager.GetActiveScene().GetRootGameObjects())
+            {
+                stack.Push(new KeyValuePair<Transform, bool>(root.transform, false));
+            }
+            while (stack.Count > 0 && matched < wanted.Count)
+            {
+                var entry = stack.Pop();
+                Transform t = entry.Key;
+                bool doomed = entry.Value;
+                if (wanted.Contains(t.gameObject.GetInstanceID()))
+                {
+                    matched++;
+                    if (!doomed) found.Add(t.gameObject); // Nested ones go with their ancestor
+                    doomed = true;
+                }
+                for (int c = 0; c < t.childCount; c++)
+                {
+                    stack.Push(new KeyValuePair<Transform, bool>(t.GetChild(c), doomed));
+                }
+            }
+
+            foreach (var obj in found) DestroyImmediate(obj);
+            return matched;
+        }
+
+        private static ByteString PackInts(List<int> values)
+        {
+            var bytes = new byte[values.Count * sizeof(int)];
+            System.Buffer.BlockCopy(values.ToArray(), 0, bytes, 0, bytes.Length);
+            return ByteString.CopyFrom(bytes);
+        }
+
         private void AddEntityToState(GameStateMsg state, GameObject obj)
         {
             if (obj == null) return;
@@ -300,6 +1064,13 @@ namespace Core
             tMsg.Name = obj.name;
             var pos = obj.transform.position;
             tMsg.Position = new Vector3Msg { X = pos.x, Y = pos.y, Z = pos.z };
+
+            // Full precision position for large-scale objects
+            var wm = obj.GetComponent<WorldMover>();
+            var vt = obj.GetComponent<VirtualTransform>();
+            if (wm != null) tMsg.WorldPosition = ToSectorMsg(wm.VirtualPosition);
+            else if (vt != null) tMsg.WorldPosition = ToSectorMsg(vt.WorldPosition);
+
             state.Entities.Add(tMsg);
         }
     }
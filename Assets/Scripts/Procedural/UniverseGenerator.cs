@@ -77,7 +77,7 @@ namespace Procedural
             // v = sqrt(0.0001 * 1.0 / 200.0) = sqrt(0.0000005) ~= 0.000707
             // Direction: Tangent to (200,0,0) is (0,0,1)
             
-            double G = 0.0001; // Must match PhysicsEngine
+            double G = Core.PhysicsEngine.Instance != null ? Core.PhysicsEngine.Instance.G : 0.0001; // PhysicsEngine default
             double r = 200.0;
             double M_Sol = 1000000000000.0;
             double vMag = System.Math.Sqrt(G * M_Sol / r); 
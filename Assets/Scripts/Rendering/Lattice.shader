@@ -6,6 +6,11 @@ Shader "Custom/Lattice"
         _Spacing ("Grid Spacing", Float) = 10.0
         _Thickness ("Line Thickness", Range(0, 1)) = 0.02
         _Offset ("World Offset", Vector) = (0,0,0,0)
+        _GravityField ("Gravity Field (RGB accel, A potential)", 3D) = "black" {}
+        _FieldOrigin ("Field Origin", Vector) = (0,0,0,0)
+        _FieldSize ("Field Size", Vector) = (1,1,1,0)
+        _GravityScale ("Gravity Scale", Float) = 0.001
+        _UseGravityField ("Use Gravity Field", Float) = 0
     }
     SubShader
     {
@@ -32,6 +37,7 @@ Shader "Custom/Lattice"
                 float2 uv : TEXCOORD0;
                 float4 vertex : SV_POSITION;
                 float3 worldPos : TEXCOORD1;
+                float3 renderPos : TEXCOORD2; // Without _Offset: the gravity field box is placed in render space
             };
 
             float4 _Color;
@@ -40,12 +46,18 @@ Shader "Custom/Lattice"
             float4 _Offset;
             float _Alpha;          // Controlled by Speed
             float _GravityOverlay; // Controlled by Gravity Strength
+            sampler3D _GravityField;   // Precomputed by gravity_grid.py (LatticeRenderer.gravityField)
+            float4 _FieldOrigin;
+            float4 _FieldSize;
+            float _GravityScale;
+            float _UseGravityField;
 
             v2f vert (appdata v)
             {
                 v2f o;
                 o.vertex = UnityObjectToClipPos(v.vertex);
-                o.worldPos = mul(unity_ObjectToWorld, v.vertex).xyz + _Offset.xyz;
+                o.renderPos = mul(unity_ObjectToWorld, v.vertex).xyz;
+                o.worldPos = o.renderPos + _Offset.xyz;
                 return o;
             }
 
@@ -66,7 +78,14 @@ Shader "Custom/Lattice"
                 
                 // 2. Gravity Color Shift
                 // Shift from Base Color to Red/Orange as Gravity increases
-                float3 finalColor = lerp(_Color.rgb, float3(1, 0.2, 0), _GravityOverlay);
+                // Precomputed field: strength at this pixel instead of the one per-frame sample
+                float overlay = _GravityOverlay;
+                if (_UseGravityField > 0.5)
+                {
+                    float3 uvw = (i.renderPos - _FieldOrigin.xyz) / _FieldSize.xyz;
+                    overlay = saturate(length(tex3D(_GravityField, uvw).xyz) * _GravityScale);
+                }
+                float3 finalColor = lerp(_Color.rgb, float3(1, 0.2, 0), overlay);
                 
                 // 3. Final Alpha
                 // Multiply by lineVal (shape) and _Alpha (fade)
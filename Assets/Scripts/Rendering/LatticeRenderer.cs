@@ -9,12 +9,69 @@ namespace Rendering
         public float gridSize = 1000f; // Size of the quad
         public float spacing = 10f;
 
+        [Header("Precomputed Gravity Field")]
+        // Binary grid from gravity_grid.py --export (rename to .bytes so Unity imports it as a TextAsset)
+        public TextAsset gravityField;
+        public float gravityScale = 0.001f; // Same tuning as the per-frame distortion below
+
         private GameObject gridQuad;
         private Material instanceMat;
+        private Texture3D fieldTexture;
+        private Vector3d fieldCorner; // Virtual (float64) position of the field box corner
 
         private void Start()
         {
             CreateGrid();
+            if (instanceMat != null && gravityField != null) LoadGravityField(gravityField.bytes);
+        }
+
+        // Layout: "GGRD", uint32 version, int32 nx ny nz, double origin xyz, double spacing,
+        // then float32 (ax, ay, az, potential) per point, x fastest.
+        private void LoadGravityField(byte[] data)
+        {
+            using (var reader = new System.IO.BinaryReader(new System.IO.MemoryStream(data)))
+            {
+                if (data.Length < 52 || new string(reader.ReadChars(4)) != "GGRD" || reader.ReadUInt32() != 1)
+                {
+                    Debug.LogError("[Lattice] Gravity field: not a GGRD v1 file");
+                    return;
+                }
+                int nx = reader.ReadInt32(), ny = reader.ReadInt32(), nz = reader.ReadInt32();
+                Vector3d origin = new Vector3d(reader.ReadDouble(), reader.ReadDouble(), reader.ReadDouble());
+                double cellD = reader.ReadDouble();
+                float cell = (float)cellD;
+                int count = nx * ny * nz;
+                if (data.Length - 52 != count * 16)
+                {
+                    Debug.LogError($"[Lattice] Gravity field: expected {count} points, got {(data.Length - 52) / 16}");
+                    return;
+                }
+
+                // 1. Raw texels straight into a float texture (RGB = acceleration, A = potential)
+                fieldTexture = new Texture3D(nx, ny, nz, TextureFormat.RGBAFloat, false);
+                fieldTexture.wrapMode = TextureWrapMode.Clamp;
+                fieldTexture.filterMode = FilterMode.Bilinear;
+                var texels = new float[count * 4];
+                System.Buffer.BlockCopy(data, 52, texels, 0, count * 16);
+                fieldTexture.SetPixelData(texels, 0);
+                fieldTexture.Apply(false, true);
+
+                // 2. Virtual box the texture covers (texel centers sit on the lattice points).
+                // Kept in float64: Update moves it into render space around the current VirtualPosition.
+                Vector3 size = new Vector3(nx, ny, nz) * cell;
+                fieldCorner = origin - new Vector3d(cellD, cellD, cellD) * 0.5;
+                instanceMat.SetTexture("_GravityField", fieldTexture);
+                instanceMat.SetVector("_FieldOrigin", fieldCorner.ToVector3());
+                instanceMat.SetVector("_FieldSize", size);
+                instanceMat.SetFloat("_GravityScale", gravityScale);
+                instanceMat.SetFloat("_UseGravityField", 1f);
+                Debug.Log($"[Lattice] Gravity field {nx}x{ny}x{nz} loaded ({cell} units per cell)");
+            }
+        }
+
+        private void OnDestroy()
+        {
+            if (fieldTexture != null) Destroy(fieldTexture);
         }
 
         private void CreateGrid()
@@ -60,11 +117,16 @@ namespace Rendering
             {
                 Vector3d pos = WorldMover.Instance.VirtualPosition;
                 instanceMat.SetVector("_Offset", new Vector4((float)pos.x, (float)pos.y, (float)pos.z, 0));
+                // Field box in render space (virtual - VirtualPosition, subtracted in float64): the shader
+                // samples it at the unshifted pixel position, so both frames line up without float32 loss
+                if (fieldTexture != null) instanceMat.SetVector("_FieldOrigin", (fieldCorner - pos).ToVector3());
             }
             else
             {
                 // Fallback for non-WorldMover setup
                 instanceMat.SetVector("_Offset", transform.position);
+                // Nothing is shifted: render space is virtual space
+                if (fieldTexture != null) instanceMat.SetVector("_FieldOrigin", fieldCorner.ToVector3());
             }
             
             // 2. Map Mode Logic (Speed -> Visibility)
@@ -82,6 +144,12 @@ namespace Rendering
             
             // 3. Gravity Visualization (Field Strength)
             // Lines condense (Spacing decreases? Thickness increases?) as Gravity increases.
+            // A precomputed field only replaces the colour shift (read per pixel instead of one sample
+            // per frame); the spacing below still follows the strength at the player either way.
+            if (fieldTexture != null)
+            {
+                instanceMat.SetFloat("_GravityScale", gravityScale);
+            }
             if (Core.PhysicsEngine.Instance != null && alpha > 0.01f)
             {
                 // Sample generic position (e.g. Player)
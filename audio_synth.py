@@ -0,0 +1,355 @@
+"""
+Offline renderer for Audio.AudioSynthesizer (Assets/Scripts/Audio/AudioSynthesizer.cs).
+
+OnAudioFilterRead produces one sample at a time; Synth.render() produces the
+same samples a block at a time with NumPy, bit for bit:
+
+1. phase: double, += increment per frame, one "- 2*PI" when it passes 2*PI
+   (wrap points found per cycle; np.cumsum adds in the same order as the loop),
+2. increment = frequency * 2.0 * Mathf.PI / sampleRate, with Mathf.PI the float constant,
+3. waveforms on (float)phase with Unity's float Mathf.Sin / PingPong / Repeat,
+   including the "Triangle", which is really a ramp (PingPong never folds in (0, 2*PI]),
+4. Noise: System.Random.NextDouble() (the .NET subtractive generator); exact when
+   the component has a noiseSeed, statistically equivalent otherwise.
+
+Also: band-limited wavetables built from those exact shapes (Synth(band_limited=True))
+and spectral checks (analyze: fundamental, THD, aliasing).
+
+    synth = Synth("Square", frequency=440, amplitude=0.5, sample_rate=48000)
+    block = synth.render(1024, channels=2)   # == OnAudioFilterRead's data[]
+    print(analyze(synth.render(48000, 1), 48000, 440))
+
+    python audio_synth.py Square 440 --seconds 2 --wav square.wav
+"""
+import sys
+import wave
+import argparse
+import numpy as np
+
+WAVE_TYPES = ("Sine", "Square", "Saw", "Triangle", "Noise")  # AudioSynthesizer.WaveType order
+
+PI_F = float(np.float32(np.pi))   # Mathf.PI (float), as C# promotes it to double
+TWO_PI = 2.0 * PI_F               # Wrap threshold: 2.0 * Mathf.PI in double
+TWO_PI_F = np.float32(2.0) * np.float32(PI_F)  # PingPong length: 2.0f * Mathf.PI
+
+def log(msg):
+    print(f"[Synth] {msg}")
+
+def wave_type(value):
+    """WaveType name or enum index -> name."""
+    if isinstance(value, str):
+        for name in WAVE_TYPES:
+            if name.lower() == value.lower():
+                return name
+        raise ValueError(f"unknown wave type {value!r} (expected one of {', '.join(WAVE_TYPES)})")
+    return WAVE_TYPES[int(value)]
+
+def phase_increment(frequency, sample_rate):
+    """AudioSynthesizer.Update: frequency * 2.0 * Mathf.PI / sampleRate (float frequency)."""
+    return float(np.float32(frequency)) * 2.0 * PI_F / sample_rate
+
+
+# --- System.Random ---
+
+class NetRandom:
+    """
+    .NET Framework / Mono System.Random (Knuth subtractive generator), vectorized.
+    next_doubles(n) returns exactly what n NextDouble() calls would.
+    """
+    MBIG = 2 ** 31 - 1
+    MSEED = 161803398
+
+    def __init__(self, seed):
+        seed = int(seed)
+        subtraction = self.MBIG if seed == -2 ** 31 else abs(seed)
+        mj = self.MSEED - subtraction
+        s = [0] * 56
+        s[55] = mj
+        mk = 1
+        for i in range(1, 55):
+            ii = (21 * i) % 55
+            s[ii] = mk
+            mk = mj - mk
+            if mk < 0:
+                mk += self.MBIG
+            mj = s[ii]
+        for _ in range(1, 5):
+            for i in range(1, 56):
+                s[i] = (s[i] - s[1 + (i + 30) % 55]) & 0xFFFFFFFF  # int32 wraparound
+                if s[i] >= 2 ** 31:
+                    s[i] -= 2 ** 32
+                if s[i] < 0:
+                    s[i] += self.MBIG
+        self.seed_array = np.array(s, dtype=np.int64)
+        self.inext = 0
+        self.inextp = 21
+
+    def next_doubles(self, n):
+        out = np.empty(n, dtype=np.int64)
+        s = self.seed_array
+        done = 0
+        while done < n:
+            # Slot i+21 is rewritten 34 draws after slot i: blocks of 34 never read their own writes
+            b = min(34, n - done)
+            steps = np.arange(1, b + 1)
+            a = (self.inext + steps - 1) % 55 + 1
+            p = (self.inextp + steps - 1) % 55 + 1
+            ret = s[a] - s[p]
+            ret[ret == self.MBIG] -= 1
+            ret[ret < 0] += self.MBIG
+            s[a] = ret
+            out[done:done + b] = ret
+            self.inext = int(a[-1])
+            self.inextp = int(p[-1])
+            done += b
+        return out * (1.0 / self.MBIG)
+
+
+# --- Waveforms ---
+
+def advance_phase(phase, increment, frames):
+    """
+    Phase after each of `frames` steps (float64) and the final phase, exactly as
+    the per-sample loop computes it.
+    """
+    if increment <= 0 or frames == 0:
+        # Never wraps (frequency <= 0)
+        steps = np.full(frames + 1, increment)
+        steps[0] = phase
+        out = np.cumsum(steps)[1:]
+        return out, (out[-1] if frames else phase)
+    out = np.empty(frames, dtype=np.float64)
+    i = 0
+    while i < frames:
+        # One cycle at a time: [phase, inc, inc, ...] accumulated left to right
+        m = min(frames - i, max(1, int((TWO_PI - phase) / increment) + 2))
+        steps = np.full(m + 1, increment)
+        steps[0] = phase
+        values = np.cumsum(steps)[1:]
+        over = np.flatnonzero(values > TWO_PI)
+        if over.size == 0:
+            out[i:i + m] = values
+            phase = values[-1]
+            i += m
+            continue
+        j = over[0]
+        out[i:i + j] = values[:j]
+        phase = values[j] - TWO_PI
+        out[i + j] = phase
+        i += j + 1
+    return out, phase
+
+def mathf_repeat(t, length):
+    """Mathf.Repeat in float32."""
+    return np.clip(t - np.floor(t / length) * length, np.float32(0.0), length)
+
+def mathf_pingpong(t, length):
+    """Mathf.PingPong in float32."""
+    t = mathf_repeat(t, length * np.float32(2.0))
+    return length - np.abs(t - length)
+
+def shape(wave_name, phase):
+    """Un-scaled waveform (float32) for double phases, as OnAudioFilterRead computes it."""
+    phase_f = phase.astype(np.float32)
+    if wave_name == "Sine":
+        return np.sin(phase_f.astype(np.float64)).astype(np.float32)
+    if wave_name == "Square":
+        return np.where(np.sin(phase_f.astype(np.float64)).astype(np.float32) >= 0,
+                        np.float32(1.0), np.float32(-1.0))
+    if wave_name == "Triangle":
+        return mathf_pingpong(phase_f, TWO_PI_F) / np.float32(PI_F) - np.float32(1.0)
+    if wave_name == "Saw":
+        return (phase / PI_F - 1.0).astype(np.float32)
+    raise ValueError(f"{wave_name} has no periodic shape")
+
+
+# --- Band-limited wavetables ---
+
+class Wavetables:
+    """
+    One single-cycle table per octave (from `low` Hz up), each holding only the harmonics
+    that stay below Nyquist for every frequency in its octave. Harmonic amplitudes come
+    from the exact shape() of the wave, so the tables follow the C# waveform.
+    """
+
+    def __init__(self, wave_name, sample_rate, size=2048, low=20.0, oversample=64):
+        self.wave = wave_type(wave_name)
+        self.sample_rate = sample_rate
+        self.size = size
+        n = size * oversample
+        spectrum = np.fft.rfft(shape(self.wave, TWO_PI * np.arange(n) / n).astype(np.float64)) / n
+        nyquist = sample_rate / 2.0
+        self.bases = []
+        self.tables = []
+        base = low
+        while base < nyquist:
+            harmonics = min(size // 2 - 1, max(1, int(nyquist / (2 * base))))
+            partial = np.zeros(size // 2 + 1, dtype=np.complex128)
+            partial[:harmonics + 1] = spectrum[:harmonics + 1]
+            table = np.fft.irfft(partial, size) * size
+            self.bases.append(base)
+            self.tables.append(np.append(table, table[0]))  # Guard sample for interpolation
+            base *= 2.0
+
+    def table_for(self, frequency):
+        k = int(np.searchsorted(self.bases, frequency, side="right")) - 1
+        return self.tables[max(0, k)]
+
+    def lookup(self, frequency, phase):
+        """Linear interpolation at double phases (0..2*PI]."""
+        table = self.table_for(frequency)
+        pos = (phase / TWO_PI) * self.size
+        i = np.floor(pos).astype(np.int64)
+        frac = pos - i
+        i %= self.size
+        return (table[i] + (table[i + 1] - table[i]) * frac).astype(np.float32)
+
+
+# --- Renderer ---
+
+class Synth:
+    """
+    AudioSynthesizer state (phase, increment, rng) rendering whole blocks.
+    Change frequency / amplitude / wave / playing between blocks, like Update does.
+    seed: the component's noiseSeed (None or 0 = unknown clock seed, noise still uniform).
+    band_limited: play Square/Saw/Triangle from Wavetables instead of the naive shapes.
+    """
+
+    def __init__(self, wave="Sine", frequency=440.0, amplitude=0.5, sample_rate=48000, seed=None,
+                 playing=True, band_limited=False):
+        self.wave = wave_type(wave)
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.sample_rate = sample_rate
+        self.playing = playing
+        self.phase = 0.0
+        self.rng = NetRandom(seed if seed else np.random.randint(1, 2 ** 31 - 1))
+        self.band_limited = band_limited
+        self.tables = {}
+
+    def render(self, frames, channels=2):
+        """One OnAudioFilterRead call: float32 data[] of frames * channels (interleaved)."""
+        if not self.playing:
+            return np.zeros(frames * channels, dtype=np.float32)  # Buffer left untouched
+        phase, self.phase = advance_phase(self.phase, phase_increment(self.frequency, self.sample_rate), frames)
+        if self.wave == "Noise":
+            value = (self.rng.next_doubles(frames) * 2.0 - 1.0).astype(np.float32)
+        elif self.band_limited and self.wave != "Sine":
+            if self.wave not in self.tables:
+                self.tables[self.wave] = Wavetables(self.wave, self.sample_rate)
+            value = self.tables[self.wave].lookup(self.frequency, phase)
+        else:
+            value = shape(self.wave, phase)
+        value = value * np.float32(self.amplitude)
+        return np.repeat(value, channels)
+
+def render_reference(synth, frames, channels=2):
+    """
+    The C# loop transcribed sample by sample (slow; for checking render()).
+    Uses and updates the same state as synth.render would.
+    """
+    data = np.zeros(frames * channels, dtype=np.float32)
+    if not synth.playing:
+        return data
+    increment = phase_increment(synth.frequency, synth.sample_rate)
+    amplitude = np.float32(synth.amplitude)
+    phase = synth.phase
+    for i in range(frames):
+        phase += increment
+        if phase > TWO_PI:
+            phase -= TWO_PI
+        if synth.wave == "Noise":
+            value = np.float32(synth.rng.next_doubles(1)[0] * 2.0 - 1.0)
+        else:
+            value = shape(synth.wave, np.array([phase]))[0]
+        data[i * channels:(i + 1) * channels] = value * amplitude
+    synth.phase = phase
+    return data
+
+
+# --- Spectral checks ---
+
+def analyze(signal, sample_rate, frequency, width=6):
+    """
+    Mono signal -> {"fundamental" Hz, "thd" (ratio), "thd_db", "aliasing_db", "harmonics"}.
+    Blackman-Harris window; harmonics are the k * fundamental below Nyquist,
+    aliasing is everything else (DC excluded) relative to the whole signal.
+    """
+    x = np.asarray(signal, dtype=np.float64)
+    n = len(x)
+    a = (0.35875, 0.48829, 0.14128, 0.01168)
+    t = 2 * np.pi * np.arange(n) / (n - 1)
+    window = a[0] - a[1] * np.cos(t) + a[2] * np.cos(2 * t) - a[3] * np.cos(3 * t)
+    power = np.abs(np.fft.rfft((x - x.mean()) * window)) ** 2
+    bin_hz = sample_rate / n
+
+    # 1. Fundamental: strongest bin near the expected frequency, parabolic interpolation
+    lo = max(1, int(frequency * 0.5 / bin_hz))
+    hi = min(len(power) - 2, int(frequency * 1.5 / bin_hz) + 1)
+    k = lo + int(np.argmax(power[lo:hi + 1]))
+    l, c, r = np.log(power[k - 1:k + 2] + 1e-300)
+    offset = 0.5 * (l - r) / (l - 2 * c + r) if (l - 2 * c + r) != 0 else 0.0
+    fundamental = (k + offset) * bin_hz
+
+    # 2. Harmonic energy (k * fundamental) vs everything else
+    covered = np.zeros(len(power), dtype=bool)
+    covered[:width] = True  # DC
+    harmonics = []
+    h = 1
+    while h * fundamental < sample_rate / 2:
+        centre = int(round(h * fundamental / bin_hz))
+        band = slice(max(0, centre - width), centre + width + 1)
+        harmonics.append(power[band].sum())
+        covered[band] = True
+        h += 1
+    harmonics = np.array(harmonics)
+    total = power[width:].sum()
+    thd = np.sqrt(harmonics[1:].sum() / harmonics[0]) if harmonics[0] > 0 else float("inf")
+    alias = power[~covered].sum()
+    return {
+        "fundamental": fundamental,
+        "thd": thd,
+        "thd_db": 20 * np.log10(max(thd, 1e-12)),
+        "aliasing_db": 10 * np.log10(max(alias / total, 1e-24)) if total > 0 else float("-inf"),
+        "harmonics": harmonics / harmonics[0] if harmonics[0] > 0 else harmonics,
+    }
+
+def write_wav(path, data, sample_rate, channels):
+    """Interleaved float32 data -> 16-bit PCM .wav."""
+    pcm = (np.clip(data, -1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(path, "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm.tobytes())
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Render AudioSynthesizer output without an audio device.")
+    parser.add_argument("wave", help="Sine, Square, Saw, Triangle or Noise")
+    parser.add_argument("frequency", type=float)
+    parser.add_argument("--amplitude", type=float, default=0.5)
+    parser.add_argument("--rate", type=int, default=48000, help="AudioSettings.outputSampleRate")
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--seed", type=int, help="noiseSeed")
+    parser.add_argument("--band-limited", action="store_true")
+    parser.add_argument("--wav", help="write a 16-bit .wav")
+    args = parser.parse_args(argv)
+
+    synth = Synth(args.wave, args.frequency, args.amplitude, args.rate, args.seed, band_limited=args.band_limited)
+    data = synth.render(int(args.seconds * args.rate), args.channels)
+    if synth.wave != "Noise":
+        stats = analyze(data[::args.channels], args.rate, args.frequency)
+        log(f"{synth.wave} {args.frequency:g} Hz: fundamental {stats['fundamental']:.3f} Hz, "
+            f"THD {stats['thd'] * 100:.2f}% ({stats['thd_db']:.1f} dB), aliasing {stats['aliasing_db']:.1f} dB")
+    else:
+        mono = data[::args.channels]
+        log(f"Noise: mean {mono.mean():+.4f}, rms {np.sqrt((mono ** 2).mean()):.4f} "
+            f"(uniform: {args.amplitude / np.sqrt(3):.4f})")
+    if args.wav:
+        write_wav(args.wav, data, args.rate, args.channels)
+        log(f"Wrote {args.wav}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,97 @@
+import sys
+import copy
+import time
+import numpy as np
+from audio_synth import Synth, WAVE_TYPES, analyze, render_reference
+
+# Offline checks for the AudioSynthesizer renderer (audio_synth.py).
+# 1. Exactness: vectorized blocks == the transcribed per-sample C# loop, every WaveType,
+#    frequency changes between blocks (Update), seeded noise.
+# 2. Spectrum: fundamental, THD and aliasing of the naive waves vs the band-limited tables.
+# 3. Throughput in samples per second (and x real time at 48 kHz).
+
+RATE = 48000
+BLOCK = 1024  # Frames per OnAudioFilterRead call (Best latency: 256, Good: 512, Best performance: 1024)
+
+def log(msg):
+    print(f"[Bench Synth] {msg}")
+
+def exactness():
+    ok = True
+    for wave in WAVE_TYPES:
+        synth = Synth(wave, 440.0, 0.5, RATE, seed=1234)
+        reference = copy.deepcopy(synth)
+        mismatches = 0
+        for frequency in (440.0, 1999.7, 20.0, 333.3, 1000.0):
+            synth.frequency = reference.frequency = frequency
+            fast = synth.render(BLOCK, 2)
+            slow = render_reference(reference, BLOCK, 2)
+            mismatches += int(np.count_nonzero(fast != slow)) + int(synth.phase != reference.phase)
+        log(f"{wave:>8}: {'exact' if mismatches == 0 else f'{mismatches} mismatches'}")
+        ok &= mismatches == 0
+
+    # Not playing: buffer untouched, phase frozen
+    synth = Synth("Sine", 440.0, 0.5, RATE, playing=False)
+    ok &= not synth.render(BLOCK, 2).any() and synth.phase == 0.0
+    return ok
+
+def spectrum():
+    ok = True
+    log(f"{'wave':>8} {'Hz':>6} {'mode':>12} {'fundamental':>12} {'THD':>8} {'aliasing':>9}")
+    for wave, frequency in (("Sine", 440.0), ("Square", 440.0), ("Square", 1760.0),
+                            ("Saw", 1760.0), ("Triangle", 1760.0)):
+        results = {}
+        for band_limited in (False, True):
+            if band_limited and wave == "Sine":
+                continue
+            synth = Synth(wave, frequency, 0.5, RATE, band_limited=band_limited)
+            stats = analyze(synth.render(RATE, 1), RATE, frequency)
+            mode = "band-limited" if band_limited else "naive"
+            results[mode] = stats
+            log(f"{wave:>8} {frequency:6.0f} {mode:>12} {stats['fundamental']:12.3f} "
+                f"{stats['thd_db']:7.1f}dB {stats['aliasing_db']:8.1f}dB")
+            # The fundamental lands within 0.05 Hz (float32 frequency, double phase)
+            ok &= abs(stats["fundamental"] - frequency) < 0.05
+        if wave == "Sine":
+            ok &= results["naive"]["thd_db"] < -90 and results["naive"]["aliasing_db"] < -90
+        else:
+            # Tables must cut aliasing by at least 30 dB without changing the harmonic content
+            ok &= results["band-limited"]["aliasing_db"] < results["naive"]["aliasing_db"] - 30
+            ok &= abs(results["band-limited"]["thd_db"] - results["naive"]["thd_db"]) < 3
+
+    # Noise: uniform in [-amplitude, amplitude]
+    noise = Synth("Noise", 440.0, 0.5, RATE, seed=7).render(RATE, 1)
+    rms = np.sqrt((noise.astype(np.float64) ** 2).mean())
+    log(f"   Noise rms {rms:.4f} (uniform {0.5 / np.sqrt(3):.4f}), mean {noise.mean():+.4f}")
+    ok &= abs(rms - 0.5 / np.sqrt(3)) < 0.005 and np.abs(noise).max() <= 0.5
+    return ok
+
+def throughput(seconds=20):
+    frames = RATE * seconds
+    log(f"{'wave':>8} {'mode':>12} {'M samples/s':>12} {'x realtime':>11}")
+    for wave in WAVE_TYPES:
+        modes = [("vectorized", False), ("band-limited", True)] if wave not in ("Sine", "Noise") else [("vectorized", False)]
+        for mode, band_limited in modes:
+            synth = Synth(wave, 440.0, 0.5, RATE, seed=1, band_limited=band_limited)
+            synth.render(BLOCK, 2)  # Build tables outside the timing
+            t0 = time.perf_counter()
+            for _ in range(frames // BLOCK):
+                synth.render(BLOCK, 2)
+            rate = (frames // BLOCK) * BLOCK / (time.perf_counter() - t0)
+            log(f"{wave:>8} {mode:>12} {rate / 1e6:12.2f} {rate / RATE:10.0f}x")
+
+    synth = Synth("Sine", 440.0, 0.5, RATE)
+    t0 = time.perf_counter()
+    render_reference(synth, BLOCK * 4, 2)
+    rate = BLOCK * 4 / (time.perf_counter() - t0)
+    log(f"{'Sine':>8} {'per-sample':>12} {rate / 1e6:12.2f} {rate / RATE:10.1f}x")
+
+def main():
+    ok = exactness()
+    ok &= spectrum()
+    throughput()
+    log("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+import sys
+import json
+import time
+import bridge_dag
+from zmq_bridge import make_command, make_create_command
+from zmq_flow import FlowController
+from zmq_standin import StandInServer
+
+# Hierarchy scheduling in bridge_dag.
+# 1. A generated level with one Transform move per object stays a few waves deep (tree depth, not object count).
+# 2. Small hand-built tree: sibling subtrees are independent, moving a parent waits for its subtree
+#    and later child creates / transform reads wait for the move.
+# 3. End to end against the stand-in: parents applied, a create under a missing parent only skips its own subtree.
+
+ADDR = "tcp://127.0.0.1:5592"
+MOVE = {"type": "UnityEngine.Transform", "propertyName": "position", "value": "0,0,10"}
+
+def log(msg):
+    print(f"[Bench DAG] {msg}")
+
+def move(name):
+    return make_command("set_property", name, payload_json=json.dumps(MOVE))
+
+def depends(p, i, j):
+    """True if command i (transitively) waits for command j."""
+    seen, stack = set(), [i]
+    while stack:
+        for d in p.deps[stack.pop()]:
+            if d == j:
+                return True
+            if d not in seen:
+                seen.add(d)
+                stack.append(d)
+    return False
+
+def level_depth(objects=2000):
+    commands = bridge_dag.synthetic_level(objects, moves=True)
+    t0 = time.perf_counter()
+    p = bridge_dag.plan(commands)
+    log(f"{len(commands)} commands ({objects} objects, one move each): depth {p.depth} "
+        f"in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    return p.depth <= 20
+
+def small_tree():
+    commands = [
+        make_create_command("Root"),                  # 0
+        make_create_command("A", parent="Root"),      # 1
+        make_create_command("B", parent="Root"),      # 2
+        make_create_command("A1", parent="A"),        # 3
+        move("A1"),                                   # 4
+        move("B"),                                    # 5
+        move("A"),                                    # 6
+        make_command("get_property", "A1", payload_json=json.dumps(MOVE)),  # 7
+        make_create_command("A2", parent="A"),        # 8
+        move("Root"),                                 # 9
+    ]
+    p = bridge_dag.plan(commands)
+    checks = {
+        "sibling moves independent": not depends(p, 5, 4) and not depends(p, 6, 5),
+        "parent move after child move": depends(p, 6, 4),
+        "child read after parent move": depends(p, 7, 6),
+        "child create after parent move": depends(p, 8, 6),
+        "root move after whole tree": all(depends(p, 9, j) for j in (4, 5, 6, 7, 8)),
+    }
+    for name, ok in checks.items():
+        log(f"  {name}: {'ok' if ok else 'WRONG'}")
+    return commands, all(checks.values())
+
+def end_to_end(commands):
+    commands = commands + [
+        make_create_command("C1", parent="Missing"),
+        make_create_command("C2", parent="C1"),
+        move("B"),
+    ]
+    server = StandInServer(ADDR).start()
+    flow = FlowController(ADDR)
+    try:
+        result = bridge_dag.run_plan(bridge_dag.plan(commands), bridge_dag.flow_sender(flow), verbose=False)
+    finally:
+        flow.close()
+        server.stop()
+    log(f"End to end: {result.summary()}")
+    objects = server.scene.objects
+    parents = {n: objects[n].parent.name if objects[n].parent else "" for n in objects}
+    ok = parents == {"Root": "", "A": "Root", "B": "Root", "A1": "A", "A2": "A"}
+    ok &= result.failed == [10] and result.skipped == 1 and result.statuses[12] == "ok"
+    return ok
+
+def run():
+    ok = level_depth()
+    commands, tree_ok = small_tree()
+    ok &= tree_ok
+    ok &= end_to_end(commands)
+    log("PASS" if ok else "FAIL")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if run() else 1)
@@ -0,0 +1,48 @@
+import sys
+import time
+import numpy as np
+from combat_sim import CombatSim, make_params
+
+# Engagement timing in the combat simulator.
+# 1. Every drone of the default 10k run is firing by (spawn_distance - attack_range) / drone_speed + dt.
+# 2. One ship, 10 drones: the first volley is 10 shots.
+# 3. Steps per second at 10k drones.
+
+DT = 0.02
+
+def log(msg):
+    print(f"[Bench Combat] {msg}")
+
+def arrival(drones=10000, ships=1000):
+    p = make_params()
+    sim = CombatSim(drones, ships, p)
+    deadline = (p["spawn_distance"] - p["attack_range"]) / p["drone_speed"] + DT
+    while sim.time < deadline + 1e-9:
+        sim.step(DT)
+    late = int(np.count_nonzero(np.isnan(sim.drone_first_shot)))
+    log(f"{drones} drones: {drones - late} firing by t={deadline:.2f}s, {late} still chasing")
+    return late == 0
+
+def first_volley():
+    p = make_params()
+    sim = CombatSim(10, 1, p)
+    while sim.shots == 0:
+        sim.step(DT)
+    log(f"1 ship, 10 drones: first volley {sim.shots} shots at t={sim.time - DT:.2f}s")
+    return sim.shots == 10
+
+def throughput(drones=10000, ships=1000, seconds=2.0):
+    sim = CombatSim(drones, ships)
+    t0 = time.perf_counter()
+    sim.run(seconds, DT)
+    log(f"{drones} drones: {seconds / DT / (time.perf_counter() - t0):.0f} steps/s")
+
+def run():
+    ok = arrival()
+    ok &= first_volley()
+    throughput()
+    log("PASS" if ok else "FAIL")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if run() else 1)
@@ -0,0 +1,88 @@
+import sys
+import time
+import numpy as np
+import fix_duplicates
+import hierarchy_columnar
+from zmq_bridge import UnityZeroMQClient
+from zmq_standin import StandInServer
+
+# Duplicate cleanup at scale.
+# 1. Grouping + planning time for 25k..200k objects (should grow linearly).
+# 2. Survivor inside a later group's extra: X keeps its copy under Y, then Y drops that copy;
+#    X must fall back to its other copy.
+# 3. End to end against the stand-in: 100k objects, 5% duplicated, dry run then --apply.
+
+ADDR = "tcp://127.0.0.1:5595"
+
+def log(msg):
+    print(f"[Bench Dedupe] {msg}")
+
+def scene_tree(count, dup_rate=0.05, seed=0):
+    rng = np.random.default_rng(seed)
+    unique = int(count * (1 - dup_rate))
+    names = [f"Obj_{i}" for i in range(unique)]
+    names += [f"Obj_{i}" for i in rng.integers(0, unique, size=count - unique)]
+    comps = [["UnityEngine.Transform", "Core.VirtualTransform"]] * count
+    positions = rng.uniform(-1e4, 1e4, size=(count, 3))
+    return names, comps, positions
+
+def scaling():
+    for count in (25000, 50000, 100000, 200000):
+        names, comps, positions = scene_tree(count)
+        tree = hierarchy_columnar.decode(hierarchy_columnar.encode(np.full(count, -1), names, comps, positions))
+        t0 = time.perf_counter()
+        groups = fix_duplicates.find_groups(tree, ("name", "components"), names=None)
+        _, to_destroy = fix_duplicates.plan(tree, groups)
+        elapsed = time.perf_counter() - t0
+        log(f"{count:7d} objects: {elapsed * 1000:7.1f} ms ({elapsed / count * 1e9:5.0f} ns/object), "
+            f"{len(groups)} groups, {len(to_destroy)} extras")
+
+def nested_survivor():
+    #   Root
+    #     P
+    #       Y (inactive)     <- y2, doomed: y1 is the active one
+    #         X (active)     <- x_a, picked first by the "active" policy
+    #       Y (active)       <- y1
+    #     X (inactive)       <- x_b
+    parents = np.array([-1, 0, 1, 2, 1, 0])
+    names = ["Root", "P", "Y", "X", "Y", "X"]
+    comps = [["UnityEngine.Transform"]] * 6
+    active = [True, True, False, True, True, False]
+    tree = hierarchy_columnar.decode(hierarchy_columnar.encode(parents, names, comps, np.zeros((6, 3)), active))
+    groups = fix_duplicates.find_groups(tree, ("name",), names=None)
+    decisions, to_destroy = fix_duplicates.plan(tree, groups, policy="active")
+    survivors = sorted(s for s, _ in decisions)
+    ok = survivors == [4, 5] and to_destroy == [2]
+    log(f"Nested survivor: keep {survivors}, destroy {to_destroy}  {'ok' if ok else 'WRONG'}")
+    return ok
+
+def end_to_end(count=100000):
+    server = StandInServer(ADDR)
+    names, comps, positions = scene_tree(count)
+    for name, pos in zip(names, positions):
+        server.scene.add(name, pos, ["Core.VirtualTransform"])
+    server.start()
+    client = UnityZeroMQClient(ADDR, reliable=True, timeout=10.0)
+
+    expected = count - len(set(names))
+    dry = fix_duplicates.cleanup_scene(client, names=None, apply=False)
+    ok = dry == expected and len(server.scene.instances) == count
+
+    t0 = time.perf_counter()
+    removed = fix_duplicates.cleanup_scene(client, names=None, apply=True)
+    elapsed = time.perf_counter() - t0
+    ok &= removed == expected and len(server.scene.instances) == count - expected
+    ok &= fix_duplicates.cleanup_scene(client, names=None) == 0
+    server.stop()
+    log(f"End to end: {removed} of {count} removed in {elapsed * 1000:.0f} ms (one destroy_instances command)")
+    return ok
+
+def run():
+    scaling()
+    ok = nested_survivor()
+    ok &= end_to_end()
+    log("PASS" if ok else "FAIL")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if run() else 1)
@@ -0,0 +1,68 @@
+import time
+from zmq_bridge import make_command, UnityZeroMQClient
+from zmq_flow import FlowController
+from zmq_standin import StandInServer
+
+# Flow control benchmark against the stand-in bridge in editor-emulation mode:
+# one request per 16 ms Update, 100 us main-thread cost per command, 1 s reply timeout.
+# Compares naive one-command-per-request, one fixed oversized batch, and FlowController.
+
+ADDR = "tcp://127.0.0.1:5591"
+FRAME_TIME = 0.016
+COMMAND_COST = 100e-6
+BODIES = 20000
+
+def log(msg):
+    print(f"[Bench Flow] {msg}")
+
+def commands_for(count, offset=0.0):
+    return [make_command("set_transform", f"Body_{i}", (i + offset, 0.0, 0.0)) for i in range(count)]
+
+def naive(client, count):
+    t0 = time.perf_counter()
+    timeouts = 0
+    for cmd in commands_for(count):
+        reply = client.send_command(cmd)
+        if reply is not None and reply.status == "error: timeout":
+            timeouts += 1
+    return count / (time.perf_counter() - t0), timeouts
+
+def single_batch(client, count):
+    t0 = time.perf_counter()
+    reply = client.send_batch(commands_for(count))
+    done = count if reply.status != "error: timeout" else 0
+    return done / (time.perf_counter() - t0), int(reply.status == "error: timeout")
+
+def adaptive(count):
+    flow = FlowController(ADDR)
+    results = flow.run(commands_for(count, offset=1.0))
+    flow.close()
+    stats = flow.stats.snapshot()
+    ok = sum(1 for r in results if not r.status.startswith("error"))
+    return stats, ok
+
+def run():
+    server = StandInServer(ADDR, frame_time=FRAME_TIME, command_cost=COMMAND_COST)
+    server.scene.populate(BODIES)
+    server.start()
+    client = UnityZeroMQClient(ADDR)
+
+    log(f"Editor emulation: {FRAME_TIME * 1000:.0f} ms frames, {COMMAND_COST * 1e6:.0f} us/command, "
+        f"max rate ~{1 / COMMAND_COST:.0f} commands/s")
+
+    rate, timeouts = naive(client, 200)
+    log(f"Naive (1 command/request, 200 cmds):   {rate:8.0f} cmds/s  timeouts={timeouts}")
+
+    rate, timeouts = single_batch(client, BODIES)
+    log(f"Single batch ({BODIES} cmds):          {rate:8.0f} cmds/s  timeouts={timeouts}")
+
+    stats, ok = adaptive(BODIES)
+    log(f"FlowController ({BODIES} cmds):        {stats['throughput_per_s']:8.0f} cmds/s  "
+        f"timeouts={stats['timeouts']} client_timeouts={stats['client_timeouts']} ok={ok}")
+    log(f"  service_rate={stats['service_rate_per_s']:.0f}/s  rtt_ewma={stats['rtt_ewma_ms']:.0f} ms  "
+        f"requests={stats['requests']} retries={stats['retries']}")
+
+    server.stop()
+
+if __name__ == "__main__":
+    run()
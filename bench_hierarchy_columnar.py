@@ -0,0 +1,119 @@
+import sys
+import json
+import time
+import tracemalloc
+import numpy as np
+import hierarchy_columnar
+from zmq_bridge import UnityZeroMQClient
+from zmq_standin import StandInServer
+
+# Columnar hierarchy vs nested JSON for a large synthetic scene.
+# 1. Build an N-node tree (pre-order) and both encodings of it.
+# 2. Load each: json.loads -> dict tree vs hierarchy_columnar.decode, time + peak memory.
+# 3. Check both describe the same tree, then fetch a columnar hierarchy from the stand-in bridge.
+#
+#   python bench_hierarchy_columnar.py [nodes]   (default 1,000,000)
+
+ADDR = "tcp://127.0.0.1:5594"
+COMPONENT_SETS = [
+    ["UnityEngine.Transform"],
+    ["UnityEngine.Transform", "UnityEngine.MeshFilter", "UnityEngine.MeshRenderer"],
+    ["UnityEngine.Transform", "UnityEngine.Rigidbody", "Core.VirtualTransform"],
+    ["UnityEngine.Transform", "Core.Planet", "Core.VirtualTransform"],
+]
+
+def log(msg):
+    print(f"[Bench Hierarchy] {msg}")
+
+def synthetic_tree(count, seed=0, max_depth=12):
+    """Random pre-order tree: each node goes one level down, stays, or climbs back up (roots every ~1000)."""
+    rng = np.random.default_rng(seed)
+    steps = rng.choice([1, 0, -1, -2], size=count, p=[0.4, 0.35, 0.2, 0.05])
+    new_root = rng.random(count) < 0.001
+    parents = np.empty(count, dtype=np.int64)
+    path = []  # Ancestors of the current node
+    for i in range(count):
+        if i == 0 or new_root[i]:
+            path = []
+        elif steps[i] > 0 and len(path) < max_depth:
+            path.append(i - 1)
+        elif steps[i] < 0:
+            del path[max(0, len(path) + steps[i]):]
+        parents[i] = path[-1] if path else -1
+    names = [f"Node_{i % 50000}" for i in range(count)]
+    comps = [COMPONENT_SETS[k] for k in rng.integers(0, len(COMPONENT_SETS), size=count)]
+    positions = rng.uniform(-1e4, 1e4, size=(count, 3)).astype(np.float32)
+    return parents, names, comps, positions
+
+def to_json(parents, names, comps, positions):
+    nodes = [{"name": names[i], "components": comps[i], "position": positions[i].tolist(), "children": []}
+             for i in range(len(parents))]
+    roots = []
+    for i, p in enumerate(parents.tolist()):
+        (roots if p < 0 else nodes[p]["children"]).append(nodes[i])
+    return json.dumps({"object_count": len(nodes), "roots_count": len(roots), "objects": roots})
+
+def measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def count_json(nodes):
+    total, stack = 0, list(nodes)
+    while stack:
+        node = stack.pop()
+        total += 1
+        stack.extend(node["children"])
+    return total
+
+def run(count=1000000):
+    parents, names, comps, positions = synthetic_tree(count)
+    data = hierarchy_columnar.encode(parents, names, comps, positions).SerializeToString()
+    text = to_json(parents, names, comps, positions)
+    log(f"{count} nodes: columnar {len(data) / 1e6:.1f} MB, JSON {len(text) / 1e6:.1f} MB")
+
+    # Timing without tracemalloc (it slows allocation-heavy code a lot)
+    t0 = time.perf_counter()
+    tree = hierarchy_columnar.decode(data)
+    t1 = time.perf_counter()
+    tree.depths()
+    tree.children(0)
+    t2 = time.perf_counter()
+    doc = json.loads(text)
+    t3 = time.perf_counter()
+    log(f"Load:  columnar {(t1 - t0) * 1000:7.1f} ms (+{(t2 - t1) * 1000:.0f} ms depths/children)   "
+        f"JSON {(t3 - t2) * 1000:7.1f} ms")
+    del doc
+
+    _, _, peak_columnar = measure(lambda: hierarchy_columnar.decode(data))
+    _, _, peak_json = measure(lambda: json.loads(text))
+    log(f"Peak memory: columnar {peak_columnar / 1e6:7.1f} MB   JSON {peak_json / 1e6:7.1f} MB "
+        f"({peak_json / max(peak_columnar, 1):.0f}x)")
+
+    # Same tree both ways
+    doc = json.loads(text)
+    ok = count_json(doc["objects"]) == len(tree) and len(tree.roots()) == doc["roots_count"]
+    ok &= np.array_equal(tree.parents, hierarchy_columnar.decode(
+        hierarchy_columnar.from_json(doc["objects"])).parents)
+    ok &= tree.node(1).name == names[1] and list(tree.node(1).components) == comps[1]
+    ok &= tree.subtree_sizes()[tree.roots()].sum() == len(tree)
+    sizes = tree.subtree_sizes()
+    ok &= all(tree.subtree_size(i) == sizes[i] for i in range(0, len(tree), max(1, len(tree) // 1000)))
+    ok &= (t1 - t0) < 1.0
+
+    server = StandInServer(ADDR)
+    server.scene.populate(1000)
+    server.start()
+    fetched = UnityZeroMQClient(ADDR).get_hierarchy_columnar()
+    server.stop()
+    ok &= fetched is not None and len(fetched) == 1000 and len(fetched.with_component("VirtualTransform")) == 1000
+
+    log("PASS" if ok else "FAIL")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000) else 1)
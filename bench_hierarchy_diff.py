@@ -0,0 +1,98 @@
+import sys
+import time
+import numpy as np
+import hierarchy_columnar
+import hierarchy_diff
+from bench_hierarchy_columnar import synthetic_tree
+
+# Merkle differ on a 100k-object scene: diff cost must follow the number of edits, not the scene size.
+# Each round applies k position edits + a component change, a removal, an addition and a
+# reparent to a copy of the scene, then checks the diff reports exactly those.
+
+NODES = 100000
+
+def log(msg):
+    print(f"[Bench Diff] {msg}")
+
+def build(parents, names, comps, positions, active=None):
+    return hierarchy_columnar.decode(hierarchy_columnar.encode(parents, names, comps, positions, active))
+
+def mutate(base, k, rng):
+    parents, names, comps, positions = (list(base[0]), list(base[1]), list(base[2]), base[3].copy())
+    count = len(parents)
+    expected = {"changed": set(), "added": {"Spawned_Object"}, "removed": set(), "moved": set()}
+    has_child = np.zeros(count, dtype=bool)
+    has_child[[p for p in parents if p >= 0]] = True
+    leaves = np.flatnonzero(~has_child & (np.array(parents) >= 0))
+
+    # Position edits (well beyond tolerance) on k random nodes, one component change
+    for i in rng.choice(count, size=k, replace=False).tolist():
+        positions[i] += 1.0
+        expected["changed"].add(names[i])
+    i = int(rng.integers(count))
+    comps[i] = list(comps[i]) + ["Gameplay.Added"]
+    expected["changed"].add(names[i])
+
+    # Reparent: a leaf under an earlier, different parent (keeps parents[i] < i)
+    mover = int(rng.choice(leaves[leaves > 1000]))
+    parents[mover] = int(rng.integers(0, 1000))
+    expected["moved"].add(names[mover])
+
+    # Removal: another leaf, indices after it shift down by one
+    removed = int(rng.choice(leaves[leaves != mover]))
+    expected["removed"].add(names[removed])
+    expected["changed"].discard(names[removed])
+    parents = [p - (p > removed) for j, p in enumerate(parents) if j != removed]
+    del names[removed], comps[removed]
+    positions = np.delete(positions, removed, axis=0)
+
+    # Addition: a brand new root at the end
+    parents.append(-1)
+    names.append("Spawned_Object")
+    comps.append(["UnityEngine.Transform"])
+    positions = np.vstack([positions, [[0.0, 0.0, 0.0]]])
+    return build(parents, names, comps, positions), expected
+
+def tails(rows):
+    return {row[0].rsplit("/", 1)[-1] for row in rows}
+
+def moved_with_removal():
+    """X moves from R to Q and loses its child Z on the way: Z must still be reported."""
+    comps = [["UnityEngine.Transform"]]
+    a = build(np.array([-1, 0, 1, 1, -1]), ["R", "X", "Y", "Z", "Q"], comps * 5, np.zeros((5, 3)))
+    b = build(np.array([-1, -1, 1, 2]), ["R", "Q", "X", "Y"], comps * 4, np.zeros((4, 3)))
+    result = hierarchy_diff.diff(hierarchy_diff.Snapshot(a), hierarchy_diff.Snapshot(b))
+    ok = result.moved == [("R/X", "Q/X")] and result.removed == [("R/X/Z", 1)] and not result.added
+    log(f"Removal inside a moved subtree: {result.summary()}  {'ok' if ok else 'MISMATCH'}")
+    return ok
+
+def run():
+    rng = np.random.default_rng(1)
+    base = synthetic_tree(NODES)
+    # Unique names so the expected set is unambiguous
+    base = (base[0], [f"Node_{i}" for i in range(NODES)], base[2], base[3])
+
+    t0 = time.perf_counter()
+    before = hierarchy_diff.Snapshot(build(*base))
+    log(f"Snapshot hashing ({NODES} nodes): {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    ok = hierarchy_diff.diff(before, hierarchy_diff.Snapshot(build(*base))).empty()
+    for k in (0, 10, 100, 1000, 10000):
+        tree, expected = mutate(base, k, rng)
+        after = hierarchy_diff.Snapshot(tree)
+        t0 = time.perf_counter()
+        result = hierarchy_diff.diff(before, after)
+        elapsed = time.perf_counter() - t0
+
+        round_ok = (tails(result.changed) == expected["changed"] and tails(result.added) == expected["added"] and
+                    tails(result.removed) == expected["removed"] and
+                    {new.rsplit("/", 1)[-1] for _, new in result.moved} == expected["moved"])
+        ok &= round_ok
+        log(f"k={k:6d}: {elapsed * 1000:8.1f} ms  {result.summary()}  {'ok' if round_ok else 'MISMATCH'}")
+
+    ok &= moved_with_removal()
+    log("PASS" if ok else "FAIL")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if run() else 1)
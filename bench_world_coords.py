@@ -0,0 +1,90 @@
+import sys
+import time
+import numpy as np
+import game_state_pb2
+import world_coords
+from zmq_bridge import UnityZeroMQClient
+from zmq_standin import StandInServer
+
+# Precision + throughput check for the sector/offset position encoding (world_coords.py).
+# 1. Round-trip error vs plain float32 (Vector3Msg) from 1 unit out to 1e12 units.
+# 2. Encode/decode throughput for large (N,3) float64 arrays.
+# 3. End to end: set_transforms(precise=True) + get_hierarchy against the stand-in bridge.
+
+ADDR = "tcp://127.0.0.1:5593"
+MAX_ERROR = 1.6e-5  # Half a float32 ulp just below |offset| = 512
+
+def log(msg):
+    print(f"[Bench Coords] {msg}")
+
+def precision(rng, count=100000):
+    ok = True
+    log(f"{'scale':>8} {'float32 max err':>16} {'sector max err':>15}")
+    for exponent in (0, 4, 6, 8, 10, 11, 12):
+        scale = 10.0 ** exponent
+        positions = rng.uniform(-scale, scale, size=(count, 3))
+        as_float32 = np.abs(positions.astype(np.float32).astype(np.float64) - positions).max()
+        sectors, offsets = world_coords.encode(positions)
+        error = np.abs(world_coords.decode(sectors, offsets) - positions).max()
+        log(f"{scale:8.0e} {as_float32:16.3e} {error:15.3e}")
+        ok &= error <= MAX_ERROR
+
+    # Exact round trip through the packed buffers and the single-position message
+    positions = rng.uniform(-1e11, 1e11, size=(count, 3))
+    sector_bytes, offset_bytes = world_coords.pack(positions)
+    sectors, offsets = world_coords.encode(positions)
+    ok &= np.array_equal(world_coords.unpack(sector_bytes, offset_bytes), world_coords.decode(sectors, offsets))
+    msg = game_state_pb2.SectorVector3Msg.FromString(world_coords.to_msg(*positions[0]).SerializeToString())
+    ok &= np.abs(np.array(world_coords.from_msg(msg)) - positions[0]).max() <= MAX_ERROR
+
+    try:
+        world_coords.encode([[3e12, 0.0, 0.0]])
+        ok = False
+    except ValueError:
+        pass
+    return ok
+
+def throughput(rng, count=1000000, rounds=5):
+    positions = rng.uniform(-1e12, 1e12, size=(count, 3))
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        sector_bytes, offset_bytes = world_coords.pack(positions)
+    t1 = time.perf_counter()
+    for _ in range(rounds):
+        world_coords.unpack(sector_bytes, offset_bytes)
+    t2 = time.perf_counter()
+    size = len(sector_bytes) + len(offset_bytes)
+    log(f"pack:   {count * rounds / (t1 - t0) / 1e6:6.1f} M positions/s")
+    log(f"unpack: {count * rounds / (t2 - t1) / 1e6:6.1f} M positions/s")
+    log(f"wire:   {size / count:.0f} bytes/position (vs 24 for packed doubles, 12 for float32)")
+
+def end_to_end(rng, count=1000):
+    server = StandInServer(ADDR)
+    server.scene.populate(count)
+    server.start()
+    client = UnityZeroMQClient(ADDR)
+    names = [f"Body_{i}" for i in range(count)]
+    positions = rng.uniform(-1e11, 1e11, size=(count, 3))
+
+    reply = client.set_transforms(names, positions, precise=True)
+    state = client.get_hierarchy()
+    server.stop()
+    if reply is None or state is None or reply.status != "ok":
+        log(f"End to end failed: {reply.status if reply else 'no reply'}")
+        return False
+
+    world = world_coords.world_positions(state)
+    error = max(np.abs(np.array(world[n]) - positions[i]).max() for i, n in enumerate(names))
+    log(f"End to end ({count} objects at 1e11): max error {error:.3e}")
+    return error <= MAX_ERROR
+
+def run():
+    rng = np.random.default_rng(0)
+    ok = precision(rng)
+    throughput(rng)
+    ok &= end_to_end(rng)
+    log("PASS" if ok else "FAIL")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if run() else 1)
@@ -0,0 +1,81 @@
+import sys
+import time
+import numpy as np
+import game_state_pb2
+from zmq_templates import CommandTemplate, TemplateBatch
+
+# Microbenchmark: client-side cost of building one set_transform message.
+# No socket involved - this isolates serialization, the client's hot spot when streaming.
+
+def log(msg):
+    print(f"[Bench Templates] {msg}")
+
+def build_protobuf(name, x, y, z):
+    # Current path (what set_transform did before templates)
+    cmd = game_state_pb2.CommandMsg()
+    cmd.action = "set_transform"
+    cmd.target = name
+    cmd.vector_payload.x = x
+    cmd.vector_payload.y = y
+    cmd.vector_payload.z = z
+    return cmd.SerializeToString()
+
+def verify(names, xyz):
+    # Template bytes must parse to the same message as the protobuf path
+    batch = TemplateBatch("set_transform", names).render(xyz)
+    for i, msg in enumerate(batch.messages()):
+        a = game_state_pb2.CommandMsg.FromString(bytes(msg))
+        b = game_state_pb2.CommandMsg.FromString(build_protobuf(names[i], *map(float, xyz[i].astype(np.float32))))
+        if a != b:
+            log(f"MISMATCH at {names[i]}: {a} != {b}")
+            return False
+    return True
+
+def per_message_us(fn, count):
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) / count * 1e6
+
+def run(entities=500, frames=20):
+    names = [f"Body_{i}" for i in range(entities)]
+    rng = np.random.default_rng(0)
+    xyz = rng.uniform(-1e4, 1e4, size=(frames, entities, 3))
+    rows = xyz.tolist()
+    total = entities * frames
+
+    if not verify(names, xyz[0]):
+        sys.exit(1)
+    log("Template output matches protobuf serialization.")
+
+    def protobuf_path():
+        for f in range(frames):
+            for i, name in enumerate(names):
+                p = rows[f][i]
+                build_protobuf(name, p[0], p[1], p[2])
+
+    tpls = [CommandTemplate("set_transform", n) for n in names]
+    def template_path():
+        for f in range(frames):
+            for i, tpl in enumerate(tpls):
+                p = rows[f][i]
+                tpl.render(p[0], p[1], p[2])
+
+    batch = TemplateBatch("set_transform", names)
+    def batch_path():
+        for f in range(frames):
+            for msg in batch.render(xyz[f]).messages():
+                pass
+
+    results = [
+        ("CommandMsg + SerializeToString", per_message_us(protobuf_path, total)),
+        ("CommandTemplate.render", per_message_us(template_path, total)),
+        ("TemplateBatch.render (NumPy)", per_message_us(batch_path, total)),
+    ]
+
+    log(f"{entities} entities x {frames} frames ({total} messages)")
+    base = results[0][1]
+    for label, us in results:
+        log(f"  {label:<32} {us:7.3f} us/msg  ({base / us:5.1f}x)")
+
+if __name__ == "__main__":
+    run()
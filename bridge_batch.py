@@ -0,0 +1,205 @@
+"""
+Resumable command batches.
+
+execute_batch / send_batch send a whole command list in one request, so when
+command 17 of 25 fails the only option is running everything again, delete_all
+included. run_batches() instead:
+
+1. splits the list into requests of at most max_commands / max_bytes,
+2. sends them in order with stop-on-error and reads one status per command,
+3. appends every confirmed command (hash) to a checkpoint file,
+4. on the next run skips the prefix that already completed (as long as those
+   commands are unchanged) and resumes at the first failed index.
+
+A request that gets no reply is split in half (and later requests capped at the
+smaller size) - but only resent if resendable(chunk) says running it twice is
+harmless; otherwise the run stops there, because the bridge may still execute it.
+
+    from bridge_batch import run_batches, http_sender
+    result = run_batches(commands, http_sender(), checkpoint="level.ckpt")
+    if not result.ok:
+        index, status = result.failure
+"""
+import os
+import json
+import hashlib
+
+def log(msg):
+    print(f"[Batch] {msg}")
+
+def command_bytes(cmd):
+    """Stable serialized form: JSON dict (AgentBridge) or CommandMsg (ZeroMQ)."""
+    if isinstance(cmd, dict):
+        return json.dumps(cmd, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return cmd.SerializeToString(deterministic=True)
+
+def command_hash(cmd):
+    return hashlib.blake2b(command_bytes(cmd), digest_size=8).hexdigest()
+
+def is_ok(status):
+    return not (status.startswith("error") or status.startswith("skipped"))
+
+
+class BatchResult:
+    def __init__(self, total):
+        self.total = total
+        self.statuses = [None] * total  # None: not run in this session
+        self.resumed = 0                # Leading commands skipped thanks to the checkpoint
+        self.completed = 0              # Commands known to be done (resumed ones included)
+        self.failure = None             # (index, status) of the first failure
+        self.requests = 0
+
+    @property
+    def ok(self):
+        return self.completed == self.total
+
+    def summary(self):
+        text = f"{self.completed}/{self.total} done in {self.requests} requests"
+        if self.resumed:
+            text += f" ({self.resumed} from checkpoint)"
+        if self.failure:
+            text += f"; failed at #{self.failure[0]}: {self.failure[1]}"
+        return text
+
+
+class Checkpoint:
+    """Hashes of the commands completed so far, one per line (append-only)."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return []
+        with open(self.path) as f:
+            return [line.strip() for line in f if line.strip()]
+
+    def resume_point(self, hashes):
+        """Length of the completed prefix that still matches the command list."""
+        done = self.load()
+        n = 0
+        while n < len(done) and n < len(hashes) and done[n] == hashes[n]:
+            n += 1
+        if n < len(done):
+            # The list changed after index n: forget the rest so the file stays a true prefix
+            self.reset(hashes[:n])
+        return n
+
+    def reset(self, hashes=()):
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            f.writelines(h + "\n" for h in hashes)
+        os.replace(tmp, self.path)
+
+    def append(self, hashes):
+        if not self.path:
+            return
+        with open(self.path, "a") as f:
+            f.writelines(h + "\n" for h in hashes)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def run_batches(commands, send, checkpoint=None, max_commands=500, max_bytes=1 << 20,
+                resendable=lambda chunk: False, resume=True, verbose=True):
+    """
+    commands: dicts (AgentBridge) or CommandMsgs (ZeroMQ), in dependency order.
+    send(chunk): one status string per command (stop-on-error: "skipped" after a
+    failure), or None if the request got no usable reply (outcome unknown).
+    It raises ConnectionError when the bridge is down (stops the run, no splitting).
+    checkpoint: file path; removed once everything has completed.
+    Returns a BatchResult.
+    """
+    commands = list(commands)
+    hashes = [command_hash(c) for c in commands]
+    sizes = [len(command_bytes(c)) for c in commands]
+    result = BatchResult(len(commands))
+    ckpt = Checkpoint(checkpoint)
+
+    start = ckpt.resume_point(hashes) if resume else 0
+    if not resume:
+        ckpt.reset()
+    result.resumed = result.completed = start
+    if start and verbose:
+        log(f"Resuming at #{start} ({start} commands already done).")
+
+    cap = max_commands
+    while start < len(commands):
+        # 1. Next chunk: up to cap commands / max_bytes (always at least one)
+        end, size = start, 0
+        while end < len(commands) and end - start < cap and (end == start or size + sizes[end] <= max_bytes):
+            size += sizes[end]
+            end += 1
+        chunk = commands[start:end]
+
+        # 2. Send
+        result.requests += 1
+        try:
+            statuses = send(chunk)
+        except ConnectionError as e:
+            result.failure = (start, f"error: bridge unreachable ({e})")
+            break
+        if statuses is None:
+            if len(chunk) > 1 and resendable(chunk):
+                cap = max(1, len(chunk) // 2)
+                if verbose:
+                    log(f"No reply for #{start}-{end - 1}; retrying in chunks of {cap}.")
+                continue
+            result.failure = (start, "error: no reply (outcome unknown)")
+            break
+
+        # 3. Record what completed, stop at the first failure
+        statuses = list(statuses) + ["skipped"] * (len(chunk) - len(statuses))
+        done = 0
+        for status in statuses:
+            if not is_ok(status):
+                break
+            done += 1
+        result.statuses[start:end] = statuses
+        ckpt.append(hashes[start:start + done])
+        result.completed += done
+        if done < len(chunk):
+            result.failure = (start + done, statuses[done])
+            break
+        start = end
+
+    if result.ok:
+        ckpt.clear()
+    if verbose:
+        log(result.summary())
+    return result
+
+
+# --- Senders ---
+
+def http_sender(retry=5):
+    """AgentBridge (HTTP) batches via unity_bridge.execute_batch_results."""
+    import unity_bridge
+
+    def send(chunk):
+        return unity_bridge.execute_batch_results(chunk, retry=retry)
+    return send
+
+def zmq_sender(client):
+    """ZeroMQBridge "batch" (CommandMsgs); pair with resendable=zmq_resendable."""
+    def send(chunk):
+        reply = client.send_batch(chunk, stop_on_error=True)
+        if reply is None and client.breaker is not None and client.breaker.state == client.breaker.OPEN:
+            raise ConnectionError("circuit open")
+        if reply is None or reply.status == "error: timeout":
+            return None
+        if not reply.results:
+            # Rejected as a whole (e.g. "error: missing batch"): nothing ran
+            return [reply.status] + ["skipped"] * (len(chunk) - 1)
+        return [r.status for r in reply.results]
+    return send
+
+def zmq_resendable(chunk):
+    from zmq_bridge import is_idempotent
+    return all(is_idempotent(c) for c in chunk)
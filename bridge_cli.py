@@ -0,0 +1,97 @@
+"""
+Thin front end for bridge_daemon.py.
+
+Forwards one CLI call to the warm daemon and prints its output.
+Imports only the standard library basics so it starts in a few milliseconds
+(no requests / zmq / protobuf - the daemon already has those loaded).
+
+Usage:
+    python bridge_cli.py unity ping
+    python bridge_cli.py unity set_transform Earth 200 0 0
+    python bridge_cli.py zmq set_pos PlayerShip 0 10 0
+    python bridge_cli.py daemon status | metrics | shutdown
+
+Tip: `python -S -E bridge_cli.py ...` skips site-packages scanning for the fastest start.
+If the daemon is not running it is spawned on first use.
+"""
+import os
+import sys
+import json
+import socket
+
+# --- DAEMON ADDRESS ---
+# Unix socket where available, localhost TCP otherwise (Windows).
+if hasattr(socket, "AF_UNIX"):
+    DAEMON_ADDR = os.environ.get("UNITY_BRIDGE_SOCKET",
+                                 os.path.join(os.environ.get("TMPDIR", "/tmp"), "unity_bridge.sock"))
+else:
+    DAEMON_ADDR = ("127.0.0.1", int(os.environ.get("UNITY_BRIDGE_DAEMON_PORT", "7787")))
+
+TOOLS = ("unity", "zmq", "daemon")
+SPAWN_TIMEOUT = 10.0
+# ----------------------
+
+def connect():
+    if isinstance(DAEMON_ADDR, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.connect(DAEMON_ADDR)
+    return sock
+
+def spawn_daemon():
+    """Starts bridge_daemon.py in the background and waits for its socket."""
+    import subprocess
+    import time
+
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bridge_daemon.py")
+    print(f"[BridgeCLI] Starting daemon ({script})...", file=sys.stderr)
+    subprocess.Popen([sys.executable, script],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+
+    deadline = time.monotonic() + SPAWN_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            return connect()
+        except OSError:
+            time.sleep(0.05)
+    return None
+
+def send_request(tool, argv, spawn=True):
+    """
+    Sends {"tool", "argv"} to the daemon.
+    Returns (exit_code, output_text).
+    """
+    try:
+        sock = connect()
+    except OSError:
+        sock = spawn_daemon() if spawn else None
+        if sock is None:
+            return 1, "[BridgeCLI] Daemon not reachable.\n"
+
+    with sock:
+        sock.sendall(json.dumps({"tool": tool, "argv": argv}).encode("utf-8") + b"\n")
+        chunks = []
+        while True:
+            data = sock.recv(65536)
+            if not data:
+                break
+            chunks.append(data)
+
+    if not chunks:
+        return 1, "[BridgeCLI] Daemon closed the connection without a reply.\n"
+    reply = json.loads(b"".join(chunks))
+    return reply.get("code", 0), reply.get("output", "")
+
+def main(argv):
+    if len(argv) < 2 or argv[0] not in TOOLS:
+        print("Usage: bridge_cli.py [unity|zmq|daemon] [action] [args...]")
+        return 1
+
+    code, output = send_request(argv[0], argv[1:], spawn=(argv[0] != "daemon"))
+    sys.stdout.write(output)
+    return code
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
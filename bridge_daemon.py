@@ -0,0 +1,151 @@
+"""
+Warm Bridge Daemon.
+
+Long-lived process that keeps requests / zmq / protobuf imported and holds
+the HTTP keep-alive session (unity_bridge.SESSION) and one ZeroMQ client open.
+bridge_cli.py forwards CLI calls here over a local socket, so each shell
+invocation skips the heavy imports and connection setup.
+
+Usage:
+    python bridge_daemon.py          # serve until Ctrl+C or `bridge_cli.py daemon shutdown`
+"""
+import io
+import os
+import json
+import time
+import socketserver
+import contextlib
+
+import unity_bridge
+import zmq_bridge
+from bridge_metrics import METRICS
+from bridge_cli import DAEMON_ADDR, connect
+
+def log(msg):
+    print(f"[BridgeDaemon] {msg}")
+
+class BridgeDaemon:
+    def __init__(self):
+        self.started = time.time()
+        self.served = 0
+        self.running = True
+        self.zmq_client = None  # Created on first zmq call
+
+    def get_zmq_client(self):
+        if self.zmq_client is None:
+            self.zmq_client = zmq_bridge.UnityZeroMQClient(reliable=True)
+        return self.zmq_client
+
+    def run_tool(self, tool, argv):
+        if tool == "unity":
+            unity_bridge.main(argv)
+        elif tool == "zmq":
+            zmq_bridge.main(argv, client=self.get_zmq_client())
+        elif tool == "daemon":
+            self.run_daemon_command(argv)
+        else:
+            print(f"Unknown tool: {tool}")
+            return 1
+        return 0
+
+    def run_daemon_command(self, argv):
+        cmd = argv[0] if argv else "status"
+        if cmd == "status":
+            print(f"pid: {os.getpid()}")
+            print(f"uptime: {time.time() - self.started:.1f}s")
+            print(f"served: {self.served}")
+            print(f"zmq: {'connected' if self.zmq_client else 'idle'}")
+            if self.zmq_client:
+                print(f"zmq latency: {self.zmq_client.latency.snapshot()}")
+        elif cmd == "metrics":
+            # Prometheus text for everything this daemon has sent so far
+            print(METRICS.render(), end="")
+        elif cmd == "shutdown":
+            print("Daemon shutting down.")
+            self.running = False
+        else:
+            print(f"Unknown daemon command: {cmd}")
+
+    def handle(self, request):
+        """Runs one forwarded CLI call. Returns {"code", "output"}."""
+        out = io.StringIO()
+        code = 0
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+            try:
+                code = self.run_tool(request.get("tool"), request.get("argv", []))
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                print(f"[BridgeDaemon] Error: {e}")
+                code = 1
+        self.served += 1
+        return {"code": code, "output": out.getvalue()}
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            reply = {"code": 1, "output": "[BridgeDaemon] Malformed request.\n"}
+        else:
+            reply = self.server.daemon.handle(request)
+        self.wfile.write(json.dumps(reply).encode("utf-8"))
+
+def daemon_running():
+    """True if a daemon already answers on DAEMON_ADDR."""
+    try:
+        connect().close()
+        return True
+    except OSError:
+        return False
+
+def owns_socket(server):
+    """The socket file is still the one this server bound (not a newer daemon's)."""
+    try:
+        return os.stat(DAEMON_ADDR).st_ino == server.socket_inode
+    except OSError:
+        return False
+
+def make_server(daemon):
+    """Listening server, or None if another daemon already serves DAEMON_ADDR."""
+    if daemon_running():
+        return None
+    if isinstance(DAEMON_ADDR, str):
+        # Nobody answers: a stale socket file left by a crashed daemon
+        if os.path.exists(DAEMON_ADDR):
+            os.unlink(DAEMON_ADDR)
+        server = socketserver.UnixStreamServer(DAEMON_ADDR, RequestHandler)
+        server.socket_inode = os.stat(DAEMON_ADDR).st_ino
+    else:
+        socketserver.TCPServer.allow_reuse_address = True
+        server = socketserver.TCPServer(DAEMON_ADDR, RequestHandler)
+    server.daemon = daemon
+    return server
+
+def serve():
+    daemon = BridgeDaemon()
+    server = make_server(daemon)
+    if server is None:
+        log(f"Another daemon is already listening on {DAEMON_ADDR}.")
+        return
+    # Forwarded commands arrive in bursts: focus the Unity window once per burst, not per command
+    unity_bridge.FOCUS_INTERVAL = 30.0
+    log(f"Listening on {DAEMON_ADDR}")
+    try:
+        # Single threaded on purpose: the REQ socket and stdout capture are not thread safe,
+        # and Unity serves one command at a time anyway.
+        while daemon.running:
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if isinstance(DAEMON_ADDR, str) and owns_socket(server):
+            os.unlink(DAEMON_ADDR)
+        log("Stopped.")
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,433 @@
+"""
+Dependency-aware scheduling of scene-build commands.
+
+Build scripts send commands in one hand-written order, one batch after another,
+even when whole subtrees have nothing to do with each other. plan() works out
+what actually has to happen before what, from object names and parents:
+
+1. every command reads / writes resources: the object itself (create, destroy),
+   one component (add_component), one property (set_property), or transforms
+   (Transform properties / set_transform write the node and its subtree and read
+   its ancestors; creating a child reads its ancestors);
+   a command depends on the last writer of what it reads and on every reader
+   since the last write of what it writes (so the original order of conflicting
+   commands is kept, nothing else is),
+2. commands without an object (delete_all, save_scene, generate_universe, ...)
+   and unknown object-level actions are barriers,
+3. wave k holds the commands whose longest dependency chain is k long; a wave
+   only needs the previous waves to be done, so each one goes out as pipelined
+   batches (zmq_flow.FlowController) and the number of waits follows the depth
+   of the build, not its size,
+4. a failed command only skips the commands that depend on it.
+
+    from bridge_dag import plan, run_plan, flow_sender
+    p = plan(commands)            # AgentBridge dicts or ZeroMQ CommandMsgs
+    print(p.report())             # depth, widest wave, critical path
+    result = run_plan(p, flow_sender(FlowController()))
+
+    python bridge_dag.py --objects 50000            # plan report for a generated level
+    python bridge_dag.py --objects 50000 --standin  # + DAG vs in-order batches on zmq_standin
+"""
+import sys
+import json
+import time
+import argparse
+from collections import defaultdict
+
+TRANSFORM_TYPES = {"Transform", "UnityEngine.Transform"}
+
+def log(msg):
+    print(f"[DAG] {msg}")
+
+def command_fields(cmd):
+    """(action, object name, spec dict) for an AgentBridge dict or a ZeroMQ CommandMsg."""
+    if isinstance(cmd, dict):
+        return cmd.get("action", ""), cmd.get("name", ""), cmd
+    spec = {}
+    if cmd.payload_json:
+        try:
+            spec = json.loads(cmd.payload_json)
+        except ValueError:
+            spec = {}
+    if cmd.action == "set_transforms":
+        spec = {"names": list(cmd.transform_batch.names)}
+    return cmd.action, cmd.target, spec
+
+def describe(cmd):
+    action, name, spec = command_fields(cmd)
+    detail = spec.get("propertyName") or spec.get("type") or ""
+    return " ".join(part for part in (action, name, detail) if part)
+
+
+class Hierarchy:
+    """Parents of the objects created so far (names not created here are their own roots)."""
+
+    def __init__(self):
+        self.parent = {}
+        self.children = defaultdict(list)
+
+    def add(self, name, parent):
+        self.parent[name] = parent
+        if parent:
+            self.children[parent].append(name)
+
+    def ancestors(self, name):
+        out = []
+        while self.parent.get(name) and len(out) < 1000:
+            name = self.parent[name]
+            out.append(name)
+        return out
+
+    def subtree(self, name):
+        out, stack = [], [name]
+        while stack:
+            node = stack.pop()
+            out.append(node)
+            stack.extend(self.children.get(node, ()))
+        return out
+
+def transform_access(name, tree, write):
+    """
+    A node's world transform depends on its ancestors' transforms (reads); moving it
+    moves its whole subtree (writes). Sibling subtrees stay independent.
+    """
+    reads = [("xform", a) for a in tree.ancestors(name)]
+    if not write:
+        return reads + [("xform", name)], []
+    return reads, [("xform", n) for n in tree.subtree(name)]
+
+def accesses(cmd, tree):
+    """(reads, writes) resource keys of one command, or None for a barrier. Updates `tree`."""
+    action, name, spec = command_fields(cmd)
+    if action == "set_transforms":
+        names = spec["names"]
+        if not names:
+            return None  # Handle-based: objects unknown
+        reads, writes = [], []
+        for n in names:
+            r, w = transform_access(n, tree, True)
+            reads += [("obj", n)] + r
+            writes += w
+        return reads, writes
+    if not name:
+        return None
+    obj = ("obj", name)
+    if action == "create":
+        parent = spec.get("parent") or ""
+        tree.add(name, parent)
+        if parent:
+            # Placed relative to the parent chain as it is right now
+            return [("obj", parent)] + [("xform", a) for a in tree.ancestors(name)], [obj]
+        return [], [obj]
+    if action == "destroy":
+        return [], [("obj", n) for n in tree.subtree(name)]
+    if action == "add_component":
+        return [obj], [("comp", name, spec.get("type", ""))]
+    if action in ("set_property", "get_property"):
+        kind = spec.get("type", "")
+        reads = [obj, ("comp", name, kind)]
+        if kind in TRANSFORM_TYPES:
+            r, w = transform_access(name, tree, action == "set_property")
+            return reads + r, w
+        key = ("prop", name, kind, spec.get("propertyName", ""))
+        return (reads + [key], []) if action == "get_property" else (reads, [key])
+    if action == "set_transform":
+        r, w = transform_access(name, tree, True)
+        return [obj] + r, w
+    # Anything else on a named object (check_components, upload_mesh, call_method...): whole object
+    return [], [obj]
+
+
+class Plan:
+    """Commands plus their dependencies, waves and critical path."""
+
+    def __init__(self, commands, deps, barriers):
+        self.commands = commands
+        self.deps = deps
+        self.barriers = barriers
+        # Longest chain ending at each command (wave index) and where it came from
+        self.level = [0] * len(commands)
+        self.via = [-1] * len(commands)
+        for i, ds in enumerate(deps):
+            for d in ds:
+                if self.level[d] + 1 > self.level[i]:
+                    self.level[i] = self.level[d] + 1
+                    self.via[i] = d
+        self.waves = [[] for _ in range(max(self.level) + 1 if commands else 0)]
+        for i, lv in enumerate(self.level):
+            self.waves[lv].append(i)
+
+    @property
+    def depth(self):
+        return len(self.waves)
+
+    @property
+    def edges(self):
+        return sum(len(d) for d in self.deps)
+
+    def critical_path(self):
+        """Indices of one longest dependency chain, first command first."""
+        if not self.commands:
+            return []
+        i = max(range(len(self.commands)), key=lambda k: self.level[k])
+        path = []
+        while i >= 0:
+            path.append(i)
+            i = self.via[i]
+        return path[::-1]
+
+    def estimate(self, rtt=0.02, per_command=2e-5, max_commands=500):
+        """
+        Seconds for in-order batches (one round trip per batch) vs waves
+        (one round trip per wave, batches pipelined, plus the editor's work).
+        """
+        n = len(self.commands)
+        serial = -(-n // max_commands) * rtt + n * per_command
+        waves = self.depth * rtt + n * per_command
+        return serial, waves
+
+    def report(self, show=12):
+        widths = [len(w) for w in self.waves]
+        path = self.critical_path()
+        serial, waves = self.estimate()
+        lines = [
+            f"{len(self.commands)} commands, {self.edges} dependencies, {len(self.barriers)} barriers",
+            f"Depth {self.depth} waves (critical path), widest wave {max(widths, default=0)}, "
+            f"mean {sum(widths) / max(len(widths), 1):.0f} commands per wave",
+            f"Estimate at 20 ms per round trip: in-order batches {serial:.2f}s, waves {waves:.2f}s",
+            "Critical path:",
+        ]
+        for k, i in enumerate(path[:show]):
+            lines.append(f"  {k:3d}. #{i} {describe(self.commands[i])}")
+        if len(path) > show:
+            lines.append(f"  ... {len(path) - show} more")
+        return "\n".join(lines)
+
+def plan(commands):
+    """Builds the dependency graph for a command list (see the module docstring)."""
+    commands = list(commands)
+    tree = Hierarchy()
+    last_writer = {}
+    readers = defaultdict(list)
+    sinks = set()         # Commands nothing depends on yet (what a barrier has to wait for)
+    barrier = None
+    deps, barriers = [], []
+    for i, cmd in enumerate(commands):
+        access = accesses(cmd, tree)
+        if access is None:
+            ds = set(sinks)
+            last_writer.clear()
+            readers.clear()
+            barrier = i
+            barriers.append(i)
+        else:
+            reads, writes = access
+            ds = set()
+            for key in reads:
+                if key in last_writer:
+                    ds.add(last_writer[key])
+                readers[key].append(i)
+            for key in writes:
+                if key in last_writer:
+                    ds.add(last_writer[key])
+                ds.update(readers.pop(key, ()))
+                last_writer[key] = i
+            ds.discard(i)
+            if barrier is not None and not ds:
+                ds.add(barrier)
+        sinks.difference_update(ds)
+        sinks.add(i)
+        deps.append(sorted(ds))
+    return Plan(commands, deps, barriers)
+
+
+class DagResult:
+    def __init__(self, total):
+        self.total = total
+        self.statuses = [None] * total
+        self.failed = []       # Indices whose own status was an error
+        self.skipped = 0       # Commands not sent because a dependency failed
+        self.wave_times = []
+
+    @property
+    def ok(self):
+        return not self.failed and not self.skipped and None not in self.statuses
+
+    def summary(self):
+        done = sum(1 for s in self.statuses if s is not None and not s.startswith(("error", "skipped")))
+        text = f"{done}/{self.total} done in {len(self.wave_times)} waves ({sum(self.wave_times):.2f}s)"
+        if self.failed:
+            i = self.failed[0]
+            text += f"; {len(self.failed)} failed (first #{i}: {self.statuses[i]}), {self.skipped} skipped"
+        return text
+
+def run_plan(p, send_wave, verbose=True):
+    """
+    Runs the plan wave by wave. send_wave(commands) returns one status per command
+    (see flow_sender / chunked_sender). Returns a DagResult.
+    """
+    result = DagResult(len(p.commands))
+    bad = set()
+    for k, wave in enumerate(p.waves):
+        todo = []
+        for i in wave:
+            if any(d in bad for d in p.deps[i]):
+                result.statuses[i] = "skipped: dependency failed"
+                result.skipped += 1
+                bad.add(i)
+            else:
+                todo.append(i)
+        if not todo:
+            continue
+        started = time.perf_counter()
+        try:
+            statuses = send_wave([p.commands[i] for i in todo])
+        except ConnectionError as e:
+            statuses = [f"error: bridge unreachable ({e})"] * len(todo)
+        result.wave_times.append(time.perf_counter() - started)
+        for i, status in zip(todo, statuses):
+            result.statuses[i] = status
+            if status.startswith("error") or status.startswith("skipped"):
+                result.failed.append(i)
+                bad.add(i)
+        if verbose and len(p.waves) <= 20:
+            log(f"Wave {k}: {len(todo)} commands in {result.wave_times[-1] * 1000:.0f} ms")
+    if verbose:
+        log(result.summary())
+    return result
+
+
+# --- Wave senders ---
+
+def flow_sender(flow):
+    """ZeroMQ CommandMsgs through a zmq_flow.FlowController (pipelined AIMD batches)."""
+    def send_wave(commands):
+        return [r.status for r in flow.run(commands)]
+    return send_wave
+
+def chunked_sender(send, max_commands=500):
+    """
+    Wraps a bridge_batch sender (http_sender / zmq_sender: stop-on-error chunks).
+    Commands in a wave are independent, so after a failure the rest of the chunk is sent again.
+    """
+    def send_wave(commands):
+        statuses = [None] * len(commands)
+        start = 0
+        while start < len(commands):
+            chunk = commands[start:start + max_commands]
+            got = send(chunk)
+            if got is None:
+                statuses[start:start + len(chunk)] = ["error: no reply (outcome unknown)"] * len(chunk)
+                start += len(chunk)
+                continue
+            got = list(got) + ["skipped"] * (len(chunk) - len(got))
+            ran = 0
+            while ran < len(got) and not got[ran].startswith("skipped"):
+                statuses[start + ran] = got[ran]
+                ran += 1
+            if ran == 0:
+                statuses[start:start + len(chunk)] = got
+                ran = len(chunk)
+            start += ran
+        return statuses
+    return send_wave
+
+
+def synthetic_level(objects, fanout=8, zmq=False, moves=False):
+    """
+    Generated level: a Cosmos root and a tree of `fanout` children per node.
+    AgentBridge: create (with parent) + add_component + set_property per object.
+    ZeroMQ: create (parent and components inline) + set_property.
+    moves=True adds a Transform position set_property per object.
+    """
+    names = ["Cosmos"]
+    parents = [""]
+    frontier = 0
+    while len(names) < objects:
+        for _ in range(fanout):
+            if len(names) >= objects:
+                break
+            parents.append(names[frontier])
+            names.append(f"Body_{len(names)}")
+        frontier += 1
+    mass = {"type": "Core.CelestialBody", "propertyName": "Mass", "value": "1.0"}
+    move = {"type": "UnityEngine.Transform", "propertyName": "position", "value": "0,0,10"}
+    commands = []
+    if zmq:
+        from zmq_bridge import make_command, make_create_command
+        for k, (name, parent) in enumerate(zip(names, parents)):
+            commands.append(make_create_command(name, (k * 10.0, 0.0, 0.0), ["Core.CelestialBody"],
+                                                primitive="sphere", parent=parent))
+            if moves:
+                commands.append(make_command("set_property", name, payload_json=json.dumps(move)))
+        for name in names:
+            commands.append(make_command("set_property", name, payload_json=json.dumps(mass)))
+        return commands
+    commands.append({"action": "delete_all", "exclude": ["Main Camera", "Directional Light"]})
+    for name, parent in zip(names, parents):
+        cmd = {"action": "create", "type": "sphere", "name": name, "position": [0, 0, 0]}
+        if parent:
+            cmd["parent"] = parent
+        commands.append(cmd)
+        commands.append({"action": "add_component", "type": "Core.CelestialBody", "name": name})
+        commands.append(dict(mass, action="set_property", name=name))
+        if moves:
+            commands.append(dict(move, action="set_property", name=name))
+    commands.append({"action": "save_scene"})
+    return commands
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Plan (and run) scene-build commands as a dependency DAG.")
+    parser.add_argument("--objects", type=int, default=50000)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--moves", action="store_true", help="add a Transform set_property per object")
+    parser.add_argument("--standin", action="store_true", help="run DAG vs in-order batches on zmq_standin")
+    parser.add_argument("--frame-time", type=float, default=1 / 60, help="stand-in editor frame (s)")
+    args = parser.parse_args(argv)
+
+    commands = synthetic_level(args.objects, args.fanout, moves=args.moves)
+    t0 = time.perf_counter()
+    p = plan(commands)
+    log(f"Planned AgentBridge level in {time.perf_counter() - t0:.2f}s")
+    print(p.report())
+    if not args.standin:
+        return 0
+
+    import zmq_standin
+    from zmq_bridge import UnityZeroMQClient
+    from zmq_flow import FlowController
+    from bridge_batch import run_batches, zmq_sender
+    commands = synthetic_level(args.objects, args.fanout, zmq=True, moves=args.moves)
+    p = plan(commands)
+    log(f"ZeroMQ level: {len(commands)} commands, depth {p.depth}")
+
+    addr = "tcp://127.0.0.1:5596"
+    server = zmq_standin.StandInServer(addr, frame_time=args.frame_time).start()
+    try:
+        client = UnityZeroMQClient(addr, reliable=True)
+        t0 = time.perf_counter()
+        ordered = run_batches(commands, zmq_sender(client), max_commands=100, verbose=False)
+        serial = time.perf_counter() - t0
+        log(f"In-order batches of 100: {ordered.summary()} in {serial:.2f}s")
+
+        server.scene = zmq_standin.StandInScene()
+        flow = FlowController(addr)
+        t0 = time.perf_counter()
+        result = run_plan(p, flow_sender(flow))
+        dag = time.perf_counter() - t0
+        flow.close()
+        log(f"DAG waves: {dag:.2f}s ({serial / dag:.1f}x)")
+        # Same hierarchy as the in-order build: every child under the parent its create named
+        wrong = 0
+        for cmd in commands:
+            action, name, spec = command_fields(cmd)
+            if action == "create":
+                parent = server.scene.objects[name].parent
+                wrong += (parent.name if parent else "") != spec.get("parent", "")
+        log(f"Hierarchy after DAG build: {'ok' if wrong == 0 else f'{wrong} objects under the wrong parent'}")
+        return 0 if ordered.ok and result.ok and wrong == 0 else 1
+    finally:
+        server.stop()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
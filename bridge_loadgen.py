@@ -0,0 +1,260 @@
+"""
+Load generator for the editor bridge (ZeroMQ).
+
+Grows the scene to --objects Load_* objects at a target op rate, mixing
+create / set_property / set_transform / destroy, and measures at every step:
+
+    latency   send -> reply of each op (what the bridge itself takes)
+    backlog   from each op's *scheduled* start (open loop: once the bridge can't
+              keep up with --rate, the queue shows up here instead of
+              silently lowering the rate)
+    frames    editor Update interval while the step ran (action "frame_stats")
+
+then reports the knee of the latency and frame-time curves over scene size
+(Kneedle: the point furthest below the chord of the normalized curve).
+
+    python bridge_loadgen.py --objects 5000 --rate 500
+    python bridge_loadgen.py --mix create=6,set_property=2,destroy=1 --csv load.csv
+    python bridge_loadgen.py --standin --object-us 2     # in-process stand-in, emulated frame cost
+
+Load_* objects are removed at the end (--keep to leave them).
+"""
+import sys
+import time
+import random
+import argparse
+import numpy as np
+from zmq_bridge import UnityZeroMQClient
+from bridge_resilience import LatencyStats
+
+PREFIX = "Load_"
+COMPONENTS = ["Gameplay.ShipController", "Core.VirtualTransform"]
+DEFAULT_MIX = {"create": 5, "set_property": 2, "set_transform": 2, "destroy": 1}
+# set_property targets: (component, property, value range)
+PROPERTIES = [("Gameplay.ShipController", "thrustForce", (500.0, 3000.0)),
+              ("Gameplay.ShipController", "pitchSpeed", (10.0, 200.0))]
+
+def log(msg):
+    print(f"[LoadGen] {msg}")
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        op, _, weight = part.partition("=")
+        if op not in DEFAULT_MIX:
+            raise ValueError(f"unknown op '{op}' (use {', '.join(DEFAULT_MIX)})")
+        mix[op] = float(weight or 1)
+    return mix
+
+def find_knee(xs, ys, min_rise=0.25):
+    """
+    Kneedle on an increasing, convex curve (flat, then climbing).
+    Returns the index of the knee, or None if the curve never really rises
+    (last value less than min_rise above the first) or has no bend.
+    """
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+    if len(x) < 3 or x[-1] <= x[0] or y.max() <= y.min():
+        return None
+    if y[-1] - y[0] < min_rise * max(abs(y[0]), 1e-9):
+        return None
+    xn = (x - x[0]) / (x[-1] - x[0])
+    yn = (y - y.min()) / (y.max() - y.min())
+    gap = xn - yn
+    i = int(np.argmax(gap))
+    return i if gap[i] > 0.05 else None
+
+
+class Step:
+    """Measurements for one scene-size level."""
+
+    def __init__(self, target):
+        self.target = target
+        self.objects = 0
+        self.ops = 0
+        self.errors = 0
+        self.elapsed = 0.0
+        self.latency = LatencyStats(window=1 << 20)  # Send -> reply
+        self.backlog = LatencyStats(window=1 << 20)  # Scheduled start -> reply: includes waiting behind earlier ops
+        self.frames = None
+
+    def row(self):
+        lat = self.latency.snapshot()
+        queued = self.backlog.snapshot()
+        frame_mean = self.frames.mean_ms if self.frames else float("nan")
+        frame_p95 = self.frames.p95_ms if self.frames else float("nan")
+        return {"objects": self.objects, "ops": self.ops, "rate": self.ops / max(self.elapsed, 1e-9),
+                "p50_ms": lat["p50_ms"], "p95_ms": lat["p95_ms"], "p99_ms": lat["p99_ms"],
+                "backlog_p50_ms": queued["p50_ms"], "backlog_p95_ms": queued["p95_ms"], "errors": self.errors,
+                "frame_mean_ms": frame_mean, "frame_p95_ms": frame_p95}
+
+
+class LoadGenerator:
+    def __init__(self, client, rate=500.0, mix=None, components=COMPONENTS, primitive="cube",
+                 spread=500.0, seed=0):
+        self.client = client
+        self.rate = rate
+        ops = mix or DEFAULT_MIX
+        self.ops = [op for op in ops if ops[op] > 0]
+        self.weights = [ops[op] for op in self.ops]
+        if ops.get("create", 0) <= ops.get("destroy", 0):
+            raise ValueError("create weight must exceed destroy weight or the scene never grows")
+        self.components = list(components)
+        self.primitive = primitive
+        self.spread = spread
+        self.random = random.Random(seed)
+        self.live = []  # Names of Load_* objects we created and haven't destroyed
+        self.next_id = 0
+
+    def pick(self):
+        return self.live[self.random.randrange(len(self.live))]
+
+    def position(self):
+        s = self.spread
+        return (self.random.uniform(-s, s), self.random.uniform(-s, s), self.random.uniform(-s, s))
+
+    def do_op(self, op):
+        """Runs one op; returns the reply (None on transport failure)."""
+        if op != "create" and not self.live:
+            op = "create"
+        if op == "create":
+            name = f"{PREFIX}{self.next_id}"
+            self.next_id += 1
+            reply = self.client.create_object(name, self.position(), self.components, self.primitive)
+            if reply is not None and not reply.status.startswith("error"):
+                self.live.append(name)
+            return reply
+        if op == "destroy":
+            # Swap-remove a random live object
+            i = self.random.randrange(len(self.live))
+            name = self.live[i]
+            self.live[i] = self.live[-1]
+            self.live.pop()
+            return self.client.destroy_object(name)
+        if op == "set_transform":
+            return self.client.set_transform(self.pick(), *self.position())
+        component, prop, (low, high) = self.random.choice(PROPERTIES)
+        return self.client.set_property(self.pick(), component, prop, round(self.random.uniform(low, high), 2))
+
+    def run_step(self, step, max_seconds):
+        """Ops at self.rate until len(live) reaches step.target (or max_seconds pass)."""
+        interval = 1.0 / self.rate
+        start = time.perf_counter()
+        scheduled = start
+        while len(self.live) < step.target and scheduled - start < max_seconds:
+            # Open loop: wait for the op's slot, never skip it when behind
+            now = time.perf_counter()
+            if scheduled > now:
+                time.sleep(scheduled - now)
+            sent = time.perf_counter()
+            reply = self.do_op(self.random.choices(self.ops, self.weights)[0])
+            done = time.perf_counter()
+            step.latency.record(done - sent)
+            step.backlog.record(done - scheduled)
+            step.ops += 1
+            if reply is None or reply.status.startswith("error"):
+                step.errors += 1
+            scheduled += interval
+        step.elapsed = time.perf_counter() - start
+        step.frames = self.client.frame_stats()
+        step.objects = step.frames.object_count if step.frames else len(self.live)
+
+    def run(self, objects=5000, steps=10, max_step_seconds=60.0):
+        self.client.frame_stats()  # Reset the editor's frame window
+        results = []
+        for target in np.linspace(objects / steps, objects, steps).astype(int).tolist():
+            step = Step(target)
+            self.run_step(step, max_step_seconds)
+            results.append(step)
+            row = step.row()
+            log(f"{row['objects']:7d} objects: {row['rate']:7.0f} ops/s  p50 {row['p50_ms']:7.2f}  "
+                f"p95 {row['p95_ms']:7.2f}  p99 {row['p99_ms']:7.2f} ms  backlog p95 {row['backlog_p95_ms']:7.2f} ms  "
+                f"frame {row['frame_mean_ms']:6.2f}/{row['frame_p95_ms']:6.2f} ms  errors {row['errors']}")
+            if len(self.live) < target:
+                log(f"Step timed out at {len(self.live)} of {target} objects; stopping.")
+                break
+        return results
+
+    def cleanup(self, batch=1000):
+        """Removes every Load_* object in the scene (ours and leftovers from earlier runs)."""
+        tree = self.client.get_hierarchy_columnar()
+        if tree is None or tree.instance_ids is None:
+            log("No columnar hierarchy; destroying by name.")
+            for name in self.live:
+                self.client.destroy_object(name)
+            removed = len(self.live)
+        else:
+            ids = [tree.instance_ids[i] for i in range(len(tree))
+                   if tree.names[tree.name_ids[i]].startswith(PREFIX)]
+            for i in range(0, len(ids), batch):
+                self.client.destroy_instances(ids[i:i + batch])
+            removed = len(ids)
+        self.live = []
+        return removed
+
+
+def report(results, csv_path=None):
+    rows = [s.row() for s in results]
+    if csv_path:
+        with open(csv_path, "w") as f:
+            f.write(",".join(rows[0]) + "\n")
+            for row in rows:
+                f.write(",".join(f"{v:.4f}" if isinstance(v, float) else str(v) for v in row.values()) + "\n")
+        log(f"Wrote {csv_path}")
+
+    objects = [r["objects"] for r in rows]
+    for label, key in (("Latency p95", "p95_ms"), ("Frame time", "frame_mean_ms")):
+        values = [r[key] for r in rows]
+        if any(np.isnan(values)):
+            log(f"{label}: not reported by the bridge")
+            continue
+        knee = find_knee(objects, values)
+        if knee is None:
+            log(f"{label}: no knee ({values[0]:.2f} -> {values[-1]:.2f} ms over {objects[0]}-{objects[-1]} objects)")
+        else:
+            log(f"{label}: knee at ~{objects[knee]} objects ({values[knee]:.2f} ms; "
+                f"{values[-1]:.2f} ms at {objects[-1]})")
+    return rows
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Stress the editor bridge and find where it degrades.")
+    parser.add_argument("--objects", type=int, default=5000, help="scene size to grow to")
+    parser.add_argument("--steps", type=int, default=10, help="measurement points")
+    parser.add_argument("--rate", type=float, default=500.0, help="target ops per second")
+    parser.add_argument("--mix", default=None, help="op weights, e.g. create=5,set_property=2,destroy=1")
+    parser.add_argument("--components", default=",".join(COMPONENTS))
+    parser.add_argument("--primitive", default="cube")
+    parser.add_argument("--step-seconds", type=float, default=60.0, help="give up on a step after this long")
+    parser.add_argument("--csv", help="write the step table here")
+    parser.add_argument("--keep", action="store_true", help="leave the Load_* objects in the scene")
+    parser.add_argument("--addr", default="tcp://127.0.0.1:5555")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--standin", action="store_true", help="run against an in-process zmq_standin")
+    parser.add_argument("--frame-ms", type=float, default=0.0, help="stand-in: emulated Update period")
+    parser.add_argument("--object-us", type=float, default=2.0, help="stand-in: frame cost per object")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.standin:
+        from zmq_standin import StandInServer
+        server = StandInServer(args.addr, frame_time=args.frame_ms / 1000.0, object_cost=args.object_us / 1e6)
+        server.start()
+
+    client = UnityZeroMQClient(args.addr, reliable=True)
+    gen = LoadGenerator(client, args.rate, parse_mix(args.mix) if args.mix else None,
+                        [c for c in args.components.split(",") if c], args.primitive, seed=args.seed)
+    log(f"Growing to {args.objects} objects in {args.steps} steps at {args.rate:.0f} ops/s "
+        f"({', '.join(f'{op}={w:g}' for op, w in zip(gen.ops, gen.weights))})")
+    try:
+        results = gen.run(args.objects, args.steps, args.step_seconds)
+        if results:
+            report(results, args.csv)
+    finally:
+        if not args.keep:
+            log(f"Cleanup: removed {gen.cleanup()} Load_* objects.")
+        if server:
+            server.stop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,352 @@
+"""
+In-process metrics for the Unity bridges: counters, gauges and HDR-style
+latency histograms, exported as Prometheus text.
+
+    from bridge_metrics import METRICS
+    sent = METRICS.counter("unity_bridge_commands_total", "Commands sent.", bridge="zmq")
+    sent.inc()
+
+Exposure (opt-in, both can be on):
+    UNITY_BRIDGE_METRICS_PORT=9477   -> http://127.0.0.1:9477/metrics
+    UNITY_BRIDGE_METRICS_FILE=m.prom -> rewritten every UNITY_BRIDGE_METRICS_INTERVAL s (default 5)
+                                        and on exit (node_exporter textfile format)
+
+Hot path: counters and histograms write to a per-thread shard (plain dict / list
+owned by one thread), so updates take no lock. Shards are only summed when the
+registry is rendered. Gauges are a single attribute store.
+"""
+import os
+import abc
+import time
+import atexit
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PORT_ENV = "UNITY_BRIDGE_METRICS_PORT"
+FILE_ENV = "UNITY_BRIDGE_METRICS_FILE"
+INTERVAL_ENV = "UNITY_BRIDGE_METRICS_INTERVAL"
+
+# Exported histogram buckets (seconds). The HDR buckets underneath are much finer.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 16384, 65536)
+BYTES_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# ZeroMQBridge's reply when the main thread didn't get to a request within ~1 s
+SERVER_TIMEOUT_STATUS = "error: timeout"
+
+def log(msg):
+    print(f"[BridgeMetrics] {msg}")
+
+
+class _Sharded(abc.ABC):
+    """Per-thread state; the registry keeps every shard so collect() can sum them."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._shards_lock = threading.Lock()  # Only taken the first time a thread records
+
+    @abc.abstractmethod
+    def _new_shard(self):
+        """Fresh state for a thread that records for the first time."""
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = self._new_shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+            return shard
+
+
+class Counter(_Sharded):
+    kind = "counter"
+
+    def _new_shard(self):
+        return [0]
+
+    def inc(self, amount=1):
+        self._shard()[0] += amount
+
+    def value(self):
+        return sum(s[0] for s in list(self._shards))
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self):
+        self.current = 0.0
+
+    def set(self, value):
+        self.current = value
+
+    def value(self):
+        return self.current
+
+
+class Histogram(_Sharded):
+    """
+    Log-linear (HDR-style) histogram. Values are scaled to integers (`unit`) and
+    bucketed with `precision_bits` of mantissa, i.e. ~1.6% worst-case relative
+    error at the default 7 bits, over any range, with a bounded bucket count.
+    """
+    kind = "histogram"
+
+    def __init__(self, unit=1e-6, precision_bits=7, buckets=LATENCY_BUCKETS):
+        super().__init__()
+        self.unit = unit
+        self.bits = precision_bits
+        self.half = 1 << (precision_bits - 1)
+        self.buckets = buckets
+
+    def _new_shard(self):
+        # [count, sum, {hdr index: count}]
+        return [0, 0.0, {}]
+
+    def index(self, scaled):
+        shift = scaled.bit_length() - self.bits
+        if shift <= 0:
+            return scaled
+        return shift * self.half + (scaled >> shift)
+
+    def upper_bound(self, index):
+        """Largest scaled value that lands in `index`."""
+        if index < (self.half << 1):
+            return index
+        shift = index // self.half - 1
+        return (((index - shift * self.half) + 1) << shift) - 1
+
+    def observe(self, value):
+        shard = self._shard()
+        shard[0] += 1
+        shard[1] += value
+        i = self.index(max(0, int(value / self.unit)))
+        counts = shard[2]
+        counts[i] = counts.get(i, 0) + 1
+
+    def merged(self):
+        count, total, counts = 0, 0.0, {}
+        for shard in list(self._shards):
+            count += shard[0]
+            total += shard[1]
+            for i, n in list(shard[2].items()):
+                counts[i] = counts.get(i, 0) + n
+        return count, total, counts
+
+    def percentile(self, p, merged=None):
+        count, _, counts = merged or self.merged()
+        if not count:
+            return 0.0
+        rank = p / 100.0 * count
+        seen = 0
+        for i in sorted(counts):
+            seen += counts[i]
+            if seen >= rank:
+                return self.upper_bound(i) * self.unit
+        return self.upper_bound(max(counts)) * self.unit
+
+    def cumulative(self, merged=None):
+        """[(le, cumulative count)] over the exported buckets, then +Inf."""
+        count, _, counts = merged or self.merged()
+        ordered = sorted((self.upper_bound(i) * self.unit, n) for i, n in counts.items())
+        rows, seen, j = [], 0, 0
+        for le in self.buckets:
+            while j < len(ordered) and ordered[j][0] <= le:
+                seen += ordered[j][1]
+                j += 1
+            rows.append((le, seen))
+        rows.append(("+Inf", count))
+        return rows
+
+    def snapshot(self):
+        merged = self.merged()
+        count, total, _ = merged
+        return {
+            "count": count,
+            "mean": total / count if count else 0.0,
+            "p50": self.percentile(50, merged),
+            "p99": self.percentile(99, merged),
+            "p999": self.percentile(99.9, merged),
+        }
+
+
+def _escape_label(value):
+    """Label value as the Prometheus text format wants it: backslash, quote and newline escaped."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(labels, extra=None):
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in items) + "}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.families = {}  # name -> (kind, help, {labels: metric})
+        self.lock = threading.Lock()
+        self.server = None
+        self.flusher = None
+
+    def _get(self, factory, name, help_text, labels, **kwargs):
+        key = tuple(sorted(labels.items()))
+        family = self.families.get(name)
+        if family is not None and key in family[2]:
+            return family[2][key]
+        with self.lock:
+            if name not in self.families:
+                self.families[name] = (factory.kind, help_text, {})
+            kind, _, children = self.families[name]
+            if kind != factory.kind:
+                raise ValueError(f"metric {name} already registered as a {kind}")
+            if key not in children:
+                children[key] = factory(**kwargs)
+            return children[key]
+
+    def counter(self, name, help_text="", **labels):
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(self, name, help_text="", **labels):
+        return self._get(Gauge, name, help_text, labels)
+
+    def histogram(self, name, help_text="", buckets=LATENCY_BUCKETS, unit=1e-6, **labels):
+        return self._get(Histogram, name, help_text, labels, buckets=buckets, unit=unit)
+
+    def render(self):
+        """Prometheus text exposition format (0.0.4)."""
+        lines = []
+        with self.lock:
+            families = sorted(self.families.items())
+        for name, (kind, help_text, children) in families:
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, metric in sorted(list(children.items()), key=lambda item: item[0]):
+                if kind == "histogram":
+                    merged = metric.merged()
+                    for le, n in metric.cumulative(merged):
+                        lines.append(f"{name}_bucket{_format_labels(labels, ('le', le))} {n}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {merged[1]:.9g}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {merged[0]}")
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {metric.value():.9g}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        """{name{labels}: value or histogram percentiles} for logs / daemon status."""
+        out = {}
+        with self.lock:
+            families = sorted(self.families.items())
+        for name, (kind, _, children) in families:
+            for labels, metric in sorted(list(children.items()), key=lambda item: item[0]):
+                key = name + _format_labels(labels)
+                out[key] = metric.snapshot() if kind == "histogram" else metric.value()
+        return out
+
+    # --- Exposure ---
+
+    def write_file(self, path):
+        # Write-then-rename so scrapers never read a half-written file
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+    def start_file_flusher(self, path, interval=5.0):
+        def loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.write_file(path)
+                except OSError as e:
+                    log(f"Could not write {path}: {e}")
+        self.flusher = threading.Thread(target=loop, daemon=True)
+        self.flusher.start()
+        atexit.register(self.write_file, path)
+        log(f"Flushing metrics to {path} every {interval:.0f}s")
+
+    def start_http_server(self, port, host="127.0.0.1"):
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # Keep scrapes out of the bridge output
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        log(f"Serving metrics on http://{host}:{self.server.server_port}/metrics")
+        return self.server
+
+
+METRICS = MetricsRegistry()
+
+
+class ClientMetrics:
+    """The standard metric set every bridge client records, labelled by bridge name."""
+
+    def __init__(self, bridge, registry=METRICS):
+        r = registry
+        self.registry = registry
+        self.bridge = bridge
+        self.errors = r.counter("unity_bridge_errors_total", "Failed requests and error replies.", bridge=bridge)
+        self.timeouts = r.counter("unity_bridge_timeouts_total", "Requests with no reply in time.", bridge=bridge)
+        self.retries = r.counter("unity_bridge_retries_total", "Requests resent after a failure.", bridge=bridge)
+        self.fast_failures = r.counter("unity_bridge_fast_failures_total",
+                                       "Requests rejected while the circuit was open.", bridge=bridge)
+        self.bytes_sent = r.counter("unity_bridge_sent_bytes_total", "Request payload bytes.", bridge=bridge)
+        self.bytes_received = r.counter("unity_bridge_received_bytes_total", "Reply payload bytes.", bridge=bridge)
+        self.latency = r.histogram("unity_bridge_request_seconds", "Round trip including retries.", bridge=bridge)
+        self.payload = r.histogram("unity_bridge_request_bytes", "Request payload size.",
+                                   buckets=BYTES_BUCKETS, unit=1, bridge=bridge)
+        self.batch = r.histogram("unity_bridge_batch_commands", "Commands per batch request.",
+                                 buckets=SIZE_BUCKETS, unit=1, bridge=bridge)
+        self.unity_queue = r.histogram("unity_bridge_unity_queue_seconds",
+                                       "Time a request waited for the editor main thread.", bridge=bridge)
+        self.unity_exec = r.histogram("unity_bridge_unity_exec_seconds",
+                                      "Main-thread execution time reported by Unity.", bridge=bridge)
+        self._requests = {}
+
+    def requests(self, action):
+        counter = self._requests.get(action)
+        if counter is None:
+            counter = self._requests[action] = self.registry.counter(
+                "unity_bridge_requests_total", "Requests sent, by action.", bridge=self.bridge, action=action or "unknown")
+        return counter
+
+    def record_reply(self, reply):
+        """
+        Error status and Unity-side timings from a GameStateMsg.
+        A bridge timeout is left to the caller: it may be retried, so only the final outcome is an error.
+        """
+        if reply.status.startswith("error") and reply.status != SERVER_TIMEOUT_STATUS:
+            self.errors.inc()
+        if reply.queue_ms or reply.exec_ms:
+            self.unity_queue.observe(reply.queue_ms / 1000.0)
+            self.unity_exec.observe(reply.exec_ms / 1000.0)
+
+
+def _start_from_env():
+    port = os.environ.get(PORT_ENV)
+    if port:
+        try:
+            METRICS.start_http_server(int(port))
+        except OSError as e:
+            log(f"Metrics port {port} unavailable: {e}")
+    path = os.environ.get(FILE_ENV)
+    if path:
+        METRICS.start_file_flusher(path, float(os.environ.get(INTERVAL_ENV, "5")))
+
+_start_from_env()
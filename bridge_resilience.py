@@ -0,0 +1,220 @@
+"""
+Shared resilience layer for the Unity bridges (HTTP AgentBridge and ZeroMQBridge).
+
+* Backoff        - exponential backoff with full jitter.
+* CircuitBreaker - fails fast while a bridge is known to be down, lets one
+                   trial call through once the readiness probe (or the reset
+                   timeout) says it may be back, and measures reconnect time.
+                   Only connection-level failures count: a timeout while the
+                   port still accepts connections is a busy editor, not an outage.
+* tcp_probe      - cheap readiness check: a bare TCP connect to the bridge port.
+                   No HTTP request, no REQ socket state to corrupt.
+* wait_until_ready - polls a probe every few ms, so callers resume the moment
+                   the editor finishes recompiling instead of sleeping blindly.
+* LatencyStats   - request latency percentiles (p50..p99.9) plus timeout/retry counts.
+
+    breaker = BREAKERS["http"]
+    if not breaker.allow():
+        ...fail fast...
+"""
+import time
+import random
+import socket
+from collections import deque
+
+def log(msg):
+    print(f"[Resilience] {msg}")
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class Backoff:
+    def __init__(self, base=0.1, factor=2.0, cap=5.0, jitter=True):
+        self.base = base
+        self.factor = factor
+        self.cap = cap
+        self.jitter = jitter
+
+    def delay(self, attempt):
+        """Delay before retry number `attempt` (0-based)."""
+        ceiling = min(self.cap, self.base * (self.factor ** attempt))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+
+def tcp_probe(host, port, timeout=0.2):
+    """Returns a probe() -> bool that checks whether anything accepts connections on host:port."""
+    def probe():
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+    return probe
+
+
+def wait_until_ready(probe, timeout, interval=0.05):
+    """
+    Polls probe() until it succeeds or `timeout` seconds pass.
+    Returns the seconds waited, or None if it never became ready.
+    """
+    start = time.monotonic()
+    while True:
+        if probe():
+            return time.monotonic() - start
+        remaining = timeout - (time.monotonic() - start)
+        if remaining <= 0:
+            return None
+        time.sleep(min(interval, remaining))
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name, probe=None, failure_threshold=3, reset_timeout=5.0):
+        self.name = name
+        self.probe = probe
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.down_since = None       # First failure of the current outage
+        self.last_reconnect = None   # Seconds the last outage lasted
+        self.reconnects = 0
+        self.fast_failures = 0       # Calls rejected while open
+        self.trial_started = None    # Half open: when the one trial call went out
+
+    def allow(self):
+        """True if a call may go out now (while half open: only the single trial call)."""
+        now = time.monotonic()
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            # Open: let one trial through if the bridge looks alive again
+            if not ((self.probe is not None and self.probe()) or now - self.opened_at >= self.reset_timeout):
+                self.fast_failures += 1
+                return False
+            self.state = self.HALF_OPEN
+            self.trial_started = None
+        # Half open: everyone else waits for the trial (one whose caller never reported back expires)
+        if self.trial_started is not None and now - self.trial_started < self.reset_timeout:
+            self.fast_failures += 1
+            return False
+        self.trial_started = now
+        return True
+
+    def check(self):
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} bridge is down (circuit open)")
+
+    def record_success(self):
+        if self.down_since is not None:
+            self.last_reconnect = time.monotonic() - self.down_since
+            self.reconnects += 1
+            log(f"{self.name} bridge back after {self.last_reconnect:.2f}s.")
+        self.state = self.CLOSED
+        self.failures = 0
+        self.down_since = None
+        self.trial_started = None
+
+    def record_failure(self):
+        """Connection-level failure (refused, reset, unreachable)."""
+        now = time.monotonic()
+        self.failures += 1
+        self.trial_started = None
+        if self.down_since is None:
+            self.down_since = now
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                log(f"{self.name} bridge marked down after {self.failures} failures (circuit open).")
+            self.state = self.OPEN
+            self.opened_at = now
+
+    def record_timeout(self):
+        """
+        No reply in time. If the port still accepts connections the bridge is up and
+        the editor busy (long frame, asset import): not counted. Otherwise a failure.
+        Returns True if it was counted.
+        """
+        if self.probe is not None and self.probe():
+            self.trial_started = None
+            return False
+        self.record_failure()
+        return True
+
+    def wait_until_ready(self, timeout, interval=0.05):
+        """Blocks until the probe succeeds (returns seconds waited) or timeout (None)."""
+        if self.probe is None:
+            return 0.0
+        waited = wait_until_ready(self.probe, timeout, interval)
+        if waited is not None and self.state == self.OPEN:
+            self.state = self.HALF_OPEN
+            self.trial_started = None
+        return waited
+
+    def snapshot(self):
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "fast_failures": self.fast_failures,
+            "reconnects": self.reconnects,
+            "last_reconnect_s": self.last_reconnect,
+        }
+
+
+class LatencyStats:
+    """Tail latency over the most recent `window` requests."""
+
+    def __init__(self, window=4096):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.timeouts = 0
+        self.retries = 0
+
+    def record(self, seconds):
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(p / 100.0 * len(ordered)))]
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "mean_ms": (self.total / self.count * 1000) if self.count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "p999_ms": self.percentile(99.9) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+# One breaker per endpoint, shared by every client in the process
+_ENDPOINT_BREAKERS = {}
+
+def get_breaker(name, host, port):
+    breaker = _ENDPOINT_BREAKERS.get((host, port))
+    if breaker is None:
+        breaker = _ENDPOINT_BREAKERS[(host, port)] = CircuitBreaker(name, probe=tcp_probe(host, port))
+    return breaker
+
+BREAKERS = {
+    "http": get_breaker("http", "127.0.0.1", 7777),
+    "zmq": get_breaker("zmq", "127.0.0.1", 5555),
+}
@@ -0,0 +1,135 @@
+"""
+Opt-in command tracing for the Unity bridges, exported as Chrome trace-event JSON.
+
+Enable on any script with one environment variable:
+
+    UNITY_BRIDGE_TRACE=trace.json python build_full_level.py
+
+then open trace.json in chrome://tracing or https://ui.perfetto.dev.
+
+Recorded per command (where the path supports it):
+    zmq.serialize / zmq.request / zmq.parse      client side
+    unity.queue / unity.exec                     from GameStateMsg.queue_ms / exec_ms,
+                                                 drawn on a separate "Unity" track
+    http.focus / http.post                       unity_bridge.execute
+
+When the variable is unset TRACER.enabled is False and span() returns a shared
+no-op object, so instrumented code pays one attribute check per command.
+"""
+import os
+import json
+import time
+import atexit
+import threading
+
+TRACE_ENV = "UNITY_BRIDGE_TRACE"
+UNITY_TID = 1000000  # Virtual thread id for server-side spans
+
+def log(msg):
+    print(f"[BridgeTrace] {msg}")
+
+
+class _NullArgs(dict):
+    """Span args of a disabled span: writes are dropped, so the shared instance stays empty."""
+    __slots__ = ()
+
+    def __setitem__(self, key, value):
+        pass
+
+    def update(self, *args, **kwargs):
+        pass
+
+    def setdefault(self, key, default=None):
+        return default
+
+
+class _NullSpan:
+    __slots__ = ()
+    args = _NullArgs()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_SPAN = _NullSpan()
+
+
+class Span:
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.start, time.perf_counter(), self.cat, args=self.args)
+        return False
+
+
+class Tracer:
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = bool(path)
+        self.events = []
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+        if self.enabled:
+            self.events.append({"ph": "M", "name": "thread_name", "pid": self.pid, "tid": UNITY_TID,
+                                "args": {"name": "Unity (ZeroMQBridge)"}})
+            atexit.register(self.flush)
+
+    def _us(self, t):
+        return (t - self.origin) * 1e6
+
+    def complete(self, name, start, end, cat="bridge", tid=None, args=None):
+        """Records a finished span; start/end are time.perf_counter() values."""
+        event = {"ph": "X", "name": name, "cat": cat, "pid": self.pid,
+                 "tid": threading.get_ident() if tid is None else tid,
+                 "ts": self._us(start), "dur": max(0.0, (end - start) * 1e6)}
+        if args:
+            event["args"] = args
+        with self.lock:
+            self.events.append(event)
+
+    def span(self, name, cat="bridge", **args):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, cat, args)
+
+    def server_spans(self, sent, received, reply, action=""):
+        """
+        Places Unity-side queue/exec time (GameStateMsg.queue_ms / exec_ms) inside a
+        client round trip. The unaccounted remainder is split evenly between the
+        request and reply legs (transport + ServerLoop polling).
+        """
+        queue = reply.queue_ms / 1000.0
+        execute = reply.exec_ms / 1000.0
+        if queue <= 0 and execute <= 0:
+            return
+        transit = max(0.0, (received - sent) - queue - execute) / 2
+        start = sent + transit
+        self.complete("unity.queue", start, start + queue, "unity", UNITY_TID, {"action": action})
+        self.complete("unity.exec", start + queue, start + queue + execute, "unity", UNITY_TID,
+                      {"action": action, "status": reply.status})
+
+    def flush(self, path=None):
+        path = path or self.path
+        if not path:
+            return
+        with self.lock:
+            data = {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+        with open(path, "w") as f:
+            json.dump(data, f)
+        log(f"Wrote {len(data['traceEvents'])} events to {path}")
+
+
+TRACER = Tracer(os.environ.get(TRACE_ENV))
@@ -1,10 +1,11 @@
+import sys
 import unity_bridge
-import time
+from bridge_batch import run_batches, http_sender
 
-import unity_bridge
-import time
+# Completed commands are recorded here; a rerun after a failure starts at the failed command
+CHECKPOINT = "build_full_level.checkpoint"
 
-def build_full_level():
+def build_full_level(fresh=False):
     unity_bridge.log("Building Full Level (BATCH MODE)...")
     unity_bridge.ensure_initialized()
 
@@ -13,7 +14,7 @@ def build_full_level():
     # 1. Reset & Infrastructure
     batch_cmds.append({"action": "delete_all", "exclude": ["Main Camera", "Directional Light"]})
     batch_cmds.append({"action": "create", "type": "empty", "name": "Cosmos", "position": [0,0,0]})
-    
+
     # Physics
     batch_cmds.append({"action": "create", "type": "empty", "name": "Physics", "parent": "Cosmos"})
     batch_cmds.append({"action": "add_component", "type": "Core.PhysicsEngine", "name": "Physics"})
@@ -38,7 +39,7 @@ def build_full_level():
     batch_cmds.append({"action": "add_component", "type": "UnityEngine.Rigidbody", "name": "PlayerShip"})
     batch_cmds.append({"action": "add_component", "type": "Gameplay.GravityDrive", "name": "PlayerShip"})
     batch_cmds.append({"action": "add_component", "type": "Rendering.LatticeRenderer", "name": "PlayerShip"})
-    
+
     # Warp State
     batch_cmds.append({"action": "set_property", "name": "PlayerShip", "type": "UnityEngine.Rigidbody", "propertyName": "velocity", "value": "0,0,200"})
 
@@ -54,15 +55,15 @@ def build_full_level():
     # 6. Save Scene (User Request)
     batch_cmds.append({"action": "save_scene"})
 
-    # EXECUTE BATCH
-    success, msg = unity_bridge.execute_batch(batch_cmds)
-    if success:
+    # EXECUTE BATCH (resumes after the last completed command unless fresh)
+    result = run_batches(batch_cmds, http_sender(), checkpoint=CHECKPOINT, resume=not fresh)
+    if result.ok:
         unity_bridge.log("Batch Build Complete.")
     else:
-        unity_bridge.log(f"Batch Build Failed: {msg}")
-
-if __name__ == "__main__":
-    build_full_level()
+        index, status = result.failure
+        unity_bridge.log(f"Batch Build Failed at command {index} ({batch_cmds[index]['action']}): {status}")
+        unity_bridge.log("Fix the cause and rerun to continue from there (--fresh to start over).")
+    return result.ok
 
 if __name__ == "__main__":
-    build_full_level()
+    sys.exit(0 if build_full_level("--fresh" in sys.argv) else 1)
@@ -2,34 +2,46 @@ import requests
 import json
 import time
 import sys
+from bridge_resilience import Backoff, BREAKERS
 
 URL = "http://localhost:7777/execute"
 HEADERS = {"Content-Type": "application/json"}
+BACKOFF = Backoff(base=0.25, factor=2.0, cap=4.0)
+BREAKER = BREAKERS["http"]
 
 def log(msg):
     print(f"[MasterBuilder] {msg}")
 
 def execute(payload, retry=3):
+    if not BREAKER.allow():
+        log("Unity bridge is down (circuit open). Skipping command.")
+        return False
     for i in range(retry):
         try:
             response = requests.post(URL, data=json.dumps(payload), headers=HEADERS, timeout=10)
+            BREAKER.record_success()
             if response.status_code == 200:
                 return True
             else:
                 log(f"Command Failed ({response.status_code}): {response.text}")
+        except requests.exceptions.ConnectionError as e:
+            BREAKER.record_failure()
+            log(f"Connection Error (Attempt {i+1}/{retry}): {e}")
+            BREAKER.wait_until_ready(BACKOFF.delay(i))
         except Exception as e:
             log(f"Connection Error (Attempt {i+1}/{retry}): {e}")
-            time.sleep(2)
+            time.sleep(BACKOFF.delay(i))
     return False
 
-def check_connection():
+def check_connection(timeout=20.0):
     log("Checking connection to Unity...")
-    for i in range(10):
-        if execute({"action": "ping"}):
-            log("Unity Connected!")
-            return True
-        log("Waiting for Unity compilation/server...")
-        time.sleep(2)
+    # Cheap port probe first: returns the moment compilation finishes and the server is back
+    if BREAKER.wait_until_ready(timeout) is None:
+        log("Waiting for Unity compilation/server timed out.")
+        return False
+    if execute({"action": "ping"}):
+        log("Unity Connected!")
+        return True
     return False
 
 def build_hierarchy():
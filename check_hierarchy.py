@@ -39,5 +39,26 @@ def print_tree(nodes, depth):
         if "children" in node:
             print_tree(node["children"], depth + 1)
 
+def check_hierarchy_columnar(limit=200):
+    # Full tree over ZeroMQ as flat arrays (get_hierarchy_columnar), cheap even for huge scenes
+    import zmq_bridge
+    import hierarchy_columnar
+    client = zmq_bridge.UnityZeroMQClient(reliable=True)
+    tree = client.get_hierarchy_columnar()
+    if tree is None:
+        print("Failed to query columnar hierarchy.")
+        return
+    print("\n=== SCENE HIERARCHY (columnar) ===")
+    print(f"Total Objects: {len(tree)}")
+    print(f"Root Objects: {len(tree.roots())}")
+    print(f"Distinct Names: {len(tree.names)}  Component Sets: {len(tree.component_sets)}")
+    print("--- Tree ---")
+    hierarchy_columnar.print_tree(tree, limit)
+    print("=======================\n")
+
 if __name__ == "__main__":
-    check_hierarchy()
+    import sys
+    if "--zmq" in sys.argv:
+        check_hierarchy_columnar()
+    else:
+        check_hierarchy()
@@ -0,0 +1,300 @@
+"""
+Headless combat simulator: drone pursuit, firing, projectile flight and hits.
+
+test_combat.py spawns one Combat.DroneAI in the editor and waits for a log line.
+This steps thousands of engagements at once in NumPy so balance parameters can
+be swept in seconds:
+
+1. ships (the XR Origin / Gameplay.ShipSystems) sit still or jink at ship_speed,
+2. each drone chases its ship at drone_speed until within attack_range, then holds
+   and fires every fire_interval (aim: straight at the ship or leading it, plus
+   aim_spread radians of noise),
+3. projectiles are Combat.Projectile: fixed velocity = forward * speed, gone after
+   lifetime, damage on the first ship they overlap (discrete test every step, like
+   a trigger collider),
+4. hit tests go through a spatial hash rebuilt every step (uniform grid, 8 cells
+   per query), so the cost follows projectiles + ships instead of their product,
+5. damage follows ShipSystems.TakeDamage (shields first, overflow to health) and
+   Die() (health back to max); the first death is the ship's time to kill.
+
+    python combat_sim.py --drones 10000 --ships 1000 --seconds 30
+    python combat_sim.py --sweep aim_spread=0,0.02,0.05 --sweep fire_interval=0.5,1,2
+"""
+import sys
+import time
+import argparse
+import itertools
+import numpy as np
+from sim_params import ParamSet
+
+# Projectile.cs / ShipSystems.cs field defaults; drone values follow test_combat.py
+# (speed 20, attack range 50, first shot ~2.5s after spawn). Radii stand in for the trigger colliders.
+DEFAULT_PARAMS = {
+    "drone_speed": 20.0,
+    "attack_range": 50.0,
+    "fire_interval": 1.0,
+    "aim_spread": 0.02,      # Radians (std dev) of aim noise
+    "lead_target": False,    # Aim where the ship will be after the flight time
+    "muzzle_offset": 2.0,    # Spawn point in front of the drone (outside its own cube)
+    "projectile_speed": 100.0,
+    "damage": 10.0,
+    "lifetime": 5.0,
+    "projectile_radius": 0.25,
+    "ship_radius": 2.0,
+    "ship_health": 100.0,
+    "ship_shields": 0.0,
+    "ship_speed": 0.0,       # 0 = static target like the QA scene
+    "ship_jink": 2.0,        # Seconds between ship heading changes
+    "spawn_distance": 100.0,  # test_combat.py spawns at 400, then moves the drone to 100
+    "arena": 20000.0,        # Side of the cube the ships are scattered over
+}
+
+HASH_BITS = 21
+HASH_MASK = (1 << HASH_BITS) - 1
+HASH_BIAS = 1 << (HASH_BITS - 1)
+ARRIVE_TOLERANCE = 1e-6  # Units: closer to attack_range than this counts as in range
+CORNERS = np.array(list(itertools.product((0, 1), repeat=3)), dtype=np.int64)
+
+def log(msg):
+    print(f"[Combat Sim] {msg}")
+
+PARAMS = ParamSet("combat", DEFAULT_PARAMS)
+make_params = PARAMS.make
+
+def normalize(v):
+    n = np.linalg.norm(v, axis=-1, keepdims=True)
+    return v / np.where(n > 0, n, 1.0)
+
+
+def cell_keys(cells):
+    """(n,3) int64 cell coordinates -> one int64 key per cell (21 bits per axis)."""
+    c = (cells + HASH_BIAS) & HASH_MASK
+    return (c[:, 0] << (2 * HASH_BITS)) | (c[:, 1] << HASH_BITS) | c[:, 2]
+
+class SpatialHash:
+    """
+    Points bucketed into a uniform grid (a sorted key array). With cell >= 2*radius
+    every sphere touches at most 2 cells per axis, so pairs() looks at 8 cells.
+    """
+
+    def __init__(self, positions, cell):
+        self.cell = float(cell)
+        keys = cell_keys(np.floor(positions / self.cell).astype(np.int64))
+        self.order = np.argsort(keys, kind="stable")
+        self.keys = keys[self.order]
+
+    def pairs(self, points, radius):
+        """Candidate (query index, point index) pairs for spheres of `radius` around `points`."""
+        if radius * 2 > self.cell:
+            raise ValueError(f"cell {self.cell} too small for radius {radius}")
+        base = np.floor(points / self.cell - 0.5).astype(np.int64)
+        queries, found = [], []
+        for corner in CORNERS:
+            keys = cell_keys(base + corner)
+            lo = np.searchsorted(self.keys, keys, "left")
+            n = np.searchsorted(self.keys, keys, "right") - lo
+            total = int(n.sum())
+            if total == 0:
+                continue
+            # Expand each [lo, lo + n) range into flat indices
+            starts = np.repeat(lo - (np.cumsum(n) - n), n)
+            queries.append(np.repeat(np.arange(len(points)), n))
+            found.append(self.order[np.arange(total) + starts])
+        if not queries:
+            return np.empty(0, np.int64), np.empty(0, np.int64)
+        return np.concatenate(queries), np.concatenate(found)
+
+
+class CombatSim:
+    """drones engagements against ships; drone i attacks ship i % ships."""
+
+    def __init__(self, drones, ships, params=None, seed=0):
+        self.p = params or make_params()
+        self.rng = np.random.default_rng(seed)
+        self.time = 0.0
+        p = self.p
+
+        # 1. Ships
+        self.ship_pos = self.rng.uniform(-p["arena"] / 2, p["arena"] / 2, size=(ships, 3))
+        self.ship_vel = np.zeros((ships, 3))
+        self.ship_health = np.full(ships, p["ship_health"])
+        self.ship_shields = np.full(ships, p["ship_shields"])
+        self.next_jink = np.zeros(ships)
+        self.first_shot = np.full(ships, np.nan)
+        self.time_to_kill = np.full(ships, np.nan)
+        self.kills = np.zeros(ships, dtype=np.int64)
+
+        # 2. Drones, spawn_distance out from their ship in a random direction
+        self.target = np.arange(drones) % ships
+        self.drone_pos = self.ship_pos[self.target] + normalize(self.rng.normal(size=(drones, 3))) * p["spawn_distance"]
+        self.cooldown = np.zeros(drones)
+        self.drone_first_shot = np.full(drones, np.nan)
+
+        # 3. Projectile pool: one fire_interval's worth of shots per drone per lifetime
+        capacity = drones * (int(np.ceil(p["lifetime"] / p["fire_interval"])) + 1)
+        self.proj_pos = np.zeros((capacity, 3))
+        self.proj_vel = np.zeros((capacity, 3))
+        self.proj_age = np.zeros(capacity)
+        self.proj_owner = np.zeros(capacity, dtype=np.int64)
+        self.proj_alive = np.zeros(capacity, dtype=bool)
+
+        self.shots = 0
+        self.hits = 0
+        self.hits_on_target = 0
+
+    def step_ships(self, dt):
+        p = self.p
+        if p["ship_speed"] > 0:
+            jink = self.next_jink <= self.time
+            if jink.any():
+                self.ship_vel[jink] = normalize(self.rng.normal(size=(int(jink.sum()), 3))) * p["ship_speed"]
+                self.next_jink[jink] = self.time + p["ship_jink"]
+            self.ship_pos += self.ship_vel * dt
+
+    def step_drones(self, dt):
+        p = self.p
+        to_ship = self.ship_pos[self.target] - self.drone_pos
+        dist = np.linalg.norm(to_ship, axis=1)
+        direction = to_ship / np.maximum(dist, 1e-9)[:, None]
+
+        # Chase until in range (no overshoot), then hold and shoot. A drone that reaches the
+        # range this step lands on it and counts as arrived (the float remainder would otherwise
+        # leave it a hair outside forever; ARRIVE_TOLERANCE keeps drones spawned together in step)
+        gap = dist - p["attack_range"]
+        chase = gap > ARRIVE_TOLERANCE
+        step = p["drone_speed"] * dt
+        self.drone_pos[chase] += direction[chase] * np.minimum(step, gap[chase])[:, None]
+        chase &= gap - step > ARRIVE_TOLERANCE
+
+        self.cooldown -= dt
+        fire = np.flatnonzero(~chase & (self.cooldown <= 0))
+        if len(fire) == 0:
+            return
+        self.cooldown[fire] = p["fire_interval"]
+
+        muzzle = self.drone_pos[fire] + direction[fire] * p["muzzle_offset"]
+        aim_at = self.ship_pos[self.target[fire]]
+        if p["lead_target"]:
+            flight = np.linalg.norm(aim_at - muzzle, axis=1) / p["projectile_speed"]
+            aim_at = aim_at + self.ship_vel[self.target[fire]] * flight[:, None]
+        aim = normalize(aim_at - muzzle)
+        if p["aim_spread"] > 0:
+            aim = normalize(aim + self.rng.normal(0, p["aim_spread"], size=aim.shape))
+
+        slots = np.flatnonzero(~self.proj_alive)[:len(fire)]
+        if len(slots) < len(fire):
+            raise RuntimeError("projectile pool exhausted")
+        self.proj_pos[slots] = muzzle
+        self.proj_vel[slots] = aim * p["projectile_speed"]
+        self.proj_age[slots] = 0.0
+        self.proj_owner[slots] = fire
+        self.proj_alive[slots] = True
+        self.shots += len(fire)
+        targets = self.target[fire]
+        self.drone_first_shot[fire[np.isnan(self.drone_first_shot[fire])]] = self.time
+        unseen = np.isnan(self.first_shot[targets])
+        self.first_shot[targets[unseen]] = self.time
+
+    def step_projectiles(self, dt):
+        p = self.p
+        live = np.flatnonzero(self.proj_alive)
+        if len(live) == 0:
+            return
+        # Projectile.Update: WorldPosition += velocity * deltaTime; Destroy after lifetime
+        self.proj_pos[live] += self.proj_vel[live] * dt
+        self.proj_age[live] += dt
+        expired = live[self.proj_age[live] >= p["lifetime"]]
+        self.proj_alive[expired] = False
+        live = live[self.proj_age[live] < p["lifetime"]]
+
+        # Hit test: hash the projectiles (usually the bigger set), query around each ship
+        radius = p["ship_radius"] + p["projectile_radius"]
+        grid = SpatialHash(self.proj_pos[live], 2 * radius)
+        ship_idx, cand = grid.pairs(self.ship_pos, radius)
+        if len(ship_idx) == 0:
+            return
+        d = self.proj_pos[live[cand]] - self.ship_pos[ship_idx]
+        inside = np.einsum("ij,ij->i", d, d) <= radius * radius
+        ship_idx, cand = ship_idx[inside], cand[inside]
+        if len(cand) == 0:
+            return
+        # A projectile overlapping several ships hits the one it is deepest in
+        dist2 = np.einsum("ij,ij->i", d[inside], d[inside])
+        order = np.lexsort((dist2, cand))
+        first = order[np.r_[True, cand[order][1:] != cand[order][:-1]]]
+        ship_idx, proj = ship_idx[first], live[cand[first]]
+
+        self.proj_alive[proj] = False
+        self.hits += len(proj)
+        self.hits_on_target += int(np.count_nonzero(self.target[self.proj_owner[proj]] == ship_idx))
+        self.apply_damage(np.bincount(ship_idx, minlength=len(self.ship_pos)) * p["damage"])
+
+    def apply_damage(self, amount):
+        """ShipSystems.TakeDamage for a whole frame's hits at once (one Die() per ship per frame)."""
+        hit = amount > 0
+        absorbed = np.minimum(self.ship_shields, amount)
+        self.ship_shields -= np.where(hit, absorbed, 0)
+        self.ship_health -= np.where(hit, amount - absorbed, 0)
+        dead = self.ship_health <= 0
+        if dead.any():
+            first = dead & np.isnan(self.time_to_kill)
+            self.time_to_kill[first] = self.time
+            self.kills[dead] += 1
+            self.ship_health[dead] = self.p["ship_health"]  # Die(): reset
+
+    def step(self, dt):
+        self.step_ships(dt)
+        self.step_drones(dt)
+        self.step_projectiles(dt)
+        self.time += dt
+
+    def run(self, seconds, dt):
+        for _ in range(int(round(seconds / dt))):
+            self.step(dt)
+        return self.report()
+
+    def report(self):
+        killed = ~np.isnan(self.time_to_kill)
+        engaged = ~np.isnan(self.first_shot)
+        ttk = self.time_to_kill[killed]
+        fire_to_kill = (self.time_to_kill - self.first_shot)[killed]
+        return {
+            "shots": self.shots,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.shots if self.shots else 0.0,
+            "friendly_hits": self.hits - self.hits_on_target,
+            "first_shot": float(np.nanmin(self.first_shot)) if engaged.any() else float("nan"),
+            "killed": float(killed.mean()),
+            "kills": int(self.kills.sum()),
+            "ttk_median": float(np.median(ttk)) if len(ttk) else float("nan"),
+            "ttk_p90": float(np.percentile(ttk, 90)) if len(ttk) else float("nan"),
+            "fire_to_kill": float(np.median(fire_to_kill)) if len(ttk) else float("nan"),
+        }
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Headless drone vs ship combat simulation.")
+    parser.add_argument("--drones", type=int, default=10000)
+    parser.add_argument("--ships", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--dt", type=float, default=0.02, help="step (Unity fixed timestep: triggers run at this rate)")
+    parser.add_argument("--seed", type=int, default=0)
+    PARAMS.add_arguments(parser)
+    args = parser.parse_args(argv)
+    names, runs = PARAMS.sweep(args)
+
+    columns = ("hit_rate", "friendly_hits", "first_shot", "killed", "ttk_median", "ttk_p90", "fire_to_kill")
+    log(f"{args.drones} drones vs {args.ships} ships, {args.seconds}s at dt={args.dt}")
+    log(" ".join(f"{n:>14}" for n in names) + " " + " ".join(f"{c:>13}" for c in columns) + f" {'steps/s':>8}")
+    for combo, params in runs:
+        sim = CombatSim(args.drones, args.ships, params, args.seed)
+        t0 = time.perf_counter()
+        result = sim.run(args.seconds, args.dt)
+        rate = args.seconds / args.dt / (time.perf_counter() - t0)
+        log(" ".join(f"{str(v):>14}" for v in combo) + " "
+            + " ".join(f"{result[c]:13.3f}" if isinstance(result[c], float) else f"{result[c]:13d}" for c in columns)
+            + f" {rate:8.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
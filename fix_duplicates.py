@@ -1,45 +1,196 @@
-import requests
-import json
-import time
+"""
+Duplicate cleanup.
 
-URL = "http://localhost:7777"
-HEADERS = {'Content-Type': 'application/json'}
+Setup scripts that get re-run leave extra copies of managers / rigs in the scene.
+This scans the hierarchy once (ZeroMQ get_hierarchy_columnar), groups objects by
+a key, keeps one survivor per group and destroys every extra instance with a
+single destroy_instances command. Dry run by default.
+
+    python fix_duplicates.py                       # report duplicates of the usual suspects
+    python fix_duplicates.py --apply               # ...and remove them
+    python fix_duplicates.py --all --key name,components,parent --policy active
+
+Key fields:  name, components, position (grid of --tolerance units), parent
+Policies:    first (scene order), last, active (prefer active, then first),
+             components (prefer the richest component set, then first)
+"""
+import sys
+import argparse
+import numpy as np
+
+# Objects the setup scripts create once; any copy beyond the first is a duplicate
+TARGETS = [
+    "XR Origin",
+    "WorldMover_Manager",
+    "GravityManager",
+    "Enemy_Drone",
+    "TestShip",
+    "ShipRoot",
+    "HUD_Display",
+    "AgentVerified_Cube",
+    "MiningShip",
+    "Iron_Ore_Vein",
+    "Virtual_Cube"
+]
+
+KEY_FIELDS = ("name", "components", "position", "parent")
+POLICIES = ("first", "last", "active", "components")
 
 def log(msg):
     print(f"[Cleanup] {msg}")
 
-def execute(payload):
-    try:
-        resp = requests.post(URL, data=json.dumps(payload), headers=HEADERS, timeout=5)
-        return resp.json()
-    except Exception as e:
-        log(f"Error: {e}")
-        return {}
-
-def cleanup_scene():
-    log("Cleaning Scene Duplicates...")
-
-    targets = [
-        "XR Origin",
-        "WorldMover_Manager",
-        "GravityManager",
-        "Enemy_Drone",
-        "TestShip",
-        "ShipRoot",
-        "HUD_Display",
-        "AgentVerified_Cube",
-        "MiningShip",
-        "Iron_Ore_Vein",
-        "Virtual_Cube"
-    ]
-    
-    for t in targets:
-        log(f"Deleting '{t}'...")
-        res = execute({ "action": "delete", "name": t })
-        if "message" in res:
-            log(f"Result: {res['message']}")
+def key_columns(tree, fields, tolerance):
+    """One int column per key component, so a node's key is a tuple of ints."""
+    columns = []
+    for field in fields:
+        if field == "name":
+            columns.append(tree.name_ids)
+        elif field == "components":
+            # Same components in a different order are the same set
+            canonical = {}
+            ids = [canonical.setdefault(tuple(sorted(s)), len(canonical)) for s in tree.component_sets]
+            columns.append(np.asarray(ids, dtype=np.int64)[tree.set_ids] if ids else tree.set_ids)
+        elif field == "position":
+            cells = np.rint(np.nan_to_num(tree.positions.astype(np.float64)) / tolerance).astype(np.int64)
+            columns.extend(cells.T)
+        elif field == "parent":
+            columns.append(tree.parents)
+        else:
+            raise ValueError(f"unknown key field '{field}' (use {', '.join(KEY_FIELDS)})")
+    return columns
+
+def find_groups(tree, fields=("name", "components"), tolerance=0.01, names=None):
+    """Lists of node indices (scene order) sharing a key; only groups with more than one member."""
+    candidates = np.arange(len(tree))
+    if names is not None:
+        names = set(names)
+        wanted = [i for i, n in enumerate(tree.names) if n in names]
+        candidates = np.flatnonzero(np.isin(tree.name_ids, wanted))
+
+    # One pass over the candidates: dict keyed by the column tuple
+    columns = [c[candidates].tolist() for c in key_columns(tree, fields, tolerance)]
+    groups = {}
+    for index, key in zip(candidates.tolist(), zip(*columns)):
+        groups.setdefault(key, []).append(index)
+    return [g for g in groups.values() if len(g) > 1]
+
+def choose_survivor(tree, group, policy):
+    if policy == "first":
+        return group[0]
+    if policy == "last":
+        return group[-1]
+    if policy == "active":
+        return next((i for i in group if tree.active[i]), group[0])
+    if policy == "components":
+        return max(group, key=lambda i: len(tree.component_sets[tree.set_ids[i]]))  # max() keeps the first tie
+    raise ValueError(f"unknown policy '{policy}' (use {', '.join(POLICIES)})")
+
+def plan(tree, groups, policy="first"):
+    """
+    Returns [(survivor, [extras])] and the indices to destroy.
+    Extras inside an already doomed subtree are not sent again, and a survivor is never
+    left inside one (its ancestor is going away anyway).
+    """
+    depths = tree.depths()
+    groups = sorted(groups, key=lambda g: int(depths[g].min()))
+    # A later (deeper) group can doom the ancestor of an earlier survivor; avoid that survivor and plan again
+    avoid = set()
+    while True:
+        decisions, doomed, inside = plan_pass(tree, groups, policy, avoid)
+        lost = {s for s, _ in decisions if inside[s] and s not in avoid}
+        if not lost:
+            break
+        avoid |= lost
 
+    to_destroy = np.flatnonzero(doomed & ~inside).tolist()
+    return decisions, to_destroy
+
+def plan_pass(tree, groups, policy, avoid):
+    doomed = np.zeros(len(tree), dtype=bool)
+    # Strictly below a doomed node; pre-order keeps each subtree one slice [i + 1, i + size)
+    inside = np.zeros(len(tree), dtype=bool)
+    decisions = []
+    for group in groups:
+        alive = [i for i in group if not inside[i]]
+        if len(alive) < 2:
+            continue
+        # If every candidate is avoided they all go down with their ancestors; any pick is fine
+        survivor = choose_survivor(tree, [i for i in alive if i not in avoid] or alive, policy)
+        extras = [i for i in alive if i != survivor]
+        doomed[extras] = True
+        for i in extras:
+            inside[i + 1:i + tree.subtree_size(i)] = True
+        decisions.append((survivor, extras))
+    return decisions, doomed, inside
+
+def path(tree, i):
+    parts = []
+    while i >= 0:
+        parts.append(tree.names[tree.name_ids[i]])
+        i = int(tree.parents[i])
+    return "/".join(reversed(parts))
+
+def report(tree, decisions, limit=20):
+    for survivor, extras in decisions[:limit]:
+        log(f"'{tree.names[tree.name_ids[survivor]]}': keep {path(tree, survivor)} "
+            f"(#{survivor}), remove {len(extras)}")
+        for i in extras[:5]:
+            log(f"    - {path(tree, i)} (#{i}{'' if tree.active[i] else ', inactive'})")
+        if len(extras) > 5:
+            log(f"    ... {len(extras) - 5} more")
+    if len(decisions) > limit:
+        log(f"... {len(decisions) - limit} more groups")
+
+def cleanup_scene(client=None, fields=("name", "components"), policy="first", names=TARGETS,
+                  tolerance=0.01, apply=False):
+    """Returns the number of objects destroyed (or that would be, on a dry run), None on failure."""
+    import zmq_bridge
+    client = client or zmq_bridge.UnityZeroMQClient(reliable=True)
+    log("Scanning hierarchy for duplicates...")
+    tree = client.get_hierarchy_columnar()
+    if tree is None:
+        log("Could not read the hierarchy.")
+        return None
+
+    decisions, to_destroy = plan(tree, find_groups(tree, fields, tolerance, names), policy)
+    log(f"{len(tree)} objects, {len(decisions)} duplicate groups, {len(to_destroy)} to remove "
+        f"(key: {', '.join(fields)}; policy: {policy})")
+    report(tree, decisions)
+    if not to_destroy:
+        log("Scene has no duplicates.")
+        return 0
+    if not apply:
+        log("Dry run - nothing removed. Re-run with --apply.")
+        return len(to_destroy)
+    if tree.instance_ids is None:
+        log("Bridge did not report instance ids; update ZeroMQBridge.cs to remove duplicates.")
+        return None
+
+    # All extras go in one command (one editor frame)
+    reply = client.destroy_instances(tree.instance_ids[to_destroy])
+    if reply is None:
+        log("Destroy request failed.")
+        return None
+    log(f"Result: {reply.status}")
     log("Scene Cleaned.")
+    return len(to_destroy)
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Find and remove duplicate scene objects.")
+    parser.add_argument("--apply", action="store_true", help="remove duplicates (default: dry run)")
+    parser.add_argument("--all", action="store_true", help="check every object, not just the known targets")
+    parser.add_argument("--names", nargs="+", help="only check these names")
+    parser.add_argument("--key", default="name,components", help=f"comma separated: {','.join(KEY_FIELDS)}")
+    parser.add_argument("--policy", default="first", choices=POLICIES)
+    parser.add_argument("--tolerance", type=float, default=0.01, help="position grid size for the key")
+    parser.add_argument("--addr", default="tcp://127.0.0.1:5555")
+    args = parser.parse_args(argv)
+
+    import zmq_bridge
+    names = None if args.all else (args.names or TARGETS)
+    removed = cleanup_scene(zmq_bridge.UnityZeroMQClient(args.addr, reliable=True),
+                            tuple(args.key.split(",")), args.policy, names, args.tolerance, args.apply)
+    return 1 if removed is None else 0
 
 if __name__ == "__main__":
-    cleanup_scene()
+    sys.exit(main(sys.argv[1:]))
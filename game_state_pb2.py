@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10game_state.proto\x12\x0c\x43ore.Network\"-\n\nVector3Msg\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x12\t\n\x01z\x18\x03 \x01(\x02\"\x9d\x01\n\x0cTransformMsg\x12\x0c\n\x04name\x18\x01 \x01(\t\x12*\n\x08position\x18\x02 \x01(\x0b\x32\x18.Core.Network.Vector3Msg\x12*\n\x08rotation\x18\x03 \x01(\x0b\x32\x18.Core.Network.Vector3Msg\x12\'\n\x05scale\x18\x04 \x01(\x0b\x32\x18.Core.Network.Vector3Msg\"t\n\nCommandMsg\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\t\x12\x14\n\x0cpayload_json\x18\x03 \x01(\t\x12\x30\n\x0evector_payload\x18\x04 \x01(\x0b\x32\x18.Core.Network.Vector3Msg\"_\n\x0cGameStateMsg\x12\x11\n\ttimestamp\x18\x01 \x01(\x02\x12,\n\x08\x65ntities\x18\x02 \x03(\x0b\x32\x1a.Core.Network.TransformMsg\x12\x0e\n\x06status\x18\x03 \x01(\tb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10game_state.proto\x12\x0c\x43ore.Network\"-\n\nVector3Msg\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x12\t\n\x01z\x18\x03 \x01(\x02\"i\n\x10SectorVector3Msg\x12\x10\n\x08sector_x\x18\x01 \x01(\x11\x12\x10\n\x08sector_y\x18\x02 \x01(\x11\x12\x10\n\x08sector_z\x18\x03 \x01(\x11\x12\t\n\x01x\x18\x04 \x01(\x02\x12\t\n\x01y\x18\x05 \x01(\x02\x12\t\n\x01z\x18\x06 \x01(\x02\"\xd5\x01\n\x0cTransformMsg\x12\x0c\n\x04name\x18\x01 \x01(\t\x12*\n\x08position\x18\x02 \x01(\x0b\x32\x18.Core.Network.Vector3Msg\x12*\n\x08rotation\x18\x03 \x01(\x0b\x32\x18.Core.Network.Vector3Msg\x12\'\n\x05scale\x18\x04 \x01(\x0b\x32\x18.Core.Network.Vector3Msg\x12\x36\n\x0eworld_position\x18\x05 \x01(\x0b\x32\x1e.Core.Network.SectorVector3Msg\"j\n\x11TransformBatchMsg\x12\r\n\x05names\x18\x01 \x03(\t\x12\x0f\n\x07handles\x18\x02 \x03(\x05\x12\x11\n\tpositions\x18\x03 \x01(\x0c\x12\x11\n\trotations\x18\x04 \x01(\x0c\x12\x0f\n\x07sectors\x18\x05 \x01(\x0c\"\xd4\x02\n\nCommandMsg\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\t\x12\x0e\n\x06target\x18\x02 \x01(\t\x12\x14\n\x0cpayload_json\x18\x03 \x01(\t\x12\x30\n\x0evector_payload\x18\x04 \x01(\x0b\x32\x18.Core.Network.Vector3Msg\x12\x38\n\x0ftransform_batch\x18\x05 \x01(\x0b\x32\x1f.Core.Network.TransformBatchMsg\x12,\n\x05\x62\x61tch\x18\x06 \x01(\x0b\x32\x1d.Core.Network.CommandBatchMsg\x12\x35\n\rworld_payload\x18\x07 \x01(\x0b\x32\x1e.Core.Network.SectorVector3Msg\x12\x14\n\x0cinstance_ids\x18\x08 \x03(\x05\x12)\n\x04mesh\x18\t \x01(\x0b\x32\x1b.Core.Network.MeshUploadMsg\"\xb6\x01\n\rMeshUploadMsg\x12\x0c\n\x04hash\x18\x01 \x01(\t\x12\x11\n\tmesh_name\x18\x02 \x01(\t\x12\x14\n\x0cvertex_count\x18\x03 \x01(\x05\x12\x13\n\x0bindex_count\x18\x04 \x01(\x05\x12\x0f\n\x07index32\x18\x05 \x01(\x08\x12\x13\n\x0bhas_normals\x18\x06 \x01(\x08\x12\x0e\n\x06has_uv\x18\x07 \x01(\x08\x12\x13\n\x0btotal_bytes\x18\x08 \x01(\x05\x12\x0e\n\x06offset\x18\t \x01(\x05\"T\n\x0f\x43ommandBatchMsg\x12*\n\x08\x63ommands\x18\x01 \x03(\x0b\x32\x18.Core.Network.CommandMsg\x12\x15\n\rstop_on_error\x18\x02 \x01(\x08\"\xe4\x01\n\x0cHierarchyMsg\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\r\n\x05names\x18\x02 \x03(\t\x12\x12\n\ncomponents\x18\x03 \x03(\t\x12\x35\n\x0e\x63omponent_sets\x18\x04 \x03(\x0b\x32\x1d.Core.Network.ComponentSetMsg\x12\x0f\n\x07parents\x18\x05 \x01(\x0c\x12\x10\n\x08name_ids\x18\x06 \x01(\x0c\x12\x0f\n\x07set_ids\x18\x07 \x01(\x0c\x12\x11\n\tpositions\x18\x08 \x01(\x0c\x12\x0e\n\x06\x61\x63tive\x18\t \x01(\x0c\x12\x14\n\x0cinstance_ids\x18\n \x01(\x0c\"g\n\rFrameStatsMsg\x12\x0f\n\x07mean_ms\x18\x01 \x01(\x02\x12\x0e\n\x06p95_ms\x18\x02 \x01(\x02\x12\x0e\n\x06max_ms\x18\x03 \x01(\x02\x12\x0f\n\x07samples\x18\x04 \x01(\x05\x12\x14\n\x0cobject_count\x18\x05 \x01(\x05\"%\n\x0f\x43omponentSetMsg\x12\x12\n\ncomponents\x18\x01 \x03(\x05\"\xb7\x02\n\x0cGameStateMsg\x12\x11\n\ttimestamp\x18\x01 \x01(\x02\x12,\n\x08\x65ntities\x18\x02 \x03(\x0b\x32\x1a.Core.Network.TransformMsg\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x0f\n\x07handles\x18\x04 \x03(\x05\x12+\n\x07results\x18\x05 \x03(\x0b\x32\x1a.Core.Network.GameStateMsg\x12\x10\n\x08queue_ms\x18\x06 \x01(\x02\x12\x0f\n\x07\x65xec_ms\x18\x07 \x01(\x02\x12-\n\thierarchy\x18\x08 \x01(\x0b\x32\x1a.Core.Network.HierarchyMsg\x12\x30\n\x0b\x66rame_stats\x18\t \x01(\x0b\x32\x1b.Core.Network.FrameStatsMsg\x12\x14\n\x0cinstance_ids\x18\n \x03(\x05\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -23,10 +23,24 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
   _globals['_VECTOR3MSG']._serialized_start=34
   _globals['_VECTOR3MSG']._serialized_end=79
-  _globals['_TRANSFORMMSG']._serialized_start=82
-  _globals['_TRANSFORMMSG']._serialized_end=239
-  _globals['_COMMANDMSG']._serialized_start=241
-  _globals['_COMMANDMSG']._serialized_end=357
-  _globals['_GAMESTATEMSG']._serialized_start=359
-  _globals['_GAMESTATEMSG']._serialized_end=454
+  _globals['_SECTORVECTOR3MSG']._serialized_start=81
+  _globals['_SECTORVECTOR3MSG']._serialized_end=186
+  _globals['_TRANSFORMMSG']._serialized_start=189
+  _globals['_TRANSFORMMSG']._serialized_end=402
+  _globals['_TRANSFORMBATCHMSG']._serialized_start=404
+  _globals['_TRANSFORMBATCHMSG']._serialized_end=510
+  _globals['_COMMANDMSG']._serialized_start=513
+  _globals['_COMMANDMSG']._serialized_end=853
+  _globals['_MESHUPLOADMSG']._serialized_start=856
+  _globals['_MESHUPLOADMSG']._serialized_end=1038
+  _globals['_COMMANDBATCHMSG']._serialized_start=1040
+  _globals['_COMMANDBATCHMSG']._serialized_end=1124
+  _globals['_HIERARCHYMSG']._serialized_start=1127
+  _globals['_HIERARCHYMSG']._serialized_end=1355
+  _globals['_FRAMESTATSMSG']._serialized_start=1357
+  _globals['_FRAMESTATSMSG']._serialized_end=1460
+  _globals['_COMPONENTSETMSG']._serialized_start=1462
+  _globals['_COMPONENTSETMSG']._serialized_end=1499
+  _globals['_GAMESTATEMSG']._serialized_start=1502
+  _globals['_GAMESTATEMSG']._serialized_end=1813
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,307 @@
+"""
+Gravity field on a 3D lattice (potential + acceleration) for Rendering.LatticeRenderer.
+
+PhysicsEngine.CalculateGravityAtPoint loops over every body for one point. This
+evaluates the same sum (a = G*m*d/r^3, bodies closer than sqrt(0.001) skipped)
+for a whole lattice at once with NumPy:
+
+1. points x bodies in chunks of PAIR_BUDGET pairs, so memory stays bounded,
+2. grids cached in gravity_cache/ by a hash of G, the lattice and every body's
+   mass and position (order independent),
+3. GravityGrid.update() diffs the new bodies against the last grid: when only a
+   few moved / changed / appeared, their old contribution is subtracted and the
+   new one added (the field is a plain sum), instead of recomputing everything,
+4. export() writes the grid as a binary file LatticeRenderer.gravityField loads
+   into a Texture3D, so the shader samples the field per pixel. Lattice and
+   body positions are virtual (WorldMover) coordinates; the renderer shifts the
+   box by VirtualPosition each frame.
+
+    python gravity_grid.py bodies.json --size 64 --extent 2000 --export Assets/Resources/GravityField.bytes
+    python gravity_grid.py --random 500 --size 48 --move 3       # incremental updates demo
+"""
+import os
+import sys
+import json
+import time
+import struct
+import hashlib
+import argparse
+import tempfile
+import numpy as np
+
+CACHE_DIR = "gravity_cache"
+FORMAT_VERSION = 1
+PHYSICS_G = 0.0001       # PhysicsEngine.G field initializer
+MIN_DIST_SQ = 0.001      # CalculateGravityAtPoint skips bodies closer than this (squared)
+PAIR_BUDGET = 1 << 21    # Point x body pairs per chunk (~50 MB of float64 temporaries)
+REBUILD_AFTER = 64       # Incremental updates before a full recompute (rounding drift)
+EXPORT_MAGIC = b"GGRD"
+
+def log(msg):
+    print(f"[Gravity] {msg}")
+
+
+class Lattice:
+    """shape (nx, ny, nz) points, `spacing` apart, starting at `origin`. Flat order: x fastest (Texture3D)."""
+
+    def __init__(self, origin, spacing, shape):
+        self.origin = np.asarray(origin, dtype=np.float64).reshape(3)
+        self.spacing = float(spacing)
+        self.shape = tuple(int(n) for n in shape)
+        if len(self.shape) != 3 or min(self.shape) < 2:
+            raise ValueError(f"lattice needs at least 2 points per axis, got {self.shape}")
+
+    @classmethod
+    def centered(cls, center, extent, size):
+        """size^3 points covering a cube of side `extent` around `center`."""
+        spacing = extent / (size - 1)
+        return cls(np.asarray(center, dtype=np.float64) - extent / 2, spacing, (size, size, size))
+
+    def __len__(self):
+        return self.shape[0] * self.shape[1] * self.shape[2]
+
+    def points(self, start=0, stop=None):
+        """World positions of flat indices [start, stop) as (k,3) float64."""
+        i = np.arange(start, len(self) if stop is None else stop)
+        nx, ny, _ = self.shape
+        ijk = np.stack([i % nx, (i // nx) % ny, i // (nx * ny)], axis=1)
+        return self.origin + ijk * self.spacing
+
+    def describe(self):
+        return {"origin": self.origin.tolist(), "spacing": self.spacing, "shape": list(self.shape)}
+
+
+def field(points, masses, positions, G=PHYSICS_G, budget=PAIR_BUDGET):
+    """
+    Potential (P,) and acceleration (P,3) at `points` from point masses, float64.
+    Same rule as CalculateGravityAtPoint; the potential is -G*m/r with the same cutoff.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    masses = np.asarray(masses, dtype=np.float64).reshape(-1)
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    potential = np.zeros(len(points))
+    accel = np.zeros((len(points), 3))
+    gm = G * masses
+    # Points per chunk so that chunk x bodies fits the budget; bodies are split too
+    # when there are more of them than the budget
+    step_p = max(1, budget // max(1, len(masses)))
+    step_b = max(1, budget // max(1, min(step_p, len(points))))
+    for p0 in range(0, len(points), step_p):
+        pts = points[p0:p0 + step_p]
+        for b0 in range(0, len(masses), step_b):
+            d = positions[None, b0:b0 + step_b] - pts[:, None]
+            r2 = np.einsum("pbk,pbk->pb", d, d)
+            inv_r = np.zeros_like(r2)
+            np.sqrt(r2, out=inv_r, where=r2 >= MIN_DIST_SQ)
+            np.divide(1.0, inv_r, out=inv_r, where=inv_r > 0)
+            w = gm[b0:b0 + step_b] * inv_r
+            potential[p0:p0 + step_p] -= w.sum(axis=1)
+            accel[p0:p0 + step_p] += np.einsum("pb,pbk->pk", w * inv_r * inv_r, d)
+    return potential, accel
+
+def bodies_key(G, lattice, names, masses, positions):
+    """Cache key: G, lattice and every (name, mass, position), independent of body order."""
+    order = np.argsort(np.asarray(names, dtype=object).astype(str), kind="stable")
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps({"v": FORMAT_VERSION, "G": G, "lattice": lattice.describe()}, sort_keys=True).encode())
+    h.update("\0".join(str(names[i]) for i in order).encode("utf-8"))
+    h.update(np.ascontiguousarray(np.asarray(masses, dtype="<f8")[order]).tobytes())
+    h.update(np.ascontiguousarray(np.asarray(positions, dtype="<f8").reshape(-1, 3)[order]).tobytes())
+    return h.hexdigest()
+
+
+class GravityGrid:
+    """
+    Potential / acceleration on one lattice, kept current with update().
+    potential: (nz, ny, nx); acceleration: (nz, ny, nx, 3) (x fastest, like Texture3D).
+    """
+
+    def __init__(self, lattice, G=PHYSICS_G, cache_dir=CACHE_DIR, budget=PAIR_BUDGET, incremental_limit=None):
+        self.lattice = lattice
+        self.G = G
+        self.cache_dir = cache_dir
+        self.budget = budget
+        # Changed bodies beyond which a full recompute is cheaper (default: a quarter of them)
+        self.incremental_limit = incremental_limit
+        self.bodies = None  # name -> (mass, position tuple) the grid currently holds
+        self.potential = None
+        self.accel = None
+        self.updates_since_full = 0
+        self.key = None
+
+    # 1. Cache
+    def cache_path(self, key):
+        return os.path.join(self.cache_dir, key + ".npz") if self.cache_dir else None
+
+    def load(self, key):
+        path = self.cache_path(key)
+        if not path or not os.path.exists(path):
+            return False
+        with np.load(path) as data:
+            self.potential = data["potential"].reshape(-1)
+            self.accel = data["accel"].reshape(-1, 3)
+            self.updates_since_full = int(data["updates_since_full"])
+        return True
+
+    def save(self):
+        path = self.cache_path(self.key)
+        if not path:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, potential=self.potential, accel=self.accel,
+                     updates_since_full=np.int64(self.updates_since_full))
+        os.replace(tmp, path)
+
+    # 2. Evaluation
+    def contribution(self, masses, positions):
+        return field(self.lattice.points(), masses, positions, self.G, self.budget)
+
+    def update(self, names, masses, positions):
+        """
+        Brings the grid to these bodies. Returns how: "unchanged", "cached",
+        "incremental" (n bodies re-evaluated) or "full".
+        """
+        names = [str(n) for n in names]
+        masses = np.asarray(masses, dtype=np.float64).reshape(-1)
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        if len(set(names)) != len(names):
+            raise ValueError("body names must be unique")
+        new = {n: (float(m), tuple(p)) for n, m, p in zip(names, masses.tolist(), positions.tolist())}
+        key = bodies_key(self.G, self.lattice, names, masses, positions)
+        if key == self.key:
+            return "unchanged"
+
+        previous, self.bodies = self.bodies, new
+        if self.load(key):
+            self.key = key
+            return "cached"
+
+        # Which bodies differ from what the current grid holds
+        limit = self.incremental_limit if self.incremental_limit is not None else max(1, len(new) // 4)
+        mode = "full"
+        if previous is not None and self.updates_since_full < REBUILD_AFTER:
+            removed = [previous[n] for n in previous if new.get(n) != previous[n]]
+            added = [new[n] for n in new if previous.get(n) != new[n]]
+            if max(len(removed), len(added)) <= limit:
+                # Superposition: take the old versions out, put the new ones in
+                for sign, bodies in ((-1.0, removed), (1.0, added)):
+                    if bodies:
+                        pot, acc = self.contribution([b[0] for b in bodies], [b[1] for b in bodies])
+                        self.potential += sign * pot
+                        self.accel += sign * acc
+                self.updates_since_full += 1
+                mode = f"incremental ({max(len(removed), len(added))} bodies)"
+        if mode == "full":
+            self.potential, self.accel = self.contribution(masses, positions)
+            self.updates_since_full = 0
+        self.key = key
+        self.save()
+        return mode
+
+    # 3. Reading it back
+    def grids(self):
+        nx, ny, nz = self.lattice.shape
+        return self.potential.reshape(nz, ny, nx), self.accel.reshape(nz, ny, nx, 3)
+
+    def sample(self, points):
+        """Trilinear interpolation of (potential, acceleration) at world points (clamped to the lattice)."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        nx, ny, nz = self.lattice.shape
+        f = (points - self.lattice.origin) / self.lattice.spacing
+        f = np.clip(f, 0, np.array([nx, ny, nz]) - 1.000001)
+        i = np.floor(f).astype(np.int64)
+        t = f - i
+        potential = np.zeros(len(points))
+        accel = np.zeros((len(points), 3))
+        for dx in (0, 1):
+            for dy in (0, 1):
+                for dz in (0, 1):
+                    w = (np.where(dx, t[:, 0], 1 - t[:, 0]) * np.where(dy, t[:, 1], 1 - t[:, 1])
+                         * np.where(dz, t[:, 2], 1 - t[:, 2]))
+                    flat = (i[:, 0] + dx) + (i[:, 1] + dy) * nx + (i[:, 2] + dz) * nx * ny
+                    potential += w * self.potential[flat]
+                    accel += w[:, None] * self.accel[flat]
+        return potential, accel
+
+    def export(self, path):
+        """
+        Binary grid for LatticeRenderer.gravityField (a .bytes TextAsset):
+        "GGRD", uint32 version, int32 nx ny nz, float64 origin xyz, float64 spacing,
+        then float32 (ax, ay, az, potential) per point, x fastest (Texture3D RGBAFloat order).
+        """
+        nx, ny, nz = self.lattice.shape
+        texels = np.empty((len(self.lattice), 4), dtype="<f4")
+        texels[:, :3] = self.accel
+        texels[:, 3] = self.potential
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(EXPORT_MAGIC)
+            f.write(struct.pack("<I3i4d", FORMAT_VERSION, nx, ny, nz, *self.lattice.origin.tolist(), self.lattice.spacing))
+            f.write(texels.tobytes())
+        return os.path.getsize(path)
+
+
+def load_bodies(path):
+    """JSON list of {"name", "mass", "position": [x, y, z]} -> (names, masses, positions)."""
+    with open(path) as f:
+        bodies = json.load(f)
+    return ([b["name"] for b in bodies], np.array([float(b["mass"]) for b in bodies]),
+            np.array([b["position"] for b in bodies], dtype=np.float64))
+
+def random_bodies(count, extent, seed=0):
+    rng = np.random.default_rng(seed)
+    names = [f"Body_{i}" for i in range(count)]
+    masses = 10 ** rng.uniform(6, 12, count)
+    positions = rng.uniform(-extent / 2, extent / 2, size=(count, 3))
+    return names, masses, positions
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Precompute the gravity field on a lattice.")
+    parser.add_argument("bodies", nargs="?", help='JSON list of {"name", "mass", "position"}')
+    parser.add_argument("--random", type=int, help="use this many random bodies instead")
+    parser.add_argument("--G", type=float, default=PHYSICS_G)
+    parser.add_argument("--size", type=int, default=64, help="points per axis")
+    parser.add_argument("--extent", type=float, default=2000.0, help="cube side length")
+    parser.add_argument("--center", type=float, nargs=3, default=(0.0, 0.0, 0.0))
+    parser.add_argument("--cache", default=CACHE_DIR)
+    parser.add_argument("--move", type=int, default=0, help="then move one body N times (incremental demo)")
+    parser.add_argument("--export", help="write the binary grid for LatticeRenderer.gravityField")
+    args = parser.parse_args(argv)
+
+    if args.random:
+        names, masses, positions = random_bodies(args.random, args.extent)
+    elif args.bodies:
+        names, masses, positions = load_bodies(args.bodies)
+    else:
+        parser.error("give a bodies file or --random N")
+
+    lattice = Lattice.centered(args.center, args.extent, args.size)
+    grid = GravityGrid(lattice, args.G, args.cache)
+    t0 = time.perf_counter()
+    mode = grid.update(names, masses, positions)
+    log(f"{len(lattice)} points x {len(names)} bodies: {mode} in {time.perf_counter() - t0:.3f}s")
+
+    rng = np.random.default_rng(1)
+    for _ in range(args.move):
+        positions = positions.copy()
+        positions[0] += rng.normal(0, lattice.spacing, 3)
+        t0 = time.perf_counter()
+        mode = grid.update(names, masses, positions)
+        log(f"Moved {names[0]}: {mode} in {time.perf_counter() - t0:.3f}s")
+
+    # Accuracy: incremental grid vs direct evaluation, and trilinear sampling between points
+    check = lattice.points()[rng.choice(len(lattice), min(len(lattice), 2000), replace=False)]
+    direct_pot, direct_acc = field(check, masses, positions, args.G)
+    _, grid_acc = grid.sample(check)
+    scale = np.abs(direct_acc).max() or 1.0
+    log(f"Grid vs direct at lattice points: max error {np.abs(grid_acc - direct_acc).max() / scale:.2e} (relative)")
+
+    if args.export:
+        size = grid.export(args.export)
+        log(f"Exported {args.export} ({size / 1e6:.1f} MB)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
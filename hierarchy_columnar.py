@@ -0,0 +1,270 @@
+"""
+Columnar scene hierarchy (HierarchyMsg, action "get_hierarchy_columnar").
+
+The /hierarchy JSON is a nested dict per object; a million-object scene turns
+into a million dicts + lists on the Python side. Here the tree is flat arrays:
+
+    parents    int32 (N,)     parent index, -1 for roots; pre-order, so parents[i] < i
+    name_ids   int32 (N,)  -> names            (interned)
+    set_ids    int32 (N,)  -> component_sets   (interned tuples of component names)
+    positions  float32 (N,3)
+    active     bool (N,)
+    instance_ids int32 (N,)   GameObject.GetInstanceID() (destroy_instances target)
+
+decode() wraps the reply buffers with np.frombuffer (no per-node Python objects).
+Node(tree, i) is a __slots__ view for code that wants node.name / node.children.
+
+    tree = client.get_hierarchy_columnar()
+    for i in tree.find("Earth"):
+        print(tree.node(i).components, tree.positions[i])
+"""
+import numpy as np
+import game_state_pb2
+
+
+class Node:
+    """Lightweight view of node `index` (nothing is copied)."""
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    @property
+    def name(self):
+        return self.tree.names[self.tree.name_ids[self.index]]
+
+    @property
+    def components(self):
+        return self.tree.component_sets[self.tree.set_ids[self.index]]
+
+    @property
+    def position(self):
+        return tuple(self.tree.positions[self.index].tolist())
+
+    @property
+    def active(self):
+        return bool(self.tree.active[self.index])
+
+    @property
+    def parent(self):
+        p = int(self.tree.parents[self.index])
+        return Node(self.tree, p) if p >= 0 else None
+
+    @property
+    def children(self):
+        return [Node(self.tree, int(c)) for c in self.tree.children(self.index)]
+
+    def __repr__(self):
+        return f"Node({self.index}, {self.name!r})"
+
+
+class Hierarchy:
+    __slots__ = ("parents", "name_ids", "set_ids", "positions", "active", "instance_ids",
+                 "names", "components", "component_sets", "_child_offsets", "_child_order", "_depths")
+
+    def __init__(self, parents, name_ids, set_ids, positions, active, names, components, component_sets,
+                 instance_ids=None):
+        self.parents = parents
+        self.name_ids = name_ids
+        self.set_ids = set_ids
+        self.positions = positions
+        self.active = active
+        self.instance_ids = instance_ids
+        self.names = names
+        self.components = components
+        self.component_sets = component_sets  # tuple of component names per set
+        self._child_offsets = None
+        self._child_order = None
+        self._depths = None
+
+    def __len__(self):
+        return len(self.parents)
+
+    def node(self, index):
+        return Node(self, index)
+
+    def roots(self):
+        return np.flatnonzero(self.parents < 0)
+
+    def _build_children(self):
+        # CSR child lists: one stable sort keeps children in scene order
+        n = len(self.parents)
+        order = np.argsort(self.parents, kind="stable")
+        order = order[np.count_nonzero(self.parents < 0):]
+        counts = np.bincount(self.parents[self.parents >= 0], minlength=n)
+        self._child_offsets = np.concatenate(([0], np.cumsum(counts)))
+        self._child_order = order
+
+    def children(self, index):
+        if self._child_offsets is None:
+            self._build_children()
+        return self._child_order[self._child_offsets[index]:self._child_offsets[index + 1]]
+
+    def depths(self):
+        """Depth per node (roots = 0), one vectorized step per tree level."""
+        if self._depths is None:
+            depths = np.zeros(len(self.parents), dtype=np.int32)
+            ancestor = self.parents.copy()
+            mask = ancestor >= 0
+            while mask.any():
+                depths[mask] += 1
+                ancestor[mask] = self.parents[ancestor[mask]]
+                mask = ancestor >= 0
+            self._depths = depths
+        return self._depths
+
+    def subtree_sizes(self):
+        """Nodes in each subtree (including itself). Subtree of i is the slice [i, i + size)."""
+        sizes = np.ones(len(self.parents), dtype=np.int64)
+        depths = self.depths()
+        for depth in range(int(depths.max(initial=0)), 0, -1):
+            level = np.flatnonzero(depths == depth)
+            np.add.at(sizes, self.parents[level], sizes[level])
+        return sizes
+
+    def subtree_size(self, index):
+        """Nodes in one subtree: pre-order puts its last node at the end of the last-child chain (O(depth))."""
+        last = index
+        kids = self.children(last)
+        while len(kids):
+            last = int(kids[-1])
+            kids = self.children(last)
+        return last - index + 1
+
+    def find(self, name):
+        """Indices of every node called `name`."""
+        try:
+            name_id = self.names.index(name)
+        except ValueError:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(self.name_ids == name_id)
+
+    def with_component(self, component):
+        """Indices of nodes carrying `component` (full or short type name)."""
+        sets = [i for i, comps in enumerate(self.component_sets)
+                if any(c == component or c.rsplit(".", 1)[-1] == component for c in comps)]
+        return np.flatnonzero(np.isin(self.set_ids, sets))
+
+
+def decode(msg):
+    """HierarchyMsg (or its serialized bytes) -> Hierarchy."""
+    if isinstance(msg, (bytes, bytearray, memoryview)):
+        msg = game_state_pb2.HierarchyMsg.FromString(bytes(msg))
+    count = msg.count
+    parents = np.frombuffer(msg.parents, dtype="<i4")
+    name_ids = np.frombuffer(msg.name_ids, dtype="<i4")
+    set_ids = np.frombuffer(msg.set_ids, dtype="<i4")
+    positions = np.frombuffer(msg.positions, dtype="<f4").reshape(-1, 3)
+    active = np.frombuffer(msg.active, dtype=np.uint8).astype(bool) if msg.active else np.ones(count, dtype=bool)
+    instance_ids = np.frombuffer(msg.instance_ids, dtype="<i4") if msg.instance_ids else None
+    if not (len(parents) == len(name_ids) == len(set_ids) == len(positions) == len(active) == count) or \
+            (instance_ids is not None and len(instance_ids) != count):
+        raise ValueError(f"column length mismatch for {count} nodes")
+    components = list(msg.components)
+    component_sets = [tuple(components[c] for c in s.components) for s in msg.component_sets]
+    return Hierarchy(parents, name_ids, set_ids, positions, active,
+                     list(msg.names), components, component_sets, instance_ids)
+
+
+def encode(parents, names, component_lists, positions, active=None, instance_ids=None):
+    """
+    Per-node Python data (pre-order) -> HierarchyMsg.
+    names / component_lists: one entry per node; names and component sets are interned here.
+    """
+    msg = game_state_pb2.HierarchyMsg()
+    name_table, component_table, set_table = {}, {}, {}
+    name_ids = np.empty(len(names), dtype="<i4")
+    set_ids = np.empty(len(names), dtype="<i4")
+    for i, (name, comps) in enumerate(zip(names, component_lists)):
+        name_id = name_table.get(name)
+        if name_id is None:
+            name_id = name_table[name] = len(name_table)
+            msg.names.append(name)
+        name_ids[i] = name_id
+
+        key = tuple(comps)
+        set_id = set_table.get(key)
+        if set_id is None:
+            set_id = set_table[key] = len(set_table)
+            ids = []
+            for c in key:
+                if c not in component_table:
+                    component_table[c] = len(component_table)
+                    msg.components.append(c)
+                ids.append(component_table[c])
+            msg.component_sets.add().components.extend(ids)
+        set_ids[i] = set_id
+
+    msg.count = len(names)
+    msg.parents = np.asarray(parents, dtype="<i4").tobytes()
+    msg.name_ids = name_ids.tobytes()
+    msg.set_ids = set_ids.tobytes()
+    msg.positions = np.asarray(positions, dtype="<f4").reshape(-1, 3).tobytes()
+    msg.active = np.ones(len(names), dtype=np.uint8).tobytes() if active is None else \
+        np.asarray(active, dtype=np.uint8).tobytes()
+    if instance_ids is not None:
+        msg.instance_ids = np.asarray(instance_ids, dtype="<i4").tobytes()
+    return msg
+
+
+def to_msg(tree):
+    """Hierarchy -> HierarchyMsg (e.g. to save a snapshot with SerializeToString())."""
+    msg = game_state_pb2.HierarchyMsg()
+    msg.count = len(tree)
+    msg.names.extend(tree.names)
+    msg.components.extend(tree.components)
+    component_ids = {c: i for i, c in enumerate(tree.components)}
+    for comps in tree.component_sets:
+        msg.component_sets.add().components.extend(component_ids[c] for c in comps)
+    msg.parents = np.asarray(tree.parents, dtype="<i4").tobytes()
+    msg.name_ids = np.asarray(tree.name_ids, dtype="<i4").tobytes()
+    msg.set_ids = np.asarray(tree.set_ids, dtype="<i4").tobytes()
+    msg.positions = np.asarray(tree.positions, dtype="<f4").tobytes()
+    msg.active = np.asarray(tree.active, dtype=np.uint8).tobytes()
+    if tree.instance_ids is not None:
+        msg.instance_ids = np.asarray(tree.instance_ids, dtype="<i4").tobytes()
+    return msg
+
+
+def _parse_position(pos):
+    if isinstance(pos, dict):
+        return (pos.get("x", np.nan), pos.get("y", np.nan), pos.get("z", np.nan))
+    if isinstance(pos, (list, tuple)) and len(pos) == 3:
+        return tuple(pos)
+    if isinstance(pos, str):
+        parts = pos.strip("()[] ").split(",")
+        if len(parts) == 3:
+            try:
+                return tuple(float(p) for p in parts)
+            except ValueError:
+                pass
+    return (np.nan, np.nan, np.nan)
+
+
+def from_json(nodes):
+    """Nested /hierarchy JSON ("objects" list) -> HierarchyMsg."""
+    parents, names, comps, positions = [], [], [], []
+    stack = [(node, -1) for node in reversed(nodes)]
+    while stack:
+        node, parent = stack.pop()
+        index = len(parents)
+        parents.append(parent)
+        names.append(node["name"])
+        comps.append(node.get("components", ()))
+        positions.append(_parse_position(node.get("position")))
+        for child in reversed(node.get("children", ())):
+            stack.append((child, index))
+    return encode(parents, names, comps, positions)
+
+
+def print_tree(tree, limit=None):
+    """Same output as check_hierarchy.print_tree, straight from the columns."""
+    depths = tree.depths()
+    count = len(tree) if limit is None else min(limit, len(tree))
+    for i in range(count):
+        comps = ", ".join(tree.component_sets[tree.set_ids[i]])
+        x, y, z = tree.positions[i].tolist()
+        print(f"{'  ' * depths[i]}- {tree.names[tree.name_ids[i]]} [{comps}] @ ({x:.2f}, {y:.2f}, {z:.2f})")
+    if count < len(tree):
+        print(f"... {len(tree) - count} more")
@@ -0,0 +1,250 @@
+"""
+Snapshot differ for scene hierarchies (columnar, see hierarchy_columnar.py).
+
+Every subtree gets a 64-bit Merkle hash, computed bottom-up once per snapshot:
+
+    local(node)   = hash(name, component set, position quantized to `tolerance`, activeSelf)
+    subtree(node) = hash(local(node), sum of subtree(child))    # sibling order does not matter
+
+diff() walks both trees top-down and skips every subtree whose hash matches,
+so the work is proportional to the changed nodes (and their siblings), not the
+scene size. Children are matched by name (+ occurrence index for duplicate names).
+
+Output: added / removed (subtree roots), moved (same name + components under a
+new parent) and changed (components, position beyond tolerance, active flag).
+
+Usage:
+    python hierarchy_diff.py capture before.hier [--http]   # ZeroMQ columnar (default) or /hierarchy JSON
+    python hierarchy_diff.py diff before.hier after.hier
+"""
+import sys
+import hashlib
+import numpy as np
+import hierarchy_columnar
+
+DEFAULT_TOLERANCE = 1e-3
+
+_C1 = np.uint64(0x9E3779B97F4A7C15)
+_C2 = np.uint64(0xBF58476D1CE4E5B9)
+_C3 = np.uint64(0x94D049BB133111EB)
+
+def log(msg):
+    print(f"[HierarchyDiff] {msg}")
+
+def _mix(x):
+    """splitmix64 finalizer over uint64 arrays (wraps mod 2^64)."""
+    with np.errstate(over="ignore"):
+        z = x + _C1
+        z = (z ^ (z >> np.uint64(30))) * _C2
+        z = (z ^ (z >> np.uint64(27))) * _C3
+        return z ^ (z >> np.uint64(31))
+
+def _hash_strings(values):
+    return np.fromiter((int.from_bytes(hashlib.blake2b(v.encode("utf-8"), digest_size=8).digest(), "little")
+                       for v in values), dtype=np.uint64, count=len(values))
+
+
+class Snapshot:
+    """A Hierarchy plus its per-node local and subtree hashes."""
+
+    def __init__(self, tree, tolerance=DEFAULT_TOLERANCE):
+        self.tree = tree
+        self.tolerance = tolerance
+        self.local = self._local_hashes()
+        self.subtree = self._subtree_hashes()
+
+    def _local_hashes(self):
+        tree = self.tree
+        name_h = _hash_strings(tree.names)
+        # Sorted: component order on the GameObject is not a change
+        set_h = _hash_strings(["\n".join(sorted(s)) for s in tree.component_sets])
+        quantized = np.rint(np.nan_to_num(tree.positions.astype(np.float64)) / self.tolerance).astype(np.int64)
+
+        h = _mix(name_h[tree.name_ids])
+        h = _mix(h ^ set_h[tree.set_ids])
+        for axis in range(3):
+            h = _mix(h ^ quantized[:, axis].view(np.uint64))
+        return _mix(h ^ tree.active.astype(np.uint64))
+
+    def _subtree_hashes(self):
+        # Deepest level first: each level folds its finished hashes into the parents
+        tree = self.tree
+        depths = tree.depths()
+        child_sum = np.zeros(len(tree), dtype=np.uint64)
+        subtree = np.zeros(len(tree), dtype=np.uint64)
+        for depth in range(int(depths.max(initial=0)), -1, -1):
+            level = np.flatnonzero(depths == depth)
+            subtree[level] = _mix(self.local[level] ^ _mix(child_sum[level]))
+            if depth > 0:
+                with np.errstate(over="ignore"):
+                    np.add.at(child_sum, tree.parents[level], subtree[level])
+        return subtree
+
+    def name(self, i):
+        return self.tree.names[self.tree.name_ids[i]]
+
+    def path(self, i):
+        parts = []
+        while i >= 0:
+            parts.append(self.name(i))
+            i = int(self.tree.parents[i])
+        return "/".join(reversed(parts))
+
+    def children(self, i):
+        """Children of node i (i = -1: scene roots)."""
+        return self.tree.roots() if i < 0 else self.tree.children(i)
+
+    def keyed_children(self, i):
+        """{(name, occurrence): child index} - stable identity for duplicate sibling names."""
+        keyed, seen = {}, {}
+        for c in self.children(i).tolist():
+            name = self.name(c)
+            k = seen.get(name, 0)
+            seen[name] = k + 1
+            keyed[(name, k)] = c
+        return keyed
+
+
+class DiffResult:
+    def __init__(self):
+        self.added = []    # (path, subtree size)
+        self.removed = []  # (path, subtree size)
+        self.moved = []    # (old path, new path)
+        self.changed = []  # (path, {field: (old, new)})
+        self.visited = 0   # Node pairs compared (cost of the diff)
+
+    def empty(self):
+        return not (self.added or self.removed or self.moved or self.changed)
+
+    def summary(self):
+        return (f"{len(self.added)} added, {len(self.removed)} removed, {len(self.moved)} moved, "
+                f"{len(self.changed)} changed ({self.visited} nodes compared)")
+
+    def print_diff(self, limit=50):
+        for label, rows in (("+", self.added), ("-", self.removed)):
+            for path, size in rows[:limit]:
+                print(f"{label} {path}" + (f" (+{size - 1} children)" if size > 1 else ""))
+        for old, new in self.moved[:limit]:
+            print(f"> {old} -> {new}")
+        for path, fields in self.changed[:limit]:
+            print(f"~ {path}: " + ", ".join(f"{k} {a} -> {b}" for k, (a, b) in fields.items()))
+        print(self.summary())
+
+
+def _changes(a, i, b, j):
+    """Field-level differences between matched nodes (empty if only within tolerance)."""
+    fields = {}
+    comps_a = set(a.tree.component_sets[a.tree.set_ids[i]])
+    comps_b = set(b.tree.component_sets[b.tree.set_ids[j]])
+    if comps_a != comps_b:
+        fields["components"] = (sorted(comps_a - comps_b), sorted(comps_b - comps_a))
+    pa = a.tree.positions[i].astype(np.float64)
+    pb = b.tree.positions[j].astype(np.float64)
+    # Quantization can split two nearby values; only report real moves
+    if np.abs(pa - pb).max() > a.tolerance:
+        fields["position"] = (tuple(np.round(pa, 4).tolist()), tuple(np.round(pb, 4).tolist()))
+    if bool(a.tree.active[i]) != bool(b.tree.active[j]):
+        fields["active"] = (bool(a.tree.active[i]), bool(b.tree.active[j]))
+    return fields
+
+
+def diff(a, b):
+    """Snapshot a (before) vs Snapshot b (after) -> DiffResult."""
+    result = DiffResult()
+    added, removed = [], []
+    stack = [(-1, -1)]  # Matched pairs; (-1, -1) is the virtual scene root
+
+    def walk(stack):
+        while stack:
+            i, j = stack.pop()
+            result.visited += 1
+            if i >= 0:
+                if a.subtree[i] == b.subtree[j]:
+                    continue
+                if a.local[i] != b.local[j]:
+                    fields = _changes(a, i, b, j)
+                    if fields:
+                        result.changed.append((b.path(j), fields))
+            kids_a = a.keyed_children(i)
+            kids_b = b.keyed_children(j)
+            for key, ci in kids_a.items():
+                cj = kids_b.get(key)
+                if cj is None:
+                    removed.append(ci)
+                else:
+                    stack.append((ci, cj))
+            added.extend(cj for key, cj in kids_b.items() if key not in kids_a)
+
+    walk(stack)
+
+    # Moves: a removed and an added subtree root with the same name and components.
+    # Walking a moved subtree can remove / add more below it, so match in rounds until nothing new appears.
+    def key(snap, i):
+        return snap.name(i), tuple(sorted(snap.tree.component_sets[snap.tree.set_ids[i]]))
+
+    candidates, pending = {}, []
+    seen_removed = seen_added = 0
+    while seen_removed < len(removed) or seen_added < len(added):
+        for ci in removed[seen_removed:]:
+            candidates.setdefault(key(a, ci), []).append(ci)
+        pending += added[seen_added:]
+        seen_removed, seen_added = len(removed), len(added)
+        unmatched = []
+        for cj in pending:
+            matches = candidates.get(key(b, cj))
+            if matches:
+                ci = matches.pop(0)
+                result.moved.append((a.path(ci), b.path(cj)))
+                walk([(ci, cj)])  # Also report what changed inside the moved subtree
+            else:
+                unmatched.append(cj)
+        pending = unmatched
+    result.added.extend((b.path(cj), b.tree.subtree_size(cj)) for cj in pending)
+    for matches in candidates.values():
+        result.removed.extend((a.path(ci), a.tree.subtree_size(ci)) for ci in matches)
+    return result
+
+
+# --- Snapshots on disk / from Unity ---
+
+def save(tree, path):
+    with open(path, "wb") as f:
+        f.write(hierarchy_columnar.to_msg(tree).SerializeToString())
+
+def load(path, tolerance=DEFAULT_TOLERANCE):
+    with open(path, "rb") as f:
+        return Snapshot(hierarchy_columnar.decode(f.read()), tolerance)
+
+def capture_zmq(client=None):
+    import zmq_bridge
+    client = client or zmq_bridge.UnityZeroMQClient(reliable=True)
+    return client.get_hierarchy_columnar()
+
+def capture_http():
+    """Current scene from the AgentBridge /hierarchy JSON (None if unreachable)."""
+    import unity_bridge
+    try:
+        response = unity_bridge.SESSION.get(f"http://localhost:{unity_bridge.PORT}/hierarchy", timeout=10)
+        response.raise_for_status()
+    except Exception as e:
+        log(f"Failed to query hierarchy: {e}")
+        return None
+    return hierarchy_columnar.decode(hierarchy_columnar.from_json(response.json().get("objects", [])))
+
+def main(argv):
+    if len(argv) >= 2 and argv[0] == "capture":
+        tree = capture_http() if "--http" in argv else capture_zmq()
+        if tree is None:
+            return 1
+        save(tree, argv[1])
+        log(f"Saved {len(tree)} objects to {argv[1]}")
+        return 0
+    if len(argv) >= 3 and argv[0] == "diff":
+        result = diff(load(argv[1]), load(argv[2]))
+        result.print_diff()
+        return 0 if result.empty() else 2
+    print("Usage: hierarchy_diff.py capture <file> [--http] | diff <before> <after>")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,225 @@
+"""
+Batched mining / economy simulator: MiningLaser -> MiningTarget -> ResourceInventory.
+
+test_mining_full.py fires one laser at one Iron_Ore_Vein for two seconds. This runs
+thousands of ships against thousands of ore bodies as array math:
+
+1. every tick (dt = 1 / tick_rate, like Time.deltaTime) a firing laser extracts
+   extraction_rate * dt from its target and adds the same amount to the ship's
+   inventory (float32 like the C# fields),
+2. MiningTarget.Extract: the tick that crosses zero clamps the target to 0 and
+   deactivates it, but MiningLaser still credits the full amount; lasers later
+   in the same frame miss it (no collider). The difference is reported as
+   overcredit,
+3. ships without a live target fly (ship_speed) to the nearest active ore body
+   and start firing once inside the laser range,
+4. --runs N does a Monte Carlo sweep (one seed per run) over a process pool and
+   reports mean / spread of the pacing numbers.
+
+    python mining_sim.py --ships 2000 --ores 5000
+    python mining_sim.py --runs 16 --sweep extraction_rate=5,10,20 --sweep tick_rate=30,90
+"""
+import sys
+import time
+import argparse
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from sim_params import ParamSet
+
+# MiningLaser / MiningTarget field defaults; the rest describes the scenario
+DEFAULT_PARAMS = {
+    "range": 50.0,
+    "extraction_rate": 10.0,   # Units per second
+    "ore_amount": 100.0,       # MiningTarget.amountRemaining (median of the lognormal)
+    "ore_spread": 0.5,         # Lognormal sigma of ore amounts (0 = all identical)
+    "resources": "Iron:0.6,Nickel:0.3,Ice:0.1",
+    "tick_rate": 90.0,         # Frames per second (Time.deltaTime = 1 / tick_rate)
+    "ship_speed": 50.0,
+    "field_size": 5000.0,      # Side of the cube ships and ores are scattered over
+    "seconds": 600.0,
+}
+
+def log(msg):
+    print(f"[Mining Sim] {msg}")
+
+PARAMS = ParamSet("mining", DEFAULT_PARAMS)
+make_params = PARAMS.make
+
+def parse_resources(spec):
+    """"Iron:0.6,Ice:0.4" -> (names, normalized weights)."""
+    names, weights = [], []
+    for item in spec.split(","):
+        name, _, weight = item.partition(":")
+        names.append(name.strip())
+        weights.append(float(weight or 1))
+    weights = np.array(weights)
+    return names, weights / weights.sum()
+
+
+class MiningSim:
+    """ships x ores; inventory is (ships, resources) like ResourceInventory.resources."""
+
+    def __init__(self, ships, ores, params=None, seed=0):
+        self.p = params or make_params()
+        p = self.p
+        self.rng = np.random.default_rng(seed)
+        self.dt = np.float32(1.0 / p["tick_rate"])
+        self.time = 0.0
+        self.resource_names, weights = parse_resources(p["resources"])
+
+        # 1. Ore bodies
+        self.ore_pos = self.rng.uniform(-p["field_size"] / 2, p["field_size"] / 2, size=(ores, 3))
+        amounts = p["ore_amount"] * np.exp(self.rng.normal(0, p["ore_spread"], ores)) if p["ore_spread"] > 0 \
+            else np.full(ores, p["ore_amount"])
+        self.ore_remaining = amounts.astype(np.float32)
+        self.ore_initial = float(self.ore_remaining.astype(np.float64).sum())
+        self.ore_resource = self.rng.choice(len(weights), size=ores, p=weights)
+        self.ore_active = np.ones(ores, dtype=bool)
+        self.depleted_at = np.full(ores, np.nan)
+
+        # 2. Ships
+        self.ship_pos = self.rng.uniform(-p["field_size"] / 2, p["field_size"] / 2, size=(ships, 3))
+        self.target = np.full(ships, -1)
+        self.inventory = np.zeros((ships, len(weights)), dtype=np.float32)
+        self.firing_ticks = np.zeros(ships, dtype=np.int64)
+        self.ticks = 0
+
+    def retarget(self, idle):
+        """Nearest active ore for each idle ship (chunked so the distance matrix stays small)."""
+        active = np.flatnonzero(self.ore_active)
+        if len(active) == 0:
+            self.target[idle] = -1
+            return
+        ore_pos = self.ore_pos[active]
+        step = max(1, (1 << 22) // len(active))
+        for i in range(0, len(idle), step):
+            ships = idle[i:i + step]
+            d2 = ((self.ship_pos[ships, None] - ore_pos[None]) ** 2).sum(axis=2)
+            self.target[ships] = active[d2.argmin(axis=1)]
+
+    def step(self):
+        p = self.p
+        # 1. Ships whose target is gone look for a new one
+        idle = np.flatnonzero((self.target < 0) | ~self.ore_active[np.maximum(self.target, 0)])
+        if len(idle):
+            self.retarget(idle)
+        has = np.flatnonzero(self.target >= 0)
+
+        # 2. Fly until the ore is inside laser range
+        to_ore = self.ore_pos[self.target[has]] - self.ship_pos[has]
+        dist = np.linalg.norm(to_ore, axis=1)
+        flying = dist > p["range"]
+        if flying.any():
+            fly, d = has[flying], dist[flying]
+            move = np.minimum(p["ship_speed"] * float(self.dt), d - p["range"] * 0.9)
+            self.ship_pos[fly] += to_ore[flying] * (move / d)[:, None]
+        self.mine(has[~flying])
+        self.time += float(self.dt)
+        self.ticks += 1
+
+    def mine(self, lasers):
+        """One frame of MiningLaser.ProcessMining for every firing laser (in ship order)."""
+        if len(lasers) == 0:
+            return
+        amount = np.float32(self.p["extraction_rate"]) * self.dt
+        targets = self.target[lasers]
+
+        # Lasers on the same ore run one after another: laser k of a group still sees
+        # the ore if the k lasers before it left something (remaining > 0)
+        order = np.argsort(targets, kind="stable")
+        lasers, targets = lasers[order], targets[order]
+        group_start = np.r_[True, targets[1:] != targets[:-1]]
+        rank = np.arange(len(targets)) - np.maximum.accumulate(np.where(group_start, np.arange(len(targets)), 0))
+        hits = self.ore_remaining[targets].astype(np.float64) - rank * float(amount) > 0
+        lasers, targets = lasers[hits], targets[hits]
+
+        # Full amount to every laser that hit (MiningLaser adds before checking what was left)
+        self.inventory[lasers, self.ore_resource[targets]] += amount
+        self.firing_ticks[lasers] += 1
+        # (Per-frame total per ore; the C# subtracts laser by laser, same up to float32 rounding)
+        taken = np.bincount(targets, minlength=len(self.ore_remaining)).astype(np.float32) * amount
+        self.ore_remaining -= taken
+        # MiningTarget.Die(): clamp to 0, SetActive(false)
+        dead = self.ore_active & (self.ore_remaining <= 0)
+        if dead.any():
+            self.ore_remaining[dead] = 0
+            self.ore_active[dead] = False
+            self.depleted_at[dead] = self.time + float(self.dt)
+
+    def run(self):
+        ticks = int(round(self.p["seconds"] * self.p["tick_rate"]))
+        for _ in range(ticks):
+            if not self.ore_active.any():
+                break
+            self.step()
+        return self.report()
+
+    def report(self):
+        mined = self.ore_initial - float(self.ore_remaining.astype(np.float64).sum())
+        per_ship = self.inventory.astype(np.float64).sum(axis=1)
+        credited = float(per_ship.sum())
+        depleted = np.sort(self.depleted_at[~np.isnan(self.depleted_at)])
+        total = len(self.depleted_at)
+
+        def depletion(fraction):
+            k = int(np.ceil(fraction * total)) - 1
+            return float(depleted[k]) if k < len(depleted) else float("nan")
+
+        minutes = max(self.time, 1e-9) / 60
+        return {
+            "mined": mined,
+            "credited": credited,
+            "overcredit": credited / mined - 1 if mined > 0 else 0.0,
+            "per_ship_min": credited / len(per_ship) / minutes,
+            "ship_p10": float(np.percentile(per_ship, 10)),
+            "ship_p90": float(np.percentile(per_ship, 90)),
+            "utilization": float(self.firing_ticks.mean() / max(self.ticks, 1)),
+            "depleted": len(depleted) / total,
+            "t50": depletion(0.5),
+            "t90": depletion(0.9),
+        }
+
+
+def run_one(job):
+    ships, ores, params, seed = job
+    return MiningSim(ships, ores, params, seed).run()
+
+def monte_carlo(ships, ores, params, runs, workers=None, seed=0):
+    """runs seeds over a process pool -> {metric: (mean, std)}."""
+    jobs = [(ships, ores, params, seed + i) for i in range(runs)]
+    if runs == 1 or workers == 1:
+        results = [run_one(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_one, jobs))
+    stats = {}
+    for key in results[0]:
+        values = np.array([r[key] for r in results])
+        values = values[~np.isnan(values)]
+        stats[key] = (float(values.mean()), float(values.std())) if len(values) else (float("nan"), float("nan"))
+    return stats
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Batched mining / economy simulation.")
+    parser.add_argument("--ships", type=int, default=2000)
+    parser.add_argument("--ores", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=1, help="Monte Carlo runs (seeds) per setting")
+    parser.add_argument("--workers", type=int, help="process count (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    PARAMS.add_arguments(parser)
+    args = parser.parse_args(argv)
+    names, runs = PARAMS.sweep(args)
+
+    columns = ("per_ship_min", "utilization", "overcredit", "depleted", "t50", "t90", "ship_p10", "ship_p90")
+    log(f"{args.ships} ships, {args.ores} ores, {args.runs} run(s) per setting (mean ± std)")
+    log(" ".join(f"{n:>15}" for n in names) + " " + " ".join(f"{c:>17}" for c in columns) + f" {'seconds':>8}")
+    for combo, params in runs:
+        t0 = time.perf_counter()
+        stats = monte_carlo(args.ships, args.ores, params, args.runs, args.workers, args.seed)
+        log(" ".join(f"{str(v):>15}" for v in combo) + " "
+            + " ".join(f"{stats[c][0]:9.4g} ±{stats[c][1]:7.2g}" for c in columns)
+            + f" {time.perf_counter() - t0:8.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,423 @@
+"""
+Orbital initial conditions for hierarchical systems (star -> planets -> moons).
+
+run_phase_1_orbit.py and UniverseGenerator.GenerateOrigin each hard-code
+v = sqrt(G*M/r) for one planet around one star. solve() takes the whole tree
+and returns consistent float64 positions / velocities for every body:
+
+1. Kepler elements -> relative state of each body's subsystem (the body plus
+   everything orbiting it) around its parent, mu = G * (m_parent + M_subsystem).
+2. Parents are offset from their subsystem barycenter so the satellites' momentum
+   is balanced (a star with planets wobbles instead of sitting still).
+3. Absolute states level by level, then shifted into the center-of-mass frame.
+
+Every step is array math over all bodies of a tree level, so thousands of
+bodies take milliseconds. G is read from the scene (PhysicsEngine.G over
+ZeroMQ) unless given. to_commands() emits one batch of set_property commands.
+
+Body description (dicts, or a JSON list of them); angles in degrees:
+
+    {"name": "Sol", "mass": 1e12, "radius": 50}
+    {"name": "Earth", "parent": "Sol", "mass": 9.8e6, "a": 200, "e": 0.0,
+     "i": 0, "node": 0, "peri": 0, "anomaly": 0}          # anomaly = mean anomaly
+
+Orbits lie in Unity's XZ plane (Y up) at i = 0; anomaly 0 puts a body on the
+parent's +X side moving toward +Z, like GenerateOrigin.
+
+    python orbit_solver.py system.json [--apply] [--verify 2]
+    python orbit_solver.py --random 5000 --verify 1
+"""
+import sys
+import json
+import time
+import argparse
+import numpy as np
+
+# PhysicsEngine.G field initializer; used when the scene can't be asked
+PHYSICS_G = 0.0001
+# PhysicsEngine substep: Time.fixedDeltaTime (0.02) / SubSteps (4); orbits need ~100 of them per period
+PHYSICS_STEP = 0.02 / 4
+MIN_STEPS_PER_ORBIT = 100
+# UniverseGenerator.GenerateOrigin values
+SOL_MASS = 1e12
+EARTH_MASS = 9.8e6
+EARTH_ORBIT = 200.0
+
+def log(msg):
+    print(f"[Orbits] {msg}")
+
+
+class System:
+    """Solved bodies: index i is bodies[i]; positions / velocities are (N,3) float64."""
+
+    def __init__(self, bodies, parents, masses, G):
+        self.bodies = bodies
+        self.names = [b["name"] for b in bodies]
+        self.parents = parents
+        self.masses = masses
+        self.G = G
+        self.positions = np.zeros((len(bodies), 3))
+        self.velocities = np.zeros((len(bodies), 3))
+        self.subsystem_masses = masses.copy()
+        self.depths = np.zeros(len(bodies), dtype=np.int64)
+
+    def __len__(self):
+        return len(self.bodies)
+
+    def momentum(self):
+        return (self.masses[:, None] * self.velocities).sum(axis=0)
+
+    def energy(self, positions=None, velocities=None):
+        """Total kinetic + potential energy (O(N^2) pairs, chunked)."""
+        positions = self.positions if positions is None else positions
+        velocities = self.velocities if velocities is None else velocities
+        kinetic = 0.5 * (self.masses * (velocities ** 2).sum(axis=1)).sum()
+        potential = 0.0
+        for lo in range(0, len(self), 1024):
+            d = np.linalg.norm(positions[lo:lo + 1024, None, :] - positions[None, :, :], axis=2)
+            rows = np.arange(lo, min(lo + 1024, len(self)))
+            mask = np.arange(len(self))[None, :] > rows[:, None]  # Each pair once
+            with np.errstate(divide="ignore"):
+                potential -= (self.G * self.masses[rows, None] * self.masses[None, :] * mask / np.where(mask, d, 1.0)).sum()
+        return kinetic + potential
+
+    def to_commands(self, component="Core.CelestialBody", transforms=True):
+        """
+        CommandMsgs setting Mass, Position and Velocity on every body (+ set_transform with
+        the double-precision position so the visible object starts in the right place).
+        """
+        from zmq_bridge import make_command
+        import world_coords
+        commands = []
+        for i, name in enumerate(self.names):
+            for prop, value in (("Mass", repr(float(self.masses[i]))),
+                                ("Position", format_vector(self.positions[i])),
+                                ("Velocity", format_vector(self.velocities[i]))):
+                spec = {"type": component, "propertyName": prop, "value": value}
+                commands.append(make_command("set_property", name, payload_json=json.dumps(spec)))
+            if transforms:
+                cmd = make_command("set_transform", name)
+                world_coords.to_msg(*self.positions[i].tolist(), msg=cmd.world_payload)
+                commands.append(cmd)
+        return commands
+
+    def to_http_commands(self, component="Core.CelestialBody"):
+        """Same settings as AgentBridge set_property dicts (for unity_bridge.execute_batch)."""
+        commands = []
+        for i, name in enumerate(self.names):
+            for prop, value in (("Mass", repr(float(self.masses[i]))),
+                                ("Position", format_vector(self.positions[i])),
+                                ("Velocity", format_vector(self.velocities[i]))):
+                commands.append({"action": "set_property", "name": name, "type": component,
+                                 "propertyName": prop, "value": value})
+        return commands
+
+
+def format_vector(v):
+    """Round-trip "x,y,z" (the form ZeroMQBridge.ParseValue reads)."""
+    return ",".join(repr(float(c)) for c in v)
+
+def scene_G(client=None):
+    """PhysicsEngine.G from the running scene, PHYSICS_G if it can't be read."""
+    try:
+        import zmq_bridge
+        client = client or zmq_bridge.UnityZeroMQClient(reliable=True, timeout=1.0, retries=0)
+        value = client.get_property("", "Core.PhysicsEngine", "G")
+        if value is not None:
+            return float(value)
+    except Exception as e:
+        log(f"Could not read PhysicsEngine.G: {e}")
+    log(f"Using default G = {PHYSICS_G}")
+    return PHYSICS_G
+
+def solve_kepler(mean_anomaly, e, iterations=12):
+    """Eccentric anomaly E from M = E - e sin E (vectorized Newton)."""
+    E = np.where(e < 0.8, mean_anomaly + e * np.sin(mean_anomaly), np.pi * np.ones_like(mean_anomaly))
+    for _ in range(iterations):
+        E = E - (E - e * np.sin(E) - mean_anomaly) / (1.0 - e * np.cos(E))
+    return E
+
+def elements_to_state(mu, a, e, inc, node, peri, mean_anomaly):
+    """Kepler elements (radians) -> relative (N,3) position / velocity in Unity axes (Y up)."""
+    E = solve_kepler(np.mod(mean_anomaly, 2 * np.pi), e)
+    nu = 2.0 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
+    p = a * (1 - e ** 2)
+    r = p / (1 + e * np.cos(nu))
+    h = np.sqrt(mu / p)
+    # Perifocal frame
+    pos_pf = np.stack([r * np.cos(nu), r * np.sin(nu), np.zeros_like(r)], axis=1)
+    vel_pf = np.stack([-h * np.sin(nu), h * (e + np.cos(nu)), np.zeros_like(r)], axis=1)
+
+    # Rotation R3(node) R1(inc) R3(peri), one matrix per body
+    cO, sO, ci, si, cw, sw = np.cos(node), np.sin(node), np.cos(inc), np.sin(inc), np.cos(peri), np.sin(peri)
+    R = np.empty((len(a), 3, 3))
+    R[:, 0, 0] = cO * cw - sO * sw * ci
+    R[:, 0, 1] = -cO * sw - sO * cw * ci
+    R[:, 0, 2] = sO * si
+    R[:, 1, 0] = sO * cw + cO * sw * ci
+    R[:, 1, 1] = -sO * sw + cO * cw * ci
+    R[:, 1, 2] = -cO * si
+    R[:, 2, 0] = sw * si
+    R[:, 2, 1] = cw * si
+    R[:, 2, 2] = ci
+    pos = np.einsum("nij,nj->ni", R, pos_pf)
+    vel = np.einsum("nij,nj->ni", R, vel_pf)
+    # Orbital plane XY -> Unity XZ (Y up)
+    return pos[:, [0, 2, 1]], vel[:, [0, 2, 1]]
+
+def solve(bodies, G=None, client=None):
+    """List of body dicts (parents may come in any order) -> System."""
+    G = scene_G(client) if G is None else G
+    index = {b["name"]: i for i, b in enumerate(bodies)}
+    if len(index) != len(bodies):
+        raise ValueError("body names must be unique")
+    n = len(bodies)
+    parents = np.array([index[b["parent"]] if b.get("parent") else -1 for b in bodies], dtype=np.int64)
+    masses = np.array([float(b["mass"]) for b in bodies])
+    system = System(bodies, parents, masses, G)
+
+    # 1. Depths (also rejects cycles)
+    depths = np.zeros(n, dtype=np.int64)
+    ancestor = parents.copy()
+    while (ancestor >= 0).any():
+        depths[ancestor >= 0] += 1
+        if depths.max() > n:
+            raise ValueError("parent cycle in body list")
+        ancestor[ancestor >= 0] = parents[ancestor[ancestor >= 0]]
+    system.depths = depths
+    max_depth = int(depths.max(initial=0))
+
+    # 2. Subsystem masses, deepest level first
+    sub = masses.copy()
+    for depth in range(max_depth, 0, -1):
+        level = np.flatnonzero(depths == depth)
+        np.add.at(sub, parents[level], sub[level])
+    system.subsystem_masses = sub
+
+    # 3. Relative state of every subsystem barycenter around its parent body
+    child = np.flatnonzero(parents >= 0)
+    rel_pos = np.zeros((n, 3))
+    rel_vel = np.zeros((n, 3))
+    if len(child):
+        def column(key, default=0.0):
+            return np.array([float(bodies[i].get(key, default)) for i in child])
+        a = column("a")
+        if (a <= 0).any():
+            raise ValueError("every orbiting body needs a > 0")
+        e = column("e")
+        if ((e < 0) | (e >= 1)).any():
+            raise ValueError("eccentricity must be in [0, 1) (bound orbits)")
+        mu = G * (masses[parents[child]] + sub[child])
+        rel_pos[child], rel_vel[child] = elements_to_state(
+            mu, a, e, np.radians(column("i")), np.radians(column("node")), np.radians(column("peri")),
+            np.radians(column("anomaly")))
+
+    # 4. Body offset inside its own subsystem: satellites' momentum balanced by the parent
+    off_pos = np.zeros((n, 3))
+    off_vel = np.zeros((n, 3))
+    np.add.at(off_pos, parents[child], -sub[child, None] * rel_pos[child])
+    np.add.at(off_vel, parents[child], -sub[child, None] * rel_vel[child])
+    off_pos /= sub[:, None]
+    off_vel /= sub[:, None]
+
+    # 5. Absolute states level by level (roots: subsystem barycenter at "position", default origin)
+    bary_pos = np.zeros((n, 3))
+    bary_vel = np.zeros((n, 3))
+    roots = np.flatnonzero(parents < 0)
+    bary_pos[roots] = [b.get("position", (0.0, 0.0, 0.0)) for b in (bodies[i] for i in roots)]
+    bary_vel[roots] = [b.get("velocity", (0.0, 0.0, 0.0)) for b in (bodies[i] for i in roots)]
+    pos = np.zeros((n, 3))
+    vel = np.zeros((n, 3))
+    for depth in range(max_depth + 1):
+        level = np.flatnonzero(depths == depth)
+        if depth > 0:
+            bary_pos[level] = pos[parents[level]] + rel_pos[level]
+            bary_vel[level] = vel[parents[level]] + rel_vel[level]
+        pos[level] = bary_pos[level] + off_pos[level]
+        vel[level] = bary_vel[level] + off_vel[level]
+
+    # 6. Center-of-mass frame
+    total = masses.sum()
+    pos -= (masses[:, None] * pos).sum(axis=0) / total
+    vel -= (masses[:, None] * vel).sum(axis=0) / total
+    system.positions = pos
+    system.velocities = vel
+    check_stability(system)
+    return system
+
+def periods(system):
+    """Orbital period of each orbiting body around its parent (NaN for roots)."""
+    T = np.full(len(system), np.nan)
+    child = np.flatnonzero(system.parents >= 0)
+    a = np.array([float(system.bodies[i]["a"]) for i in child])
+    mu = system.G * (system.masses[system.parents[child]] + system.subsystem_masses[child])
+    T[child] = 2 * np.pi * np.sqrt(a ** 3 / mu)
+    return T
+
+def check_stability(system, limit=10):
+    """Warns about orbits that leave their parent's Hill sphere, cross a sibling's, or are too fast to integrate."""
+    bodies, parents = system.bodies, system.parents
+    child = np.flatnonzero(parents >= 0)
+    if not len(child):
+        return []
+    a = np.array([float(bodies[i]["a"]) for i in child])
+    e = np.array([float(bodies[i].get("e", 0.0)) for i in child])
+    problems = []
+
+    # Apoapsis vs the parent's Hill radius (parents that orbit something themselves)
+    p = parents[child]
+    grand = parents[p]
+    has_grand = grand >= 0
+    hill = np.full(len(child), np.inf)
+    if has_grand.any():
+        pa = np.array([float(bodies[i]["a"]) for i in p[has_grand]])
+        pe = np.array([float(bodies[i].get("e", 0.0)) for i in p[has_grand]])
+        hill[has_grand] = pa * (1 - pe) * np.cbrt(system.subsystem_masses[p[has_grand]] /
+                                                  (3 * system.masses[grand[has_grand]]))
+    apo = a * (1 + e)
+    for k in np.flatnonzero(apo > 0.5 * hill).tolist():
+        problems.append(f"{system.names[child[k]]}: apoapsis {apo[k]:.4g} beyond half the Hill radius "
+                        f"{hill[k]:.4g} of {system.names[p[k]]}")
+
+    # Siblings whose periapsis/apoapsis ranges overlap
+    order = np.lexsort((a, p))
+    cp, peri, apo_sorted = p[order], (a * (1 - e))[order], apo[order]
+    clash = (cp[1:] == cp[:-1]) & (peri[1:] <= apo_sorted[:-1])
+    for k in np.flatnonzero(clash).tolist():
+        problems.append(f"{system.names[child[order[k]]]} and {system.names[child[order[k + 1]]]}: orbits overlap")
+
+    # PhysicsEngine integrates with plain Euler substeps: short periods spiral out
+    T = periods(system)[child]
+    for k in np.flatnonzero(T < MIN_STEPS_PER_ORBIT * PHYSICS_STEP).tolist():
+        problems.append(f"{system.names[child[k]]}: period {T[k]:.3g} is under {MIN_STEPS_PER_ORBIT} physics steps")
+
+    for text in problems[:limit]:
+        log(f"Warning: {text}")
+    if len(problems) > limit:
+        log(f"... {len(problems) - limit} more warnings")
+    return problems
+
+def simulate(system, duration, dt, substeps=4):
+    """
+    Integrates like PhysicsEngine.StepSimulation (v += a dt; p += v dt per substep).
+    Returns (positions, velocities). O(N^2) per step: keep N in the low thousands.
+    """
+    pos = system.positions.copy()
+    vel = system.velocities.copy()
+    GM = system.G * system.masses
+    step = dt / substeps
+    for _ in range(int(round(duration / dt)) * substeps):
+        acc = np.zeros_like(pos)
+        for lo in range(0, len(pos), 512):
+            d = pos[None, :, :] - pos[lo:lo + 512, None, :]
+            r2 = (d ** 2).sum(axis=2)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                inv = np.where(r2 > 0.001, r2 ** -1.5, 0.0)  # Same singularity cut-off
+            acc[lo:lo + 512] = np.einsum("ijk,ij->ik", d, inv * GM[None, :])
+        vel += acc * step
+        pos += vel * step
+    return pos, vel
+
+def semi_major_axes(system, positions, velocities):
+    """Osculating semi-major axis of each body around its parent body (vis-viva), NaN for roots."""
+    a = np.full(len(system), np.nan)
+    child = np.flatnonzero(system.parents >= 0)
+    p = system.parents[child]
+    r = np.linalg.norm(positions[child] - positions[p], axis=1)
+    v2 = ((velocities[child] - velocities[p]) ** 2).sum(axis=1)
+    mu = system.G * (system.masses[p] + system.subsystem_masses[child])
+    a[child] = 1.0 / (2.0 / r - v2 / mu)
+    return a
+
+def orbit_drift(system, positions, velocities):
+    """Relative semi-major axis change of every orbiting body."""
+    child = system.parents >= 0
+    before = semi_major_axes(system, system.positions, system.velocities)[child]
+    after = semi_major_axes(system, positions, velocities)[child]
+    return np.abs(after - before) / np.abs(before)
+
+def random_system(count, G=PHYSICS_G, seed=0):
+    """
+    One star, planets on spaced orbits, moons inside their Hill spheres: `count` bodies.
+    Moons only go where their period stays integrable (MIN_STEPS_PER_ORBIT).
+    """
+    rng = np.random.default_rng(seed)
+    bodies = [{"name": "Sol", "mass": SOL_MASS, "radius": 50}]
+    t_min = 2 * MIN_STEPS_PER_ORBIT * PHYSICS_STEP
+
+    # 1. Planets (outwards, 30% apart) until there are enough moon slots:
+    #    a_min (period limit) * 1.1^slot, up to a third of the Hill radius.
+    #    Moons are light, so 10% spacing keeps them clear of each other.
+    slots = []
+    planets = []
+    while len(planets) < count - 1 and (len(planets) < min(count // 20, 20) or 1 + len(planets) + len(slots) < count):
+        k = len(planets)
+        planet = {"name": f"Planet_{k}", "parent": "Sol", "mass": EARTH_MASS * rng.uniform(0.1, 10),
+                  "a": EARTH_ORBIT * 1.3 ** k, "e": rng.uniform(0, 0.05), "i": rng.uniform(0, 5),
+                  "node": rng.uniform(0, 360), "peri": rng.uniform(0, 360), "anomaly": rng.uniform(0, 360)}
+        planets.append(planet)
+        hill = planet["a"] * np.cbrt(planet["mass"] / (3 * SOL_MASS))
+        a_min = np.cbrt(G * planet["mass"] * (t_min / (2 * np.pi)) ** 2)
+        slot = 0
+        while a_min * 1.1 ** slot < hill / 3:
+            slots.append((k, slot, a_min * 1.1 ** slot))
+            slot += 1
+    bodies += planets
+
+    # 2. Moons, inner slots of every planet first
+    slots.sort(key=lambda s: s[1])
+    for k, slot, a in slots[:count - len(bodies)]:
+        planet = planets[k]
+        bodies.append({"name": f"Moon_{k}_{slot}", "parent": planet["name"],
+                       "mass": planet["mass"] * 1e-6, "a": a, "e": rng.uniform(0, 0.02),
+                       "i": rng.uniform(0, 10), "anomaly": rng.uniform(0, 360)})
+    return bodies
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Consistent orbital initial conditions for a body tree.")
+    parser.add_argument("system", nargs="?", help="JSON list of bodies")
+    parser.add_argument("--random", type=int, help="solve a generated system of this many bodies instead")
+    parser.add_argument("--G", type=float, help="gravitational constant (default: PhysicsEngine.G from the scene)")
+    parser.add_argument("--apply", action="store_true", help="send the set_property batch to Unity (ZeroMQ)")
+    parser.add_argument("--verify", type=float, help="integrate this many time units and report drift")
+    parser.add_argument("--dt", type=float, default=0.02, help="--verify step (Time.fixedDeltaTime, 4 substeps)")
+    args = parser.parse_args(argv)
+
+    if args.random:
+        bodies = random_system(args.random, args.G or PHYSICS_G)
+    elif args.system:
+        with open(args.system) as f:
+            bodies = json.load(f)
+    else:
+        parser.error("give a system file or --random N")
+
+    client = None
+    if args.apply or args.G is None:
+        import zmq_bridge
+        client = zmq_bridge.UnityZeroMQClient(reliable=True)
+    t0 = time.perf_counter()
+    system = solve(bodies, args.G, client)
+    log(f"Solved {len(system)} bodies in {(time.perf_counter() - t0) * 1000:.1f} ms (G = {system.G})")
+    log(f"Total momentum {np.linalg.norm(system.momentum()):.3g}, "
+        f"center of mass {np.linalg.norm((system.masses[:, None] * system.positions).sum(0)) / system.masses.sum():.3g}")
+    for i in range(min(len(system), 5)):
+        p, v = system.positions[i], system.velocities[i]
+        log(f"  {system.names[i]}: pos ({p[0]:.4f}, {p[1]:.4f}, {p[2]:.4f}) vel ({v[0]:.4f}, {v[1]:.4f}, {v[2]:.4f})")
+
+    if args.verify:
+        e0 = system.energy()
+        t0 = time.perf_counter()
+        pos, vel = simulate(system, args.verify, args.dt)
+        drift = orbit_drift(system, pos, vel)
+        log(f"Integrated {args.verify} time units in {time.perf_counter() - t0:.1f} s: "
+            f"energy drift {abs(system.energy(pos, vel) - e0) / abs(e0):.2e}, "
+            f"semi-major axis drift median {np.median(drift):.2e} max {drift.max():.2e}")
+
+    if args.apply:
+        commands = system.to_commands()
+        reply = client.send_batch(commands)
+        log(f"Sent {len(commands)} commands: {reply.status if reply is not None else 'no reply'}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
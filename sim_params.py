@@ -0,0 +1,58 @@
+"""
+Parameter sets for the offline simulators (combat_sim, mining_sim, terrain_chunks).
+
+Each tool keeps its tunables in a DEFAULT_PARAMS dict and wraps it once:
+
+    PARAMS = ParamSet("combat", DEFAULT_PARAMS)
+    make_params = PARAMS.make                 # make_params(aim_spread=0.05); unknown names raise ValueError
+
+Command line: PARAMS.add_arguments(parser) adds --set NAME=VALUE (override) and
+--sweep NAME=V1,V2 (one run per combination); PARAMS.sweep(args) expands them.
+Values are parsed with the type of the default (bools take 1/true/yes; string
+params may hold commas themselves, so they take one value each).
+"""
+import itertools
+
+
+class ParamSet:
+    def __init__(self, kind, defaults):
+        self.kind = kind  # Used in error messages ("unknown combat params")
+        self.defaults = defaults
+
+    def make(self, **overrides):
+        unknown = set(overrides) - set(self.defaults)
+        if unknown:
+            raise ValueError(f"unknown {self.kind} params: {sorted(unknown)}")
+        params = dict(self.defaults)
+        params.update(overrides)
+        return params
+
+    def parse_values(self, name, raw):
+        if name not in self.defaults:
+            raise ValueError(f"unknown {self.kind} param: {name}")
+        kind = type(self.defaults[name])
+        if kind is str:
+            return [raw]
+        if kind is bool:
+            return [v.lower() in ("1", "true", "yes") for v in raw.split(",")]
+        return [kind(v) for v in raw.split(",")]
+
+    def parse_sweep(self, items):
+        """["aim_spread=0,0.02", ...] -> (names, list of value tuples) for every combination."""
+        names, values = [], []
+        for item in items:
+            name, _, raw = item.partition("=")
+            values.append(self.parse_values(name, raw))
+            names.append(name)
+        return names, list(itertools.product(*values))
+
+    def add_arguments(self, parser):
+        parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE", help="override a param")
+        parser.add_argument("--sweep", action="append", default=[], metavar="NAME=V1,V2", help="sweep a param")
+
+    def sweep(self, args):
+        """--set / --sweep -> (swept names, [(value tuple, params)]); one entry without --sweep."""
+        base_names, base_values = self.parse_sweep(args.set)
+        base = dict(zip(base_names, base_values[0])) if base_names else {}
+        names, combos = self.parse_sweep(args.sweep) if args.sweep else ([], [()])
+        return names, [(combo, self.make(**base, **dict(zip(names, combo)))) for combo in combos]
@@ -0,0 +1,316 @@
+"""
+Terrain chunk pipeline (heightmaps, normals, index buffers) with an on-disk cache.
+
+Procedural.ProceduralTerrain builds one 100x100 sin/cos grid per object on the
+main thread. This builds whole surfaces offline instead:
+
+1. every chunk is a (n+1)x(n+1) vertex grid, n = size / 2^lod, covering the same
+   size*scale square at every LOD; heights come from world coordinates, so
+   neighbouring chunks (and LODs) share their edges,
+2. height = the ProceduralTerrain formula + seeded fBm value noise, all NumPy
+   (noise_octaves=0 gives exactly the ProceduralTerrain shape for chunk 0,0),
+3. chunks go to a process pool, one job per (chunk, lod),
+4. results land in terrain_cache/ keyed by a hash of (seed, chunk, lod, params),
+   so regenerating only computes what is missing.
+
+    python terrain_chunks.py --radius 8 --lods 0,1,2        # 17x17 chunks, 3 LODs
+    python terrain_chunks.py --radius 4 --bench             # 1 worker vs all cores
+    python terrain_chunks.py --radius 2 --upload 1          # + send LOD 1 meshes to Unity (ZeroMQ)
+
+    from terrain_chunks import load_chunk
+    chunk = load_chunk(3, -2, lod=1)   # vertices, normals, uv, indices
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+import functools
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from sim_params import ParamSet
+
+CACHE_DIR = "terrain_cache"
+FORMAT_VERSION = 1  # Bump when the generator changes: old cache entries stop matching
+
+# size/scale/height_scale/frequency are the ProceduralTerrain fields
+DEFAULT_PARAMS = {
+    "seed": 0,
+    "size": 100,
+    "scale": 1.0,
+    "height_scale": 10.0,
+    "frequency": 0.05,
+    "noise_octaves": 5,
+    "noise_frequency": 0.01,
+    "noise_height": 25.0,
+    "lacunarity": 2.0,
+    "gain": 0.5,
+}
+
+def log(msg):
+    print(f"[Terrain] {msg}")
+
+make_params = ParamSet("terrain", DEFAULT_PARAMS).make
+
+
+# --- Noise ---
+
+def lattice_hash(ix, iz, seed):
+    """Integer lattice coords -> floats in [-1, 1] (32-bit integer hash, same on every platform)."""
+    mask = np.uint64(0xFFFFFFFF)
+    h = ((ix.astype(np.uint64) * np.uint64(0x27D4EB2D))
+         ^ (iz.astype(np.uint64) * np.uint64(0x165667B1))
+         ^ np.uint64((seed * 0x9E3779B1) & 0xFFFFFFFF)) & mask
+    h = ((h ^ (h >> np.uint64(15))) * np.uint64(0x2C1B3C6D)) & mask
+    h = ((h ^ (h >> np.uint64(12))) * np.uint64(0x297A2D39)) & mask
+    h ^= h >> np.uint64(15)
+    return h.astype(np.float64) * (2.0 / 0xFFFFFFFF) - 1.0
+
+def value_noise(x, z, seed):
+    """Smoothly interpolated lattice noise, [-1, 1]."""
+    x0, z0 = np.floor(x), np.floor(z)
+    fx, fz = x - x0, z - z0
+    fx, fz = fx * fx * (3 - 2 * fx), fz * fz * (3 - 2 * fz)
+    ix, iz = x0.astype(np.int64), z0.astype(np.int64)
+    a = lattice_hash(ix, iz, seed)
+    b = lattice_hash(ix + 1, iz, seed)
+    c = lattice_hash(ix, iz + 1, seed)
+    d = lattice_hash(ix + 1, iz + 1, seed)
+    top = a + (b - a) * fx
+    bottom = c + (d - c) * fx
+    return top + (bottom - top) * fz
+
+def heights(x, z, params):
+    """Terrain height at world (x, z) arrays."""
+    f = params["frequency"]
+    y = np.sin(x * f) * params["height_scale"] + np.cos(z * f) * params["height_scale"]
+    freq, amp = params["noise_frequency"], params["noise_height"]
+    for octave in range(params["noise_octaves"]):
+        y += value_noise(x * freq, z * freq, params["seed"] + octave) * amp
+        freq *= params["lacunarity"]
+        amp *= params["gain"]
+    return y
+
+
+# --- Chunks ---
+
+@functools.lru_cache(maxsize=None)
+def triangles(n):
+    """Index buffer for an (n+1)x(n+1) grid, same winding as ProceduralTerrain."""
+    z, x = np.mgrid[0:n, 0:n]
+    v = (z * (n + 1) + x).ravel()
+    tris = np.stack([v, v + n + 1, v + 1, v + 1, v + n + 1, v + n + 2], axis=1).ravel()
+    tris = tris.astype(np.uint16 if (n + 1) ** 2 <= 65536 else np.uint32)
+    tris.flags.writeable = False
+    return tris
+
+def chunk_resolution(params, lod):
+    step = 2 ** lod
+    if params["size"] % step:
+        raise ValueError(f"size {params['size']} is not divisible by 2^{lod}")
+    return params["size"] // step
+
+def build_chunk(cx, cz, lod, params):
+    """
+    One chunk as float32 arrays: vertices (V,3) relative to the chunk centre
+    (like ProceduralTerrain), normals (V,3), uv (V,2). V = (n+1)^2, row-major in z.
+    """
+    n = chunk_resolution(params, lod)
+    extent = params["size"] * params["scale"]
+    spacing = extent / n
+
+    # 1. Heights on the grid plus a one-vertex border (for normals across chunk edges)
+    local = np.arange(-1, n + 2) * spacing - extent / 2
+    xs = cx * extent + local
+    zs = cz * extent + local
+    h = heights(xs[None, :], zs[:, None], params)
+
+    # 2. Normals from central differences
+    dx = (h[1:-1, 2:] - h[1:-1, :-2]) / (2 * spacing)
+    dz = (h[2:, 1:-1] - h[:-2, 1:-1]) / (2 * spacing)
+    normals = np.stack([-dx, np.ones_like(dx), -dz], axis=-1)
+    normals /= np.linalg.norm(normals, axis=-1, keepdims=True)
+
+    # 3. Vertices / uvs
+    gz, gx = np.meshgrid(local[1:-1], local[1:-1], indexing="ij")
+    vertices = np.stack([gx, h[1:-1, 1:-1], gz], axis=-1)
+    u = np.arange(n + 1) / n
+    uv = np.stack(np.meshgrid(u, u, indexing="xy"), axis=-1)
+    return {
+        "vertices": vertices.reshape(-1, 3).astype(np.float32),
+        "normals": normals.reshape(-1, 3).astype(np.float32),
+        "uv": uv.reshape(-1, 2).astype(np.float32),
+    }
+
+
+# --- Cache ---
+
+def chunk_key(cx, cz, lod, params):
+    text = json.dumps({"v": FORMAT_VERSION, "chunk": [cx, cz], "lod": lod, "params": params},
+                      sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def cache_path(key, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, key[:2], key + ".npz")
+
+def store(path, chunk):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write-then-rename: a killed worker never leaves a half-written entry behind
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        np.savez(f, **chunk)
+    os.replace(tmp, path)
+
+def load_chunk(cx, cz, lod=0, params=None, cache_dir=CACHE_DIR):
+    """Chunk arrays + "indices", from the cache (built and stored on a miss)."""
+    params = params or make_params()
+    path = cache_path(chunk_key(cx, cz, lod, params), cache_dir)
+    if os.path.exists(path):
+        with np.load(path) as data:
+            chunk = {name: data[name] for name in data.files}
+    else:
+        chunk = build_chunk(cx, cz, lod, params)
+        store(path, chunk)
+    chunk["indices"] = triangles(chunk_resolution(params, lod))
+    return chunk
+
+
+# --- Surfaces ---
+
+def square_chunks(radius, center=(0, 0)):
+    """Chunk coords of the (2r+1)^2 square around center."""
+    r = np.arange(-radius, radius + 1)
+    cz, cx = np.meshgrid(r + center[1], r + center[0], indexing="ij")
+    return list(zip(cx.ravel().tolist(), cz.ravel().tolist()))
+
+def _build_job(job):
+    cx, cz, lod, params, path = job
+    store(path, build_chunk(cx, cz, lod, params))
+    return path
+
+def generate_surface(chunks, lods=(0,), params=None, cache_dir=CACHE_DIR, workers=None, verbose=True):
+    """
+    Makes sure every (chunk, lod) is in the cache, building only missing ones.
+    workers: process count (default: all cores; 1 = in this process).
+    Returns {"total", "cached", "built", "seconds"}.
+    """
+    params = params or make_params()
+    for lod in lods:
+        chunk_resolution(params, lod)  # Reject bad LODs before starting any work
+    t0 = time.perf_counter()
+
+    # 1. Which entries are missing
+    jobs = []
+    total = 0
+    for cx, cz in chunks:
+        for lod in lods:
+            total += 1
+            path = cache_path(chunk_key(cx, cz, lod, params), cache_dir)
+            if not os.path.exists(path):
+                jobs.append((cx, cz, lod, params, path))
+
+    # 2. Build them (largest LODs first so the pool doesn't end on one big job)
+    jobs.sort(key=lambda job: job[2])
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            _build_job(job)
+    elif jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(jobs) // (workers * 8))
+            for _ in pool.map(_build_job, jobs, chunksize=chunksize):
+                pass
+
+    stats = {"total": total, "cached": total - len(jobs), "built": len(jobs),
+             "seconds": time.perf_counter() - t0}
+    if verbose:
+        log(f"{stats['total']} chunks: {stats['built']} built, {stats['cached']} cached "
+            f"in {stats['seconds']:.2f}s ({workers} workers)")
+    return stats
+
+def upload_surface(client, chunks, lod=0, params=None, cache_dir=CACHE_DIR):
+    """
+    Sends cached chunk meshes to Unity (upload_mesh), one Terrain_<cx>_<cz> object per chunk,
+    created at the chunk centre when missing. Unchanged chunks cost one request each.
+    Returns the number of chunks that failed.
+    """
+    params = params or make_params()
+    extent = params["size"] * params["scale"]
+    failed = 0
+    for cx, cz in chunks:
+        name = f"Terrain_{cx}_{cz}"
+        reply = client.check_components(name)
+        if reply is not None and reply.status.startswith("error"):
+            client.create_object(name, (cx * extent, 0.0, cz * extent), primitive="", precise=True)
+        chunk = load_chunk(cx, cz, lod, params, cache_dir)
+        reply = client.upload_mesh(name, chunk["vertices"], chunk["indices"], chunk["uv"], chunk["normals"],
+                                   name=f"{name}_lod{lod}")
+        if reply is None or reply.status.startswith("error"):
+            failed += 1
+            log(f"{name}: {reply.status if reply is not None else 'no reply'}")
+    log(f"Uploaded {len(chunks) - failed}/{len(chunks)} chunks (LOD {lod}).")
+    return failed
+
+def bench(chunks, lods, params):
+    """Cold builds with 1 worker and with every core, then a fully cached rerun."""
+    import shutil
+    cores = os.cpu_count() or 1
+    times = {}
+    for workers in sorted({1, cores}):
+        cache_dir = tempfile.mkdtemp(prefix="terrain_bench_")
+        try:
+            times[workers] = generate_surface(chunks, lods, params, cache_dir, workers, verbose=False)["seconds"]
+            log(f"cold, {workers} worker(s): {times[workers]:.2f}s")
+            if workers == cores:
+                warm = generate_surface(chunks, lods, params, cache_dir, workers, verbose=False)["seconds"]
+                log(f"cached rerun: {warm * 1000:.1f} ms")
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+    if cores > 1:
+        log(f"speedup on {cores} cores: {times[1] / times[cores]:.2f}x")
+    else:
+        log("only one core here: no parallel speedup to measure")
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Generate cached terrain chunks.")
+    parser.add_argument("--radius", type=int, default=4, help="chunks around the centre (square)")
+    parser.add_argument("--center", type=int, nargs=2, default=(0, 0), metavar=("CX", "CZ"))
+    parser.add_argument("--lods", default="0,1,2", help="comma separated LOD levels")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--octaves", type=int, default=DEFAULT_PARAMS["noise_octaves"],
+                        help="noise octaves (0 = plain ProceduralTerrain sin/cos)")
+    parser.add_argument("--workers", type=int, help="process count (default: all cores)")
+    parser.add_argument("--cache", default=CACHE_DIR)
+    parser.add_argument("--bench", action="store_true", help="compare 1 worker against all cores")
+    parser.add_argument("--upload", type=int, metavar="LOD", help="then upload this LOD to Unity (ZeroMQ)")
+    parser.add_argument("--standin", action="store_true", help="--upload to an in-process zmq_standin")
+    args = parser.parse_args(argv)
+
+    params = make_params(seed=args.seed, noise_octaves=args.octaves)
+    lods = [int(v) for v in args.lods.split(",")]
+    chunks = square_chunks(args.radius, args.center)
+    if args.bench:
+        bench(chunks, lods, params)
+        return 0
+    generate_surface(chunks, lods, params, args.cache, args.workers)
+    if args.upload is None:
+        return 0
+
+    import zmq_bridge
+    server = None
+    addr = "tcp://127.0.0.1:5555"
+    if args.standin:
+        import zmq_standin
+        addr = "tcp://127.0.0.1:5599"
+        server = zmq_standin.StandInServer(addr).start()
+    try:
+        client = zmq_bridge.UnityZeroMQClient(addr, reliable=True)
+        return 1 if upload_surface(client, chunks, args.upload, params, args.cache) else 0
+    finally:
+        if server:
+            server.stop()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
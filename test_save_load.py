@@ -1,6 +1,8 @@
 import requests
 import json
 import time
+import sys
+import hierarchy_diff
 
 URL = "http://localhost:7777"
 HEADERS = {'Content-Type': 'application/json'}
@@ -54,6 +56,7 @@ def test_save_load():
     })
     
     time.sleep(2.0)
+    saved = hierarchy_diff.capture_http()
     
     # 4. Modify State Again (Scramble)
     log("Scrambling State (Health -> 10)...")
@@ -83,7 +86,23 @@ def test_save_load():
     # ShipSystems doesn't log on health set.
     # But SaveManager logs "Game Loaded".
     
+    # Scene structure must survive the round trip (Merkle diff of /hierarchy snapshots)
+    time.sleep(1.0)
+    loaded = hierarchy_diff.capture_http()
+    if saved is None or loaded is None:
+        log(f"Could not capture the hierarchy {'before save' if saved is None else 'after load'}; cannot compare.")
+        identical = False
+    else:
+        result = hierarchy_diff.diff(hierarchy_diff.Snapshot(saved), hierarchy_diff.Snapshot(loaded))
+        identical = result.empty()
+        if identical:
+            log("Hierarchy identical after load.")
+        else:
+            log("Hierarchy differs after load:")
+            result.print_diff()
+
     log("Test Complete. Check logs for '[SaveManager] Game Loaded' and verify Health is 50 in Inspector.")
+    return identical
 
 if __name__ == "__main__":
-    test_save_load()
+    sys.exit(0 if test_save_load() else 1)
@@ -10,11 +10,21 @@ URL = f"http://localhost:{PORT}/execute"
 HEADERS = {"Content-Type": "application/json"}
 # ---------------------------------
 
+# Keep-alive session: reuses the TCP connection between calls.
+# (Matters when this module stays loaded, e.g. inside bridge_daemon.py)
+SESSION = requests.Session()
+
 import subprocess
 import os
+from bridge_resilience import Backoff, BREAKERS
+from bridge_trace import TRACER
+from bridge_metrics import ClientMetrics
 
 # --- WIN32 POWER TOOl ---
 FOCUS_SCRIPT = "focus_unity.ps1"
+# Seconds between focus switches (0 = before every command; bridge_daemon.py raises it)
+FOCUS_INTERVAL = 0.0
+_last_focus = None
 
 def focus_unity_window():
     """Forces Unity to Foreground to ensure compilation/execution."""
@@ -29,35 +39,83 @@ def focus_unity_window():
 def log(msg):
     print(f"[UnityBridge] {msg}")
 
+# Retries: exponential backoff with jitter, cut short the moment the port accepts connections again
+BACKOFF = Backoff(base=0.25, factor=2.0, cap=4.0)
+BREAKER = BREAKERS["http"]
+METRICS = ClientMetrics("http")
+
 def execute(payload, retry=5, verbose=True):
     """
     Executes a command against the Unity AgentBridge.
-    Retries on connection failure.
+    Retries on connection failure; fails fast while the bridge is known to be down.
     Returns (success: bool, response_text: str)
     """
-    for i in range(retry):
-        try:
-            # WORKFLOW FIX: Focus Unity first!
+    action = payload.get("action", "")
+    METRICS.requests(action).inc()
+    if action == "batch":
+        METRICS.batch.observe(len(payload.get("batch", [])))
+
+    if not BREAKER.allow():
+        log(f"Bridge on Port {PORT} is down (circuit open). Failing fast.")
+        METRICS.fast_failures.inc()
+        METRICS.errors.inc()
+        return False, "Circuit Open"
+
+    # WORKFLOW FIX: Focus Unity first! (once per command, not per attempt)
+    global _last_focus
+    if _last_focus is None or time.monotonic() - _last_focus >= FOCUS_INTERVAL:
+        with TRACER.span("http.focus", "http", action=action):
             focus_unity_window()
             time.sleep(0.5) # Give Windows a moment to switch context
-            
-            response = requests.post(URL, data=json.dumps(payload), headers=HEADERS, timeout=10)
+        _last_focus = time.monotonic()
+
+    body = json.dumps(payload)
+    METRICS.payload.observe(len(body))
+    start = time.perf_counter()
+    for i in range(retry):
+        try:
+            with TRACER.span("http.post", "http", action=action, attempt=i + 1) as span:
+                response = SESSION.post(URL, data=body, headers=HEADERS, timeout=10)
+                span.args["status"] = response.status_code
+            BREAKER.record_success()
+            METRICS.bytes_sent.inc(len(body))
+            METRICS.bytes_received.inc(len(response.content))
+            METRICS.latency.observe(time.perf_counter() - start)
             if response.status_code == 200:
                 # Command received by AgentBridge and executed (or queued)
                 return True, response.text
             else:
+                METRICS.errors.inc()
                 log(f"Command Failed ({response.status_code}): {response.text}")
                 return False, response.text
         except requests.exceptions.ConnectionError:
+            BREAKER.record_failure()
             log(f"Connection Attempt {i+1}/{retry} failed. (Target: Port {PORT})")
-            time.sleep(1)
+            if i + 1 < retry:
+                METRICS.retries.inc()
+                BREAKER.wait_until_ready(BACKOFF.delay(i))
+        except requests.exceptions.Timeout as e:
+            METRICS.timeouts.inc()
+            METRICS.errors.inc()
+            log(f"Unexpected Error: {e}")
+            return False, str(e)
         except Exception as e:
+            METRICS.errors.inc()
             log(f"Unexpected Error: {e}")
             return False, str(e)
             
+    METRICS.errors.inc()
     log(f"CRITICAL: Could not connect to Unity on Port {PORT}. Check AgentBridge/Unity status.")
     return False, "Connection Failed"
 
+def wait_for_bridge(timeout=60.0):
+    """Blocks until the AgentBridge port accepts connections (e.g. after a recompile)."""
+    waited = BREAKER.wait_until_ready(timeout)
+    if waited is None:
+        log(f"Bridge on Port {PORT} not ready after {timeout:.0f}s.")
+        return False
+    return True
+
 def execute_batch(commands, retry=5, verbose=True):
     """
     Executes a list of commands in a single HTTP request.
@@ -69,6 +127,41 @@ def execute_batch(commands, retry=5, verbose=True):
     }
     return execute(payload, retry, verbose)
 
+def execute_batch_results(commands, retry=5, verbose=True):
+    """
+    Like execute_batch, but asks the bridge to stop at the first failure and
+    returns one status string per command ("skipped" after a failure).
+    Returns None if there is no per-command answer (request failed, or an
+    AgentBridge without "results" reported an error - the outcome is unknown).
+    Raises ConnectionError if the bridge could not be reached at all.
+    """
+    payload = {
+        "action": "batch",
+        "batch": commands,
+        "stop_on_error": True
+    }
+    success, text = execute(payload, retry, verbose)
+    if not success and text in ("Circuit Open", "Connection Failed"):
+        raise ConnectionError(text)
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    results = data.get("results") if isinstance(data, dict) else None
+    if isinstance(results, list):
+        statuses = []
+        for r in results:
+            if isinstance(r, dict):
+                status = str(r.get("status", "ok"))
+                if status.startswith("error") and r.get("message"):
+                    status = f"{status}: {r['message']}"
+                statuses.append(status)
+            else:
+                statuses.append(str(r))
+        return statuses + ["skipped"] * (len(commands) - len(statuses))
+    # Older AgentBridge: one status for the whole batch
+    return ["ok"] * len(commands) if success else None
+
 def check_connection():
     log(f"Verifying connection to Unity (Port {PORT})...")
     success, _ = execute({"action": "ping"}, retry=2, verbose=False)
@@ -76,21 +169,26 @@ def check_connection():
         log("Connection Verified.")
     return success
 
-def ensure_initialized():
-    if not check_connection():
+def ensure_initialized(timeout=30.0):
+    # Wait out a recompile first instead of burning retries
+    if not wait_for_bridge(timeout) or not check_connection():
         sys.exit(1)
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
+def main(argv):
+    """
+    Command line entry point.
+    argv excludes the script name (e.g. ["ping"]).
+    """
+    if len(argv) < 1:
         print("Usage: unity_bridge.py [action] [args...]")
         sys.exit(1)
 
-    action = sys.argv[1]
+    action = argv[0]
 
     if action == "ping":
         check_connection()
     elif action == "log":
-        msg = sys.argv[2] if len(sys.argv) > 2 else "Test Log"
+        msg = argv[1] if len(argv) > 1 else "Test Log"
         execute({"action": "log", "name": msg})
     elif action == "set":
         # Usage: python unity_bridge.py set [name] [prop] [val]
@@ -98,10 +196,10 @@ if __name__ == "__main__":
         pass
     elif action == "set_transform":
         # Usage: set_transform [name] x y z
-        name = sys.argv[2]
-        x = float(sys.argv[3])
-        y = float(sys.argv[4])
-        z = float(sys.argv[5])
+        name = argv[1]
+        x = float(argv[2])
+        y = float(argv[3])
+        z = float(argv[4])
         execute({
             "action": "set",
             "name": name,
@@ -112,15 +210,15 @@ if __name__ == "__main__":
     elif action == "screenshot":
         execute({"action": "screenshot", "filename": "unity_screenshot.png"})
     elif action == "add_component":
-        name = sys.argv[2]
-        comp = sys.argv[3]
+        name = argv[1]
+        comp = argv[2]
         execute({"action": "add_component", "name": name, "type": comp})
     elif action == "generate_universe":
         execute({"action": "generate_universe"})
     elif action == "call_method":
-        name = sys.argv[2]
-        comp = sys.argv[3]
-        method = sys.argv[4]
+        name = argv[1]
+        comp = argv[2]
+        method = argv[3]
         execute({
             "action": "call_method", 
             "name": name, 
@@ -128,10 +226,13 @@ if __name__ == "__main__":
             "value": method
         })
     elif action == "destroy":
-        name = sys.argv[2]
+        name = argv[1]
         execute({"action": "destroy", "name": name})
     elif action == "save_scene":
-        filename = sys.argv[2] if len(sys.argv) > 2 else ""
+        filename = argv[1] if len(argv) > 1 else ""
         execute({"action": "save_scene", "filename": filename})
     else:
         log(f"Unknown action: {action}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
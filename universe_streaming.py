@@ -0,0 +1,362 @@
+"""
+Proximity streaming around WorldMover.VirtualPosition.
+
+WorldMover only culls (SetActive) objects that already exist in the scene, so the
+universe is limited to what the editor can hold. UniverseStreamer keeps the whole
+catalog on the Python side and only the player's neighbourhood in Unity:
+
+    distance < load_radius     -> streamed in  (create, VirtualTransform at the float64 catalog position)
+    distance > unload_radius   -> streamed out (destroy_instances)
+    in between                 -> left alone (hysteresis band: no churn at the border)
+
+Catalog positions sit in a uniform grid index (SpatialGrid), so a tick looks at a
+few cells around the player instead of millions of entries. Loads go nearest
+(and biggest) first, unloads farthest first. Each tick sends at most one batch
+of max_batch commands at no more than `rate` commands/s, and the scene never
+holds more than max_objects streamed objects (objects in the band are evicted
+early when the budget is full).
+
+A create without a confirmed reply (timeout) may still run in the editor later,
+so it is neither resident nor free: the next tick destroys it by name
+(catalog names are unique) and only then may it stream in again.
+
+    catalog = Catalog.clustered(2000000)
+    streamer = UniverseStreamer(UnityZeroMQClient(), catalog)
+    streamer.run()                 # polls get_world_mover every tick
+
+    python universe_streaming.py --standin --catalog 2000000   # fly a stand-in WorldMover through it
+"""
+import sys
+import time
+import argparse
+import numpy as np
+from zmq_bridge import UnityZeroMQClient, make_command, make_create_command
+import game_state_pb2
+
+# (primitive, components) per catalog kind
+DEFAULT_KINDS = [
+    ("sphere", ["Core.VirtualTransform"]),
+    ("cube", ["Core.VirtualTransform"]),
+]
+
+def log(msg):
+    print(f"[Streaming] {msg}")
+
+
+class Catalog:
+    """Everything that could exist: float64 positions, a size (radius) and a kind per entry."""
+
+    def __init__(self, positions, sizes=None, kinds=None, kind_table=DEFAULT_KINDS, prefix="Stream_"):
+        self.positions = np.ascontiguousarray(positions, dtype=np.float64).reshape(-1, 3)
+        count = len(self.positions)
+        self.sizes = np.ones(count) if sizes is None else np.asarray(sizes, dtype=np.float64)
+        self.kinds = np.zeros(count, dtype=np.int8) if kinds is None else np.asarray(kinds, dtype=np.int8)
+        self.kind_table = kind_table
+        self.prefix = prefix
+
+    def __len__(self):
+        return len(self.positions)
+
+    def name(self, i):
+        return f"{self.prefix}{i}"
+
+    @classmethod
+    def clustered(cls, count, clusters=None, extent=1e8, spread=10000.0, seed=0):
+        """Synthetic universe: `clusters` systems spread over +-extent, members gaussian around each."""
+        rng = np.random.default_rng(seed)
+        clusters = clusters or max(1, count // 2000)
+        centers = rng.uniform(-extent, extent, size=(clusters, 3))
+        members = rng.integers(0, clusters, size=count)
+        positions = centers[members] + rng.normal(0.0, spread, size=(count, 3))
+        sizes = rng.lognormal(0.0, 1.0, size=count)
+        kinds = rng.integers(0, len(DEFAULT_KINDS), size=count)
+        return cls(positions, sizes, kinds)
+
+
+class SpatialGrid:
+    """Uniform grid over float64 points: entries sorted by cell key, one slice per occupied cell."""
+    OFFSET = 1 << 20  # Cell coordinates must stay within +-2^20 (21 bits per axis in the key)
+
+    def __init__(self, positions, cell):
+        self.positions = positions
+        self.cell = float(cell)
+        cells = np.floor(positions / self.cell).astype(np.int64)
+        if len(cells) and np.abs(cells).max() >= self.OFFSET:
+            raise ValueError(f"catalog spans more than +-{self.OFFSET} cells of {cell}; use a bigger cell")
+        keys = self._keys(cells)
+        self.order = np.argsort(keys, kind="stable")
+        self.keys, self.starts = np.unique(keys[self.order], return_index=True)
+        self.ends = np.append(self.starts[1:], len(keys))
+
+    @classmethod
+    def _keys(cls, cells):
+        c = cells + cls.OFFSET
+        return (c[..., 0] << 42) | (c[..., 1] << 21) | c[..., 2]
+
+    def query(self, center, radius):
+        """(indices, distances) of every point within radius of center."""
+        center = np.asarray(center, dtype=np.float64)
+        lo = np.floor((center - radius) / self.cell).astype(np.int64)
+        hi = np.floor((center + radius) / self.cell).astype(np.int64)
+        axes = [np.arange(lo[k], hi[k] + 1) for k in range(3)]
+        wanted = self._keys(np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3))
+        if not len(self.keys):
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        slot = np.minimum(np.searchsorted(self.keys, wanted), len(self.keys) - 1)
+        slot = slot[self.keys[slot] == wanted]
+        if not len(slot):
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        idx = np.concatenate([self.order[s:e] for s, e in zip(self.starts[slot], self.ends[slot])])
+        dist = np.linalg.norm(self.positions[idx] - center, axis=1)
+        inside = dist <= radius
+        return idx[inside], dist[inside]
+
+
+class StreamStats:
+    def __init__(self):
+        self.ticks = 0
+        self.loaded = 0
+        self.unloaded = 0
+        self.deferred = 0       # Loads wanted but left for a later tick (rate / scene budget)
+        self.failed = 0
+        self.plan_ms = 0.0      # Last tick: spatial query + planning
+        self.send_ms = 0.0      # Last tick: batch round trip
+
+
+class UniverseStreamer:
+    def __init__(self, client, catalog, load_radius=10000.0, unload_radius=12000.0, max_objects=2000,
+                 max_batch=250, rate=2000.0, lookahead=0.0, cell=None):
+        if unload_radius <= load_radius:
+            raise ValueError("unload_radius must be larger than load_radius (hysteresis band)")
+        self.client = client
+        self.catalog = catalog
+        self.load_radius = load_radius
+        self.unload_radius = unload_radius
+        self.max_objects = max_objects
+        self.max_batch = max_batch
+        self.rate = rate
+        self.lookahead = lookahead  # Seconds of player velocity to prefetch ahead
+        self.grid = SpatialGrid(catalog.positions, cell or load_radius / 2)
+        self.resident = {}  # Catalog index -> Unity instance id
+        self.unconfirmed = set()  # Catalog indices created without a reply (may or may not exist)
+        self.loaded = np.zeros(len(catalog), dtype=bool)
+        self.player = None
+        self.velocity = np.zeros(3)
+        self.last_sample = None
+        self.tokens = float(max_batch)
+        self.last_refill = time.perf_counter()
+        self.stats = StreamStats()
+
+    def observe_player(self, position):
+        now = time.perf_counter()
+        position = np.asarray(position, dtype=np.float64)
+        if self.last_sample is not None:
+            dt = now - self.last_sample[0]
+            if dt > 0:
+                self.velocity = 0.5 * self.velocity + 0.5 * (position - self.last_sample[1]) / dt
+        self.last_sample = (now, position)
+        self.player = position
+
+    def plan(self, budget):
+        """(catalog indices to load, in priority order; catalog indices to unload) for this tick."""
+        center = self.player + self.velocity * self.lookahead
+        positions = self.catalog.positions
+
+        # 1. Out: residents beyond the unload radius, farthest first
+        resident = np.fromiter(self.resident, dtype=np.int64, count=len(self.resident))
+        dist = np.linalg.norm(positions[resident] - self.player, axis=1) if len(resident) else np.empty(0)
+        outside = dist > self.unload_radius
+        unload = resident[outside][np.argsort(-dist[outside])]
+
+        # 2. In: not yet loaded inside the load radius, nearest / biggest first
+        idx, d = self.grid.query(center, self.load_radius)
+        new = ~self.loaded[idx]
+        idx, d = idx[new], d[new]
+        load = idx[np.argsort(d - self.catalog.sizes[idx], kind="stable")]
+
+        # 3. Scene budget: evict band objects (farthest first) for closer loads, then cap the loads
+        kept = len(resident) - len(unload) + len(self.unconfirmed)
+        room = self.max_objects - kept
+        if len(load) > room:
+            band = resident[~outside]
+            band_dist = dist[~outside]
+            evictable = band[band_dist > self.load_radius][np.argsort(-band_dist[band_dist > self.load_radius])]
+            evict = evictable[:len(load) - room]
+            unload = np.concatenate([unload, evict])
+            room += len(evict)
+
+        unload = unload[:budget]
+        room = min(room, self.max_objects - (len(resident) - len(unload) + len(self.unconfirmed)))
+        take = max(0, min(room, budget - len(unload)))
+        self.stats.deferred += max(0, len(load) - take)
+        return load[:take], unload
+
+    def take_tokens(self):
+        now = time.perf_counter()
+        self.tokens = min(float(self.max_batch), self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        return int(self.tokens)
+
+    def tick(self, player=None):
+        """One streaming step. player: float64 (x, y, z), or None to ask Unity (get_world_mover)."""
+        if player is None:
+            player = self.client.get_world_mover()
+            if player is None:
+                return False
+        self.observe_player(player)
+        self.stats.ticks += 1
+
+        t0 = time.perf_counter()
+        budget = self.take_tokens()
+        orphans = list(self.unconfirmed)[:budget]
+        load, unload = self.plan(budget - len(orphans))
+        commands = []
+        if len(unload):
+            cmd = game_state_pb2.CommandMsg()
+            cmd.action = "destroy_instances"
+            cmd.instance_ids.extend(self.resident[i] for i in unload.tolist())
+            commands.append(cmd)
+        catalog = self.catalog
+        # Queued behind the create they may race with, so the editor settles it either way
+        commands.extend(make_command("destroy", catalog.name(i)) for i in orphans)
+        for i in load.tolist():
+            primitive, components = catalog.kind_table[catalog.kinds[i]]
+            commands.append(make_create_command(catalog.name(i), catalog.positions[i].tolist(), components,
+                                                primitive, precise=True))
+        self.stats.plan_ms = (time.perf_counter() - t0) * 1000
+        if not commands:
+            return True
+
+        t1 = time.perf_counter()
+        reply = self.client.send_batch(commands)
+        self.stats.send_ms = (time.perf_counter() - t1) * 1000
+        self.tokens -= len(commands)
+        results = iter(reply.results if reply is not None else ())
+
+        # 1. Unloads: "K of N not found" only means those were already gone; no reply means
+        #    nothing is known, so they stay resident and get picked again next tick
+        if len(unload):
+            result = next(results, None)
+            if result is not None and (result.status.startswith("ok") or result.status.endswith("not found")):
+                for i in unload.tolist():
+                    del self.resident[i]
+                self.loaded[unload] = False
+                self.stats.unloaded += len(unload)
+            else:
+                self.stats.failed += 1
+
+        # 2. Orphans: destroyed or "not found", either way gone now
+        for i in orphans:
+            if next(results, None) is not None:
+                self.unconfirmed.discard(i)
+                self.loaded[i] = False
+
+        # 3. Creates
+        for i in load.tolist():
+            result = next(results, None)
+            if result is not None and result.status.startswith("error"):
+                self.stats.failed += 1
+            elif result is not None and result.instance_ids:
+                self.resident[i] = result.instance_ids[0]
+                self.loaded[i] = True
+                self.stats.loaded += 1
+            else:
+                # No reply: the editor may still run it. Not resident (no id to destroy it by)
+                # and not created again until a destroy by name has settled it
+                self.unconfirmed.add(i)
+                self.loaded[i] = True
+        return True
+
+    def unload_all(self):
+        ids = list(self.resident.values())
+        for k in range(0, len(ids), 5000):
+            self.client.destroy_instances(ids[k:k + 5000])
+        names = [self.catalog.name(i) for i in self.unconfirmed]
+        for k in range(0, len(names), 500):
+            self.client.send_batch([make_command("destroy", n) for n in names[k:k + 500]])
+        self.loaded[:] = False
+        self.resident.clear()
+        self.unconfirmed.clear()
+        return len(ids) + len(names)
+
+    def run(self, interval=0.1, duration=None, report_every=5.0):
+        """Ticks every `interval` seconds (deadline scheduled) until duration passes or Ctrl+C."""
+        start = next_tick = next_report = time.perf_counter()
+        try:
+            while duration is None or time.perf_counter() - start < duration:
+                self.tick()
+                now = time.perf_counter()
+                if now >= next_report:
+                    self.report()
+                    next_report = now + report_every
+                next_tick += interval
+                time.sleep(max(0.0, next_tick - time.perf_counter()))
+        except KeyboardInterrupt:
+            pass
+        self.report()
+
+    def report(self):
+        s = self.stats
+        pos = "?" if self.player is None else ", ".join(f"{v:.0f}" for v in self.player)
+        log(f"player ({pos}): {len(self.resident)} resident, {len(self.unconfirmed)} unconfirmed, +{s.loaded} / -{s.unloaded} streamed, "
+            f"{s.deferred} deferred, {s.failed} failed, plan {s.plan_ms:.2f} ms, send {s.send_ms:.1f} ms")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Stream catalog objects in and out around the player.")
+    parser.add_argument("--catalog", type=int, default=1000000, help="synthetic catalog size")
+    parser.add_argument("--load", type=float, default=10000.0, help="stream in inside this distance")
+    parser.add_argument("--unload", type=float, default=12000.0, help="stream out beyond this distance")
+    parser.add_argument("--max-objects", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=2000.0, help="commands per second")
+    parser.add_argument("--batch", type=int, default=250, help="max commands per tick")
+    parser.add_argument("--interval", type=float, default=0.1, help="seconds between ticks")
+    parser.add_argument("--duration", type=float, default=None)
+    parser.add_argument("--addr", default="tcp://127.0.0.1:5555")
+    parser.add_argument("--standin", action="store_true",
+                        help="in-process stand-in; a WorldMover circles through one cluster at --speed")
+    parser.add_argument("--speed", type=float, default=20000.0)
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    catalog = Catalog.clustered(args.catalog)
+    log(f"Catalog: {len(catalog)} entries ({time.perf_counter() - t0:.1f} s)")
+
+    server = None
+    if args.standin:
+        from zmq_standin import StandInServer
+        server = StandInServer(args.addr).start()
+        server.scene.add("WorldMover", catalog.positions[0], ["Core.WorldMover"])
+
+    client = UnityZeroMQClient(args.addr, reliable=True)
+    t0 = time.perf_counter()
+    streamer = UniverseStreamer(client, catalog, args.load, args.unload, args.max_objects, args.batch, args.rate)
+    log(f"Spatial index: {len(streamer.grid.keys)} cells ({time.perf_counter() - t0:.1f} s)")
+
+    try:
+        if args.standin:
+            # Circle (radius 15000) through the cluster around the first catalog entry
+            origin = catalog.positions[0]
+            start = time.perf_counter()
+            mover = server.scene.objects["WorldMover"]
+            while args.duration is None or time.perf_counter() - start < args.duration:
+                angle = args.speed * (time.perf_counter() - start) / 15000.0
+                mover.position = origin + 15000.0 * np.array([np.cos(angle), np.sin(angle), 0.0])
+                streamer.tick()
+                if streamer.stats.ticks % 20 == 0:
+                    streamer.report()
+                time.sleep(args.interval)
+            streamer.report()
+        else:
+            streamer.run(args.interval, args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        log(f"Unloading {streamer.unload_all()} streamed objects.")
+        if server:
+            server.stop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
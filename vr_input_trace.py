@@ -0,0 +1,368 @@
+"""
+Recorded VR input traces, replayed into VR.CockpitInputController at headset rates.
+
+test_vr_input.py sets mockLeftY to 1.0 once. This records or loads time series
+of the mock fields (both sticks + trigger) and streams them into the running
+editor at 90/120 Hz over the ZeroMQ bridge:
+
+1. ticks run on absolute monotonic deadlines (start + k / rate): sleep until just
+   before the deadline, spin the rest, never accumulate drift; a tick that wakes
+   up more than a period late skips the missed deadlines instead of bursting,
+2. each tick sends only the channels that changed, as one set_property batch
+   (one editor frame), and only if the previous batch was answered - at most one
+   batch is in flight; ticks that find it busy are coalesced into the next send,
+3. the value for tick k is the trace at k / rate (sample and hold), so a replay
+   is deterministic: the same trace and rate always produce the same sequence,
+4. stats: wake-up lateness (jitter), send interval spread, round trips,
+   coalesced / skipped ticks and errors.
+
+    python vr_input_trace.py synth --maneuver step --seconds 5 -o throttle_step.npz
+    python vr_input_trace.py record -o flight.npz --seconds 30         # poll the fields while someone flies
+    python vr_input_trace.py replay flight.npz --rate 120
+    python vr_input_trace.py replay throttle_step.npz --standin        # against zmq_standin
+"""
+import sys
+import csv
+import json
+import time
+import argparse
+import itertools
+import numpy as np
+import zmq
+import game_state_pb2
+from zmq_bridge import make_command
+
+ADDR = "tcp://127.0.0.1:5555"
+TARGET = "XR Origin"
+COMPONENT = "VR.CockpitInputController"
+CHANNELS = ("mockLeftX", "mockLeftY", "mockRightX", "mockRightY", "mockTrigger")
+SPIN = 0.002        # Seconds before a deadline where sleeping stops and spinning starts
+REPLY_TIMEOUT = 1.5  # ZeroMQBridge answers "error: timeout" after ~1 s; give up a bit later
+
+def log(msg):
+    print(f"[VR Input] {msg}")
+
+
+class Trace:
+    """times (n,) seconds from 0, ascending; values (n, channels) float32."""
+
+    def __init__(self, times, values, channels=CHANNELS):
+        self.times = np.asarray(times, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float32).reshape(len(self.times), len(channels))
+        self.channels = tuple(channels)
+        if len(self.times) == 0 or np.any(np.diff(self.times) < 0):
+            raise ValueError("trace needs at least one sample and ascending times")
+
+    @property
+    def duration(self):
+        return float(self.times[-1])
+
+    def at(self, t):
+        """Sample and hold: the last sample at or before each time in t."""
+        i = np.searchsorted(self.times, np.asarray(t, dtype=np.float64), side="right") - 1
+        return self.values[np.clip(i, 0, len(self.times) - 1)]
+
+    def ticks(self, rate):
+        """Per-tick values for a replay at `rate` Hz, (ticks, channels)."""
+        count = int(np.floor(self.duration * rate + 1e-9)) + 1
+        return self.at(np.arange(count) / rate)
+
+    def save(self, path):
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(("time",) + self.channels)
+                for t, row in zip(self.times, self.values):
+                    writer.writerow([f"{t:.6f}"] + [f"{v:.9g}" for v in row])
+        else:
+            np.savez(path, times=self.times, values=self.values, channels=np.array(self.channels))
+
+    @classmethod
+    def load(cls, path):
+        """.npz from save(), or .csv with a time column plus any of CHANNELS (missing ones stay 0)."""
+        if path.endswith(".csv"):
+            with open(path, newline="") as f:
+                rows = list(csv.DictReader(f))
+            times = [float(r["time"]) for r in rows]
+            values = [[float(r.get(c) or 0.0) for c in CHANNELS] for r in rows]
+            return cls(times, values)
+        with np.load(path) as data:
+            return cls(data["times"], data["values"], [str(c) for c in data["channels"]])
+
+
+def synth(maneuver, seconds=5.0, rate=1000.0):
+    """
+    Canned flight-control inputs:
+    step (throttle 0 -> 1 at 1 s), sine (0.5 Hz roll), doublet (pitch +1/-1),
+    pulses (trigger at 2 Hz), all (every one at once).
+    """
+    t = np.arange(int(seconds * rate) + 1) / rate
+    values = np.zeros((len(t), len(CHANNELS)), dtype=np.float32)
+    col = {c: i for i, c in enumerate(CHANNELS)}
+    kinds = ("step", "sine", "doublet", "pulses") if maneuver == "all" else (maneuver,)
+    for kind in kinds:
+        if kind == "step":
+            values[:, col["mockLeftY"]] = t >= 1.0
+        elif kind == "sine":
+            values[:, col["mockLeftX"]] = np.sin(2 * np.pi * 0.5 * t)
+        elif kind == "doublet":
+            values[:, col["mockRightY"]] = np.where((t >= 1.0) & (t < 1.5), 1.0, np.where((t >= 1.5) & (t < 2.0), -1.0, 0.0))
+        elif kind == "pulses":
+            values[:, col["mockTrigger"]] = (t * 2.0) % 1.0 < 0.5
+        else:
+            raise ValueError(f"unknown maneuver: {kind}")
+    return Trace(t, values)
+
+def format_value(v):
+    return f"{float(v):.9g}"  # Round-trips a float32
+
+
+class FeedStats:
+    def __init__(self):
+        self.ticks = 0
+        self.batches = 0
+        self.commands = 0
+        self.unchanged = 0   # Ticks with nothing to send
+        self.coalesced = 0   # Ticks that found the previous batch still in flight
+        self.skipped = 0     # Deadlines missed by a whole period (not sent at all)
+        self.errors = 0
+        self.timeouts = 0
+        self.lateness = []   # Seconds past each deadline at wake-up
+        self.send_times = []
+        self.rtts = []
+
+    def snapshot(self):
+        def ms(values, p):
+            return float(np.percentile(values, p) * 1000) if len(values) else 0.0
+        intervals = np.diff(self.send_times)
+        return {
+            "ticks": self.ticks,
+            "batches": self.batches,
+            "commands": self.commands,
+            "unchanged": self.unchanged,
+            "coalesced": self.coalesced,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "late_p50_ms": ms(self.lateness, 50),
+            "late_p99_ms": ms(self.lateness, 99),
+            "late_max_ms": ms(self.lateness, 100),
+            "send_interval_std_ms": float(intervals.std() * 1000) if len(intervals) > 1 else 0.0,
+            "rtt_p50_ms": ms(self.rtts, 50),
+            "rtt_p99_ms": ms(self.rtts, 99),
+        }
+
+
+class InputFeeder:
+    """Streams a Trace into the CockpitInputController mock fields (one batch in flight)."""
+
+    def __init__(self, addr=ADDR, rate=90.0, target=TARGET, component=COMPONENT):
+        self.addr = addr
+        self.rate = float(rate)
+        self.period = 1.0 / self.rate
+        self.target = target
+        self.component = component
+        self.context = zmq.Context.instance()
+        self.socket = None
+        self.ids = itertools.count()
+        self.inflight = None  # (request id, sent_at)
+        self.applied = None   # Channel values Unity has (as far as we know)
+        self.stats = FeedStats()
+
+    def connect(self):
+        if self.socket is None:
+            # DEALER: send without blocking on the reply (REQ would), REP still answers in order
+            self.socket = self.context.socket(zmq.DEALER)
+            self.socket.setsockopt(zmq.LINGER, 0)
+            self.socket.connect(self.addr)
+        return self.socket
+
+    def close(self):
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+    def batch(self, channels, values):
+        cmd = game_state_pb2.CommandMsg()
+        cmd.action = "batch"
+        for channel, value in zip(channels, values):
+            spec = {"type": self.component, "propertyName": channel, "value": format_value(value)}
+            cmd.batch.commands.append(make_command("set_property", self.target, payload_json=json.dumps(spec)))
+        return cmd.SerializeToString()
+
+    # 1. Replies
+    def receive(self, wait):
+        """Waits up to `wait` seconds for the in-flight reply."""
+        if self.inflight is None or not self.socket.poll(max(0, int(wait * 1000))):
+            self.check_timeout()
+            return
+        frames = self.socket.recv_multipart()
+        rid, sent = self.inflight
+        if frames[0] != rid:
+            return  # Late reply to a batch we already gave up on
+        self.inflight = None
+        self.stats.rtts.append(time.perf_counter() - sent)
+        reply = game_state_pb2.GameStateMsg()
+        reply.ParseFromString(frames[-1])
+        if reply.status.startswith("error"):
+            self.stats.errors += 1
+            self.applied = None  # Unknown state: resend every channel next tick
+
+    def check_timeout(self):
+        if self.inflight is not None and time.perf_counter() - self.inflight[1] > REPLY_TIMEOUT:
+            self.stats.timeouts += 1
+            self.inflight = None
+            self.applied = None
+
+    def wait_until(self, deadline):
+        """Sleeps (serving replies) until SPIN before the deadline, then spins to it."""
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return
+            if remaining > SPIN:
+                if self.inflight is not None:
+                    self.receive(remaining - SPIN)
+                else:
+                    time.sleep(remaining - SPIN)
+            elif self.inflight is not None:
+                self.receive(0)
+
+    # 2. Ticks
+    def send(self, values):
+        if self.inflight is not None:
+            self.stats.coalesced += 1
+            return
+        changed = np.arange(len(values)) if self.applied is None else np.flatnonzero(values != self.applied)
+        if len(changed) == 0:
+            self.stats.unchanged += 1
+            return
+        rid = next(self.ids).to_bytes(8, "little")
+        self.socket.send_multipart([rid, b"", self.batch([CHANNELS[i] for i in changed], values[changed])])
+        now = time.perf_counter()
+        self.inflight = (rid, now)
+        self.applied = values.copy()
+        self.stats.batches += 1
+        self.stats.commands += len(changed)
+        self.stats.send_times.append(now)
+
+    def run(self, trace, lead=0.05):
+        """Replays the trace once; returns stats.snapshot()."""
+        if trace.channels != CHANNELS:
+            raise ValueError(f"trace channels {trace.channels} != {CHANNELS}")
+        self.connect()
+        frames = trace.ticks(self.rate)
+        start = time.perf_counter() + lead
+        k = 0
+        while k < len(frames):
+            deadline = start + k * self.period
+            self.wait_until(deadline)
+            late = time.perf_counter() - deadline
+            if late >= self.period:
+                # Woke up whole periods late: drop those ticks, carry on with the current one
+                missed = min(int(late // self.period), len(frames) - 1 - k)
+                self.stats.skipped += missed
+                k += missed
+                late -= missed * self.period
+            self.stats.lateness.append(late)
+            self.stats.ticks += 1
+            self.send(frames[k])
+            k += 1
+
+        # 3. Drain: the final values must land even if the last ticks were coalesced
+        final = frames[-1]
+        give_up = time.perf_counter() + REPLY_TIMEOUT * 2
+        while time.perf_counter() < give_up:
+            if self.inflight is not None:
+                self.receive(REPLY_TIMEOUT)
+                continue
+            if self.applied is not None and np.array_equal(self.applied, final):
+                break
+            self.send(final)
+        return self.stats.snapshot()
+
+
+def record(addr=ADDR, seconds=10.0, rate=90.0, target=TARGET, component=COMPONENT):
+    """Polls the mock fields every tick (get_property batch) into a Trace."""
+    from zmq_bridge import UnityZeroMQClient
+    client = UnityZeroMQClient(addr, reliable=True)
+    cmds = [make_command("get_property", target, payload_json=json.dumps(
+        {"type": component, "propertyName": c, "value": ""})) for c in CHANNELS]
+    times, values = [], []
+    start = time.perf_counter()
+    for k in range(int(seconds * rate) + 1):
+        deadline = start + k / rate
+        while deadline - time.perf_counter() > SPIN:
+            time.sleep(deadline - time.perf_counter() - SPIN)
+        while time.perf_counter() < deadline:
+            pass
+        reply = client.send_batch(cmds)
+        if reply is None or len(reply.results) != len(CHANNELS):
+            log(f"Poll failed at tick {k}: {reply.status if reply else 'no reply'}")
+            continue
+        row = [float(r.status[4:]) if r.status.startswith("ok: ") else 0.0 for r in reply.results]
+        times.append(time.perf_counter() - start)
+        values.append(row)
+    return Trace(times, values)
+
+def print_stats(stats):
+    log(f"{stats['ticks']} ticks -> {stats['batches']} batches / {stats['commands']} set_property "
+        f"({stats['unchanged']} unchanged, {stats['coalesced']} coalesced, {stats['skipped']} skipped)")
+    log(f"Wake-up lateness p50 {stats['late_p50_ms']:.3f} ms, p99 {stats['late_p99_ms']:.3f} ms, "
+        f"max {stats['late_max_ms']:.3f} ms; send interval std {stats['send_interval_std_ms']:.3f} ms")
+    log(f"Round trip p50 {stats['rtt_p50_ms']:.2f} ms, p99 {stats['rtt_p99_ms']:.2f} ms; "
+        f"{stats['errors']} errors, {stats['timeouts']} timeouts")
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Record / synthesize / replay CockpitInputController input traces.")
+    parser.add_argument("mode", choices=("synth", "record", "replay"))
+    parser.add_argument("trace", nargs="?", help="trace to replay (.npz or .csv)")
+    parser.add_argument("-o", "--output", help="where synth / record write the trace")
+    parser.add_argument("--maneuver", default="all", choices=("step", "sine", "doublet", "pulses", "all"))
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rate", type=float, default=90.0, help="ticks per second (90 / 120 for headsets)")
+    parser.add_argument("--target", default=TARGET)
+    parser.add_argument("--addr", default=ADDR)
+    parser.add_argument("--standin", action="store_true", help="replay against an in-process zmq_standin")
+    args = parser.parse_args(argv)
+
+    if args.mode == "synth":
+        trace = synth(args.maneuver, args.seconds)
+        trace.save(args.output or f"{args.maneuver}.npz")
+        log(f"Wrote {args.output or args.maneuver + '.npz'} ({len(trace.times)} samples, {trace.duration:.1f}s)")
+        return 0
+    if args.mode == "record":
+        trace = record(args.addr, args.seconds, args.rate, args.target)
+        trace.save(args.output or "recorded.npz")
+        log(f"Recorded {len(trace.times)} samples to {args.output or 'recorded.npz'}")
+        return 0
+
+    if not args.trace:
+        parser.error("replay needs a trace file")
+    trace = Trace.load(args.trace)
+    server = None
+    addr = args.addr
+    if args.standin:
+        import zmq_standin
+        from zmq_bridge import UnityZeroMQClient
+        addr = "tcp://127.0.0.1:5598"
+        server = zmq_standin.StandInServer(addr, frame_time=1.0 / args.rate).start()
+        UnityZeroMQClient(addr).create_object(args.target, components=[COMPONENT], primitive="")
+    feeder = InputFeeder(addr, args.rate, args.target)
+    try:
+        log(f"Replaying {args.trace} ({trace.duration:.1f}s) at {args.rate:.0f} Hz into {args.target}")
+        stats = feeder.run(trace)
+        print_stats(stats)
+        if server:
+            props = server.scene.objects[args.target].properties
+            final = [props.get((COMPONENT, c)) for c in CHANNELS]
+            expected = [format_value(v) for v in trace.ticks(args.rate)[-1]]
+            log(f"Final fields {'match' if final == expected else 'MISMATCH'}: {dict(zip(CHANNELS, final))}")
+        return 1 if stats["errors"] or stats["timeouts"] else 0
+    finally:
+        feeder.close()
+        if server:
+            server.stop()
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
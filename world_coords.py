@@ -0,0 +1,67 @@
+"""
+Sector + offset encoding for double-precision world positions.
+
+Vector3Msg carries float32s, which are off by up to ~5e-4 units at 10^4 and
+stop resolving whole units past ~1.7e7. Core.Vector3d positions (WorldMover.VirtualPosition,
+VirtualTransform.WorldPosition) go over the wire as an integer sector plus a
+float32 offset inside it instead:
+
+    world = sector * SECTOR_SIZE + offset,   |offset| <= SECTOR_SIZE / 2
+
+so the error is bounded by float32 rounding below 512 (~1.5e-5 units) however far
+from the origin the object is. SECTOR_SIZE matches Core.Vector3d.SectorSize.
+
+    sectors, offsets = encode(positions)          # (N,3) float64 -> int32, float32
+    positions = decode(sectors, offsets)
+    sector_bytes, offset_bytes = pack(positions)  # TransformBatchMsg.sectors / .positions
+"""
+import numpy as np
+import game_state_pb2
+
+SECTOR_SIZE = 1024.0
+SECTOR_LIMIT = 2 ** 31 - 1  # int32 sectors: +-2.2e12 units
+
+def encode(positions):
+    """(N,3) float64 -> (sectors int32 (N,3), offsets float32 (N,3))."""
+    positions = np.asarray(positions, dtype=np.float64)
+    sectors = np.rint(positions / SECTOR_SIZE)
+    if sectors.size and np.abs(sectors).max() > SECTOR_LIMIT:
+        raise ValueError(f"position beyond +-{SECTOR_LIMIT * SECTOR_SIZE:.3g} units")
+    # sectors * SECTOR_SIZE is exact (power of two) and close to positions, so the subtraction is exact too
+    offsets = (positions - sectors * SECTOR_SIZE).astype(np.float32)
+    return sectors.astype(np.int32), offsets
+
+def decode(sectors, offsets):
+    """Inverse of encode(): float64 positions."""
+    return np.asarray(sectors, dtype=np.float64) * SECTOR_SIZE + np.asarray(offsets, dtype=np.float64)
+
+def pack(positions):
+    """(N,3) float64 -> (sector bytes, offset bytes), little-endian int32 / float32 triples."""
+    sectors, offsets = encode(positions)
+    return sectors.astype("<i4").tobytes(), offsets.astype("<f4").tobytes()
+
+def unpack(sector_bytes, offset_bytes):
+    """Inverse of pack(): (N,3) float64."""
+    sectors = np.frombuffer(sector_bytes, dtype="<i4")
+    offsets = np.frombuffer(offset_bytes, dtype="<f4")
+    if sectors.size != offsets.size or sectors.size % 3:
+        raise ValueError(f"buffer size mismatch ({sectors.size} sectors, {offsets.size} offsets)")
+    return decode(sectors, offsets).reshape(-1, 3)
+
+def to_msg(x, y, z, msg=None):
+    """One position -> SectorVector3Msg (fills `msg` in place when given)."""
+    msg = msg if msg is not None else game_state_pb2.SectorVector3Msg()
+    (sx, sy, sz), (ox, oy, oz) = (a.tolist() for a in encode((x, y, z)))
+    msg.sector_x, msg.sector_y, msg.sector_z = sx, sy, sz
+    msg.x, msg.y, msg.z = ox, oy, oz
+    return msg
+
+def from_msg(msg):
+    """SectorVector3Msg -> (x, y, z) floats."""
+    return (msg.sector_x * SECTOR_SIZE + msg.x,
+            msg.sector_y * SECTOR_SIZE + msg.y,
+            msg.sector_z * SECTOR_SIZE + msg.z)
+
+def world_positions(state):
+    """{name: (x, y, z)} for the entities of a GameStateMsg that carry world_position."""
+    return {t.name: from_msg(t.world_position) for t in state.entities if t.HasField("world_position")}
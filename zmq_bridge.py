@@ -1,30 +1,260 @@
 import zmq
 import sys
+import json
 import time
+import hashlib
+import numpy as np
 import game_state_pb2
+import world_coords
+import hierarchy_columnar
+from zmq_templates import TEMPLATES, TemplateBatch
+from bridge_resilience import Backoff, LatencyStats, get_breaker
+from bridge_trace import TRACER
+from bridge_metrics import ClientMetrics, METRICS, SERVER_TIMEOUT_STATUS
+
+METRICS_ZMQ = ClientMetrics("zmq")
+HIERARCHY_SIZE = METRICS.gauge("unity_scene_hierarchy_objects", "Objects in the last get_hierarchy reply.")
+
+# Safe to resend after a timeout: running them twice leaves the scene the same
+IDEMPOTENT_ACTIONS = {"set_transform", "set_transforms", "set_property", "check_components", "get_hierarchy",
+                      "get_hierarchy_columnar", "get_world_mover", "get_property", "upload_mesh", "mesh_chunk"}
+
+# upload_mesh: bytes per mesh_chunk request (one editor frame copies this much)
+MESH_CHUNK_BYTES = 1 << 20
+
+def is_idempotent(cmd):
+    if cmd.action == "batch":
+        return all(is_idempotent(c) for c in cmd.batch.commands)
+    return cmd.action in IDEMPOTENT_ACTIONS
+
+def breaker_for(addr):
+    """Shared circuit breaker for a tcp://host:port endpoint (None for ipc:// / inproc://: nothing to probe)."""
+    if not addr.startswith("tcp://"):
+        return None
+    host, port = addr.split("://", 1)[-1].rsplit(":", 1)
+    return get_breaker("zmq", host, int(port))
+
+def pack_vectors(values, count):
+    """(N,3) array-like -> packed little-endian float32 bytes (TransformBatchMsg buffers)."""
+    packed = np.ascontiguousarray(values, dtype="<f4")
+    if packed.size != count * 3:
+        raise ValueError(f"expected {count}x3 values, got shape {packed.shape}")
+    return packed.tobytes()
+
+def pack_mesh(vertices, indices, uv=None, normals=None, name=""):
+    """
+    Mesh arrays -> (MeshUploadMsg header, list of byte views in upload order).
+    The views point into the arrays themselves: nothing is copied unless an array
+    has the wrong dtype or layout (indices are uint16 up to 65536 vertices, else uint32).
+    """
+    vertices = np.ascontiguousarray(vertices, dtype="<f4")
+    n = vertices.size // 3
+    if vertices.size != n * 3 or n == 0:
+        raise ValueError(f"vertices must be (N,3), got shape {vertices.shape}")
+    indices = np.asarray(indices).ravel()
+    if indices.size % 3:
+        raise ValueError(f"index count {indices.size} is not a multiple of 3")
+    if indices.size and (indices.min() < 0 or indices.max() >= n):
+        raise ValueError(f"indices out of range for {n} vertices")
+    index32 = n > 65536
+    indices = np.ascontiguousarray(indices, dtype="<u4" if index32 else "<u2")
+
+    pieces = [vertices]
+    if normals is not None:
+        normals = np.ascontiguousarray(normals, dtype="<f4")
+        if normals.size != n * 3:
+            raise ValueError(f"expected {n}x3 normals, got shape {normals.shape}")
+        pieces.append(normals)
+    if uv is not None:
+        uv = np.ascontiguousarray(uv, dtype="<f4")
+        if uv.size != n * 2:
+            raise ValueError(f"expected {n}x2 uvs, got shape {uv.shape}")
+        pieces.append(uv)
+    pieces.append(indices)
+    views = [memoryview(a).cast("B") for a in pieces]
+
+    digest = hashlib.sha256()
+    for view in views:
+        digest.update(view)
+    header = game_state_pb2.MeshUploadMsg(
+        hash=digest.hexdigest(), mesh_name=name, vertex_count=n, index_count=indices.size,
+        index32=index32, has_normals=normals is not None, has_uv=uv is not None,
+        total_bytes=sum(v.nbytes for v in views))
+    return header, views
+
+def slice_views(views, start, size):
+    """Byte range [start, start+size) of the concatenated views, as views (no copies)."""
+    out = []
+    for view in views:
+        if start >= view.nbytes:
+            start -= view.nbytes
+            continue
+        part = view[start:start + size]
+        out.append(part)
+        size -= part.nbytes
+        start = 0
+        if size <= 0:
+            break
+    return out
+
+def make_command(action, target="", vector=None, payload_json=""):
+    """Builds a CommandMsg (e.g. for send_batch)."""
+    cmd = game_state_pb2.CommandMsg()
+    cmd.action = action
+    if target:
+        cmd.target = target
+    if payload_json:
+        cmd.payload_json = payload_json
+    if vector is not None:
+        cmd.vector_payload.x, cmd.vector_payload.y, cmd.vector_payload.z = vector
+    return cmd
+
+def make_create_command(name, position=(0.0, 0.0, 0.0), components=(), primitive="cube", precise=False, parent=""):
+    """CommandMsg for action "create" (see UnityZeroMQClient.create_object)."""
+    spec = {"primitive": primitive, "components": list(components)}
+    if parent:
+        spec["parent"] = parent
+    cmd = make_command("create", name, None if precise else position, json.dumps(spec))
+    if precise:
+        world_coords.to_msg(*position, msg=cmd.world_payload)
+    return cmd
 
 class UnityZeroMQClient:
-    def __init__(self, addr="tcp://127.0.0.1:5555"):
+    """
+    REQ client for Core.ZeroMQBridge.
+
+    reliable=True enables Lazy Pirate mode: every request gets `timeout` seconds;
+    on a timeout the REQ socket (now stuck waiting for a reply) is closed and
+    reopened, and idempotent commands are resent up to `retries` times with
+    backoff. Non-idempotent commands are never resent - they return None.
+    An "error: timeout" reply (editor busy) counts as a timeout too; once the
+    attempts run out it is returned as is.
+    """
+    def __init__(self, addr="tcp://127.0.0.1:5555", reliable=False, timeout=2.0, retries=3):
+        self.addr = addr
+        self.reliable = reliable
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = Backoff(base=0.1, factor=2.0, cap=2.0)
+        self.latency = LatencyStats()
+        self.breaker = breaker_for(addr)
         self.context = zmq.Context()
-        self.socket = self.context.socket(zmq.REQ)
+        self.socket = None
         print(f"[ZMQ] Connecting to Unity on {addr}...")
-        self.socket.connect(addr)
+        self.connect()
+        # set_transforms: object name -> Unity handle
+        self.handles = {}
+
+    def connect(self):
+        self.socket = self.context.socket(zmq.REQ)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        self.socket.connect(self.addr)
+
+    def reset_socket(self):
+        """Lazy Pirate: a REQ socket that missed its reply can't send again - replace it."""
+        self.socket.close(linger=0)
+        self.connect()
     
-    def send_command(self, cmd_msg):
-        try:
-            # Serialize
+    def send_command(self, cmd_msg, frames=()):
+        # Serialize
+        with TRACER.span("zmq.serialize", "zmq", action=cmd_msg.action):
             data = cmd_msg.SerializeToString()
-            # Send
-            self.socket.send(data)
-            
-            # Receive Reply (GameStateMsg)
-            reply_data = self.socket.recv()
+        return self.send_bytes(data, idempotent=is_idempotent(cmd_msg), action=cmd_msg.action, frames=frames)
+
+    def send_bytes(self, data, idempotent=False, action="", frames=()):
+        """
+        Sends an already serialized CommandMsg and returns the GameStateMsg reply (None on failure).
+        frames: raw buffers sent as extra ZeroMQ frames after it, without copying (mesh_chunk).
+        """
+        attempts = 1 + (self.retries if self.reliable and idempotent else 0)
+        metrics = METRICS_ZMQ
+        metrics.requests(action).inc()
+        size = len(data) + sum(memoryview(f).nbytes for f in frames)
+        metrics.payload.observe(size)
+        start = time.perf_counter()  # Latency includes retries: that is what the caller waits
+        for attempt in range(attempts):
+            if self.breaker is not None and not self.breaker.allow():
+                print("[ZMQ] Bridge is down (circuit open). Failing fast.")
+                metrics.fast_failures.inc()
+                metrics.errors.inc()
+                return None
+            try:
+                # Send
+                sent = time.perf_counter()
+                if frames:
+                    self.socket.send(data, zmq.SNDMORE)
+                    for frame in frames[:-1]:
+                        self.socket.send(frame, zmq.SNDMORE, copy=False)
+                    self.socket.send(frames[-1], copy=False)
+                else:
+                    self.socket.send(data)
+                metrics.bytes_sent.inc(size)
+                
+                # Receive Reply (GameStateMsg)
+                if self.reliable and not self.socket.poll(self.timeout * 1000):
+                    self.reset_socket()
+                    self.timed_out(attempt, attempts, f"No reply within {self.timeout:.1f}s")
+                    continue
+                reply_data = self.socket.recv()
+            except zmq.ZMQError as e:
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                metrics.errors.inc()
+                print(f"[ZMQ] Error: {e}")
+                self.reset_socket()
+                return None
+
+            received = time.perf_counter()
+            metrics.bytes_received.inc(len(reply_data))
             state = game_state_pb2.GameStateMsg()
             state.ParseFromString(reply_data)
+            metrics.record_reply(state)
+            if state.status == SERVER_TIMEOUT_STATUS:
+                # The bridge answered for a main thread that never got to the command: same as no reply
+                if self.timed_out(attempt, attempts, "Editor busy, bridge replied timeout"):
+                    continue
+                metrics.errors.inc()  # Out of attempts: the one error for this request
+            elif self.breaker is not None:
+                self.breaker.record_success()
+            self.latency.record(received - start)
+            metrics.latency.observe(received - start)
+            if TRACER.enabled:
+                parsed = time.perf_counter()
+                TRACER.complete("zmq.request", sent, received, "zmq",
+                                args={"action": action, "bytes": size, "attempt": attempt + 1})
+                TRACER.complete("zmq.parse", received, parsed, "zmq", args={"status": state.status})
+                TRACER.server_spans(sent, received, state, action)
             return state
-        except zmq.ZMQError as e:
-            print(f"[ZMQ] Error: {e}")
-            return None
+        metrics.errors.inc()
+        return None
+
+    def timed_out(self, attempt, attempts, why):
+        """Counts a timeout of send_bytes; backs off and returns True if another attempt follows."""
+        self.latency.timeouts += 1
+        METRICS_ZMQ.timeouts.inc()
+        if self.breaker is not None:
+            self.breaker.record_timeout()
+        print(f"[ZMQ] {why} (attempt {attempt + 1}/{attempts}).")
+        if attempt + 1 >= attempts:
+            return False
+        # Port is usually still open while the editor is busy: plain backoff, not the probe
+        self.latency.retries += 1
+        METRICS_ZMQ.retries.inc()
+        time.sleep(self.backoff.delay(attempt))
+        return True
+
+    def send_batch(self, commands, stop_on_error=False):
+        """
+        Runs several CommandMsgs in one round trip / one editor frame (action "batch").
+        reply.results holds one GameStateMsg per command, in order
+        ("skipped" after the first error when stop_on_error is set).
+        """
+        cmd = game_state_pb2.CommandMsg()
+        cmd.action = "batch"
+        cmd.batch.commands.extend(commands)
+        cmd.batch.stop_on_error = stop_on_error
+        METRICS_ZMQ.batch.observe(len(commands))
+        return self.send_command(cmd)
 
     def destroy_object(self, name):
         cmd = game_state_pb2.CommandMsg()
@@ -32,21 +262,152 @@ class UnityZeroMQClient:
         cmd.target = name
         return self.send_command(cmd)
 
+    def destroy_instances(self, instance_ids):
+        """Destroys exact objects (HierarchyMsg.instance_ids) in one command."""
+        cmd = game_state_pb2.CommandMsg()
+        cmd.action = "destroy_instances"
+        cmd.instance_ids.extend(int(i) for i in instance_ids)
+        return self.send_command(cmd)
+
+    def create_object(self, name, position=(0.0, 0.0, 0.0), components=(), primitive="cube", precise=False, parent=""):
+        """
+        New GameObject (primitive="" for an empty one) with components added by type name.
+        precise=True sends the position as sector + offset (VirtualTransform.WorldPosition keeps float64).
+        parent: name of an existing object to parent it under (world position kept).
+        """
+        return self.send_command(make_create_command(name, position, components, primitive, precise, parent))
+
+    def set_property(self, name, component, prop, value):
+        """Sets a field or property on a component by reflection (value is converted from its string form)."""
+        spec = {"type": component, "propertyName": prop, "value": str(value)}
+        return self.send_command(make_command("set_property", name, payload_json=json.dumps(spec)))
+
+    def get_property(self, name, component, prop):
+        """Field or property value as a string (name="" = first such component in the scene), None on failure."""
+        spec = {"type": component, "propertyName": prop, "value": ""}
+        reply = self.send_command(make_command("get_property", name, payload_json=json.dumps(spec)))
+        if reply is None or not reply.status.startswith("ok: "):
+            return None
+        return reply.status[4:]
+
+    def upload_mesh(self, target, vertices, indices, uv=None, normals=None, name="", chunk_size=MESH_CHUNK_BYTES):
+        """
+        Uploads a mesh to `target`'s MeshFilter (added if missing).
+        vertices / normals (N,3), uv (N,2), indices (flat or (T,3)): NumPy arrays, sent without copies.
+        Unity keeps meshes by content hash: a repeat upload costs one small request ("ok: cached").
+        Large meshes go in chunk_size pieces; an interrupted upload resumes where Unity stopped.
+        Returns the final reply (None on failure).
+        """
+        header, views = pack_mesh(vertices, indices, uv, normals, name)
+
+        # 1. Header only: Unity either has it already or says which byte it needs next
+        cmd = make_command("upload_mesh", target)
+        cmd.mesh.CopyFrom(header)
+        reply = self.send_command(cmd)
+        offset = -1
+        while reply is not None and reply.status.startswith("ok: need "):
+            # 2. Next chunk from the requested offset
+            need = int(reply.status[len("ok: need "):])
+            if need <= offset:
+                reply.status = f"error: upload stuck at byte {need}"
+                break
+            offset = need
+            cmd = make_command("mesh_chunk", target)
+            cmd.mesh.CopyFrom(header)
+            cmd.mesh.offset = offset
+            reply = self.send_command(cmd, frames=slice_views(views, offset, chunk_size))
+        return reply
+
+    def get_world_mover(self):
+        """WorldMover.VirtualPosition as float64 (x, y, z), None if unavailable."""
+        cmd = game_state_pb2.CommandMsg()
+        cmd.action = "get_world_mover"
+        reply = self.send_command(cmd)
+        if reply is None or reply.status.startswith("error") or not reply.entities:
+            return None
+        return world_coords.from_msg(reply.entities[0].world_position)
+
+    def frame_stats(self):
+        """Editor frame timing since the previous call (reply.frame_stats), None on failure."""
+        cmd = game_state_pb2.CommandMsg()
+        cmd.action = "frame_stats"
+        reply = self.send_command(cmd)
+        if reply is None or reply.status.startswith("error"):
+            return None
+        return reply.frame_stats
+
     def generate_universe(self):
         cmd = game_state_pb2.CommandMsg()
         cmd.action = "generate_universe"
         return self.send_command(cmd)
         
     def set_transform(self, name, x, y, z):
+        # Cached serialized prefix, only the Vector3Msg floats are patched (see zmq_templates.py)
+        return self.send_bytes(TEMPLATES.get("set_transform", name).render(x, y, z), idempotent=True,
+                               action="set_transform")
+
+    def set_world_position(self, name, x, y, z):
+        """Double-precision set_transform (sector + offset, see world_coords.py)."""
         cmd = game_state_pb2.CommandMsg()
         cmd.action = "set_transform"
         cmd.target = name
-        # Vector3Msg
-        cmd.vector_payload.x = x
-        cmd.vector_payload.y = y
-        cmd.vector_payload.z = z
+        world_coords.to_msg(x, y, z, cmd.world_payload)
         return self.send_command(cmd)
 
+    def stream_transforms(self, batch, xyz):
+        """
+        Sends one set_transform per target from an (N,3) array.
+        batch: a TemplateBatch (reuse it across frames) or a list of names.
+        Returns the list of replies.
+        """
+        if not isinstance(batch, TemplateBatch):
+            batch = TemplateBatch("set_transform", batch)
+        return [self.send_bytes(msg, idempotent=True, action=batch.action) for msg in batch.render(xyz).messages()]
+
+    def set_transforms(self, names, positions, rotations=None, precise=False):
+        """
+        Moves N objects with one message (action "set_transforms").
+        names: N object names. positions / rotations (Euler, optional): (N,3) arrays.
+        precise=True sends positions as float64-accurate sector + offset (world_coords.py).
+        Unity returns an integer handle per name; once every name has one,
+        later calls send the handles instead of the strings.
+        """
+        names = list(names)
+        handles = [self.handles.get(n) for n in names]
+        use_handles = len(names) > 0 and None not in handles
+
+        cmd = game_state_pb2.CommandMsg()
+        cmd.action = "set_transforms"
+        batch = cmd.transform_batch
+        if use_handles:
+            batch.handles.extend(handles)
+        else:
+            batch.names.extend(names)
+        if precise:
+            if np.size(positions) != len(names) * 3:
+                raise ValueError(f"expected {len(names)}x3 values, got shape {np.shape(positions)}")
+            batch.sectors, batch.positions = world_coords.pack(positions)
+        else:
+            batch.positions = pack_vectors(positions, len(names))
+        if rotations is not None:
+            batch.rotations = pack_vectors(rotations, len(names))
+
+        METRICS_ZMQ.batch.observe(len(names))
+        reply = self.send_command(cmd)
+        if reply is None:
+            return None
+
+        if use_handles and reply.status.startswith("error"):
+            # Stale handles (objects destroyed/recreated): forget them and resend by name
+            for n in names:
+                self.handles.pop(n, None)
+            return self.set_transforms(names, positions, rotations, precise)
+
+        for name, handle in zip(names, reply.handles):
+            if handle >= 0:
+                self.handles[name] = handle
+        return reply
+
     def run_physics_test(self):
         cmd = game_state_pb2.CommandMsg()
         cmd.action = "run_test"
@@ -55,7 +416,21 @@ class UnityZeroMQClient:
     def get_hierarchy(self):
         cmd = game_state_pb2.CommandMsg()
         cmd.action = "get_hierarchy"
-        return self.send_command(cmd)
+        reply = self.send_command(cmd)
+        if reply is not None and not reply.status.startswith("error"):
+            HIERARCHY_SIZE.set(len(reply.entities))
+        return reply
+
+    def get_hierarchy_columnar(self):
+        """Whole scene tree as a hierarchy_columnar.Hierarchy (None on failure)."""
+        cmd = game_state_pb2.CommandMsg()
+        cmd.action = "get_hierarchy_columnar"
+        reply = self.send_command(cmd)
+        if reply is None or reply.status.startswith("error"):
+            return None
+        tree = hierarchy_columnar.decode(reply.hierarchy)
+        HIERARCHY_SIZE.set(len(tree))
+        return tree
 
     def save_game(self):
         cmd = game_state_pb2.CommandMsg()
@@ -79,15 +454,22 @@ class UnityZeroMQClient:
         return self.send_command(cmd)
 
 
-if __name__ == "__main__":
-    client = UnityZeroMQClient()
+def main(argv, client=None):
+    """
+    Command line entry point.
+    argv excludes the script name (e.g. ["set_pos", "Earth", "1", "2", "3"]).
+    Pass an existing client to reuse its socket (bridge_daemon.py does this).
+    """
+    if client is None:
+        # Reliable mode: a missed reply can't hang the CLI (the bridge itself gives up after ~1 s)
+        client = UnityZeroMQClient(reliable=True)
     
-    if len(sys.argv) > 1:
-        cmd = sys.argv[1]
+    if len(argv) > 0:
+        cmd = argv[0]
         
         reply = None
-        if cmd == "destroy" and len(sys.argv) > 2:
-            reply = client.destroy_object(sys.argv[2])
+        if cmd == "destroy" and len(argv) > 1:
+            reply = client.destroy_object(argv[1])
         
         elif cmd == "generate_universe":
             reply = client.generate_universe()
@@ -101,8 +483,8 @@ if __name__ == "__main__":
         elif cmd == "load_game":
              reply = client.load_game()
 
-        elif cmd == "check_components" and len(sys.argv) > 2:
-             reply = client.check_components(sys.argv[2])
+        elif cmd == "check_components" and len(argv) > 1:
+             reply = client.check_components(argv[1])
 
         elif cmd == "init_universe":
              reply = client.init_universe()
@@ -110,8 +492,8 @@ if __name__ == "__main__":
         elif cmd == "run_test":
              reply = client.run_physics_test()
              
-        elif cmd == "set_pos" and len(sys.argv) > 4:
-            reply = client.set_transform(sys.argv[2], float(sys.argv[3]), float(sys.argv[4]), float(sys.argv[5]))
+        elif cmd == "set_pos" and len(argv) > 4:
+            reply = client.set_transform(argv[1], float(argv[2]), float(argv[3]), float(argv[4]))
         
         else:
             print(f"Unknown command: {cmd}")
@@ -120,3 +502,8 @@ if __name__ == "__main__":
             print(f"Reply Status: {reply.status}")
             for e in reply.entities:
                 print(f"Entity: {e.name} pos: ({e.position.x:.1f}, {e.position.y:.1f}, {e.position.z:.1f}) rot: ({e.rotation.x:.1f}, {e.rotation.y:.1f}, {e.rotation.z:.1f})")
+        return reply
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
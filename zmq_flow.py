@@ -0,0 +1,244 @@
+"""
+Adaptive flow control for streaming commands into the Unity ZeroMQBridge.
+
+ZeroMQBridge serves one request per editor Update and gives up after ~1 s
+(200 x 5 ms) with "error: timeout", so flooding it from Python turns work into
+timeouts instead of backpressure. FlowController keeps the editor saturated:
+
+* Commands are packed into CommandBatchMsg requests (one editor frame each).
+* Several requests can be in flight on a DEALER socket, so the next batch is
+  already queued inside ZeroMQ while Unity executes the current one.
+* Batch size and in-flight window follow AIMD: they grow additively while
+  round trips stay under target_rtt and are cut multiplicatively on timeouts
+  (batch size also shrinks gently when latency drifts above target).
+
+    flow = FlowController()
+    results = flow.run(commands)      # one GameStateMsg per command, in order
+    print(flow.stats.snapshot())
+
+Timed-out requests are resent only if every command in them is idempotent
+(zmq_bridge.IDEMPOTENT_ACTIONS); a resent batch can land after later batches.
+"""
+import time
+import itertools
+from collections import deque
+import zmq
+import game_state_pb2
+from zmq_bridge import is_idempotent
+from bridge_trace import TRACER
+from bridge_metrics import ClientMetrics, METRICS
+
+ADDR = "tcp://127.0.0.1:5555"
+SERVER_TIMEOUT_STATUS = "error: timeout"
+
+METRICS_FLOW = ClientMetrics("zmq_flow")
+INFLIGHT = METRICS.gauge("unity_bridge_inflight_requests", "Requests queued in ZeroMQ / Unity.", bridge="zmq_flow")
+PENDING = METRICS.gauge("unity_bridge_pending_commands", "Commands waiting to be sent.", bridge="zmq_flow")
+BATCH_TARGET = METRICS.gauge("unity_bridge_flow_batch_size", "Current AIMD batch size.", bridge="zmq_flow")
+WINDOW = METRICS.gauge("unity_bridge_flow_window", "Current AIMD in-flight window.", bridge="zmq_flow")
+
+def log(msg):
+    print(f"[ZMQ Flow] {msg}")
+
+
+class FlowStats:
+    """Counters exposed by FlowController (see snapshot())."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.commands_sent = 0
+        self.commands_completed = 0
+        self.command_errors = 0      # Per-command "error..." statuses
+        self.timeouts = 0            # "error: timeout" replies from the bridge
+        self.client_timeouts = 0     # No reply before the client deadline
+        self.retries = 0
+        self.rtt_ewma = None
+        self.rtt_min = None
+        self.service_rate = None     # Commands/s the editor is actually serving (EWMA)
+        self.last_reply = None
+
+    def record_reply(self, rtt, commands, now, alpha=0.2):
+        self.rtt_ewma = rtt if self.rtt_ewma is None else (1 - alpha) * self.rtt_ewma + alpha * rtt
+        self.rtt_min = rtt if self.rtt_min is None else min(self.rtt_min, rtt)
+        if self.last_reply is not None and now > self.last_reply:
+            # While the window keeps Unity busy, the gap between replies is its service time
+            rate = commands / (now - self.last_reply)
+            self.service_rate = rate if self.service_rate is None else (1 - alpha) * self.service_rate + alpha * rate
+        self.last_reply = now
+
+    def throughput(self):
+        elapsed = time.perf_counter() - self.started
+        return self.commands_completed / elapsed if elapsed > 0 else 0.0
+
+    def snapshot(self):
+        return {
+            "requests": self.requests,
+            "commands_sent": self.commands_sent,
+            "commands_completed": self.commands_completed,
+            "command_errors": self.command_errors,
+            "timeouts": self.timeouts,
+            "client_timeouts": self.client_timeouts,
+            "retries": self.retries,
+            "throughput_per_s": self.throughput(),
+            "service_rate_per_s": self.service_rate or 0.0,
+            "rtt_ewma_ms": (self.rtt_ewma or 0.0) * 1000,
+            "rtt_min_ms": (self.rtt_min or 0.0) * 1000,
+        }
+
+
+class FlowController:
+    def __init__(self, addr=ADDR, target_rtt=0.25, timeout=2.0,
+                 initial_batch=8, min_batch=1, max_batch=2048, batch_step=8,
+                 initial_window=2, max_window=8, decrease=0.5, max_retries=3):
+        self.addr = addr
+        self.target_rtt = target_rtt      # Keep well below the bridge's 1 s reply timeout
+        self.timeout = timeout            # Client-side deadline per request
+        self.min_batch = min_batch
+        self.max_batch = max_batch
+        self.batch_step = batch_step
+        self.max_window = max_window
+        self.decrease = decrease
+        self.max_retries = max_retries
+
+        self.batch_size = float(initial_batch)
+        self.window = float(initial_window)
+        self.stats = FlowStats()
+
+        self.context = zmq.Context.instance()
+        self.socket = None
+        self.ids = itertools.count()
+
+    def connect(self):
+        if self.socket is None:
+            self.socket = self.context.socket(zmq.DEALER)
+            self.socket.setsockopt(zmq.LINGER, 0)
+            self.socket.connect(self.addr)
+        return self.socket
+
+    def close(self):
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+    # --- AIMD ---
+
+    def publish(self):
+        BATCH_TARGET.set(self.batch_size)
+        WINDOW.set(self.window)
+
+    def on_reply(self, rtt):
+        if rtt <= self.target_rtt:
+            self.batch_size = min(self.max_batch, self.batch_size + self.batch_step)
+            self.window = min(self.max_window, self.window + 1.0 / self.window)
+        else:
+            # Latency above target: back off before the bridge starts timing out
+            self.batch_size = max(self.min_batch, self.batch_size * 0.85)
+        self.publish()
+
+    def on_timeout(self):
+        self.batch_size = max(self.min_batch, self.batch_size * self.decrease)
+        self.window = max(1.0, self.window * self.decrease)
+        self.publish()
+
+    # --- Sending ---
+
+    def encode(self, commands, indices):
+        if len(indices) == 1 and commands[indices[0]].action != "batch":
+            return commands[indices[0]].SerializeToString()
+        cmd = game_state_pb2.CommandMsg()
+        cmd.action = "batch"
+        cmd.batch.commands.extend(commands[i] for i in indices)
+        return cmd.SerializeToString()
+
+    def run(self, commands):
+        """
+        Sends every CommandMsg and returns one GameStateMsg per command, in order.
+        Commands that could not be confirmed carry status "error: timeout".
+        """
+        commands = list(commands)
+        results = [None] * len(commands)
+        attempts = [0] * len(commands)
+        pending = deque(range(len(commands)))
+        inflight = {}  # request id -> (sent_at, indices)
+        socket = self.connect()
+
+        def give_up_or_requeue(indices):
+            retry = [i for i in indices if attempts[i] < self.max_retries and is_idempotent(commands[i])]
+            for i in indices:
+                if i not in retry:
+                    results[i] = game_state_pb2.GameStateMsg(status=SERVER_TIMEOUT_STATUS)
+            self.stats.retries += len(retry)
+            METRICS_FLOW.retries.inc(len(retry))
+            pending.extendleft(reversed(retry))
+
+        while pending or inflight:
+            # 1. Fill the window
+            while pending and len(inflight) < int(self.window):
+                size = min(max(self.min_batch, int(self.batch_size)), len(pending))
+                indices = [pending.popleft() for _ in range(size)]
+                for i in indices:
+                    attempts[i] += 1
+                rid = next(self.ids).to_bytes(8, "little")
+                # [id, "", payload]: REP echoes the envelope, so replies can be matched
+                payload = self.encode(commands, indices)
+                socket.send_multipart([rid, b"", payload])
+                inflight[rid] = (time.perf_counter(), indices)
+                self.stats.requests += 1
+                self.stats.commands_sent += len(indices)
+                METRICS_FLOW.requests("batch").inc()
+                METRICS_FLOW.batch.observe(len(indices))
+                METRICS_FLOW.payload.observe(len(payload))
+                METRICS_FLOW.bytes_sent.inc(len(payload))
+            INFLIGHT.set(len(inflight))
+            PENDING.set(len(pending))
+
+            # 2. Wait for a reply or the oldest deadline
+            now = time.perf_counter()
+            oldest = min(sent for sent, _ in inflight.values())
+            wait_ms = max(0.0, (oldest + self.timeout - now) * 1000)
+            if socket.poll(wait_ms):
+                frames = socket.recv_multipart()
+                entry = inflight.pop(frames[0], None)
+                if entry is None:
+                    continue  # Late reply to a request we already gave up on
+                sent, indices = entry
+                now = time.perf_counter()
+                reply = game_state_pb2.GameStateMsg()
+                reply.ParseFromString(frames[-1])
+                METRICS_FLOW.bytes_received.inc(len(frames[-1]))
+                METRICS_FLOW.latency.observe(now - sent)
+
+                if reply.status == SERVER_TIMEOUT_STATUS:
+                    self.stats.timeouts += 1
+                    METRICS_FLOW.timeouts.inc()
+                    self.on_timeout()
+                    give_up_or_requeue(indices)
+                    continue
+
+                if TRACER.enabled:
+                    TRACER.complete("flow.request", sent, now, "zmq",
+                                    args={"commands": len(indices), "window": int(self.window)})
+                    TRACER.server_spans(sent, now, reply, "batch")
+                self.stats.record_reply(now - sent, len(indices), now)
+                self.on_reply(now - sent)
+                METRICS_FLOW.record_reply(reply)
+                per_command = reply.results if len(reply.results) == len(indices) else [reply] * len(indices)
+                for i, result in zip(indices, per_command):
+                    results[i] = result
+                    if result.status.startswith("error"):
+                        self.stats.command_errors += 1
+                self.stats.commands_completed += len(indices)
+            else:
+                # 3. Client deadline passed: drop the expired requests (late replies are ignored)
+                now = time.perf_counter()
+                for rid in [r for r, (sent, _) in inflight.items() if now - sent >= self.timeout]:
+                    _, indices = inflight.pop(rid)
+                    self.stats.client_timeouts += 1
+                    METRICS_FLOW.timeouts.inc()
+                    self.on_timeout()
+                    give_up_or_requeue(indices)
+
+        INFLIGHT.set(0)
+        PENDING.set(0)
+        return results
@@ -0,0 +1,582 @@
+"""
+Stand-in for the Unity ZeroMQBridge (Assets/Scripts/Core/ZeroMQBridge.cs).
+
+Serves the same CommandMsg -> GameStateMsg protocol from an in-memory scene,
+so zmq_bridge clients can be exercised without the editor running.
+Status strings mirror the C# bridge.
+
+Usage:
+    python zmq_standin.py [--addr tcp://127.0.0.1:5555] [--bodies N]
+
+In-process (tests / benchmarks):
+    server = StandInServer("tcp://127.0.0.1:5599").start()
+    client = UnityZeroMQClient("tcp://127.0.0.1:5599")
+    ...
+    server.stop()
+"""
+import sys
+import time
+import random
+import hashlib
+import json
+import argparse
+import threading
+import numpy as np
+import zmq
+import game_state_pb2
+import world_coords
+import hierarchy_columnar
+
+ADDR = "tcp://127.0.0.1:5555"
+
+# create: components GameObject.CreatePrimitive adds
+PRIMITIVES = {
+    "cube": ["UnityEngine.MeshFilter", "UnityEngine.MeshRenderer", "UnityEngine.BoxCollider"],
+    "sphere": ["UnityEngine.MeshFilter", "UnityEngine.MeshRenderer", "UnityEngine.SphereCollider"],
+    "capsule": ["UnityEngine.MeshFilter", "UnityEngine.MeshRenderer", "UnityEngine.CapsuleCollider"],
+    "cylinder": ["UnityEngine.MeshFilter", "UnityEngine.MeshRenderer", "UnityEngine.CapsuleCollider"],
+    "plane": ["UnityEngine.MeshFilter", "UnityEngine.MeshRenderer", "UnityEngine.MeshCollider"],
+    "quad": ["UnityEngine.MeshFilter", "UnityEngine.MeshRenderer", "UnityEngine.MeshCollider"],
+}
+
+# Base classes the stand-in knows about (GetComponent(base) finds subclasses)
+SUBCLASSES = {"Core.CelestialBody": ("Core.Planet", "Core.Star")}
+# get_property values for fields nobody has set yet (C# field initializers)
+PROPERTY_DEFAULTS = {("Core.PhysicsEngine", "G"): "0.0001"}
+
+def log(msg):
+    print(f"[ZMQ StandIn] {msg}")
+
+def find_component(obj, type_name):
+    """Component of obj matching a full or short type name (or a subclass of it), like ResolveType."""
+    for c in obj.components:
+        if type_name in (c, c.rsplit(".", 1)[-1]) or c in SUBCLASSES.get(type_name, ()):
+            return c
+    return None
+
+
+class Entity:
+    __slots__ = ("name", "position", "rotation", "components", "instance_id", "properties", "mesh",
+                 "parent", "children")
+
+    def __init__(self, name, position=(0.0, 0.0, 0.0), components=(), instance_id=0, parent=None):
+        self.name = name
+        self.instance_id = instance_id
+        self.position = np.array(position, dtype=np.float64)
+        self.rotation = np.zeros(3, dtype=np.float64)
+        self.components = ["UnityEngine.Transform"] + list(components)
+        self.properties = {}  # (component, property) -> value string (set_property)
+        self.mesh = None      # upload_mesh: key into StandInScene.meshes
+        self.parent = parent  # Entity or None (root)
+        self.children = []
+
+
+class StandInScene:
+    """In-memory scene + command handlers (one per CommandMsg.action)."""
+
+    def __init__(self):
+        # Every object in scene order (instance id -> Entity); names can repeat, like in Unity.
+        # objects maps a name to the instance GameObject.Find would return.
+        self.instances = {}
+        self.objects = {}
+        self.next_instance_id = 1
+        # set_transforms handle cache, same contract as ZeroMQBridge
+        self.handle_objects = {}
+        self.name_handles = {}
+        self.next_handle = 1
+        # upload_mesh / mesh_chunk, same contract as ZeroMQBridge
+        self.meshes = {}          # hash + layout key -> dict of arrays
+        self.pending_meshes = {}  # key -> [bytearray, contiguous bytes received]
+        self.frames = ()          # Extra ZeroMQ frames of the command being executed
+        self.started = time.time()
+        self.handlers = {
+            "destroy": self.destroy,
+            "destroy_instances": self.destroy_instances,
+            "create": self.create,
+            "set_property": self.set_property,
+            "frame_stats": self.frame_stats,
+            "get_world_mover": self.get_world_mover,
+            "get_property": self.get_property,
+            "upload_mesh": self.upload_mesh,
+            "mesh_chunk": self.upload_mesh,
+            "generate_universe": self.generate_universe,
+            "init_universe": self.init_universe,
+            "set_transform": self.set_transform,
+            "set_transforms": self.set_transforms,
+            "check_components": self.check_components,
+            "get_hierarchy": self.get_hierarchy,
+            "get_hierarchy_columnar": self.get_hierarchy_columnar,
+            "run_test": self.run_test,
+            "batch": self.batch,
+        }
+
+    def add(self, name, position=(0.0, 0.0, 0.0), components=(), parent=None):
+        entity = Entity(name, position, components, self.next_instance_id, parent)
+        if parent is not None:
+            parent.children.append(entity)
+        self.next_instance_id += 1
+        self.instances[entity.instance_id] = entity
+        self.objects.setdefault(name, entity)
+        return entity
+
+    def remove(self, entity):
+        # Destroying a GameObject takes its children with it
+        for child in list(entity.children):
+            self.remove(child)
+        if entity.parent is not None and entity.parent.instance_id in self.instances:
+            entity.parent.children.remove(entity)
+        del self.instances[entity.instance_id]
+        if self.objects.get(entity.name) is entity:
+            del self.objects[entity.name]
+            # Find() now returns the next object with that name, if any
+            for other in self.instances.values():
+                if other.name == entity.name:
+                    self.objects[entity.name] = other
+                    break
+
+    def populate(self, count, prefix="Body", spread=1e4, seed=0):
+        rng = np.random.default_rng(seed)
+        for i, pos in enumerate(rng.uniform(-spread, spread, size=(count, 3))):
+            self.add(f"{prefix}_{i}", pos, ["Core.VirtualTransform"])
+
+    def execute(self, cmd):
+        """CommandMsg -> GameStateMsg."""
+        reply = game_state_pb2.GameStateMsg()
+        reply.timestamp = time.time() - self.started
+        reply.status = "ok"
+        handler = self.handlers.get(cmd.action)
+        try:
+            if handler:
+                handler(cmd, reply)
+        except Exception as e:
+            reply.status = f"error: {e}"
+        return reply
+
+    # --- Handlers ---
+
+    def destroy(self, cmd, reply):
+        obj = self.objects.get(cmd.target)
+        if obj is None:
+            reply.status = "error: not found"
+            return
+        self.remove(obj)
+
+    def destroy_instances(self, cmd, reply):
+        ids = set(cmd.instance_ids)  # A repeated id is still one object
+        found = [self.instances[i] for i in ids if i in self.instances]
+        for obj in found:
+            self.remove(obj)
+        missing = len(ids) - len(found)
+        reply.status = f"error: {missing} of {len(ids)} not found" if missing \
+            else f"ok: {len(found)} destroyed"
+
+    def create(self, cmd, reply):
+        spec = json.loads(cmd.payload_json) if cmd.payload_json else {}
+        primitive = (spec.get("primitive") or "").lower()
+        if primitive and primitive not in PRIMITIVES:
+            reply.status = f"error: unknown primitive {spec['primitive']}"
+            return
+        position = (0.0, 0.0, 0.0)
+        if cmd.HasField("world_payload"):
+            position = world_coords.from_msg(cmd.world_payload)
+        elif cmd.HasField("vector_payload"):
+            position = (cmd.vector_payload.x, cmd.vector_payload.y, cmd.vector_payload.z)
+        parent = None
+        if spec.get("parent"):
+            parent = self.objects.get(spec["parent"])
+            if parent is None:
+                reply.status = f"error: parent not found {spec['parent']}"
+                return
+        components = PRIMITIVES.get(primitive, []) + list(spec.get("components") or [])
+        reply.instance_ids.append(self.add(cmd.target, position, components, parent).instance_id)
+        reply.status = "ok: created"
+
+    def set_property(self, cmd, reply):
+        obj = self.objects.get(cmd.target)
+        if obj is None:
+            reply.status = "error: not found"
+            return
+        spec = json.loads(cmd.payload_json)
+        component = find_component(obj, spec["type"])
+        if component is None:
+            reply.status = f"error: component not found {spec['type']}"
+            return
+        obj.properties[(component, spec["propertyName"])] = str(spec["value"])
+        reply.status = "ok"
+
+    def get_property(self, cmd, reply):
+        spec = json.loads(cmd.payload_json)
+        if cmd.target:
+            candidates = [self.objects[cmd.target]] if cmd.target in self.objects else []
+            if not candidates:
+                reply.status = "error: not found"
+                return
+        else:
+            candidates = self.instances.values()  # First component of that type in the scene
+        for obj in candidates:
+            component = find_component(obj, spec["type"])
+            if component is not None:
+                key = (component, spec["propertyName"])
+                value = obj.properties.get(key, PROPERTY_DEFAULTS.get(key))
+                reply.status = f"ok: {value}" if value is not None else f"error: no property {spec['propertyName']}"
+                return
+        reply.status = f"error: component not found {spec['type']}"
+
+    def upload_mesh(self, cmd, reply):
+        obj = self.objects.get(cmd.target)
+        if obj is None:
+            reply.status = "error: not found"
+            return
+        m = cmd.mesh
+        key = (m.hash, m.vertex_count, m.index_count, m.index32, m.has_normals, m.has_uv)
+        if key in self.meshes:
+            self.assign_mesh(obj, key)
+            reply.status = "ok: cached"
+            return
+        n = m.vertex_count
+        per_vertex = 12 + (12 if m.has_normals else 0) + (8 if m.has_uv else 0)
+        if n <= 0 or m.index_count % 3 or n * per_vertex + m.index_count * (4 if m.index32 else 2) != m.total_bytes:
+            reply.status = f"error: bad mesh layout ({m.total_bytes} bytes for {n} vertices, {m.index_count} indices)"
+            return
+
+        pending = self.pending_meshes.get(key)
+        if pending is None:
+            if len(self.pending_meshes) >= 4:
+                self.pending_meshes.clear()
+            pending = self.pending_meshes[key] = [bytearray(m.total_bytes), 0]
+        if cmd.action == "mesh_chunk" and m.offset <= pending[1]:
+            pos = m.offset
+            for frame in self.frames:
+                frame = memoryview(frame)
+                if pos + frame.nbytes > m.total_bytes:
+                    reply.status = "error: chunk past end of mesh"
+                    return
+                pending[0][pos:pos + frame.nbytes] = frame
+                pos += frame.nbytes
+            pending[1] = max(pending[1], pos)
+        if pending[1] < m.total_bytes:
+            reply.status = f"ok: need {pending[1]}"
+            return
+
+        del self.pending_meshes[key]
+        data = bytes(pending[0])
+        if hashlib.sha256(data).hexdigest() != m.hash:
+            reply.status = "error: hash mismatch"
+            return
+        arrays, offset = {}, 0
+        for name, width, present in (("vertices", 3, True), ("normals", 3, m.has_normals), ("uv", 2, m.has_uv)):
+            if present:
+                arrays[name] = np.frombuffer(data, "<f4", n * width, offset).reshape(n, width)
+                offset += n * width * 4
+        arrays["indices"] = np.frombuffer(data, "<u4" if m.index32 else "<u2", m.index_count, offset)
+        if m.index_count and arrays["indices"].max() >= n:
+            raise ValueError(f"index {arrays['indices'].max()} out of range ({n} vertices)")
+        self.meshes[key] = arrays
+        self.assign_mesh(obj, key)
+        reply.status = f"ok: uploaded {n} vertices"
+
+    def assign_mesh(self, obj, key):
+        obj.mesh = key
+        for component in ("UnityEngine.MeshFilter", "UnityEngine.MeshRenderer"):
+            if component not in obj.components:
+                obj.components.append(component)
+
+    def get_world_mover(self, cmd, reply):
+        mover = next((o for o in self.instances.values() if "Core.WorldMover" in o.components), None)
+        if mover is None:
+            reply.status = "error: no WorldMover"
+            return
+        t = reply.entities.add()
+        t.name = mover.name
+        t.position.x, t.position.y, t.position.z = mover.position.tolist()
+        world_coords.to_msg(*mover.position.tolist(), msg=t.world_position)
+
+    def frame_stats(self, cmd, reply):
+        # Frame timing is filled in by StandInServer (it owns the emulated editor loop)
+        reply.frame_stats.object_count = len(self.instances)
+        reply.status = "ok: 0 frames"
+
+    def generate_universe(self, cmd, reply):
+        self.add("Sol", (0, 0, 0), ["Core.Star"])
+        self.add("Earth", (200, 0, 0), ["Core.Planet"])
+
+    def init_universe(self, cmd, reply):
+        self.generate_universe(cmd, reply)
+        reply.status = "ok: universe generated"
+
+    def set_transform(self, cmd, reply):
+        obj = self.objects.get(cmd.target)
+        if obj is not None and cmd.HasField("world_payload"):
+            obj.position = np.array(world_coords.from_msg(cmd.world_payload), dtype=np.float64)
+            return
+        if obj is None or not cmd.HasField("vector_payload"):
+            reply.status = "error: not found or invalid payload"
+            return
+        v = cmd.vector_payload
+        obj.position = np.array((v.x, v.y, v.z), dtype=np.float64)
+
+    def get_handle(self, name):
+        handle = self.name_handles.get(name)
+        if handle is not None and self.handle_objects.get(handle) is self.objects.get(name):
+            return handle
+        obj = self.objects.get(name)
+        if obj is None:
+            return -1
+        handle = self.next_handle
+        self.next_handle += 1
+        self.name_handles[name] = handle
+        self.handle_objects[handle] = obj
+        return handle
+
+    def resolve_handle(self, handle):
+        obj = self.handle_objects.get(handle)
+        # A destroyed object is no longer in the scene (Unity: obj == null)
+        if obj is None or obj.instance_id not in self.instances:
+            return None
+        return obj
+
+    def set_transforms(self, cmd, reply):
+        batch = cmd.transform_batch
+        by_name = len(batch.names) > 0
+        count = len(batch.names) if by_name else len(batch.handles)
+
+        positions = np.frombuffer(batch.positions, dtype="<f4")
+        rotations = np.frombuffer(batch.rotations, dtype="<f4") if batch.rotations else None
+        if positions.size != count * 3 or (rotations is not None and rotations.size != count * 3):
+            reply.status = "error: buffer size mismatch"
+            return
+        if batch.sectors:
+            sectors = np.frombuffer(batch.sectors, dtype="<i4")
+            if sectors.size != count * 3:
+                reply.status = "error: buffer size mismatch"
+                return
+            positions = world_coords.decode(sectors, positions)
+        positions = positions.reshape(count, 3).astype(np.float64)
+        if rotations is not None:
+            rotations = rotations.reshape(count, 3).astype(np.float64)
+
+        if by_name:
+            handles = [self.get_handle(n) for n in batch.names]
+            reply.handles.extend(handles)
+            targets = [self.handle_objects[h] if h >= 0 else None for h in handles]
+        else:
+            targets = [self.resolve_handle(h) for h in batch.handles]
+
+        missing = 0
+        for i, obj in enumerate(targets):
+            if obj is None:
+                missing += 1
+                continue
+            obj.position = positions[i]
+            if rotations is not None:
+                obj.rotation = rotations[i]
+
+        if missing:
+            reply.status = f"error: {missing} of {count} not found"
+
+    def check_components(self, cmd, reply):
+        obj = self.objects.get(cmd.target)
+        if obj is None:
+            reply.status = "error: not found"
+            return
+        reply.status = "ok: " + "".join(c.split(".")[-1] + ", " for c in obj.components)
+
+    def get_hierarchy(self, cmd, reply):
+        for obj in self.instances.values():
+            t = reply.entities.add()
+            t.name = obj.name
+            t.position.x, t.position.y, t.position.z = obj.position.tolist()
+            t.rotation.x, t.rotation.y, t.rotation.z = obj.rotation.tolist()
+            if "Core.VirtualTransform" in obj.components:
+                world_coords.to_msg(*obj.position.tolist(), msg=t.world_position)
+
+    def get_hierarchy_columnar(self, cmd, reply):
+        # Pre-order: every object right before its subtree (roots in creation order)
+        objects = []
+        stack = [o for o in reversed(list(self.instances.values())) if o.parent is None]
+        while stack:
+            obj = stack.pop()
+            objects.append(obj)
+            stack.extend(reversed(obj.children))
+        index = {o.instance_id: i for i, o in enumerate(objects)}
+        reply.hierarchy.CopyFrom(hierarchy_columnar.encode(
+            np.array([index[o.parent.instance_id] if o.parent is not None else -1 for o in objects]),
+            [o.name for o in objects],
+            [o.components for o in objects],
+            np.array([o.position for o in objects]).reshape(-1, 3),
+            instance_ids=[o.instance_id for o in objects]))
+        reply.status = f"ok: {len(objects)} objects"
+
+    def run_test(self, cmd, reply):
+        reply.status = "error: verifier not found"
+
+    def batch(self, cmd, reply):
+        failed = 0
+        skipping = False
+        for sub in cmd.batch.commands:
+            if skipping:
+                result = game_state_pb2.GameStateMsg(timestamp=reply.timestamp, status="skipped")
+            elif sub.action == "batch":
+                result = game_state_pb2.GameStateMsg(timestamp=reply.timestamp, status="error: nested batch")
+            else:
+                result = self.execute(sub)
+
+            if result.status.startswith("error"):
+                failed += 1
+                skipping = cmd.batch.stop_on_error
+            reply.results.append(result)
+
+        if failed:
+            reply.status = f"error: {failed} of {len(cmd.batch.commands)} failed"
+
+
+def command_count(cmd):
+    """Number of scene operations carried by one CommandMsg."""
+    if cmd.action == "batch":
+        return sum(command_count(c) for c in cmd.batch.commands)
+    if cmd.action == "set_transforms":
+        return max(len(cmd.transform_batch.names), len(cmd.transform_batch.handles))
+    return 1
+
+
+class StandInServer:
+    """REP socket serving a StandInScene. One request at a time, like the Unity bridge."""
+
+    def __init__(self, addr=ADDR, scene=None, frame_time=0.0, command_cost=0.0, reply_timeout=1.0,
+                 stall_probability=0.0, stall_time=0.0, seed=None, object_cost=0.0):
+        self.addr = addr
+        self.scene = scene if scene is not None else StandInScene()
+        # Editor emulation: a request is served on the next Update tick (frame_time),
+        # costs command_cost seconds of main-thread time per command, and is answered
+        # "error: timeout" if that takes longer than reply_timeout (200 x 5 ms in ZeroMQBridge).
+        self.frame_time = frame_time
+        self.command_cost = command_cost
+        # Per-object cost of an editor frame (scene/hierarchy upkeep): frames slow down as the scene grows
+        self.object_cost = object_cost
+        self.frame_stats_since = time.perf_counter()
+        self.frame_stats_peak = 0.0
+        self.reply_timeout = reply_timeout
+        # Editor hiccups (recompiles, modal dialogs): occasionally hold a reply for stall_time
+        self.stall_probability = stall_probability
+        self.stall_time = stall_time
+        self.random = random.Random(seed)
+        self.running = False
+        self.thread = None
+        self.served = 0
+        self.ready = threading.Event()
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        self.ready.wait(5.0)
+        return self
+
+    def stop(self):
+        self.running = False
+        if self.thread:
+            self.thread.join(2.0)
+
+    def handle(self, data, frames=()):
+        """Raw request bytes (+ extra frames, mesh_chunk) -> raw reply bytes."""
+        cmd = game_state_pb2.CommandMsg()
+        try:
+            cmd.ParseFromString(data)
+        except Exception as e:
+            reply = game_state_pb2.GameStateMsg()
+            reply.status = f"error: {e}"
+            return reply.SerializeToString()
+        busy = self.simulated_busy_time(cmd)
+        if self.stall_probability and self.random.random() < self.stall_probability:
+            time.sleep(self.stall_time)
+        started = time.perf_counter()
+        self.scene.frames = frames
+        reply = self.scene.execute(cmd)
+        self.scene.frames = ()
+        # Same timing fields as ZeroMQBridge (emulated busy time counts as queueing)
+        reply.exec_ms = (time.perf_counter() - started) * 1000
+        reply.queue_ms = busy * 1000
+        self.record_frame_stats(cmd, reply)
+        if busy > self.reply_timeout:
+            # The work still happens, the client just never hears about it
+            time.sleep(self.reply_timeout)
+            reply = game_state_pb2.GameStateMsg(status="error: timeout")
+        elif busy > 0:
+            time.sleep(busy)
+        return reply.SerializeToString()
+
+    def frame_period(self):
+        """Emulated editor Update period (seconds) for the current scene size."""
+        return self.frame_time + self.object_cost * len(self.scene.instances)
+
+    def simulated_busy_time(self, cmd):
+        """Seconds until the emulated main thread has a reply ready."""
+        busy = 0.0
+        period = self.frame_period()
+        if period > 0:
+            now = time.perf_counter()
+            busy = period - (now % period)
+        if self.command_cost > 0:
+            work = command_count(cmd) * self.command_cost
+            busy += work
+            # Commands run inside Update, so they stretch the frame that runs them
+            self.frame_stats_peak = max(self.frame_stats_peak, period + work)
+        return busy
+
+    def record_frame_stats(self, cmd, reply):
+        """frame_stats: emulated frames since the previous request, then start over."""
+        if cmd.action != "frame_stats" or reply.status.startswith("error"):
+            return
+        now = time.perf_counter()
+        period = self.frame_period()
+        stats = reply.frame_stats
+        if period > 0:
+            stats.samples = int((now - self.frame_stats_since) / period)
+            stats.mean_ms = stats.p95_ms = period * 1000
+            stats.max_ms = max(period, self.frame_stats_peak) * 1000
+            reply.status = f"ok: {stats.samples} frames"
+        self.frame_stats_since = now
+        self.frame_stats_peak = 0.0
+
+    def serve_forever(self):
+        context = zmq.Context.instance()
+        socket = context.socket(zmq.REP)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.bind(self.addr)
+        self.running = True
+        self.ready.set()
+        try:
+            while self.running:
+                # Poll so stop() is honoured (mirrors TryReceiveFrameBytes(0.1s))
+                if not socket.poll(100):
+                    continue
+                parts = socket.recv_multipart(copy=False)
+                socket.send(self.handle(parts[0].bytes, [p.buffer for p in parts[1:]]))
+                self.served += 1
+        finally:
+            socket.close()
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="In-memory stand-in for the Unity ZeroMQBridge.")
+    parser.add_argument("--addr", default=ADDR)
+    parser.add_argument("--bodies", type=int, default=0, help="Pre-populate Body_0..N-1")
+    parser.add_argument("--frame-ms", type=float, default=0.0, help="Emulated editor Update period")
+    parser.add_argument("--command-us", type=float, default=0.0, help="Emulated main-thread cost per command")
+    parser.add_argument("--object-us", type=float, default=0.0, help="Emulated frame cost per scene object")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Probability a reply is held back")
+    parser.add_argument("--stall-ms", type=float, default=3000.0, help="How long a held reply waits")
+    args = parser.parse_args(argv)
+
+    server = StandInServer(args.addr, frame_time=args.frame_ms / 1000.0, command_cost=args.command_us / 1e6,
+                           object_cost=args.object_us / 1e6, stall_probability=args.stall_rate, stall_time=args.stall_ms / 1000.0)
+    if args.bodies:
+        server.scene.populate(args.bodies)
+    log(f"Serving {len(server.scene.instances)} objects on {args.addr} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log(f"Stopped after {server.served} requests.")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
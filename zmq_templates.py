@@ -0,0 +1,143 @@
+"""
+Pre-serialized CommandMsg templates for high-rate Vector3 commands (set_transform).
+
+A CommandMsg is just `action`, `target` and a 3-float `vector_payload` on the wire:
+
+    0x0a len action | 0x12 len target | 0x22 0x0f (0x0d f32 0x15 f32 0x1d f32)
+
+Everything before the floats only depends on (action, target), so it is encoded
+once and cached. Sending a new position only patches the 12 float bytes in place.
+The output parses to the same CommandMsg that protobuf would build (zeros are
+written explicitly instead of omitted, which proto3 parsers accept).
+
+    tpl = TEMPLATES.get("set_transform", "Earth")
+    socket.send(tpl.render(200.0, 0.0, 0.0))
+
+    batch = TemplateBatch("set_transform", names)   # once
+    for frame in frames:                             # (N,3) float arrays
+        for msg in batch.render(frame).messages():
+            socket.send(msg)
+"""
+import struct
+import numpy as np
+
+# Field keys (field_number << 3 | wire_type)
+ACTION_KEY = 0x0a          # 1, length-delimited
+TARGET_KEY = 0x12          # 2, length-delimited
+VECTOR_KEY = 0x22          # 4, length-delimited
+X_KEY, Y_KEY, Z_KEY = 0x0d, 0x15, 0x1d  # Vector3Msg 1..3, fixed32
+
+VECTOR_SIZE = 15           # 3 * (1 key byte + 4 float bytes)
+VECTOR_HEADER = bytes([VECTOR_KEY, VECTOR_SIZE])
+VECTOR_STRUCT = struct.Struct("<BfBfBf")
+FLOAT_OFFSETS = (1, 6, 11)  # Offsets of x/y/z inside the Vector3Msg body
+
+def _varint(value):
+    out = bytearray()
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+def _string_field(key, text):
+    if not text:
+        return b""  # proto3 omits empty strings
+    data = text.encode("utf-8")
+    return bytes([key]) + _varint(len(data)) + data
+
+def encode_prefix(action, target=""):
+    """Serialized action + target fields of a CommandMsg."""
+    return _string_field(ACTION_KEY, action) + _string_field(TARGET_KEY, target)
+
+def _empty_vector():
+    return VECTOR_HEADER + VECTOR_STRUCT.pack(X_KEY, 0.0, Y_KEY, 0.0, Z_KEY, 0.0)
+
+
+class CommandTemplate:
+    """One cached (action, target) message with a patchable vector payload."""
+    __slots__ = ("action", "target", "buffer", "offset")
+
+    def __init__(self, action, target=""):
+        prefix = encode_prefix(action, target)
+        self.action = action
+        self.target = target
+        self.buffer = bytearray(prefix + _empty_vector())
+        self.offset = len(prefix) + len(VECTOR_HEADER)
+
+    def render(self, x, y, z):
+        """
+        Patches the floats and returns the internal buffer.
+        Send it (or copy it) before the next render() - it is reused.
+        """
+        VECTOR_STRUCT.pack_into(self.buffer, self.offset, X_KEY, x, Y_KEY, y, Z_KEY, z)
+        return self.buffer
+
+
+class TemplateCache:
+    """(action, target) -> CommandTemplate."""
+
+    def __init__(self):
+        self.templates = {}
+
+    def get(self, action, target=""):
+        tpl = self.templates.get((action, target))
+        if tpl is None:
+            tpl = self.templates[(action, target)] = CommandTemplate(action, target)
+        return tpl
+
+    def clear(self):
+        self.templates.clear()
+
+# Shared default cache
+TEMPLATES = TemplateCache()
+
+
+class TemplateBatch:
+    """
+    N back-to-back CommandMsgs (one per target) in a single uint8 buffer.
+    render() writes a whole (N,3) array of floats with one vectorized scatter;
+    messages() yields zero-copy memoryview slices, one per target.
+    """
+
+    def __init__(self, action, targets):
+        self.action = action
+        self.targets = list(targets)
+        vector = _empty_vector()
+
+        parts = []
+        starts = []
+        floats = []
+        pos = 0
+        for target in self.targets:
+            prefix = encode_prefix(action, target)
+            starts.append(pos)
+            floats.append(pos + len(prefix) + len(VECTOR_HEADER))
+            parts.append(prefix)
+            parts.append(vector)
+            pos += len(prefix) + len(vector)
+        starts.append(pos)
+
+        self.buffer = np.frombuffer(bytearray(b"".join(parts)), dtype=np.uint8)
+        self.bounds = np.asarray(starts, dtype=np.int64)
+        # (N, 12) byte positions of the x/y/z little-endian floats
+        base = np.asarray(floats, dtype=np.int64)[:, None] + np.asarray(FLOAT_OFFSETS)
+        self.float_index = (base[:, :, None] + np.arange(4)).reshape(len(self.targets), 12)
+
+    def __len__(self):
+        return len(self.targets)
+
+    def render(self, xyz):
+        """Writes an (N,3) array (any float dtype) into the payload slots."""
+        values = np.ascontiguousarray(xyz, dtype="<f4").reshape(len(self.targets), 3)
+        self.buffer[self.float_index] = values.view(np.uint8).reshape(len(self.targets), 12)
+        return self
+
+    def message(self, i):
+        return memoryview(self.buffer)[self.bounds[i]:self.bounds[i + 1]]
+
+    def messages(self):
+        view = memoryview(self.buffer)
+        bounds = self.bounds.tolist()
+        for i in range(len(self.targets)):
+            yield view[bounds[i]:bounds[i + 1]]